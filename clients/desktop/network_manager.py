@@ -22,6 +22,48 @@ from packet_validator import validate_incoming, validate_outgoing
 
 LOG = logging.getLogger(__name__)
 
+# Optional protocol features advertised to the server at login
+CLIENT_FEATURES = ["batch", "menu_patch"]
+
+# Menu settings carried over from earlier menu packets into patched menus
+_MENU_SETTING_KEYS = ("multiletter_enabled", "escape_behavior", "grid_enabled", "grid_width")
+
+
+def apply_menu_patch(items: list, ops: list[dict]) -> list | None:
+    """
+    Apply menu_patch ops to a menu's items.
+
+    Returns:
+        The new item list, or None if an op does not fit the items.
+    """
+    items = list(items)
+    for op in ops:
+        kind = op.get("op")
+        item = op.get("item")
+        if kind == "insert":
+            index = op.get("index")
+            if item is None or index is None or index > len(items):
+                return None
+            items.insert(index, item)
+            continue
+        position = next(
+            (
+                i
+                for i, existing in enumerate(items)
+                if isinstance(existing, dict) and existing.get("id") == op.get("id")
+            ),
+            None,
+        )
+        if position is None:
+            return None
+        if kind == "remove":
+            del items[position]
+        elif kind == "replace" and item is not None:
+            items[position] = item
+        else:
+            return None
+    return items
+
 
 class TLSUserDeclinedError(Exception):
     """Raised when the user declines to trust a presented TLS certificate."""
@@ -53,6 +95,10 @@ class NetworkManager:
         self.refresh_token = None
         self.refresh_expires_at = None
         self._validation_errors = 0
+        # Last full menu per menu_id, used to expand menu_patch packets
+        self._menus: dict[str, dict] = {}
+        # Menus asked for in full after a patch did not apply
+        self._menu_resyncs: set[str] = set()
 
     def _validate_outgoing_packet(self, packet: dict) -> bool:
         """Validate a packet before sending; logs and blocks invalid payloads."""
@@ -108,6 +154,8 @@ class NetworkManager:
 
             self.username = username
             self.should_stop = False
+            self._menus.clear()
+            self._menu_resyncs.clear()
             self.server_url = server_url
             self.server_id = getattr(self.main_window, "server_id", None)
             # Keep refresh token state aligned with the credentials used for this connection.
@@ -222,6 +270,7 @@ class NetworkManager:
             "patch": 0,
             "client_type": "Desktop",
             "platform": f"{platform_mod.system()} {platform_mod.release()} {platform_mod.machine()}",
+            "features": CLIENT_FEATURES,
         }
         if self.session_token and self._session_valid():
             packet["session_token"] = self.session_token
@@ -239,6 +288,7 @@ class NetworkManager:
             "username": username,
             "client_type": "Desktop",
             "platform": f"{platform_mod.system()} {platform_mod.release()} {platform_mod.machine()}",
+            "features": CLIENT_FEATURES,
         }
         if not self._validate_outgoing_packet(packet):
             raise RuntimeError("Client refused to send invalid refresh packet.")
@@ -562,6 +612,20 @@ class NetworkManager:
 
         packet_type = packet.get("type")
 
+        if packet_type == "batch":
+            for inner in packet.get("packets", []):
+                self._handle_packet(inner)
+            return
+        if packet_type == "menu_patch":
+            packet = self._expand_menu_patch(packet)
+            if packet is None:
+                return
+            packet_type = "menu"
+        if packet_type == "menu":
+            self._remember_menu(packet)
+        elif packet_type == "clear_ui":
+            self._menus.clear()
+            self._menu_resyncs.clear()
         if packet_type in {"authorize_success", "refresh_session_success"}:
             self._handle_authorize_success(packet, packet_type)
             return
@@ -574,6 +638,42 @@ class NetworkManager:
         if packet_type in _PACKET_DISPATCH:
             _PACKET_DISPATCH[packet_type](self.main_window, packet)
 
+    def _remember_menu(self, packet: dict) -> None:
+        """Record a menu's items and settings so later patches can apply."""
+        menu_id = packet.get("menu_id")
+        menu = {"type": "menu", "menu_id": menu_id}
+        previous = self._menus.get(menu_id, {})
+        for key in _MENU_SETTING_KEYS:
+            if key in packet:
+                menu[key] = packet[key]
+            elif key in previous:
+                menu[key] = previous[key]
+        menu["items"] = packet.get("items", [])
+        self._menus[menu_id] = menu
+        self._menu_resyncs.discard(menu_id)
+
+    def _expand_menu_patch(self, packet: dict) -> dict | None:
+        """Turn a menu_patch into the full menu packet it stands for.
+
+        A patch that does not apply asks the server for the full menu once;
+        later patches for that menu are ignored until it arrives.
+        """
+        menu_id = packet.get("menu_id")
+        menu = self._menus.get(menu_id)
+        items = apply_menu_patch(menu["items"], packet.get("ops", [])) if menu else None
+        if items is None:
+            self._menus.pop(menu_id, None)
+            if menu_id not in self._menu_resyncs:
+                LOG.warning("Menu patch did not apply, requesting full menu: %s", menu_id)
+                self._menu_resyncs.add(menu_id)
+                self.send_packet({"type": "menu_resync", "menu_id": menu_id})
+            return None
+        expanded = dict(menu, items=items)
+        for key in ("position", "selection_id", "play_selection_sound"):
+            if key in packet:
+                expanded[key] = packet[key]
+        return expanded
+
     def _handle_authorize_success(self, packet, packet_type: str) -> None:
         session_token = packet.get("session_token")
         if session_token:
@@ -214,6 +214,95 @@ def test_handle_packet_dispatches_to_main_window():
     assert {name for name, _ in window.calls} == set(PACKET_TO_HANDLER.values())
 
 
+def test_handle_packet_unpacks_batches_in_order():
+    window = RecordingMainWindow()
+    nm = NetworkManager(main_window=window)
+    nm._handle_packet(
+        {
+            "type": "batch",
+            "packets": [
+                {"type": "speak", "text": "hi"},
+                {"type": "play_sound", "name": "ding"},
+                {"type": "menu", "menu_id": "turn_menu", "items": []},
+            ],
+        }
+    )
+    assert window.calls == [
+        ("on_server_speak", "speak"),
+        ("on_server_play_sound", "play_sound"),
+        ("on_server_menu", "menu"),
+    ]
+
+
+def test_handle_packet_expands_menu_patches(monkeypatch):
+    window = RecordingMainWindow()
+    menus = []
+    window.on_server_menu = menus.append
+    nm = NetworkManager(main_window=window)
+    nm._handle_packet(
+        {
+            "type": "menu",
+            "menu_id": "turn_menu",
+            "items": [{"text": "Roll", "id": "roll"}, {"text": "Bank", "id": "bank"}],
+            "multiletter_enabled": False,
+            "escape_behavior": "keybind",
+        }
+    )
+    nm._handle_packet(
+        {
+            "type": "menu_patch",
+            "menu_id": "turn_menu",
+            "ops": [
+                {"op": "remove", "id": "bank"},
+                {"op": "insert", "index": 1, "item": {"text": "Keep", "id": "keep"}},
+                {"op": "replace", "id": "roll", "item": {"text": "Roll again", "id": "roll"}},
+            ],
+            "selection_id": "keep",
+        }
+    )
+    # A patch for a menu the client has no state for is dropped.
+    monkeypatch.setattr(nm, "send_packet", lambda packet: True)
+    nm._handle_packet({"type": "menu_patch", "menu_id": "other", "ops": []})
+
+    assert len(menus) == 2
+    assert menus[1] == {
+        "type": "menu",
+        "menu_id": "turn_menu",
+        "multiletter_enabled": False,
+        "escape_behavior": "keybind",
+        "items": [{"text": "Roll again", "id": "roll"}, {"text": "Keep", "id": "keep"}],
+        "selection_id": "keep",
+    }
+
+
+def test_menu_patch_that_does_not_apply_requests_the_full_menu(monkeypatch):
+    window = RecordingMainWindow()
+    menus = []
+    window.on_server_menu = menus.append
+    nm = NetworkManager(main_window=window)
+    sent = []
+    monkeypatch.setattr(nm, "send_packet", lambda packet: sent.append(packet) or True)
+    patch = {"type": "menu_patch", "menu_id": "turn_menu", "ops": [{"op": "remove", "id": "x"}]}
+
+    nm._handle_packet(patch)
+    nm._handle_packet(patch)
+    assert sent == [{"type": "menu_resync", "menu_id": "turn_menu"}]
+    assert menus == []
+
+    full_menu = {"type": "menu", "menu_id": "turn_menu", "items": [{"text": "X", "id": "x"}]}
+    nm._handle_packet(full_menu)
+    nm._handle_packet(patch)
+    assert menus[-1]["items"] == []
+    assert len(sent) == 1
+
+
+def test_apply_menu_patch_rejects_ops_that_do_not_fit():
+    items = [{"text": "A", "id": "a"}]
+    assert nm_mod.apply_menu_patch(items, [{"op": "remove", "id": "missing"}]) is None
+    assert nm_mod.apply_menu_patch(items, [{"op": "insert", "index": 5, "item": {"text": "B"}}]) is None
+    assert items == [{"text": "A", "id": "a"}]
+
+
 def test_send_packet_requires_connection():
     nm = NetworkManager(main_window=RecordingMainWindow())
     assert nm.send_packet({"type": "ping"}) is False
@@ -23,6 +23,8 @@ const DEFAULT_AMBIENCE_VOLUME = 100;
 const SESSION_REFRESH_LEEWAY_SECONDS = 60;
 const RECONNECT_WINDOW_MS = 60_000;
 const RECONNECT_RETRY_DELAY_MS = 3_000;
+// Optional protocol features advertised to the server at login
+const CLIENT_FEATURES = ["batch", "menu_patch"];
 const DEFAULT_APP_VERSION = "2026.02.17.1";
 const DEFAULT_WEB_CLIENT_CONFIG = {
   serverUrl: "",
@@ -501,6 +503,7 @@ function buildAuthorizePacketFromSession(username, sessionToken) {
     patch: 0,
     client_type: "Web",
     platform: getPlatformString(),
+    features: CLIENT_FEATURES,
   };
 }
 
@@ -510,6 +513,7 @@ function buildRefreshPacket(refreshToken, username = "") {
     refresh_token: refreshToken,
     client_type: "Web",
     platform: getPlatformString(),
+    features: CLIENT_FEATURES,
   };
   if (username) {
     packet.username = normalizeUsername(username);
@@ -1566,6 +1570,7 @@ async function bootstrap() {
         patch: 0,
         client_type: "Web",
         platform: getPlatformString(),
+        features: CLIENT_FEATURES,
       },
     });
   });
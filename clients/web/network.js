@@ -140,8 +140,95 @@ export async function loadPacketValidator() {
   }
 }
 
+// Menu settings carried over from earlier menu packets into patched menus
+const MENU_SETTING_KEYS = ["multiletter_enabled", "escape_behavior", "grid_enabled", "grid_width"];
+
+// Apply menu_patch ops to a menu's items; returns null if an op does not fit.
+export function applyMenuPatch(items, ops) {
+  const result = [...items];
+  for (const op of ops) {
+    if (op.op === "insert") {
+      if (!op.item || typeof op.index !== "number" || op.index > result.length) {
+        return null;
+      }
+      result.splice(op.index, 0, op.item);
+      continue;
+    }
+    const position = result.findIndex(
+      (item) => item && typeof item === "object" && item.id === op.id,
+    );
+    if (position < 0) {
+      return null;
+    }
+    if (op.op === "remove") {
+      result.splice(position, 1);
+    } else if (op.op === "replace" && op.item) {
+      result[position] = op.item;
+    } else {
+      return null;
+    }
+  }
+  return result;
+}
+
 export function createNetworkClient({ validator, onStatus, onPacket, onError }) {
   let ws = null;
+  // Last full menu per menu_id, used to expand menu_patch packets
+  const menus = new Map();
+  // Menus asked for in full after a patch did not apply
+  const menuResyncs = new Set();
+
+  function rememberMenu(packet) {
+    const previous = menus.get(packet.menu_id) || {};
+    const menu = { type: "menu", menu_id: packet.menu_id };
+    for (const key of MENU_SETTING_KEYS) {
+      if (Object.hasOwn(packet, key)) {
+        menu[key] = packet[key];
+      } else if (Object.hasOwn(previous, key)) {
+        menu[key] = previous[key];
+      }
+    }
+    menu.items = packet.items || [];
+    menus.set(packet.menu_id, menu);
+    menuResyncs.delete(packet.menu_id);
+  }
+
+  function expandMenuPatch(packet) {
+    const menu = menus.get(packet.menu_id);
+    const items = menu ? applyMenuPatch(menu.items, packet.ops || []) : null;
+    if (!items) {
+      // Ask for the full menu once; ignore its patches until it arrives
+      menus.delete(packet.menu_id);
+      if (!menuResyncs.has(packet.menu_id)) {
+        menuResyncs.add(packet.menu_id);
+        send({ type: "menu_resync", menu_id: packet.menu_id });
+      }
+      return null;
+    }
+    const expanded = { ...menu, items };
+    for (const key of ["position", "selection_id", "play_selection_sound"]) {
+      if (Object.hasOwn(packet, key)) {
+        expanded[key] = packet[key];
+      }
+    }
+    return expanded;
+  }
+
+  function deliver(packet) {
+    if (packet.type === "menu_patch") {
+      packet = expandMenuPatch(packet);
+      if (!packet) {
+        return;
+      }
+    }
+    if (packet.type === "menu") {
+      rememberMenu(packet);
+    } else if (packet.type === "clear_ui") {
+      menus.clear();
+      menuResyncs.clear();
+    }
+    onPacket(packet);
+  }
 
   function isConnected() {
     return ws && ws.readyState === WebSocket.OPEN;
@@ -171,6 +258,8 @@ export function createNetworkClient({ validator, onStatus, onPacket, onError })
 
   function connect({ serverUrl, authPacket }) {
     disconnect();
+    menus.clear();
+    menuResyncs.clear();
 
     onStatus("connecting");
     const socket = new WebSocket(serverUrl);
@@ -199,7 +288,18 @@ export function createNetworkClient({ validator, onStatus, onPacket, onError })
           onError(`Ignored incoming packet: ${check.error}`);
           return;
         }
-        onPacket(packet);
+        if (packet.type === "batch") {
+          for (const inner of packet.packets) {
+            const innerCheck = validator.validateIncoming(inner);
+            if (!innerCheck.ok) {
+              onError(`Ignored incoming packet: ${innerCheck.error}`);
+              continue;
+            }
+            deliver(inner);
+          }
+          return;
+        }
+        deliver(packet);
       } catch (error) {
         onError(`Invalid server message: ${String(error)}`);
       }
@@ -1,5 +1,5 @@
 """Authentication and session management."""
 
-from .auth import AuthManager, AuthResult
+from .auth import AuthManager, AuthResult, CredentialPool, CredentialPoolBusy
 
-__all__ = ["AuthManager", "AuthResult"]
+__all__ = ["AuthManager", "AuthResult", "CredentialPool", "CredentialPoolBusy"]
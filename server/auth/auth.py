@@ -1,10 +1,12 @@
 """Authentication and session management."""
 
+import asyncio
 import hashlib
 import secrets
 import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from enum import Enum, auto
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError, InvalidHashError
@@ -24,22 +26,141 @@ if TYPE_CHECKING:
     from ..persistence.database import Database, UserRecord
 
 
+HASH_EXECUTOR_THREAD = "thread"
+HASH_EXECUTOR_PROCESS = "process"
+HASH_EXECUTORS = (HASH_EXECUTOR_THREAD, HASH_EXECUTOR_PROCESS)
+DEFAULT_HASH_EXECUTOR = HASH_EXECUTOR_THREAD
+DEFAULT_HASH_WORKERS = 2
+DEFAULT_MAX_PENDING_HASHES = 32
+
+_HASHER = PasswordHasher()
+
+
+def _argon2_hash(password: str) -> str:
+    """Hash a password with Argon2 (runs in the credential pool)."""
+    return _HASHER.hash(password)
+
+
+def _argon2_verify(password_hash: str, password: str) -> bool:
+    """Check a password against an Argon2 hash (runs in the credential pool)."""
+    try:
+        return _HASHER.verify(password_hash, password)
+    except (VerifyMismatchError, InvalidHashError):
+        return False
+
+
+class CredentialPoolBusy(Exception):
+    """Raised when too many password hashes are already waiting for a worker."""
+
+
+class CredentialPool:
+    """Bounded worker pool for Argon2 hashing and verification.
+
+    Each Argon2 call costs tens of milliseconds of CPU. Running them here
+    keeps the event loop (and every table's ticks) responsive during a
+    burst of logins. At most ``workers`` hashes run at once; once
+    ``max_pending`` are running or queued, new requests are refused with
+    CredentialPoolBusy instead of queueing without bound.
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_HASH_WORKERS,
+        executor: str = DEFAULT_HASH_EXECUTOR,
+        max_pending: int = DEFAULT_MAX_PENDING_HASHES,
+    ):
+        """
+        Initialize the pool. Workers are started on first use.
+
+        Args:
+            workers: Number of worker threads or processes.
+            executor: "thread" or "process".
+            max_pending: Most hashes allowed to be running or queued at once.
+        """
+        if executor not in HASH_EXECUTORS:
+            raise ValueError(f"Unknown hash executor: {executor!r}")
+        self.workers = max(1, workers)
+        self.executor = executor
+        self.max_pending = max(1, max_pending)
+        self._executor: Executor | None = None
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def _get_executor(self) -> Executor:
+        """Return the worker pool, starting it if needed."""
+        if self._executor is None:
+            if self.executor == HASH_EXECUTOR_PROCESS:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="argon2"
+                )
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a hashing function on a worker and wait for its result.
+
+        Raises:
+            CredentialPoolBusy: If max_pending hashes are already in flight.
+        """
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            raise CredentialPoolBusy()
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._pending -= 1
+        self.completed += 1
+        return result
+
+    def shutdown(self) -> None:
+        """Stop the workers without waiting for queued hashes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return pool counters."""
+        return {
+            "executor": self.executor,
+            "workers": self.workers,
+            "pending": self._pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+
 class AuthManager:
     """Handle user authentication and session management.
 
     Uses Argon2 for password hashing and supports migration from legacy
-    SHA-256 hashes on successful login.
+    SHA-256 hashes on successful login. The ``*_async`` methods run Argon2
+    in a CredentialPool; the server uses those so logins never hash on the
+    event loop. The synchronous methods remain for the CLI and tests.
     """
 
-    def __init__(self, database: "Database"):
-        """Initialize the auth manager with a database backend."""
+    def __init__(self, database: "Database", pool: CredentialPool | None = None):
+        """Initialize the auth manager with a database backend and hash pool."""
         self._db = database
         self._sessions: dict[str, tuple[str, int]] = {}  # token -> (username, expires_at)
-        self._hasher = PasswordHasher()
+        self._pool = pool or CredentialPool()
+
+    @property
+    def pool(self) -> CredentialPool:
+        """The worker pool used by the async methods."""
+        return self._pool
+
+    def close(self) -> None:
+        """Stop the hash workers."""
+        self._pool.shutdown()
 
     def hash_password(self, password: str) -> str:
         """Hash a password using Argon2."""
-        return self._hasher.hash(password)
+        return _argon2_hash(password)
 
     def _hash_password_sha256(self, password: str) -> str:
         """Legacy SHA-256 hash for migration support."""
@@ -54,11 +175,8 @@ class AuthManager:
     def verify_password(self, password: str, password_hash: str) -> bool:
         """Verify a password against its hash (supports both Argon2 and legacy SHA-256)."""
         # Try Argon2 first
-        try:
-            self._hasher.verify(password_hash, password)
+        if _argon2_verify(password_hash, password):
             return True
-        except (VerifyMismatchError, InvalidHashError):
-            pass
 
         # Fall back to SHA-256 for legacy hashes
         if self._is_legacy_hash(password_hash):
@@ -129,6 +247,68 @@ class AuthManager:
         self._db.update_user_password(username, password_hash)
         return True
 
+    async def hash_password_async(self, password: str) -> str:
+        """Hash a password using Argon2 on the credential pool."""
+        return await self._pool.run(_argon2_hash, password)
+
+    async def verify_password_async(self, password: str, password_hash: str) -> bool:
+        """Verify a password on the credential pool (see verify_password)."""
+        if self._is_legacy_hash(password_hash):
+            # Not an Argon2 hash; the SHA-256 check is cheap enough to run inline.
+            return self._hash_password_sha256(password) == password_hash
+        return await self._pool.run(_argon2_verify, password_hash, password)
+
+    async def authenticate_async(self, username: str, password: str) -> AuthResult:
+        """Authenticate a user without hashing on the event loop.
+
+        Raises:
+            CredentialPoolBusy: If the credential pool is saturated.
+        """
+        user = self._db.get_user(username)
+        if not user:
+            return AuthResult.USER_NOT_FOUND
+
+        if not await self.verify_password_async(password, user.password_hash):
+            return AuthResult.WRONG_PASSWORD
+
+        # Upgrade legacy hash to Argon2 on successful login
+        if self._is_legacy_hash(user.password_hash):
+            new_hash = await self.hash_password_async(password)
+            self._db.update_user_password(username, new_hash)
+
+        return AuthResult.SUCCESS
+
+    async def register_async(
+        self, username: str, password: str, *, approved: bool = False, locale: str = "en"
+    ) -> bool:
+        """Register a new user without hashing on the event loop.
+
+        Raises:
+            CredentialPoolBusy: If the credential pool is saturated.
+        """
+        if self._db.user_exists(username):
+            return False
+
+        password_hash = await self.hash_password_async(password)
+        # The name may have been taken while the hash was computed.
+        if self._db.user_exists(username):
+            return False
+        self._db.create_user(username, password_hash, locale, TrustLevel.USER, approved)
+        return True
+
+    async def reset_password_async(self, username: str, new_password: str) -> bool:
+        """Reset a user's password without hashing on the event loop.
+
+        Raises:
+            CredentialPoolBusy: If the credential pool is saturated.
+        """
+        if not self._db.user_exists(username):
+            return False
+
+        password_hash = await self.hash_password_async(new_password)
+        self._db.update_user_password(username, password_hash)
+        return True
+
     def get_user(self, username: str) -> "UserRecord | None":
         """Get a user record."""
         return self._db.get_user(username)
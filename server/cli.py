@@ -19,16 +19,37 @@ Usage examples:
     # Test serialization (save/restore after each tick)
     python -m server.cli simulate threes --bots 2 --test-serialization
 
+    # Same, through the packed binary game-state codec
+    python -m server.cli simulate threes --bots 2 --test-serialization --codec packed
+
+    # Skip ticks where bots are only thinking (same tick count, faster)
+    python -m server.cli simulate pig --bots 3 --fast-forward
+
+    # Run 100 simulations on 4 worker processes and report aggregate stats
+    python -m server.cli simulate pig --bots 3 --runs 100 --workers 4
+
+    # Reproduce a run exactly (e.g. to replay a slow game under a profiler)
+    python -m server.cli simulate chess --bots 2 --seed 1234
+
     # List available games
     python -m server.cli list-games
 
+    # Time how long each game module takes to import
+    python -m server.cli import-times
+
     # Show game options
     python -m server.cli show-options lightturret
+
+    # Recompute leaderboard stats after changing a game's leaderboard configs
+    python -m server.cli rebuild-stats --db-path var/server/playpalace.db
 """
 
 import argparse
+import importlib
 import json
+import random
 import sys
+import time
 from dataclasses import dataclass, field
 from getpass import getpass
 from io import StringIO
@@ -53,6 +74,11 @@ from server.core.users.base import User, MenuItem, TrustLevel, generate_uuid  #
 from server.core.users.bot import Bot  # noqa: E402
 from server.core.ui.keybinds import KeybindState  # noqa: E402
 from server.persistence.database import Database  # noqa: E402
+from server.persistence.game_codec import (  # noqa: E402
+    DEFAULT_GAME_CODEC_NAME,
+    GAME_CODECS,
+    GameCodec,
+)
 from server.auth.auth import AuthManager  # noqa: E402
 
 
@@ -130,6 +156,7 @@ class SpectatorUser(User):
         items: list,
         position: int | None = None,
         selection_id: str | None = None,
+        play_selection_sound: bool = False,
     ) -> None:
         self.show_menu(menu_id, items)
 
@@ -205,6 +232,9 @@ class GameSimulator:
         test_serialization: bool = False,
         locale: str = "en",
         validate_keybinds: bool = False,
+        fast_forward: bool = False,
+        seed: int | None = None,
+        codec: str = DEFAULT_GAME_CODEC_NAME,
     ):
         self.game_type = game_type
         self.bot_names = bot_names
@@ -215,6 +245,9 @@ class GameSimulator:
         self.test_serialization = test_serialization
         self.locale = locale
         self.validate_keybinds = validate_keybinds
+        self.fast_forward = fast_forward
+        self.seed = seed
+        self.codec = GameCodec(codec)
 
         self.game: Game | None = None
         self.spectator: SpectatorUser | None = None
@@ -247,15 +280,23 @@ class GameSimulator:
 
         # Create game instance
         self.game = self.game_class()
+        if self.seed is not None:
+            # Games not yet drawing from game.rng still use the module-level
+            # generator, so seed both for a reproducible run.
+            random.seed(self.seed)
+            self.game.rng.seed(self.seed)
 
         # Apply options
         if hasattr(self.game, "options"):
             for key, value in self.options.items():
                 if hasattr(self.game.options, key):
-                    # Convert value to appropriate type
+                    # Convert CLI strings to the option's type; structured values
+                    # (from the simulation pool) are used as-is.
                     # Note: Check bool before int because bool is a subclass of int
                     current = getattr(self.game.options, key)
-                    if isinstance(current, bool):
+                    if not isinstance(value, str):
+                        pass
+                    elif isinstance(current, bool):
                         value = value.lower() in ("true", "1", "yes")
                     elif isinstance(current, int):
                         value = int(value)
@@ -297,7 +338,7 @@ class GameSimulator:
         return True
 
     def _save_and_restore(self, tick: int) -> None:
-        """Save game to JSON and restore it, testing serialization."""
+        """Save game state with the codec and restore it, testing serialization."""
         if not self.game or not self.game_class:
             return
 
@@ -310,15 +351,15 @@ class GameSimulator:
         saved_actions_menu_open = set(self.game._actions_menu_open)
         saved_turn_index = self.game.turn_index
 
-        # Serialize to JSON
+        # Serialize
         try:
-            game_json = self.game.to_json()
+            game_state = self.codec.encode(self.game)
         except Exception as e:
             raise RuntimeError(f"Serialization failed at tick {tick}: {e}")
 
         # Deserialize back
         try:
-            self.game = self.game_class.from_json(game_json)
+            self.game = self.codec.decode(self.game_class, game_state)
         except Exception as e:
             raise RuntimeError(f"Deserialization failed at tick {tick}: {e}")
 
@@ -368,7 +409,16 @@ class GameSimulator:
             for bot in self.capturing_bots.values():
                 bot._tick = tick
 
-            self.game.on_tick()
+            # Jump over ticks that would only count down bot think time
+            skip = self.game.fast_forward_ticks() if self.fast_forward else 0
+            if skip:
+                skip = min(skip, self.max_ticks - tick)
+                self.game.fast_forward(skip)
+                tick += skip
+                continue
+
+            with self.game.deferred_menu_updates():
+                self.game.on_tick()
             tick += 1
 
             # Test serialization after each tick if enabled
@@ -401,6 +451,7 @@ class GameSimulator:
             "rounds": self.game.round,
             "timed_out": timed_out,
             "locale": self.locale,
+            "seed": self.seed,
             "messages": filtered_messages,
             "final_menu": filtered_menu,
         }
@@ -513,7 +564,7 @@ class GameSimulator:
 
 def cmd_list_games(args):
     """List all available games."""
-    games = GameRegistry.get_all()
+    games = GameRegistry.get_infos()
 
     if args.json:
         output = []
@@ -538,6 +589,31 @@ def cmd_list_games(args):
             print()
 
 
+def cmd_import_times(args):
+    """Import each game module in turn and report how long it took.
+
+    Modules are imported in menu order within one process, so helpers shared
+    between games are counted against the first game that pulls them in.
+    """
+    timings = []
+    for info in GameRegistry.get_infos():
+        module = getattr(info, "module", None)
+        if module is None or module in sys.modules:
+            continue
+        start = time.perf_counter()
+        importlib.import_module(module)
+        timings.append({"type": info.get_type(), "ms": (time.perf_counter() - start) * 1000})
+    timings.sort(key=lambda entry: entry["ms"], reverse=True)
+    total_ms = sum(entry["ms"] for entry in timings)
+
+    if args.json:
+        print(json.dumps({"games": timings, "total_ms": total_ms}, indent=2))
+    else:
+        for entry in timings:
+            print(f"  {entry['type']:20} {entry['ms']:8.1f} ms")
+        print(f"  {'total':20} {total_ms:8.1f} ms ({len(timings)} games)")
+
+
 def cmd_show_options(args):
     """Show options for a specific game."""
     game_class = get_game_class(args.game_type)
@@ -644,6 +720,10 @@ def _run_simulate(args):
                 key, value = opt.split("=", 1)
                 options[key.strip()] = value.strip()
 
+    if args.runs > 1:
+        _run_simulate_batch(args, bot_names, options)
+        return
+
     # Create and run simulator
     simulator = GameSimulator(
         game_type=args.game_type,
@@ -655,6 +735,9 @@ def _run_simulate(args):
         test_serialization=args.test_serialization,
         locale=args.locale,
         validate_keybinds=args.validate_keybinds,
+        fast_forward=args.fast_forward,
+        seed=args.seed,
+        codec=args.codec,
     )
 
     if not simulator.setup():
@@ -712,6 +795,63 @@ def _run_simulate(args):
                     print(f"  - {issue}")
 
 
+def _run_simulate_batch(args, bot_names: list[str], options: dict[str, str]) -> None:
+    """Run args.runs simulations on a worker pool and report aggregate stats."""
+    from server.game_utils.simulation_pool import SimulationPool, summarize_ticks
+
+    if not get_game_class(args.game_type):
+        print(f"Error: Unknown game type '{args.game_type}'")
+        sys.exit(1)
+
+    pool = SimulationPool(args.workers)
+    results = []
+    try:
+        for result in pool.run_many(
+            args.runs, args.game_type, bot_names, options, max_ticks=args.max_ticks, seed=args.seed
+        ):
+            results.append(result)
+            if not args.json and not args.quiet:
+                if result.get("error"):
+                    print(f"  run {len(results)}/{args.runs}: error: {result['error']}")
+                else:
+                    seed = "" if result.get("seed") is None else f" (seed {result['seed']})"
+                    print(f"  run {len(results)}/{args.runs}: {result['ticks']} ticks{seed}")
+    finally:
+        pool.shutdown()
+
+    summary = summarize_ticks(results)
+    summary.update(
+        {
+            "game_type": args.game_type,
+            "bots": len(bot_names),
+            "workers": pool.workers,
+            "seed": args.seed,
+        }
+    )
+    errors = [r["error"] for r in results if r.get("error")]
+    if errors:
+        summary["first_error"] = errors[0]
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(
+            f"\n=== {args.game_type}: {summary['completed']}/{summary['runs']} runs completed "
+            f"on {pool.workers} workers ==="
+        )
+        if summary["completed"]:
+            print(
+                f"Ticks: mean {summary['mean_ticks']:.0f}, std dev {summary['std_dev_ticks']:.0f}, "
+                f"min {summary['min_ticks']}, max {summary['max_ticks']}"
+            )
+        if summary["timed_out"]:
+            print(f"Timed out: {summary['timed_out']}")
+        if errors:
+            print(f"Errors: {len(errors)} (first: {errors[0]})")
+    if not summary["completed"]:
+        sys.exit(1)
+
+
 def _prompt_for_password() -> str:
     """Interactively prompt for a password twice."""
     while True:
@@ -818,6 +958,23 @@ def cmd_bootstrap_owner(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
+def cmd_rebuild_stats(args: argparse.Namespace) -> None:
+    """Handle the rebuild-stats CLI command."""
+    leaderboard_types = {
+        game_class.get_type(): game_class.get_leaderboard_types()
+        for game_class in GameRegistry.get_all()
+    }
+    database = Database(args.db_path)
+    database.connect()
+    try:
+        started = time.perf_counter()
+        replayed = database.rebuild_player_stats(leaderboard_types)
+        elapsed = time.perf_counter() - started
+    finally:
+        database.close()
+    print(f"Rebuilt player stats from {replayed} game results in {elapsed:.1f} s.")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="PlayPalace CLI for AI agents",
@@ -831,6 +988,12 @@ def main():
     list_parser = subparsers.add_parser("list-games", help="List available games")
     list_parser.add_argument("--json", action="store_true", help="Output as JSON")
 
+    # import-times command
+    import_times_parser = subparsers.add_parser(
+        "import-times", help="Time importing each game module"
+    )
+    import_times_parser.add_argument("--json", action="store_true", help="Output as JSON")
+
     # show-options command
     options_parser = subparsers.add_parser("show-options", help="Show options for a game")
     options_parser.add_argument("game_type", help="Game type (e.g., lightturret, pig)")
@@ -865,6 +1028,12 @@ def main():
         action="store_true",
         help="Save and restore game state after each tick to test serialization",
     )
+    sim_parser.add_argument(
+        "--codec",
+        choices=GAME_CODECS,
+        default=DEFAULT_GAME_CODEC_NAME,
+        help=f"Game-state codec used by --test-serialization (default: {DEFAULT_GAME_CODEC_NAME})",
+    )
     sim_parser.add_argument(
         "--locale",
         "-l",
@@ -877,6 +1046,32 @@ def main():
         action="store_true",
         help="Validate keybind action IDs and run smoke tests after game",
     )
+    sim_parser.add_argument(
+        "--fast-forward",
+        "-f",
+        action="store_true",
+        help="Skip ticks where bots are only thinking (same tick count, runs faster)",
+    )
+    sim_parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed the game's RNG for a reproducible run (with --runs, run i uses seed + i)",
+    )
+    sim_parser.add_argument(
+        "--runs",
+        "-n",
+        type=int,
+        default=1,
+        help="Run the simulation N times on a worker pool and report aggregate stats",
+    )
+    sim_parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=None,
+        help="Worker processes for --runs (default: CPU count - 1)",
+    )
     sim_parser.add_argument(
         "--clip",
         action="store_true",
@@ -927,16 +1122,31 @@ def main():
         help="Suppress success output (useful for CI)",
     )
 
+    # rebuild-stats command
+    rebuild_stats_parser = subparsers.add_parser(
+        "rebuild-stats",
+        help="Recompute leaderboard and My Stats aggregates from all game results",
+    )
+    rebuild_stats_parser.add_argument(
+        "--db-path",
+        default="playpalace.db",
+        help="Path to the server database (default resolves to var/server/playpalace.db)",
+    )
+
     args = parser.parse_args()
 
     if args.command == "list-games":
         cmd_list_games(args)
+    elif args.command == "import-times":
+        cmd_import_times(args)
     elif args.command == "show-options":
         cmd_show_options(args)
     elif args.command == "simulate":
         cmd_simulate(args)
     elif args.command == "bootstrap-owner":
         cmd_bootstrap_owner(args)
+    elif args.command == "rebuild-stats":
+        cmd_rebuild_stats(args)
     else:
         parser.print_help()
         sys.exit(1)
@@ -3,13 +3,14 @@
 from importlib import import_module
 
 from .state import ServerLifecycleState, ServerMode
-from .tick import TickScheduler, load_server_config, DEFAULT_TICK_INTERVAL_MS
+from .tick import TickScheduler, TickMetrics, load_server_config, DEFAULT_TICK_INTERVAL_MS
 
 __all__ = [
     "Server",
     "ServerLifecycleState",
     "ServerMode",
     "TickScheduler",
+    "TickMetrics",
     "load_server_config",
     "DEFAULT_TICK_INTERVAL_MS",
 ]
@@ -12,6 +12,10 @@ if TYPE_CHECKING:
     from ..persistence.database import Database
 
 
+# Number of most expensive game types listed on the server status screen
+SERVER_STATUS_TOP_GAMES = 5
+
+
 # Activity buffer helper for admin/system announcements
 def _speak_activity(user, message_id: str, **kwargs) -> None:
     """Speak a localized activity message to the admin/user."""
@@ -56,12 +60,17 @@ class AdministrationMixin:
         _users: dict[str, NetworkUser] of online users.
         _user_states: dict[str, dict] of user menu states.
         _show_main_menu(user): Method to show the main menu.
+        get_tick_metrics(): Method returning tick telemetry.
     """
 
     _db: "Database"
     _users: dict[str, NetworkUser]
     _user_states: dict[str, dict]
 
+    def get_tick_metrics(self) -> dict:
+        """Return tick telemetry - to be implemented by the main class."""
+        raise NotImplementedError
+
     def _show_main_menu(self, user: NetworkUser) -> None:
         """Show main menu - to be implemented by the main class."""
         raise NotImplementedError
@@ -95,6 +104,10 @@ class AdministrationMixin:
                 text=Localization.get(user.locale, "unban-user"),
                 id="unban_user",
             ),
+            MenuItem(
+                text=Localization.get(user.locale, "server-status"),
+                id="server_status",
+            ),
         ]
         # Only server owners can promote/demote admins, manage virtual bots, and transfer ownership
         if user.trust_level.value >= TrustLevel.SERVER_OWNER.value:
@@ -480,6 +493,8 @@ class AdministrationMixin:
             self._show_unban_user_menu(user)
         elif selection_id == "virtual_bots":
             self._show_virtual_bots_menu(user)
+        elif selection_id == "server_status":
+            await self._show_server_status(user)
         elif selection_id == "back":
             self._show_main_menu(user)
 
@@ -1070,6 +1085,96 @@ class AdministrationMixin:
 
         self._show_virtual_bots_menu(owner)
 
+    @require_admin
+    async def _show_server_status(self, admin: NetworkUser) -> None:
+        """Speak tick timing telemetry, then return to the admin menu."""
+        locale = admin.locale
+        metrics = self.get_tick_metrics()
+        tick = metrics["tick"]
+        if not tick["count"]:
+            admin.speak_l("server-status-no-ticks", buffer="misc")
+            self._show_admin_menu(admin)
+            return
+
+        lines = [
+            Localization.get(
+                locale,
+                "server-status-tick",
+                ticks=tick["count"],
+                interval=metrics["tick_interval_ms"] or "-",
+                mean=f"{tick['mean_ms']:.1f}",
+                p95=f"{tick['p95_ms']:.1f}",
+                max=f"{tick['max_ms']:.1f}",
+                overruns=metrics["overruns"],
+                skipped=metrics["skipped_ticks"],
+                policy=metrics["overrun_policy"] or "-",
+            )
+        ]
+        for phase, stats in metrics["phases"].items():
+            lines.append(
+                Localization.get(
+                    locale,
+                    "server-status-tick-phase",
+                    phase=phase,
+                    mean=f"{stats['mean_ms']:.1f}",
+                    p95=f"{stats['p95_ms']:.1f}",
+                    max=f"{stats['max_ms']:.1f}",
+                    overruns=stats["overruns"],
+                )
+            )
+        packets = metrics.get("packets")
+        if packets:
+            lines.append(
+                Localization.get(
+                    locale,
+                    "server-status-packets",
+                    mode=packets["mode"],
+                    validated=packets["validated"],
+                    fast=packets["fast"],
+                    mismatches=packets["mismatches"],
+                    reused=packets.get("reused", 0),
+                )
+            )
+        localization = metrics.get("localization")
+        if localization:
+            lines.append(
+                Localization.get(
+                    locale,
+                    "server-status-localization",
+                    hits=localization["hits"],
+                    misses=localization["misses"],
+                    size=localization["size"],
+                    max_size=localization["max_size"],
+                )
+            )
+        outbox = metrics.get("outbox")
+        if outbox:
+            lines.append(
+                Localization.get(
+                    locale,
+                    "server-status-outbox",
+                    queued=outbox["queued"],
+                    max_depth=outbox["max_depth"],
+                    high=outbox["high_watermark"],
+                    dropped=outbox["dropped"],
+                    evicted=outbox["evicted"],
+                )
+            )
+        for game_type, stats in list(metrics.get("games", {}).items())[:SERVER_STATUS_TOP_GAMES]:
+            lines.append(
+                Localization.get(
+                    locale,
+                    "server-status-game-cost",
+                    game=game_type,
+                    tables=stats["tables"],
+                    total=f"{stats['total_ms']:.0f}",
+                    mean=f"{stats['mean_ms']:.2f}",
+                    max=f"{stats['max_ms']:.1f}",
+                )
+            )
+        admin.speak("\n".join(lines), buffer="misc")
+        self._show_admin_menu(admin)
+
     @require_server_owner
     async def _show_virtual_bots_status(self, owner: NetworkUser) -> None:
         """Show virtual bots status."""
@@ -33,19 +33,62 @@ from .config_paths import (
     load_full_config,
 )
 from .state import ModeSnapshot, ServerLifecycleState, ServerMode
-from .tick import TickScheduler, load_server_config
+from .tick import (
+    TickScheduler,
+    TickMetrics,
+    load_server_config,
+    OVERRUN_POLICIES,
+    DEFAULT_OVERRUN_POLICY,
+    DEFAULT_MAX_CATCH_UP_TICKS,
+)
 from .administration import AdministrationMixin
 from .documents.browsing import DocumentBrowsingMixin, _DOCUMENTS_DIR
 from .documents.transcriber_role import TranscriberRoleMixin
 from .virtual_bots import VirtualBotManager
-from ..network.websocket_server import WebSocketServer, ClientConnection
+from ..network.websocket_server import (
+    WebSocketServer,
+    ClientConnection,
+    BATCH_FEATURE,
+    MENU_PATCH_FEATURE,
+    DEFAULT_OUTBOX_HIGH_WATERMARK,
+    DEFAULT_OUTBOX_LOW_WATERMARK,
+    fan_out,
+)
+from ..network.packet_encoder import (
+    PacketEncoder,
+    run_self_test as run_packet_encoder_self_test,
+    VALIDATION_FULL,
+    VALIDATION_MODES,
+    DEFAULT_SAMPLE_RATE,
+)
 from ..persistence.database import Database
-from ..auth.auth import AuthManager, AuthResult
+from ..persistence.game_codec import (
+    DEFAULT_GAME_CODEC_NAME,
+    GAME_CODECS,
+    GameCodec,
+    UnreadableGameState,
+)
+from ..auth.auth import (
+    DEFAULT_HASH_EXECUTOR,
+    DEFAULT_HASH_WORKERS,
+    DEFAULT_MAX_PENDING_HASHES,
+    HASH_EXECUTORS,
+    AuthManager,
+    AuthResult,
+    CredentialPool,
+    CredentialPoolBusy,
+)
 from .tables.manager import TableManager
+from .tables.checkpoint import (
+    TableCheckpointer,
+    DEFAULT_CHECKPOINT_BUDGET_MS,
+    DEFAULT_CHECKPOINT_INTERVAL_SECONDS,
+)
 from .users.network_user import NetworkUser
 from .users.base import MenuItem, EscapeBehavior, TrustLevel
 from .users.preferences import UserPreferences, DiceKeepingStyle, PREF_CATEGORIES, PrefMeta
 from ..games.registry import GameRegistry, get_game_class
+from ..game_utils.simulation_pool import shutdown_simulation_pool
 from ..messages.localization import Localization
 from .ui.common_flows import show_yes_no_menu
 from .documents.manager import DocumentManager
@@ -160,8 +203,11 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         self._auth: AuthManager | None = None
         self._tables = TableManager()
         self._tables._server = self  # Enable callbacks from TableManager
+        # Saves changed tables every few seconds (intervals set from config in start())
+        self._checkpointer = TableCheckpointer(self._tables, self._db)
         self._ws_server: WebSocketServer | None = None
         self._tick_scheduler: TickScheduler | None = None
+        self._tick_metrics = TickMetrics()
 
         # User tracking
         self._users: dict[str, NetworkUser] = {}  # username -> NetworkUser
@@ -181,8 +227,13 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         self._password_min_length = DEFAULT_PASSWORD_MIN_LENGTH
         self._password_max_length = DEFAULT_PASSWORD_MAX_LENGTH
         self._ws_max_message_size = DEFAULT_WS_MAX_MESSAGE_BYTES
+        self._outbox_high_watermark = DEFAULT_OUTBOX_HIGH_WATERMARK
+        self._outbox_low_watermark = DEFAULT_OUTBOX_LOW_WATERMARK
         self._config_path = Path(config_path) if config_path else get_default_config_path()
         self._allow_insecure_ws = False
+        self._packet_validation = VALIDATION_FULL
+        self._packet_validation_sample_rate = DEFAULT_SAMPLE_RATE
+        self._packet_encoder = PacketEncoder()
         self._block_new_accounts = False
         self._auto_approve_new_accounts = False
         self._preload_locales = preload_locales
@@ -192,6 +243,9 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         self._refresh_ip_limit = DEFAULT_REFRESH_ATTEMPTS_PER_MINUTE
         self._access_token_ttl_seconds = DEFAULT_ACCESS_TOKEN_TTL_SECONDS
         self._refresh_token_ttl_seconds = DEFAULT_REFRESH_TOKEN_TTL_SECONDS
+        self._hash_executor = DEFAULT_HASH_EXECUTOR
+        self._hash_workers = DEFAULT_HASH_WORKERS
+        self._max_pending_hashes = DEFAULT_MAX_PENDING_HASHES
         self._login_ip_window = LOGIN_RATE_WINDOW_SECONDS
         self._login_user_window = LOGIN_RATE_WINDOW_SECONDS
         self._registration_ip_window = REGISTRATION_RATE_WINDOW_SECONDS
@@ -237,6 +291,54 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
                     file=sys.stderr,
                 )
                 raise SystemExit(1)
+        overrun_policy = str(server_config.get("tick_overrun_policy", DEFAULT_OVERRUN_POLICY))
+        if overrun_policy not in OVERRUN_POLICIES:
+            print(
+                f"ERROR: Invalid tick_overrun_policy '{overrun_policy}' in server configuration "
+                f"(expected one of: {', '.join(OVERRUN_POLICIES)}).",
+                file=sys.stderr,
+            )
+            raise SystemExit(1)
+        max_catch_up_ticks = server_config.get("tick_max_catch_up", DEFAULT_MAX_CATCH_UP_TICKS)
+        try:
+            max_catch_up_ticks = int(max_catch_up_ticks)
+        except (TypeError, ValueError) as exc:
+            print(
+                f"ERROR: Invalid tick_max_catch_up value '{max_catch_up_ticks}' in server configuration: {exc}",
+                file=sys.stderr,
+            )
+            raise SystemExit(1) from exc
+        if max_catch_up_ticks < 0:
+            print("ERROR: tick_max_catch_up cannot be negative.", file=sys.stderr)
+            raise SystemExit(1)
+        for key, default in (
+            ("checkpoint_interval_seconds", DEFAULT_CHECKPOINT_INTERVAL_SECONDS),
+            ("checkpoint_budget_ms", DEFAULT_CHECKPOINT_BUDGET_MS),
+        ):
+            try:
+                value = float(server_config.get(key, default))
+            except (TypeError, ValueError) as exc:
+                print(
+                    f"ERROR: Invalid {key} value '{server_config.get(key)}' in server configuration: {exc}",
+                    file=sys.stderr,
+                )
+                raise SystemExit(1) from exc
+            if value < 0:
+                print(f"ERROR: {key} cannot be negative.", file=sys.stderr)
+                raise SystemExit(1)
+            if key == "checkpoint_interval_seconds":
+                self._checkpointer.interval_s = value
+            else:
+                self._checkpointer.budget_s = value / 1000.0
+        game_codec = str(server_config.get("game_codec", DEFAULT_GAME_CODEC_NAME))
+        if game_codec not in GAME_CODECS:
+            print(
+                f"ERROR: Invalid game_codec '{game_codec}' in server configuration "
+                f"(expected one of: {', '.join(GAME_CODECS)}).",
+                file=sys.stderr,
+            )
+            raise SystemExit(1)
+        self._tables.codec = GameCodec(game_codec)
 
         await self._preload_locales_if_requested()
 
@@ -245,7 +347,18 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
 
         # Connect to database
         self._db.connect()
-        self._auth = AuthManager(self._db)
+        if self._db.player_stats_stale:
+            print("Building player stats from game history...")
+            replayed = self._db.rebuild_player_stats(
+                {info.type: self._leaderboard_types(info.type) for info in GameRegistry.get_infos()}
+            )
+            print(f"Player stats built from {replayed} game results.")
+        # Game results, ratings and table saves commit on a writer thread from here on
+        self._db.start_writer()
+        self._auth = AuthManager(
+            self._db,
+            CredentialPool(self._hash_workers, self._hash_executor, self._max_pending_hashes),
+        )
 
         # Initialize trust levels for users
         promoted_user = self._db.initialize_trust_levels()
@@ -271,6 +384,7 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             print(f"Restored {loaded} virtual bots from previous session.")
 
         # Start WebSocket server
+        self._packet_encoder = self._build_packet_encoder()
         self._ws_server = WebSocketServer(
             host=self.host,
             port=self.port,
@@ -280,6 +394,9 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             ssl_cert=self._ssl_cert,
             ssl_key=self._ssl_key,
             max_message_size=self._ws_max_message_size,
+            packet_encoder=self._packet_encoder,
+            outbox_high_watermark=self._outbox_high_watermark,
+            outbox_low_watermark=self._outbox_low_watermark,
         )
         await self._ws_server.start()
         if not self._ssl_cert:
@@ -288,7 +405,13 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             print(f"Max inbound websocket message size: {self._ws_max_message_size} bytes")
 
         # Start tick scheduler
-        self._tick_scheduler = TickScheduler(self._on_tick, tick_interval_ms)
+        self._tick_scheduler = TickScheduler(
+            self._on_tick,
+            tick_interval_ms,
+            overrun_policy=overrun_policy,
+            max_catch_up_ticks=max_catch_up_ticks,
+            metrics=self._tick_metrics,
+        )
         await self._tick_scheduler.start()
         # Tick interval message suppressed by default (configurable via config.toml).
 
@@ -327,6 +450,13 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         if self._ws_server:
             await self._ws_server.stop()
 
+        # Stop password hashing workers
+        if self._auth:
+            self._auth.close()
+
+        # Stop duration-estimate simulation workers
+        shutdown_simulation_pool()
+
         # Close database
         self._db.close()
 
@@ -401,6 +531,18 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             self._refresh_token_ttl_seconds = _read_limit(
                 auth_cfg, "refresh_token_ttl_seconds", self._refresh_token_ttl_seconds, minimum=60
             )
+            executor = auth_cfg.get("hash_executor")
+            if isinstance(executor, str) and executor.strip().lower() in HASH_EXECUTORS:
+                self._hash_executor = executor.strip().lower()
+            elif executor is not None:
+                LOG.warning(
+                    "Invalid config value for 'hash_executor': %r, using %s",
+                    executor, self._hash_executor,
+                )
+            self._hash_workers = _read_limit(auth_cfg, "hash_workers", self._hash_workers)
+            self._max_pending_hashes = _read_limit(
+                auth_cfg, "max_pending_hashes", self._max_pending_hashes
+            )
 
             # Ensure ranges are sane
             if self._username_min_length > self._username_max_length:
@@ -417,6 +559,28 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             self._allow_insecure_ws = _coerce_bool(
                 net_cfg.get("allow_insecure_ws"), self._allow_insecure_ws
             )
+            validation = net_cfg.get("packet_validation")
+            if isinstance(validation, str) and validation.strip().lower() in VALIDATION_MODES:
+                self._packet_validation = validation.strip().lower()
+            elif validation is not None:
+                LOG.warning(
+                    "Invalid config value for 'packet_validation': %r, using %s",
+                    validation, self._packet_validation,
+                )
+            self._packet_validation_sample_rate = _read_limit(
+                net_cfg,
+                "packet_validation_sample_rate",
+                self._packet_validation_sample_rate,
+                minimum=1,
+            )
+            self._outbox_high_watermark = _read_limit(
+                net_cfg, "outbox_high_watermark", self._outbox_high_watermark
+            )
+            self._outbox_low_watermark = _read_limit(
+                net_cfg, "outbox_low_watermark", self._outbox_low_watermark, minimum=0
+            )
+            if self._outbox_low_watermark > self._outbox_high_watermark:
+                self._outbox_low_watermark = self._outbox_high_watermark
 
         rate_cfg = auth_cfg.get("rate_limits") if isinstance(auth_cfg, dict) else None
         if isinstance(rate_cfg, dict):
@@ -454,6 +618,20 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
                 self._contribution_mode = mode.strip().lower()
         self._documents.contribution_mode = self._contribution_mode
 
+    def _build_packet_encoder(self) -> PacketEncoder:
+        """Create the outbound packet encoder, self-testing any fast mode."""
+        mode = self._packet_validation
+        if mode != VALIDATION_FULL:
+            problems = run_packet_encoder_self_test()
+            if problems:
+                LOG.error(
+                    "Packet encoder self-test failed; using full validation instead of %s:\n%s",
+                    mode,
+                    "\n".join(problems),
+                )
+                mode = VALIDATION_FULL
+        return PacketEncoder(mode, self._packet_validation_sample_rate)
+
     def _validate_transport_security(self) -> None:
         """Validate TLS/insecure configuration and exit on invalid combos."""
         if self._allow_insecure_ws and (self._ssl_cert or self._ssl_key):
@@ -835,23 +1013,54 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         self._lifecycle.resolve_gate(LOCALIZATION_GATE_ID)
 
     def _load_tables(self) -> None:
-        """Load tables from database and restore their games."""
+        """Load tables from database and restore their games.
+
+        Saved rows stay in the database; the checkpointer rewrites them as
+        the tables change and deletes them once the tables close. A game
+        that fails to restore, or whose state this server cannot read as
+        installed (see UnreadableGameState), is logged and skipped so one
+        bad row cannot stop the server from starting. Its row is kept, so it
+        loads again once the server is upgraded or the bug is fixed.
+        """
         from .users.bot import Bot
 
+        started = time.perf_counter()
         tables = self._db.load_all_tables()
         for table in tables:
             self._tables.add_table(table)
 
-            # Restore game from JSON if present
+            # Restore game from its saved state if present
             if table.game_json:
                 game_class = get_game_class(table.game_type)
                 if not game_class:
                     print(f"WARNING: Could not find game class for {table.game_type}")
+                    self._checkpointer.mark_saved(table)
                     continue
 
                 # Deserialize game and rebuild runtime state
-                game = game_class.from_json(table.game_json)
-                game.rebuild_runtime_state()
+                try:
+                    game = GameCodec.decode(game_class, table.game_json)
+                    game.rebuild_runtime_state()
+                except UnreadableGameState as exc:
+                    LOG.error("Skipping %s table %s: %s", table.game_type, table.table_id, exc)
+                    print(
+                        f"WARNING: Skipping {table.game_type} table {table.table_id} "
+                        f"(kept in the database): {exc}"
+                    )
+                    self._tables.remove_table(table.table_id)
+                    continue
+                except Exception:
+                    LOG.exception(
+                        "Could not restore %s table %s; skipping it",
+                        table.game_type,
+                        table.table_id,
+                    )
+                    print(
+                        f"WARNING: Could not restore {table.game_type} table "
+                        f"{table.table_id} (kept in the database)"
+                    )
+                    self._tables.remove_table(table.table_id)
+                    continue
                 table.game = game
                 game._table = table
 
@@ -865,49 +1074,75 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
                     if player.is_bot:
                         bot_user = Bot(player.name)
                         game.attach_user(player.id, bot_user)
+            self._checkpointer.mark_saved(table)
 
-        print(f"Loaded {len(tables)} tables from database.")
-
-        # Delete all tables from database after loading to prevent stale data
-        # on subsequent restarts. Tables will be re-saved on shutdown.
-        self._db.delete_all_tables()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"Loaded {len(tables)} tables from database in {elapsed_ms:.0f} ms.")
 
     def _save_tables(self) -> None:
-        """Save all tables to database."""
-        tables = self._tables.save_all()
-        self._db.save_all_tables(tables)
-        print(f"Saved {len(tables)} tables to database.")
+        """Save tables changed since their last checkpoint, and wait for the write."""
+        started = time.perf_counter()
+        saved, unchanged = self._checkpointer.checkpoint_all()
+        self._db.flush()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(
+            f"Saved {saved} tables to database ({unchanged} unchanged) in {elapsed_ms:.0f} ms."
+        )
 
     def _on_tick(self) -> None:
         """Called every tick (50ms)."""
+        metrics = self._tick_metrics
+        started = time.perf_counter()
+
         # Tick all tables
         self._tables.on_tick()
+        now = time.perf_counter()
+        metrics.record_phase("tables", now - started)
+        started = now
+
+        # Serialize a slice of the tables changed since the last checkpoint
+        self._checkpointer.on_tick()
+        now = time.perf_counter()
+        metrics.record_phase("checkpoint", now - started)
+        started = now
 
         # Tick virtual bots (handle state transitions)
         self._virtual_bots.on_tick()
+        now = time.perf_counter()
+        metrics.record_phase("virtual_bots", now - started)
+        started = now
 
         # Flush queued messages for all users
         self._flush_user_messages()
+        metrics.record_phase("flush", time.perf_counter() - started)
+
+    def get_tick_metrics(self) -> dict:
+        """Return a JSON-serializable snapshot of tick timing telemetry."""
+        snapshot = self._tick_metrics.snapshot()
+        scheduler = self._tick_scheduler
+        snapshot["tick_interval_ms"] = scheduler.tick_interval_ms if scheduler else None
+        snapshot["overrun_policy"] = scheduler.overrun_policy if scheduler else None
+        snapshot["games"] = self._tables.get_tick_costs()
+        snapshot["packets"] = self._packet_encoder.get_stats()
+        snapshot["localization"] = Localization.get_cache_stats()
+        snapshot["outbox"] = self._ws_server.get_outbox_stats() if self._ws_server else {}
+        return snapshot
+
+    def _bind_client_username(self, client: ClientConnection, username: str) -> None:
+        """Attach a username to a connection, indexing it on the WebSocket server."""
+        if self._ws_server:
+            self._ws_server.bind_username(client, username)
+        else:
+            client.username = username
 
     def _flush_user_messages(self) -> None:
-        """Send all queued messages for all users."""
+        """Hand each user's queued messages to their connection's writer."""
         for username, user in self._users.items():
             messages = user.get_queued_messages()
             if messages and self._ws_server:
                 client = self._ws_server.get_client_by_username(username)
                 if client:
-                    for msg in messages:
-                        task = asyncio.create_task(client.send(msg))
-                        task.add_done_callback(self._log_send_task_exception)
-
-    @staticmethod
-    def _log_send_task_exception(task: asyncio.Task) -> None:
-        """Log exceptions from fire-and-forget send tasks."""
-        if task.cancelled():
-            return
-        exc = task.exception()
-        if exc is not None:
-            LOG.warning("Error sending queued message: %s", exc)
+                    client.enqueue(messages)
 
     async def _handoff_existing_session(
         self, user: NetworkUser, new_client: ClientConnection
@@ -932,7 +1167,7 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
                 await old_client.close()
             except (OSError, RuntimeError, websockets.exceptions.ConnectionClosed) as exc:
                 LOG.debug("Failed to close replaced session: %s", exc)
-        new_client.username = user.username
+        self._bind_client_username(new_client, user.username)
         new_client.authenticated = True
         user.set_connection(new_client)
 
@@ -1070,6 +1305,8 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         elif packet_type == "menu":
             # Allow menu selections for all authenticated users (including unapproved)
             await self._handle_menu(client, packet)
+        elif packet_type == "menu_resync":
+            await self._handle_menu_resync(client, packet)
         else:
             # For all other packets, check if user is approved
             user = self._users.get(client.username)
@@ -1186,7 +1423,7 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             existing_user.set_fluent_languages(user_record.fluent_languages)
             return existing_user, False
 
-        client.username = username
+        self._bind_client_username(client, username)
         client.authenticated = True
         user = NetworkUser(
             username,
@@ -1319,6 +1556,9 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         locale = packet.get("locale") or self._default_locale
         client.client_type = packet.get("client_type") or ""
         client.platform = packet.get("platform") or ""
+        features = packet.get("features") or []
+        client.supports_batch = BATCH_FEATURE in features
+        client.supports_menu_patch = MENU_PATCH_FEATURE in features
 
         if session_token:
             token_username = self._auth.validate_session(session_token)
@@ -1348,7 +1588,11 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
                 return
 
             # Try to authenticate or register
-            auth_result = self._auth.authenticate(username, password)
+            try:
+                auth_result = await self._auth.authenticate_async(username, password)
+            except CredentialPoolBusy:
+                await self._send_credential_error(client, Localization.get(locale, "auth-busy"))
+                return
             if auth_result != AuthResult.SUCCESS:
                 if auth_result == AuthResult.WRONG_PASSWORD:
                     self._record_login_failure(username)
@@ -1375,7 +1619,19 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
                 if self._block_new_accounts:
                     await self._send_accounts_blocked(client, locale)
                     return
-                if not self._auth.register(username, password, approved=self._auto_approve_new_accounts, locale=locale):
+                try:
+                    registered = await self._auth.register_async(
+                        username,
+                        password,
+                        approved=self._auto_approve_new_accounts,
+                        locale=locale,
+                    )
+                except CredentialPoolBusy:
+                    await self._send_credential_error(
+                        client, Localization.get(locale, "auth-busy")
+                    )
+                    return
+                if not registered:
                     self._record_login_failure(username)
                     # Registration failed (shouldn't happen if user not found, but handle anyway)
                     error_message = Localization.get(locale, "incorrect-username")
@@ -1448,7 +1704,20 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         if self._block_new_accounts:
             await self._send_accounts_blocked(client, locale)
             return
-        if self._auth.register(username, password, approved=self._auto_approve_new_accounts, locale=locale):
+        try:
+            registered = await self._auth.register_async(
+                username, password, approved=self._auto_approve_new_accounts, locale=locale
+            )
+        except CredentialPoolBusy:
+            await client.send(
+                {
+                    "type": "speak",
+                    "text": Localization.get(locale, "auth-busy"),
+                    "buffer": "activity",
+                }
+            )
+            return
+        if registered:
             await client.send({
                 "type": "speak",
                 "text": Localization.get(locale, "registration-success"),
@@ -1501,6 +1770,9 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         locale = packet.get("locale") or self._default_locale
         client.client_type = packet.get("client_type") or ""
         client.platform = packet.get("platform") or ""
+        features = packet.get("features") or []
+        client.supports_batch = BATCH_FEATURE in features
+        client.supports_menu_patch = MENU_PATCH_FEATURE in features
         client_ip = self._get_client_ip(client)
         throttle_message = self._check_refresh_rate_limit(client_ip, locale=locale)
         if throttle_message:
@@ -1537,7 +1809,7 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
     async def _send_game_list(self, client: ClientConnection) -> None:
         """Send the list of available games to the client."""
         games = []
-        for game_class in GameRegistry.get_all():
+        for game_class in GameRegistry.get_infos():
             games.append(
                 {
                     "type": game_class.get_type(),
@@ -1604,7 +1876,7 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
 
     def _show_categories_menu(self, user: NetworkUser) -> None:
         """Show game categories menu."""
-        categories = GameRegistry.get_by_category()
+        categories = GameRegistry.get_infos_by_category()
         items = []
         for category_key in sorted(categories.keys()):
             category_name = Localization.get(user.locale, category_key)
@@ -1627,7 +1899,7 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
 
     def _show_games_menu(self, user: NetworkUser, category: str) -> None:
         """Show games in a category."""
-        categories = GameRegistry.get_by_category()
+        categories = GameRegistry.get_infos_by_category()
         games = categories.get(category, [])
 
         items = []
@@ -1887,7 +2159,7 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         relevant_games = GameRegistry.get_games_for_preference(field_name)
         if relevant_games:
             for game_type in relevant_games:
-                game_cls = GameRegistry.get(game_type)
+                game_cls = GameRegistry.get_info(game_type)
                 if not game_cls:
                     continue
                 game_name = Localization.get(user.locale, game_cls.get_name_key())
@@ -2089,6 +2361,12 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             "save_id": save_id,
         }
 
+    async def _handle_menu_resync(self, client: ClientConnection, packet: dict) -> None:
+        """Resend a menu in full to a client that could not apply a menu_patch."""
+        user = self._users.get(client.username) if client.username else None
+        if user:
+            user.resend_menu(packet["menu_id"])
+
     async def _handle_menu(self, client: ClientConnection, packet: dict) -> None:
         """Handle menu selection packets.
 
@@ -2708,7 +2986,7 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
 
         elif selection_id == "back":
             category = None
-            for cat, games in GameRegistry.get_by_category().items():
+            for cat, games in GameRegistry.get_infos_by_category().items():
                 if any(g.get_type() == game_type for g in games):
                     category = cat
                     break
@@ -2959,12 +3237,19 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
                 self._show_main_menu(user)
             return
 
+        # Load game and rebuild runtime state before anyone is seated
+        try:
+            game = GameCodec.decode(game_class, record.game_json)
+            game.rebuild_runtime_state()
+        except Exception:
+            LOG.exception("Could not restore saved table %s (%s)", save_id, record.game_type)
+            user.speak_l("saved-table-load-failed")
+            if not self._show_saved_tables_menu(user):
+                self._show_main_menu(user)
+            return
+
         # All players available - create table and restore game
         table = self._tables.create_table(record.game_type, user.username, user)
-
-        # Load game from JSON and rebuild runtime state
-        game = game_class.from_json(record.game_json)
-        game.rebuild_runtime_state()
         table.game = game
         game._table = table  # Enable game to call table.destroy()
 
@@ -3017,7 +3302,7 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         Args:
             user: Acting user.
         """
-        categories = GameRegistry.get_by_category()
+        categories = GameRegistry.get_infos_by_category()
         items = []
 
         # Add all games from all categories
@@ -3107,38 +3392,6 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             "game_name": game_name,
         }
 
-    def _get_game_results(self, game_type: str) -> list:
-        """Get game results as GameResult objects."""
-        from ..game_utils.game_result import GameResult, PlayerResult
-        import json
-
-        results = self._db.get_game_stats(game_type, limit=100)
-        game_results = []
-
-        for row in results:
-            custom_data = json.loads(row[4]) if row[4] else {}
-            player_rows = self._db.get_game_result_players(row[0])
-            player_results = [
-                PlayerResult(
-                    player_id=p["player_id"],
-                    player_name=p["player_name"],
-                    is_bot=p["is_bot"],
-                    is_virtual_bot=p.get("is_virtual_bot", False),
-                )
-                for p in player_rows
-            ]
-            game_results.append(
-                GameResult(
-                    game_type=row[1],
-                    timestamp=row[2],
-                    duration_ticks=row[3],
-                    player_results=player_results,
-                    custom_data=custom_data,
-                )
-            )
-
-        return game_results
-
     def _show_wins_leaderboard(self, user: NetworkUser, game_type: str, game_name: str) -> None:
         """Show win count leaderboard for a game.
 
@@ -3147,50 +3400,25 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             game_type: Game type identifier.
             game_name: Localized game name.
         """
-        from ..game_utils.stats_helpers import LeaderboardHelper
-
-        game_results = self._get_game_results(game_type)
-
-        # Build player stats: {player_id: {wins, losses, name}}
-        player_stats: dict[str, dict] = {}
-        for result in game_results:
-            winner_name = result.custom_data.get("winner_name")
-            for p in result.player_results:
-                if p.is_bot and not p.is_virtual_bot:
-                    continue
-                if p.player_id not in player_stats:
-                    player_stats[p.player_id] = {
-                        "wins": 0,
-                        "losses": 0,
-                        "name": p.player_name,
-                    }
-                if winner_name == p.player_name:
-                    player_stats[p.player_id]["wins"] += 1
-                else:
-                    player_stats[p.player_id]["losses"] += 1
-
-        # Sort by wins descending
-        sorted_players = sorted(player_stats.items(), key=lambda x: x[1]["wins"], reverse=True)
-
         items = []
 
-        for rank, (player_id, stats) in enumerate(sorted_players[:10], 1):
-            wins = stats["wins"]
-            losses = stats["losses"]
-            total = wins + losses
+        for entry in self._db.get_leaderboard(game_type, "wins", limit=10):
+            wins = entry["value"]
+            total = entry["games_played"]
+            losses = total - wins
             percentage = round((wins / total * 100) if total > 0 else 0)
             items.append(
                 MenuItem(
                     text=Localization.get(
                         user.locale,
                         "leaderboard-wins-entry",
-                        rank=rank,
-                        player=stats["name"],
+                        rank=entry["rank"],
+                        player=entry["player_name"],
                         wins=wins,
                         losses=losses,
                         percentage=percentage,
                     ),
-                    id=f"entry_{rank}",
+                    id=f"entry_{entry['rank']}",
                 )
             )
 
@@ -3231,20 +3459,11 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
                 )
             )
         else:
+            names = self._db.get_latest_player_names(
+                game_type, [rating.player_id for rating in ratings]
+            )
             for rank, rating in enumerate(ratings, 1):
-                # Get player name from UUID - check recent game results
-                player_name = rating.player_id
-                # Look up name from game results
-                results = self._db.get_game_stats(game_type, limit=100)
-                for result in results:
-                    players = self._db.get_game_result_players(result[0])
-                    for p in players:
-                        if p["player_id"] == rating.player_id:
-                            player_name = p["player_name"]
-                            break
-                    if player_name != rating.player_id:
-                        break
-
+                player_name = names.get(rating.player_id, rating.player_id)
                 items.append(
                     MenuItem(
                         text=Localization.get(
@@ -3284,40 +3503,19 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             game_type: Game type identifier.
             game_name: Localized game name.
         """
-        from ..game_utils.stats_helpers import LeaderboardHelper
-
-        game_results = self._get_game_results(game_type)
-
-        # Build total scores per player
-        player_scores: dict[str, dict] = {}
-        for result in game_results:
-            final_scores = result.custom_data.get("final_scores", {})
-            for p in result.player_results:
-                if p.is_bot and not p.is_virtual_bot:
-                    continue
-                if p.player_id not in player_scores:
-                    player_scores[p.player_id] = {"total": 0, "name": p.player_name}
-                # Try to get score by player name
-                score = final_scores.get(p.player_name, 0)
-                if score:
-                    player_scores[p.player_id]["total"] += score
-
-        # Sort by total score descending
-        sorted_players = sorted(player_scores.items(), key=lambda x: x[1]["total"], reverse=True)
-
         items = []
 
-        for rank, (player_id, stats) in enumerate(sorted_players[:10], 1):
+        for entry in self._db.get_leaderboard(game_type, "total_score", limit=10):
             items.append(
                 MenuItem(
                     text=Localization.get(
                         user.locale,
                         "leaderboard-score-entry",
-                        rank=rank,
-                        player=stats["name"],
-                        value=int(stats["total"]),
+                        rank=entry["rank"],
+                        player=entry["player_name"],
+                        value=int(entry["value"]),
                     ),
-                    id=f"entry_{rank}",
+                    id=f"entry_{entry['rank']}",
                 )
             )
 
@@ -3345,37 +3543,19 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             game_type: Game type identifier.
             game_name: Localized game name.
         """
-        game_results = self._get_game_results(game_type)
-
-        # Build high scores per player
-        player_high: dict[str, dict] = {}
-        for result in game_results:
-            final_scores = result.custom_data.get("final_scores", {})
-            for p in result.player_results:
-                if p.is_bot and not p.is_virtual_bot:
-                    continue
-                score = final_scores.get(p.player_name, 0)
-                if p.player_id not in player_high:
-                    player_high[p.player_id] = {"high": score, "name": p.player_name}
-                elif score > player_high[p.player_id]["high"]:
-                    player_high[p.player_id]["high"] = score
-
-        # Sort by high score descending
-        sorted_players = sorted(player_high.items(), key=lambda x: x[1]["high"], reverse=True)
-
         items = []
 
-        for rank, (player_id, stats) in enumerate(sorted_players[:10], 1):
+        for entry in self._db.get_leaderboard(game_type, "high_score", limit=10):
             items.append(
                 MenuItem(
                     text=Localization.get(
                         user.locale,
                         "leaderboard-score-entry",
-                        rank=rank,
-                        player=stats["name"],
-                        value=int(stats["high"]),
+                        rank=entry["rank"],
+                        player=entry["player_name"],
+                        value=int(entry["value"]),
                     ),
-                    id=f"entry_{rank}",
+                    id=f"entry_{entry['rank']}",
                 )
             )
 
@@ -3403,34 +3583,19 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             game_type: Game type identifier.
             game_name: Localized game name.
         """
-        game_results = self._get_game_results(game_type)
-
-        # Count games per player
-        player_games: dict[str, dict] = {}
-        for result in game_results:
-            for p in result.player_results:
-                if p.is_bot and not p.is_virtual_bot:
-                    continue
-                if p.player_id not in player_games:
-                    player_games[p.player_id] = {"count": 0, "name": p.player_name}
-                player_games[p.player_id]["count"] += 1
-
-        # Sort by games played descending
-        sorted_players = sorted(player_games.items(), key=lambda x: x[1]["count"], reverse=True)
-
         items = []
 
-        for rank, (player_id, stats) in enumerate(sorted_players[:10], 1):
+        for entry in self._db.get_leaderboard(game_type, "games_played", limit=10):
             items.append(
                 MenuItem(
                     text=Localization.get(
                         user.locale,
                         "leaderboard-games-entry",
-                        rank=rank,
-                        player=stats["name"],
-                        value=stats["count"],
+                        rank=entry["rank"],
+                        player=entry["player_name"],
+                        value=entry["value"],
                     ),
-                    id=f"entry_{rank}",
+                    id=f"entry_{entry['rank']}",
                 )
             )
 
@@ -3448,31 +3613,6 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             "game_name": game_name,
         }
 
-    def _extract_value_from_path(
-        self, data: dict, path: str, player_id: str, player_name: str
-    ) -> float | None:
-        """Extract a value from custom_data using a dot-separated path.
-
-        Supports {player_id} and {player_name} placeholders in path.
-        """
-        # Replace placeholders
-        resolved_path = path.replace("{player_id}", player_id)
-        resolved_path = resolved_path.replace("{player_name}", player_name)
-
-        # Navigate the path
-        parts = resolved_path.split(".")
-        current = data
-        for part in parts:
-            if isinstance(current, dict) and part in current:
-                current = current[part]
-            else:
-                return None
-
-        # Convert to float if possible
-        if isinstance(current, (int, float)):
-            return float(current)
-        return None
-
     def _show_custom_leaderboard(
         self,
         user: NetworkUser,
@@ -3488,95 +3628,26 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             game_name: Localized game name.
             config: Leaderboard config dict from game class.
         """
-        game_results = self._get_game_results(game_type)
-
-        lb_id = config["id"]
-        aggregate = config.get("aggregate", "sum")
         format_key = config.get("format", "score")
         decimals = config.get("decimals", 0)
 
-        # Check if this is a ratio calculation or simple path
-        is_ratio = "numerator" in config and "denominator" in config
-
-        # Aggregate data per player
-        player_data: dict[str, dict] = {}
-
-        for result in game_results:
-            custom_data = result.custom_data
-            for p in result.player_results:
-                if p.is_bot and not p.is_virtual_bot:
-                    continue
-
-                if p.player_id not in player_data:
-                    player_data[p.player_id] = {
-                        "name": p.player_name,
-                        "values": [],
-                        "numerators": [],
-                        "denominators": [],
-                    }
-
-                if is_ratio:
-                    num = self._extract_value_from_path(
-                        custom_data, config["numerator"], p.player_id, p.player_name
-                    )
-                    denom = self._extract_value_from_path(
-                        custom_data, config["denominator"], p.player_id, p.player_name
-                    )
-                    if num is not None and denom is not None:
-                        player_data[p.player_id]["numerators"].append(num)
-                        player_data[p.player_id]["denominators"].append(denom)
-                else:
-                    value = self._extract_value_from_path(
-                        custom_data, config["path"], p.player_id, p.player_name
-                    )
-                    if value is not None:
-                        player_data[p.player_id]["values"].append(value)
-
-        # Calculate final values based on aggregate type
-        player_scores: list[tuple[str, str, float]] = []
-
-        for player_id, data in player_data.items():
-            if is_ratio:
-                total_num = sum(data["numerators"])
-                total_denom = sum(data["denominators"])
-                if total_denom > 0:
-                    value = total_num / total_denom
-                    player_scores.append((player_id, data["name"], value))
-            else:
-                values = data["values"]
-                if not values:
-                    continue
-
-                if aggregate == "sum":
-                    value = sum(values)
-                elif aggregate == "max":
-                    value = max(values)
-                elif aggregate == "avg":
-                    value = sum(values) / len(values)
-                else:
-                    value = sum(values)
-
-                player_scores.append((player_id, data["name"], value))
-
-        # Sort descending
-        player_scores.sort(key=lambda x: x[2], reverse=True)
-
         # Build menu items
         items = []
         entry_key = f"leaderboard-{format_key}-entry"
 
-        for rank, (player_id, name, value) in enumerate(player_scores[:10], 1):
+        for entry in self._db.get_custom_leaderboard(game_type, config["id"], limit=10):
+            value = entry["value"]
             display_value = round(value, decimals) if decimals > 0 else int(value)
             items.append(
                 MenuItem(
                     text=Localization.get(
                         user.locale,
                         entry_key,
-                        rank=rank,
-                        player=name,
+                        rank=entry["rank"],
+                        player=entry["player_name"],
                         value=display_value,
                     ),
-                    id=f"entry_{rank}",
+                    id=f"entry_{entry['rank']}",
                 )
             )
 
@@ -3671,21 +3742,15 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
 
         Returns True if the menu was shown, False if there was nothing to show.
         """
-        categories = GameRegistry.get_by_category()
+        categories = GameRegistry.get_infos_by_category()
+        played = self._db.get_player_game_types(user.uuid)
         items = []
 
         # Add only games where the user has stats
         for category_key in sorted(categories.keys()):
             for game_class in categories[category_key]:
                 game_type = game_class.get_type()
-                # Check if user has played this game
-                game_results = self._get_game_results(game_type)
-                has_stats = any(
-                    p.player_id == user.uuid
-                    for result in game_results
-                    for p in result.player_results
-                )
-                if has_stats:
+                if game_type in played:
                     game_name = Localization.get(user.locale, game_class.get_name_key())
                     items.append(MenuItem(text=game_name, id=f"stats_{game_type}"))
 
@@ -3719,40 +3784,17 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             return
 
         game_name = Localization.get(user.locale, game_class.get_name_key())
-        game_results = self._get_game_results(game_type)
-
-        # Calculate player's personal stats
-        wins = 0
-        losses = 0
-        total_score = 0
-        high_score = 0
-        games_played = 0
-
-        for result in game_results:
-            winner_name = result.custom_data.get("winner_name")
-            final_scores = result.custom_data.get("final_scores", {})
-            final_light = result.custom_data.get("final_light", {})
-
-            for p in result.player_results:
-                if p.player_id == user.uuid:
-                    games_played += 1
-                    if winner_name == p.player_name:
-                        wins += 1
-                    else:
-                        losses += 1
-
-                    # Get score from final_scores or final_light (for Light Turret)
-                    score = final_scores.get(p.player_name, 0)
-                    if not score:
-                        score = final_light.get(p.player_name, 0)
-                    total_score += score
-                    if score > high_score:
-                        high_score = score
-
-        if games_played == 0:
+        stats = self._db.get_player_game_stats(user.uuid, game_type)
+        if not stats:
             user.speak_l("my-stats-no-data")
             return
 
+        games_played = stats["games_played"]
+        wins = stats["wins"]
+        losses = games_played - wins
+        total_score = stats["total_score"]
+        high_score = stats["high_score"]
+
         items = []
         # Basic stats
         winrate = round((wins / games_played * 100) if games_played > 0 else 0)
@@ -3822,7 +3864,7 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             )
 
         # Game-specific stats from custom leaderboard configs
-        self._add_custom_stats(user, game_class, game_results, items)
+        self._add_custom_stats(user, game_class, stats["custom"], items)
 
         items.append(MenuItem(text=Localization.get(user.locale, "back"), id="back"))
 
@@ -3842,7 +3884,7 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         self,
         user: NetworkUser,
         game_class,
-        game_results: list,
+        custom_values: dict[str, float],
         items: list,
     ) -> None:
         """Add game-specific custom stats from leaderboard configs.
@@ -3850,105 +3892,19 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         Args:
             user: Acting user.
             game_class: Game class for leaderboard config.
-            game_results: GameResult list for the game.
+            custom_values: The user's aggregated value per leaderboard id.
             items: Menu item list to append to.
         """
         for config in game_class.get_leaderboard_types():
-            custom_stat = self._build_custom_stat(user, config, game_results)
-            if not custom_stat:
+            lb_id = config["id"]
+            if lb_id not in custom_values:
                 continue
-            lb_id, text = custom_stat
+            formatted_value = self._format_custom_stat_value(
+                custom_values[lb_id], config.get("decimals", 0)
+            )
+            text = self._format_custom_stat_text(user, lb_id, formatted_value)
             items.append(MenuItem(text=text, id=f"custom_{lb_id}"))
 
-    def _build_custom_stat(
-        self, user: NetworkUser, config: dict, game_results: list
-    ) -> tuple[str, str] | None:
-        """Build a custom stat string from leaderboard config."""
-        lb_id = config["id"]
-        aggregate = config.get("aggregate", "sum")
-        decimals = config.get("decimals", 0)
-        values, num_values, denom_values = self._collect_custom_stat_values(
-            user, config, game_results
-        )
-
-        final_value = self._aggregate_custom_stat(values, num_values, denom_values, aggregate)
-        if final_value is None:
-            return None
-
-        formatted_value = self._format_custom_stat_value(final_value, decimals)
-        text = self._format_custom_stat_text(user, lb_id, formatted_value)
-        return lb_id, text
-
-    def _collect_custom_stat_values(
-        self, user: NetworkUser, config: dict, game_results: list
-    ) -> tuple[list[float], list[float], list[float]]:
-        """Extract raw custom stat values for a user across game results."""
-        path = config.get("path")
-        numerator_path = config.get("numerator")
-        denominator_path = config.get("denominator")
-
-        values: list[float] = []
-        num_values: list[float] = []
-        denom_values: list[float] = []
-
-        for result in game_results:
-            player_name = self._find_player_name(result, user.uuid)
-            if not player_name:
-                continue
-
-            custom_data = result.custom_data
-            if path:
-                resolved_path = self._resolve_stat_path(path, player_name, user.uuid)
-                value = self._extract_path_value(custom_data, resolved_path)
-                if value is not None:
-                    values.append(value)
-            elif numerator_path and denominator_path:
-                num_path = self._resolve_stat_path(numerator_path, player_name, user.uuid)
-                denom_path = self._resolve_stat_path(denominator_path, player_name, user.uuid)
-                num_val = self._extract_path_value(custom_data, num_path)
-                denom_val = self._extract_path_value(custom_data, denom_path)
-                if num_val is not None and denom_val is not None:
-                    num_values.append(num_val)
-                    denom_values.append(denom_val)
-
-        return values, num_values, denom_values
-
-    def _find_player_name(self, result, player_id: str) -> str | None:
-        """Find the player name for a given player id in a result."""
-        for p in result.player_results:
-            if p.player_id == player_id:
-                return p.player_name
-        return None
-
-    def _resolve_stat_path(self, path: str, player_name: str, player_id: str) -> str:
-        """Substitute player tokens in stat paths."""
-        return path.replace("{player_name}", player_name).replace("{player_id}", player_id)
-
-    def _aggregate_custom_stat(
-        self,
-        values: list[float],
-        num_values: list[float],
-        denom_values: list[float],
-        aggregate: str,
-    ) -> float | None:
-        """Aggregate raw stat values based on config rules."""
-        if values:
-            if aggregate == "sum":
-                return sum(values)
-            if aggregate == "max":
-                return max(values)
-            if aggregate == "avg":
-                return sum(values) / len(values)
-            return None
-
-        if num_values and denom_values:
-            total_num = sum(num_values)
-            total_denom = sum(denom_values)
-            if total_denom > 0:
-                return total_num / total_denom
-
-        return None
-
     def _format_custom_stat_value(self, value: float, decimals: int) -> str:
         """Format a custom stat value for display."""
         if decimals > 0:
@@ -3966,27 +3922,6 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         type_name = Localization.get(user.locale, type_key)
         return f"{type_name}: {formatted_value}"
 
-    def _extract_path_value(self, data: dict, path: str) -> float | None:
-        """Extract a value from nested dict using dot-notation path.
-
-        Args:
-            data: Nested dict to read from.
-            path: Dot-separated path string.
-
-        Returns:
-            Float value if found, otherwise None.
-        """
-        parts = path.split(".")
-        current = data
-        for part in parts:
-            if isinstance(current, dict) and part in current:
-                current = current[part]
-            else:
-                return None
-        if isinstance(current, (int, float)):
-            return float(current)
-        return None
-
     async def _handle_my_stats_selection(
         self, user: NetworkUser, selection_id: str, state: dict
     ) -> None:
@@ -4054,8 +3989,14 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
                 for p in result.player_results
             ],
             custom_data=result.custom_data,
+            leaderboard_types=self._leaderboard_types(result.game_type),
         )
 
+    def _leaderboard_types(self, game_type: str) -> list[dict]:
+        """Custom leaderboard configs of a game type (none if it is unknown)."""
+        game_class = get_game_class(game_type)
+        return game_class.get_leaderboard_types() if game_class else []
+
     def on_table_save(self, table, username: str) -> None:
         """Handle table save request.
 
@@ -4073,8 +4014,8 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         # Generate save name
         save_name = f"{game.get_name()} - {datetime.now():%Y-%m-%d %H:%M}"
 
-        # Get game JSON
-        game_json = game.to_json()
+        # Serialize game state
+        game_json = self._tables.codec.encode(game)
 
         # Build members list (includes bot status)
         members_data = []
@@ -4218,22 +4159,20 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         if convo == "local":
             table = self._tables.find_user_table(username)
             if table:
-                for member_name in [m.username for m in table.members]:
-                    user = self._users.get(member_name)
-                    if user and user.approved:  # Only send to approved users
-                        await user.connection.send(chat_packet)
+                members = [self._users.get(m.username) for m in table.members]
+                recipients = [user for user in members if user and user.approved]
             else:
-                for user in self._users.values():
-                    if not user.approved:
-                        continue
-                    if self._tables.find_user_table(user.username):
-                        continue
-                    await user.connection.send(chat_packet)
+                recipients = [
+                    user
+                    for user in self._users.values()
+                    if user.approved and not self._tables.find_user_table(user.username)
+                ]
         elif convo == "global":
             # Broadcast to all approved users only
-            for user in self._users.values():
-                if user.approved:
-                    await user.connection.send(chat_packet)
+            recipients = [user for user in self._users.values() if user.approved]
+        else:
+            return
+        await fan_out([user.connection for user in recipients if user.connection], chat_packet)
 
     def _get_online_usernames(self) -> list[str]:
         """Return sorted list of online usernames."""
@@ -4406,6 +4345,7 @@ async def run_server(
     ssl_cert: str | Path | None = None,
     ssl_key: str | Path | None = None,
     preload_locales: bool = False,
+    preload_games: bool = False,
 ) -> None:
     """Run the server.
 
@@ -4415,6 +4355,8 @@ async def run_server(
         ssl_cert: Path to SSL certificate file (falls back to [network].ssl_cert in config)
         ssl_key: Path to SSL private key file (falls back to [network].ssl_key in config)
         preload_locales: Whether to block on localization compilation.
+        preload_games: Whether to import every game module before starting
+            (default: each game is imported when first used).
     """
     _configure_logging()
     _install_exception_handlers(asyncio.get_running_loop())
@@ -4434,6 +4376,9 @@ async def run_server(
     port = _resolve_port(port, config_path)
     ssl_cert, ssl_key = _resolve_ssl(ssl_cert, ssl_key, config_path)
 
+    if preload_games:
+        GameRegistry.load_all()
+
     print(f"Starting PlayPalace v{VERSION} server...")
     server = Server(
         host=host,
@@ -0,0 +1,131 @@
+"""Periodic, incremental saving of open tables."""
+
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+from .table import Table
+
+if TYPE_CHECKING:
+    from .manager import TableManager
+    from ...persistence.database import Database
+
+DEFAULT_CHECKPOINT_INTERVAL_SECONDS = 30.0
+DEFAULT_CHECKPOINT_BUDGET_MS = 5.0
+
+
+def _table_fingerprint(table: Table) -> int:
+    """Hash of everything save_table writes for a table."""
+    members = tuple((m.username, m.is_spectator) for m in table.members)
+    return hash((table.game_type, table.host, members, table.game_json, table.status))
+
+
+class TableCheckpointer:
+    """Save changed tables to the database in small slices between ticks.
+
+    Every ``interval_s`` a round starts: tables marked dirty since they were
+    last saved are queued, and tables that have closed are deleted from the
+    database. Each tick then serializes queued tables until ``budget_s`` is
+    spent (always at least one), skips any whose saved row would not change,
+    and writes the rest with one save_all_tables call. A crash therefore
+    loses at most one interval of play instead of every open game.
+    """
+
+    def __init__(
+        self,
+        manager: "TableManager",
+        db: "Database",
+        interval_s: float = DEFAULT_CHECKPOINT_INTERVAL_SECONDS,
+        budget_s: float = DEFAULT_CHECKPOINT_BUDGET_MS / 1000.0,
+    ):
+        """
+        Initialize the checkpointer.
+
+        Args:
+            manager: Table manager whose tables are saved.
+            db: Database to save them to.
+            interval_s: Seconds between checkpoint rounds; 0 disables them
+                (checkpoint_all() still works).
+            budget_s: Serialization time allowed per tick.
+        """
+        self._manager = manager
+        self._db = db
+        self.interval_s = interval_s
+        self.budget_s = budget_s
+        # table id -> fingerprint of the row last written to the database
+        self._saved: dict[str, int] = {}
+        self._queue: deque[str] = deque()
+        self._next_round = time.monotonic() + interval_s
+        self.rounds = 0
+        self.tables_saved = 0
+        self.tables_unchanged = 0
+
+    def mark_saved(self, table: Table) -> None:
+        """Record a table as matching its database row (e.g. just loaded)."""
+        table._dirty = False
+        self._saved[table.table_id] = _table_fingerprint(table)
+
+    def on_tick(self) -> int:
+        """Advance checkpointing by up to one time budget.
+
+        Returns:
+            Number of tables written this tick.
+        """
+        if not self._queue:
+            if self.interval_s <= 0 or time.monotonic() < self._next_round:
+                return 0
+            self._next_round = time.monotonic() + self.interval_s
+            self._start_round()
+        return self._save_queued(time.perf_counter() + self.budget_s)
+
+    def checkpoint_all(self) -> tuple[int, int]:
+        """Save every changed table now, ignoring the budget (for shutdown).
+
+        Tables not marked dirty are checked as well, since on_tick code may
+        change a game without marking it (a timer counting down, say).
+
+        Returns:
+            (tables written, tables whose row was unchanged)
+        """
+        saved = self.tables_saved
+        unchanged = self.tables_unchanged
+        self._start_round(every_table=True)
+        self._save_queued(None)
+        return self.tables_saved - saved, self.tables_unchanged - unchanged
+
+    def _start_round(self, every_table: bool = False) -> None:
+        """Queue dirty (or all) tables and delete rows of tables that are gone."""
+        self.rounds += 1
+        tables = self._manager.get_all_tables()
+        open_ids = {table.table_id for table in tables}
+        for table_id in [table_id for table_id in self._saved if table_id not in open_ids]:
+            del self._saved[table_id]
+            self._db.delete_table(table_id)
+        queued = set(self._queue)
+        self._queue.extend(
+            table.table_id
+            for table in tables
+            if (every_table or table._dirty) and table.table_id not in queued
+        )
+
+    def _save_queued(self, deadline: float | None) -> int:
+        """Serialize queued tables until the deadline and write the changed ones."""
+        changed: list[Table] = []
+        while self._queue:
+            table = self._manager.get_table(self._queue.popleft())
+            if table is not None:
+                # Cleared first: anything that changes the table from here on dirties it again.
+                table._dirty = False
+                table.save_game_state()
+                fingerprint = _table_fingerprint(table)
+                if self._saved.get(table.table_id) == fingerprint:
+                    self.tables_unchanged += 1
+                else:
+                    self._saved[table.table_id] = fingerprint
+                    changed.append(table)
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        if changed:
+            self._db.save_all_tables(changed)
+            self.tables_saved += len(changed)
+        return len(changed)
@@ -1,9 +1,13 @@
 """Table manager for tracking all active tables."""
 
+import heapq
+import time
 from typing import TYPE_CHECKING, Any
 import uuid
 
 from .table import Table
+from ..tick import DurationHistogram
+from ...persistence.game_codec import DEFAULT_GAME_CODEC, GameCodec
 
 if TYPE_CHECKING:
     from server.core.users.base import User
@@ -15,7 +19,21 @@ class TableManager:
     def __init__(self):
         """Initialize the table registry."""
         self._tables: dict[str, Table] = {}
+        # username -> the table that user is in, kept in sync by Table.add_member,
+        # Table.remove_member and remove_table so lookups don't scan every table
+        self._user_tables: dict[str, Table] = {}
         self._server: Any = None  # Reference to server for destroy/save notifications
+        # Format tables serialize their games in; any format can be read back
+        self.codec: GameCodec = DEFAULT_GAME_CODEC
+        # Per-game-type cost of Table.on_tick, for finding which games dominate a tick
+        self._tick_costs: dict[str, DurationHistogram] = {}
+        # Idle tables are not ticked. _sleeping maps a table id to the manager
+        # tick it wakes at (None: when a player acts); _wakeups is a min-heap of
+        # (tick, table id), with entries no longer in _sleeping ignored.
+        self._tick_number = 0
+        self._last_ticked: dict[str, int] = {}
+        self._sleeping: dict[str, int | None] = {}
+        self._wakeups: list[tuple[int, str]] = []
 
     def create_table(
         self,
@@ -53,7 +71,12 @@ class TableManager:
 
     def remove_table(self, table_id: str) -> None:
         """Remove a table by id."""
-        self._tables.pop(table_id, None)
+        table = self._tables.pop(table_id, None)
+        self._last_ticked.pop(table_id, None)
+        self._sleeping.pop(table_id, None)
+        if table is not None:
+            for member in table.members:
+                self.on_member_removed(table, member.username)
 
     def get_all_tables(self) -> list[Table]:
         """Get all tables."""
@@ -72,19 +95,109 @@ class TableManager:
 
     def find_user_table(self, username: str) -> Table | None:
         """Find the table a user is currently in."""
-        for table in self._tables.values():
-            for member in table.members:
-                if member.username == username:
-                    return table
-        return None
+        return self._user_tables.get(username)
+
+    def on_member_added(self, table: Table, username: str) -> None:
+        """Index a new table member. Called by Table.add_member()."""
+        self._user_tables.setdefault(username, table)
+        self.wake_table(table)
+
+    def on_member_removed(self, table: Table, username: str) -> None:
+        """Drop a member from the index. Called by Table.remove_member()."""
+        self.wake_table(table)
+        if self._user_tables.get(username) is not table:
+            return
+        del self._user_tables[username]
+        # A user in several tables (not normally allowed) falls back to the next one.
+        for other in self._tables.values():
+            if other is not table and any(m.username == username for m in other.members):
+                self._user_tables[username] = other
+                return
 
     def on_tick(self) -> None:
-        """Tick all active tables and destroy empty ones."""
-        for table in list(self._tables.values()):
+        """Tick all active tables and destroy empty ones.
+
+        A table whose game has nothing to do before a later tick (see
+        Game.next_wakeup_tick) sleeps until then, or until wake_table().
+        """
+        self._tick_number += 1
+        wakeups = self._wakeups
+        while wakeups and wakeups[0][0] <= self._tick_number:
+            tick, table_id = heapq.heappop(wakeups)
+            if self._sleeping.get(table_id, -1) == tick:
+                del self._sleeping[table_id]
+        for table_id, table in list(self._tables.items()):
             if not table.members:
                 table.destroy()
                 continue
+            if table_id in self._sleeping:
+                continue
+            self._catch_up(table, self._tick_number - 1)
+            started = time.perf_counter()
             table.on_tick()
+            elapsed = time.perf_counter() - started
+            histogram = self._tick_costs.get(table.game_type)
+            if histogram is None:
+                histogram = self._tick_costs[table.game_type] = DurationHistogram()
+            histogram.record(elapsed)
+            self._last_ticked[table_id] = self._tick_number
+            self._schedule_wakeup(table)
+
+    def wake_table(self, table: Table) -> None:
+        """Tick a sleeping table again from the next tick on.
+
+        Called before a game changes state outside on_tick, so its scheduler
+        clock is caught up before anything is scheduled against it.
+        """
+        if self._sleeping.pop(table.table_id, -1) != -1:
+            self._catch_up(table, self._tick_number)
+
+    def _catch_up(self, table: Table, through_tick: int) -> None:
+        """Advance a game's scheduler clock over the ticks it slept through."""
+        last = self._last_ticked.get(table.table_id)
+        if last is None or last >= through_tick:
+            return
+        self._last_ticked[table.table_id] = through_tick
+        if table.game:
+            table.game.advance_sound_scheduler(through_tick - last)
+
+    def _schedule_wakeup(self, table: Table) -> None:
+        """Put a table to sleep if its game has no work due on the next tick."""
+        game = table.game
+        if game is None:
+            wake_at = None
+        else:
+            due = game.next_wakeup_tick()
+            if due is not None and due <= game.sound_scheduler_tick:
+                return
+            # The game sees its clock at sound_scheduler_tick on the next tick.
+            wake_at = None if due is None else self._tick_number + 1 + due - game.sound_scheduler_tick
+        self._sleeping[table.table_id] = wake_at
+        if wake_at is not None:
+            heapq.heappush(self._wakeups, (wake_at, table.table_id))
+
+    def get_sleeping_count(self) -> int:
+        """Return how many tables are currently skipped as idle."""
+        return len(self._sleeping)
+
+    def get_tick_costs(self) -> dict[str, dict]:
+        """Return per-game-type table tick cost, most expensive first.
+
+        Each entry is a DurationHistogram snapshot plus ``total_ms`` (all time
+        spent ticking tables of that type) and ``tables`` (how many are open).
+        """
+        open_tables: dict[str, int] = {}
+        for table in self._tables.values():
+            open_tables[table.game_type] = open_tables.get(table.game_type, 0) + 1
+        ranked = sorted(self._tick_costs.items(), key=lambda item: item[1].total_s, reverse=True)
+        return {
+            game_type: {
+                **histogram.snapshot(),
+                "total_ms": round(histogram.total_s * 1000.0, 3),
+                "tables": open_tables.get(game_type, 0),
+            }
+            for game_type, histogram in ranked
+        }
 
     def add_table(self, table: Table) -> None:
         """Add an existing table (e.g., loaded from database)."""
@@ -93,6 +206,8 @@ class TableManager:
         if self._server:
             table._db = self._server._db
         self._tables[table.table_id] = table
+        for member in table.members:
+            self.on_member_added(table, member.username)
 
     def save_all(self) -> list[Table]:
         """Save all tables' game state and return them."""
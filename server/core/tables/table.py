@@ -35,7 +35,7 @@ class Table(DataClassJSONMixin):
     game_type: str
     host: str
     members: list[TableMember] = field(default_factory=list)
-    game_json: str | None = None  # Serialized game state
+    game_json: str | bytes | None = None  # Serialized game state (see GameCodec)
     status: str = "waiting"  # waiting, playing, finished
 
     # Not serialized
@@ -44,6 +44,7 @@ class Table(DataClassJSONMixin):
     _manager: Any = field(default=None, repr=False)  # Reference to TableManager
     _server: Any = field(default=None, repr=False)  # Reference to Server (for saves)
     _db: Any = field(default=None, repr=False)  # Reference to Database (for ratings)
+    _dirty: bool = field(default=True, repr=False)  # Changed since last checkpoint
 
     def __post_init__(self):
         """Initialize non-serialized runtime references."""
@@ -52,6 +53,7 @@ class Table(DataClassJSONMixin):
         self._manager = None
         self._server = None
         self._db = None
+        self._dirty = True
 
     @property
     def game(self) -> "Game | None":
@@ -63,7 +65,8 @@ class Table(DataClassJSONMixin):
         """Set the game instance and update serialized state."""
         self._game = value
         if value:
-            self.game_json = value.to_json()
+            self.game_json = self._encode_game(value)
+        self.wake()
 
     def add_member(self, username: str, user: "User", as_spectator: bool = False) -> None:
         """Add a member to the table.
@@ -80,11 +83,17 @@ class Table(DataClassJSONMixin):
 
         self.members.append(TableMember(username=username, is_spectator=as_spectator))
         self._users[username] = user
+        self._dirty = True
+        if self._manager:
+            self._manager.on_member_added(self, username)
 
     def remove_member(self, username: str) -> None:
         """Remove a member from the table."""
         self.members = [m for m in self.members if m.username != username]
         self._users.pop(username, None)
+        self._dirty = True
+        if self._manager:
+            self._manager.on_member_removed(self, username)
 
         # Destroy table if it's empty
         if not self.members:
@@ -121,14 +130,35 @@ class Table(DataClassJSONMixin):
         for user in self._users.values():
             user.play_sound(name, volume)
 
+    def mark_dirty(self) -> None:
+        """Have the next checkpoint save this table."""
+        self._dirty = True
+
+    def wake(self) -> None:
+        """Resume ticking this table if the manager put it to sleep.
+
+        Called before the game changes outside on_tick, so it also marks
+        the table for the next checkpoint.
+        """
+        self.mark_dirty()
+        if self._manager:
+            self._manager.wake_table(self)
+
     def on_tick(self) -> None:
-        """Called every tick. Forwards to game."""
+        """Called every tick. Forwards to game, refreshing menus once at the end.
+
+        Ticking alone does not mark the table for a checkpoint; the game
+        does that when an action, scheduled event or timer changes it (see
+        Game.mark_changed).
+        """
         if self._game:
-            self._game.on_tick()
+            with self._game.deferred_menu_updates():
+                self._game.on_tick()
 
     def handle_event(self, username: str, event: dict) -> None:
         """Handle an event from a member."""
         if self._game:
+            self.mark_dirty()
             # Find the player
             for player in self._game.players:
                 if player.name == username:
@@ -138,7 +168,14 @@ class Table(DataClassJSONMixin):
     def save_game_state(self) -> None:
         """Save the current game state to game_json."""
         if self._game:
-            self.game_json = self._game.to_json()
+            self.game_json = self._encode_game(self._game)
+
+    def _encode_game(self, game: "Game") -> str | bytes:
+        """Serialize a game with the manager's codec."""
+        from ...persistence.game_codec import DEFAULT_GAME_CODEC
+
+        codec = self._manager.codec if self._manager is not None else DEFAULT_GAME_CODEC
+        return codec.encode(game)
 
     def can_start(self, min_players: int) -> bool:
         """Check if the game can start."""
@@ -3,6 +3,8 @@
 import asyncio
 import logging
 import sys
+import time
+from bisect import bisect_left
 from pathlib import Path
 from typing import Callable
 
@@ -11,6 +13,17 @@ LOG = logging.getLogger("playpalace.tick")
 # Default tick interval
 DEFAULT_TICK_INTERVAL_MS = 50
 
+# Overrun policies: replay missed ticks back-to-back, or drop them.
+OVERRUN_CATCH_UP = "catch_up"
+OVERRUN_SKIP = "skip"
+OVERRUN_POLICIES = (OVERRUN_CATCH_UP, OVERRUN_SKIP)
+DEFAULT_OVERRUN_POLICY = OVERRUN_CATCH_UP
+# Maximum missed ticks replayed under catch_up before the rest are dropped
+DEFAULT_MAX_CATCH_UP_TICKS = 5
+
+# Histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 250, 500, 1000)
+
 
 from .config_paths import get_default_config_path
 
@@ -50,6 +63,140 @@ def load_server_config(path: str | Path | None = None) -> dict:
     return data.get("server", {})
 
 
+class DurationHistogram:
+    """Fixed-bucket histogram of durations with count, total and max."""
+
+    def __init__(self, buckets_ms: tuple[int, ...] = HISTOGRAM_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self._bounds_s = [bound / 1000.0 for bound in buckets_ms]
+        self.counts = [0] * (len(buckets_ms) + 1)
+        self.count = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record one duration in seconds."""
+        self.counts[bisect_left(self._bounds_s, seconds)] += 1
+        self.count += 1
+        self.total_s += seconds
+        if seconds > self.max_s:
+            self.max_s = seconds
+
+    @property
+    def mean_ms(self) -> float:
+        """Average duration in milliseconds."""
+        if not self.count:
+            return 0.0
+        return self.total_s * 1000.0 / self.count
+
+    def percentile_ms(self, percentile: float) -> float:
+        """
+        Estimate a percentile in milliseconds.
+
+        Returns the upper bound of the bucket holding the percentile, or the
+        observed maximum when it falls in the open-ended last bucket.
+        """
+        if not self.count:
+            return 0.0
+        target = self.count * percentile / 100.0
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target and bucket_count:
+                if index < len(self.buckets_ms):
+                    return min(float(self.buckets_ms[index]), self.max_s * 1000.0)
+                break
+        return self.max_s * 1000.0
+
+    def reset(self) -> None:
+        """Clear all recorded samples."""
+        self.counts = [0] * (len(self.buckets_ms) + 1)
+        self.count = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+
+    def snapshot(self) -> dict:
+        """Return a JSON-serializable summary of the histogram."""
+        buckets = {f"le_{bound}ms": count for bound, count in zip(self.buckets_ms, self.counts)}
+        buckets[f"gt_{self.buckets_ms[-1]}ms"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.mean_ms, 3),
+            "p95_ms": round(self.percentile_ms(95), 3),
+            "max_ms": round(self.max_s * 1000.0, 3),
+            "buckets": buckets,
+        }
+
+
+class TickMetrics:
+    """
+    Tick timing telemetry shared by the scheduler and the tick callback.
+
+    The scheduler records whole-tick durations, overruns and skipped ticks.
+    The tick callback records how long each of its phases took via
+    record_phase(); when a tick goes over budget, the slowest phase of that
+    tick is blamed for the overrun.
+    """
+
+    def __init__(self):
+        self.tick = DurationHistogram()
+        self.phases: dict[str, DurationHistogram] = {}
+        self.overruns = 0
+        self.skipped_ticks = 0
+        self.overruns_by_phase: dict[str, int] = {}
+        self._current_phases: dict[str, float] = {}
+
+    def begin_tick(self) -> None:
+        """Start collecting phase durations for a new tick."""
+        self._current_phases.clear()
+
+    def record_phase(self, name: str, seconds: float) -> None:
+        """Record how long a named tick phase took."""
+        histogram = self.phases.get(name)
+        if histogram is None:
+            histogram = self.phases[name] = DurationHistogram()
+        histogram.record(seconds)
+        self._current_phases[name] = self._current_phases.get(name, 0.0) + seconds
+
+    def end_tick(self, seconds: float, budget_s: float) -> None:
+        """Record a finished tick and attribute any overrun to its slowest phase."""
+        self.tick.record(seconds)
+        if seconds <= budget_s:
+            return
+        self.overruns += 1
+        if self._current_phases:
+            slowest = max(self._current_phases, key=self._current_phases.__getitem__)
+            self.overruns_by_phase[slowest] = self.overruns_by_phase.get(slowest, 0) + 1
+
+    def record_skipped(self, ticks: int) -> None:
+        """Record ticks dropped because the scheduler fell behind."""
+        self.skipped_ticks += ticks
+
+    def reset(self) -> None:
+        """Clear all collected telemetry."""
+        self.tick.reset()
+        self.phases.clear()
+        self.overruns = 0
+        self.skipped_ticks = 0
+        self.overruns_by_phase.clear()
+        self._current_phases.clear()
+
+    def snapshot(self) -> dict:
+        """Return a JSON-serializable view of all telemetry."""
+        return {
+            "tick": self.tick.snapshot(),
+            "overruns": self.overruns,
+            "skipped_ticks": self.skipped_ticks,
+            "phases": {
+                name: {
+                    **histogram.snapshot(),
+                    "overruns": self.overruns_by_phase.get(name, 0),
+                }
+                for name, histogram in self.phases.items()
+            },
+        }
+
+
 class TickScheduler:
     """
     Schedules game ticks at a fixed interval.
@@ -57,21 +204,43 @@ class TickScheduler:
     The tick callback is called synchronously within the async context.
     This keeps game logic simple while allowing async network I/O.
 
+    Ticks are scheduled against monotonic deadlines (start + n * interval)
+    rather than sleeping a full interval after each callback, so game clocks
+    do not drift from wall time when ticks take a while. When a tick runs past
+    its deadline the scheduler either replays the missed ticks back-to-back
+    (catch_up, bounded by max_catch_up_ticks) or drops them (skip).
+
     The tick interval can be configured via config.toml [server] section
     or passed directly to the constructor.
     """
 
-    def __init__(self, on_tick: Callable[[], None], tick_interval_ms: int | None = None):
+    def __init__(
+        self,
+        on_tick: Callable[[], None],
+        tick_interval_ms: int | None = None,
+        *,
+        overrun_policy: str = DEFAULT_OVERRUN_POLICY,
+        max_catch_up_ticks: int = DEFAULT_MAX_CATCH_UP_TICKS,
+        metrics: TickMetrics | None = None,
+    ):
         """
         Initialize the tick scheduler.
 
         Args:
             on_tick: Callback function to call on each tick.
             tick_interval_ms: Tick interval in milliseconds. If None, uses default (50ms).
+            overrun_policy: "catch_up" or "skip"; what to do with missed ticks.
+            max_catch_up_ticks: Most missed ticks replayed under catch_up.
+            metrics: Telemetry sink. A private one is created if omitted.
         """
+        if overrun_policy not in OVERRUN_POLICIES:
+            raise ValueError(f"Unknown tick overrun policy: {overrun_policy!r}")
         self._on_tick = on_tick
         self._running = False
         self._task: asyncio.Task | None = None
+        self.overrun_policy = overrun_policy
+        self.max_catch_up_ticks = max(0, max_catch_up_ticks)
+        self.metrics = metrics if metrics is not None else TickMetrics()
 
         # Set tick interval
         if tick_interval_ms is None:
@@ -96,12 +265,32 @@ class TickScheduler:
 
     async def _tick_loop(self) -> None:
         """Main tick loop."""
+        interval = self.tick_interval_s
+        metrics = self.metrics
+        deadline = time.monotonic()
         while self._running:
+            metrics.begin_tick()
+            started = time.perf_counter()
             try:
                 # Call tick callback synchronously
                 self._on_tick()
             except Exception:
                 LOG.exception("Error in tick callback")
+            metrics.end_tick(time.perf_counter() - started, interval)
+
+            deadline += interval
+            now = time.monotonic()
+            if now < deadline:
+                await asyncio.sleep(deadline - now)
+                continue
 
-            # Sleep for tick interval
-            await asyncio.sleep(self.tick_interval_s)
+            # Behind schedule: the next tick runs right away, and any further
+            # whole intervals missed are replayed or dropped per the policy.
+            missed = int((now - deadline) // interval)
+            allowed = self.max_catch_up_ticks if self.overrun_policy == OVERRUN_CATCH_UP else 0
+            dropped = missed - allowed
+            if dropped > 0:
+                deadline += dropped * interval
+                metrics.record_skipped(dropped)
+            # Still yield so network I/O is serviced between back-to-back ticks.
+            await asyncio.sleep(0)
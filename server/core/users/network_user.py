@@ -1,8 +1,10 @@
 """Network user implementation for real players."""
 
 import time
+from functools import lru_cache
 from typing import Any, TYPE_CHECKING
 
+from ...network.packet_encoder import SharedPacket
 from .base import User, MenuItem, EscapeBehavior, TrustLevel, generate_uuid
 from .preferences import UserPreferences
 
@@ -10,6 +12,64 @@ if TYPE_CHECKING:
     from ...network.websocket_server import ClientConnection
 
 
+@lru_cache(maxsize=1024)
+def _speak_packet(text: str, buffer: str) -> SharedPacket:
+    """
+    Return the shared speak packet for a text and buffer.
+
+    Broadcasts queue the same speech for every player at a table; sharing
+    one packet lets the encoder serialize it once for all of them.
+    """
+    if buffer == "misc":
+        return SharedPacket(type="speak", text=text)
+    return SharedPacket(type="speak", text=text, buffer=buffer)
+
+
+def _menu_item_ids(items: list[str | dict]) -> list[str] | None:
+    """Return the ids of a menu's items, or None unless every item has a unique id."""
+    ids = []
+    for item in items:
+        if not isinstance(item, dict) or not isinstance(item.get("id"), str):
+            return None
+        ids.append(item["id"])
+    if len(set(ids)) != len(ids):
+        return None
+    return ids
+
+
+def diff_menu_items(old_items: list[str | dict], new_items: list[str | dict]) -> list[dict] | None:
+    """
+    Compute menu_patch ops turning old_items into new_items.
+
+    Items are matched by id. Removals come first, then inserts and replaces
+    in new-list order, so each insert index is final once applied.
+
+    Returns:
+        The ops, or None when the lists cannot be diffed (items without
+        unique ids, or items that changed order).
+    """
+    old_ids = _menu_item_ids(old_items)
+    new_ids = _menu_item_ids(new_items)
+    if old_ids is None or new_ids is None:
+        return None
+    old_by_id = dict(zip(old_ids, old_items))
+    new_id_set = set(new_ids)
+    kept = [item_id for item_id in old_ids if item_id in new_id_set]
+    if kept != [item_id for item_id in new_ids if item_id in old_by_id]:
+        return None
+
+    ops: list[dict] = [
+        {"op": "remove", "id": item_id} for item_id in old_ids if item_id not in new_id_set
+    ]
+    for index, (item_id, item) in enumerate(zip(new_ids, new_items)):
+        old_item = old_by_id.get(item_id)
+        if old_item is None:
+            ops.append({"op": "insert", "index": index, "item": item})
+        elif old_item != item:
+            ops.append({"op": "replace", "id": item_id, "item": item})
+    return ops
+
+
 class NetworkUser(User):
     """
     Network implementation of User for real players connected via websocket.
@@ -46,6 +106,9 @@ class NetworkUser(User):
         self._current_menus: dict[str, dict[str, Any]] = {}
         self._current_editboxes: dict[str, dict[str, Any]] = {}
         self._current_music: dict[str, Any] | None = None
+        # Menus whose current items were sent on this connection, so the
+        # client can take a menu_patch against them
+        self._patchable_menus: set[str] = set()
 
     @property
     def uuid(self) -> str:
@@ -99,8 +162,35 @@ class NetworkUser(User):
         return self._connection
 
     def set_connection(self, connection: "ClientConnection") -> None:
-        """Update the active client connection."""
+        """Update the active client connection.
+
+        The new client has none of the menus the old one was patching, so
+        queued menu patches are replaced by the full menus they lead to.
+        """
         self._connection = connection
+        self._patchable_menus.clear()
+        last_patch = {
+            packet["menu_id"]: index
+            for index, packet in enumerate(self._message_queue)
+            if packet.get("type") == "menu_patch"
+        }
+        if not last_patch:
+            return
+        queue = []
+        for index, packet in enumerate(self._message_queue):
+            if packet.get("type") != "menu_patch":
+                queue.append(packet)
+                continue
+            menu_id = packet["menu_id"]
+            if last_patch[menu_id] != index or menu_id not in self._current_menus:
+                continue
+            full = self._full_menu_packet(menu_id)
+            for key in ("position", "selection_id", "play_selection_sound"):
+                if key in packet:
+                    full[key] = packet[key]
+            queue.append(full)
+            self._patchable_menus.add(menu_id)
+        self._message_queue = queue
 
     @property
     def client_type(self) -> str:
@@ -158,10 +248,7 @@ class NetworkUser(User):
 
     def speak(self, text: str, buffer: str = "misc") -> None:
         """Queue a speech message for the client."""
-        packet = {"type": "speak", "text": text}
-        if buffer != "misc":
-            packet["buffer"] = buffer
-        self._queue_packet(packet)
+        self._queue_packet(_speak_packet(text, buffer))
 
     def play_sound(self, name: str, volume: int = 100, pan: int = 0, pitch: int = 100) -> None:
         """Queue a sound effect for the client."""
@@ -216,6 +303,77 @@ class NetworkUser(User):
                 result.append(item)
         return result
 
+    def _full_menu_packet(self, menu_id: str) -> dict[str, Any]:
+        """Build a menu packet carrying the whole current state of a shown menu."""
+        menu_state = self._current_menus[menu_id]
+        packet: dict[str, Any] = {
+            "type": "menu",
+            "menu_id": menu_id,
+            "items": menu_state["items"],
+            "multiletter_enabled": menu_state["multiletter_enabled"],
+            "escape_behavior": menu_state["escape_behavior"],
+            "grid_enabled": menu_state["grid_enabled"],
+            "grid_width": menu_state["grid_width"],
+        }
+        if menu_state["position"] is not None:
+            # Convert 1-based to 0-based for client
+            packet["position"] = menu_state["position"] - 1
+        return packet
+
+    def resend_menu(self, menu_id: str) -> None:
+        """Send a shown menu in full, for a client that could not apply a patch."""
+        if menu_id not in self._current_menus:
+            self._patchable_menus.discard(menu_id)
+            return
+        self._patchable_menus.add(menu_id)
+        self._queue_packet(self._full_menu_packet(menu_id))
+
+    def _menu_patch(
+        self,
+        menu_id: str,
+        previous_items: list[str | dict] | None,
+        items: list[str | dict],
+        packet: dict[str, Any],
+    ) -> dict[str, Any] | None:
+        """
+        Turn a full menu packet into a menu_patch when that is smaller.
+
+        Returns:
+            The packet to queue: the patch, the original packet, or None if
+            the patch would carry nothing at all.
+        """
+        patchable = menu_id in self._patchable_menus
+        self._patchable_menus.add(menu_id)
+        if (
+            not patchable
+            or previous_items is None
+            or not items
+            or getattr(self._connection, "supports_menu_patch", False) is not True
+        ):
+            return packet
+        ops = diff_menu_items(previous_items, items)
+        if ops is None or len(ops) >= len(items):
+            return packet
+        patch: dict[str, Any] = {"type": "menu_patch", "menu_id": menu_id, "ops": ops}
+        for key in ("position", "selection_id", "play_selection_sound"):
+            if key in packet:
+                patch[key] = packet[key]
+        if len(patch) == 3 and not ops:
+            return None
+        return patch
+
+    def _queue_menu(
+        self,
+        menu_id: str,
+        previous_items: list[str | dict] | None,
+        items: list[str | dict],
+        packet: dict[str, Any],
+    ) -> None:
+        """Queue a menu packet, as a menu_patch if the client can take one."""
+        packet = self._menu_patch(menu_id, previous_items, items, packet)
+        if packet is not None:
+            self._queue_packet(packet)
+
     def show_menu(
         self,
         menu_id: str,
@@ -243,7 +401,7 @@ class NetworkUser(User):
                 position = previous_position
 
         # Store for session resumption
-        self._current_menus[menu_id] = {
+        menu_state = {
             "items": converted_items,
             "multiletter_enabled": multiletter,
             "escape_behavior": escape_str,
@@ -251,22 +409,20 @@ class NetworkUser(User):
             "grid_enabled": grid_enabled,
             "grid_width": grid_width,
         }
+        self._current_menus[menu_id] = menu_state
 
-        packet: dict[str, Any] = {
-            "type": "menu",
-            "menu_id": menu_id,
-            "items": converted_items,
-            "multiletter_enabled": multiletter,
-            "escape_behavior": escape_str,
-            "grid_enabled": grid_enabled,
-            "grid_width": grid_width,
-        }
-        if position is not None:
-            # Convert 1-based to 0-based for client
-            packet["position"] = position - 1
+        # A patch can't carry settings, so only diff when they are unchanged
+        previous_items = None
+        if previous_menu and all(
+            previous_menu.get(key) == menu_state[key]
+            for key in ("multiletter_enabled", "escape_behavior", "grid_enabled", "grid_width")
+        ):
+            previous_items = previous_menu.get("items")
+
+        packet = self._full_menu_packet(menu_id)
         if play_selection_sound:
             packet["play_selection_sound"] = True
-        self._queue_packet(packet)
+        self._queue_menu(menu_id, previous_items, converted_items, packet)
 
     def update_menu(
         self,
@@ -278,8 +434,10 @@ class NetworkUser(User):
     ) -> None:
         """Update an existing menu's items or selection."""
         converted_items = self._convert_items(items)
+        previous_items = None
 
         if menu_id in self._current_menus:
+            previous_items = self._current_menus[menu_id]["items"]
             self._current_menus[menu_id]["items"] = converted_items
             if position is not None:
                 self._current_menus[menu_id]["position"] = position
@@ -300,11 +458,12 @@ class NetworkUser(User):
             packet["selection_id"] = selection_id
         if play_selection_sound:
             packet["play_selection_sound"] = True
-        self._queue_packet(packet)
+        self._queue_menu(menu_id, previous_items, converted_items, packet)
 
     def remove_menu(self, menu_id: str) -> None:
         """Remove a menu from the client UI."""
         self._current_menus.pop(menu_id, None)
+        self._patchable_menus.discard(menu_id)
         # Send empty menu to clear it
         self._queue_packet(
             {
@@ -375,4 +534,5 @@ class NetworkUser(User):
         """Clear menus, editboxes, and UI state for the client."""
         self._current_menus.clear()
         self._current_editboxes.clear()
+        self._patchable_menus.clear()
         self._queue_packet({"type": "clear_ui"})
@@ -24,6 +24,7 @@ class ActionExecutionMixin:
         find_action(player, action_id) -> Action | None.
         resolve_action(player, action) -> ResolvedAction.
         advance_turn().
+        request_tick().
     """
 
     def execute_action(
@@ -34,6 +35,7 @@ class ActionExecutionMixin:
         context: "ActionContext | None" = None,
     ) -> None:
         """Execute an action for a player, optionally with input value and context."""
+        self.request_tick()
         action = self.find_action(player, action_id)
         if not action:
             return
@@ -4,7 +4,7 @@ import copy
 import inspect
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 from mashumaro.mixins.json import DataClassJSONMixin
 
@@ -100,6 +100,129 @@ class ResolvedAction:
     sound: str | None = None  # Sound to play on highlight
 
 
+@dataclass(frozen=True)
+class _CompiledCallback:
+    """A game callback worked out once per (game class, method name).
+
+    ``func`` is the plain function defined on the class, called with the game
+    as its first argument. It is None when the name does not resolve to a
+    plain function on the class (missing, staticmethod, callable attribute),
+    in which case the callback is looked up on the game each time.
+    ``source`` is what the class attribute was when compiled; if the class
+    attribute is replaced later (monkeypatching, plugin overrides), the
+    entry is stale and is compiled again.
+    """
+
+    func: Callable | None
+    takes_action_id: bool
+    source: object = None
+
+
+_NO_CALLBACK = object()
+_compiled_callbacks: dict[tuple[type, str], _CompiledCallback] = {}
+
+
+def _compile_callback(game_cls: type, name: str) -> _CompiledCallback:
+    """Return the cached callback for a method name on a game class."""
+    key = (game_cls, name)
+    compiled = _compiled_callbacks.get(key)
+    func = getattr(game_cls, name, None)
+    if compiled is None or compiled.source is not func:
+        if inspect.isfunction(func):
+            takes_action_id = "action_id" in inspect.signature(func).parameters
+            compiled = _CompiledCallback(func, takes_action_id, func)
+        else:
+            compiled = _CompiledCallback(None, False, func)
+        _compiled_callbacks[key] = compiled
+    return compiled
+
+
+def _instance_attrs(game: object) -> dict:
+    """Return the game's instance attributes, used to spot per-instance overrides."""
+    return getattr(game, "__dict__", {})
+
+
+def _call_callback(
+    game: "Game",
+    game_cls: type,
+    instance_attrs: dict,
+    name: str,
+    player: "Player",
+    action_id: str,
+) -> object:
+    """Call a state callback, passing action_id only if it accepts one.
+
+    Returns _NO_CALLBACK if the game has no such method.
+    """
+    compiled = _compile_callback(game_cls, name)
+    if compiled.func is not None and name not in instance_attrs:
+        if compiled.takes_action_id:
+            return compiled.func(game, player, action_id=action_id)
+        return compiled.func(game, player)
+    method = getattr(game, name, None)
+    if not method:
+        return _NO_CALLBACK
+    if "action_id" in inspect.signature(method).parameters:
+        return method(player, action_id=action_id)
+    return method(player)
+
+
+def _resolve(
+    game: "Game",
+    game_cls: type,
+    instance_attrs: dict,
+    player: "Player",
+    action: Action,
+) -> ResolvedAction:
+    """Resolve one action for a player using compiled callbacks."""
+    # Resolve enabled state
+    disabled_reason: str | tuple[str, dict] | None = None
+    if action.is_enabled:
+        result = _call_callback(
+            game, game_cls, instance_attrs, action.is_enabled, player, action.id
+        )
+        if result is not _NO_CALLBACK:
+            disabled_reason = result  # type: ignore[assignment]
+
+    # Resolve visibility
+    visible = True
+    if action.is_hidden:
+        result = _call_callback(
+            game, game_cls, instance_attrs, action.is_hidden, player, action.id
+        )
+        if result is not _NO_CALLBACK:
+            visible = result == Visibility.VISIBLE
+
+    # Resolve label (always called with the action id positionally)
+    label = action.label
+    if action.get_label:
+        compiled = _compile_callback(game_cls, action.get_label)
+        if compiled.func is not None and action.get_label not in instance_attrs:
+            label = compiled.func(game, player, action.id)
+        else:
+            method = getattr(game, action.get_label, None)
+            if method:
+                label = method(player, action.id)
+
+    # Resolve sound
+    sound = None
+    if action.get_sound:
+        result = _call_callback(
+            game, game_cls, instance_attrs, action.get_sound, player, action.id
+        )
+        if result is not _NO_CALLBACK:
+            sound = result  # type: ignore[assignment]
+
+    return ResolvedAction(
+        action=action,
+        label=label,
+        enabled=disabled_reason is None,
+        disabled_reason=disabled_reason,
+        visible=visible,
+        sound=sound,
+    )
+
+
 @dataclass
 class ActionSet(DataClassJSONMixin):
     """Named group of actions for a player.
@@ -137,69 +260,22 @@ class ActionSet(DataClassJSONMixin):
 
     def resolve_action(self, game: "Game", player: "Player", action: Action) -> ResolvedAction:
         """Resolve a single action's state for a player."""
-        # Resolve enabled state
-        disabled_reason: str | tuple[str, dict] | None = None
-        if action.is_enabled:
-            method = getattr(game, action.is_enabled, None)
-            if method:
-                # Check if method accepts action_id kwarg
-                sig = inspect.signature(method)
-                if "action_id" in sig.parameters:
-                    disabled_reason = method(player, action_id=action.id)
-                else:
-                    disabled_reason = method(player)
-
-        # Resolve visibility
-        visible = True
-        if action.is_hidden:
-            method = getattr(game, action.is_hidden, None)
-            if method:
-                # Check if method accepts action_id kwarg
-                sig = inspect.signature(method)
-                if "action_id" in sig.parameters:
-                    visibility = method(player, action_id=action.id)
-                else:
-                    visibility = method(player)
-                visible = visibility == Visibility.VISIBLE
-
-        # Resolve label
-        label = action.label
-        if action.get_label:
-            method = getattr(game, action.get_label, None)
-            if method:
-                label = method(player, action.id)
-
-        # Resolve sound
-        sound = None
-        if action.get_sound:
-            method = getattr(game, action.get_sound, None)
-            if method:
-                # Check if method accepts action_id kwarg
-                sig = inspect.signature(method)
-                if "action_id" in sig.parameters:
-                    sound = method(player, action_id=action.id)
-                else:
-                    sound = method(player)
-
-        return ResolvedAction(
-            action=action,
-            label=label,
-            enabled=disabled_reason is None,
-            disabled_reason=disabled_reason,
-            visible=visible,
-            sound=sound,
-        )
+        return _resolve(game, type(game), _instance_attrs(game), player, action)
 
     def resolve_actions(self, game: "Game", player: "Player") -> list[ResolvedAction]:
-        """Resolve all actions' states for a player."""
-        result = []
-        for aid in self._order:
-            if aid not in self._actions:
-                continue
-            action = self._actions[aid]
-            resolved = self.resolve_action(game, player, action)
-            result.append(resolved)
-        return result
+        """Resolve all actions' states for a player.
+
+        Labels, enabled state, visibility and sound are worked out in one
+        pass, with the game's class and instance attributes looked up once.
+        """
+        game_cls = type(game)
+        instance_attrs = _instance_attrs(game)
+        actions = self._actions
+        return [
+            _resolve(game, game_cls, instance_attrs, player, actions[aid])
+            for aid in self._order
+            if aid in actions
+        ]
 
     def get_visible_actions(self, game: "Game", player: "Player") -> list[ResolvedAction]:
         """Get visible actions for the turn menu.
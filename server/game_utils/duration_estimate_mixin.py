@@ -1,13 +1,12 @@
 """Mixin providing game duration estimation via simulation."""
 
 import logging
-import subprocess  # nosec B404
-import sys
-import json as json_module
 import threading
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from .lobby_actions_mixin import BOT_NAMES
+from .simulation_pool import get_simulation_pool
+
 LOG = logging.getLogger("playpalace.game_utils.duration_estimate")
 
 if TYPE_CHECKING:
@@ -17,10 +16,10 @@ from server.core.users.base import TrustLevel
 
 
 class DurationEstimateMixin:
-    """Estimate game duration via CLI simulations.
+    """Estimate game duration via bot simulations.
 
-    This mixin spawns background simulations and reports estimated duration
-    based on tick counts.
+    This mixin runs simulations on the shared simulation pool and reports
+    estimated duration based on tick counts.
 
     Expected Game attributes:
         _estimate_threads: list.
@@ -42,7 +41,7 @@ class DurationEstimateMixin:
     TICKS_PER_SECOND = 20  # 50ms per tick (may be overridden by GameSoundMixin)
 
     def _action_estimate_duration(self, player: "Player", action_id: str) -> None:
-        """Start duration estimation by spawning CLI simulation threads."""
+        """Start duration estimation on the simulation pool."""
         user = self.get_user(player)
         if not user or user.trust_level.value < TrustLevel.ADMIN.value:
             return
@@ -51,60 +50,38 @@ class DurationEstimateMixin:
                 user.speak_l("estimate-already-running")
             return
 
-        # Build the options string for CLI
-        options_args = []
+        options: dict[str, Any] = {}
         if hasattr(self, "options"):
             for field_name in self.options.__dataclass_fields__:
-                value = getattr(self.options, field_name)
-                options_args.extend(["-o", f"{field_name}={value}"])
+                options[field_name] = getattr(self.options, field_name)
 
         # Determine number of bots (use current player count, minimum 2)
         num_bots = max(len([p for p in self.players if not p.is_spectator]), self.get_min_players())
-
-        # Build CLI command
-        cli_path = Path(__file__).parent.parent / "cli.py"
-        base_cmd = [
-            sys.executable,
-            str(cli_path),
-            "simulate",
-            self.get_type(),
-            "--bots",
-            str(num_bots),
-            "--json",
-            "--quiet",
-        ] + options_args
+        bot_names = BOT_NAMES[:num_bots]
 
         # Reset results
         self._estimate_results = []
         self._estimate_errors = []
         self._estimate_threads = []
 
-        # Run all simulations sequentially in a single background thread
-        # to avoid overloading the system with many concurrent processes.
-        def run_simulations():
-            """Run all simulations sequentially and collect tick counts."""
-            for _ in range(self.NUM_ESTIMATE_SIMULATIONS):
-                try:
-                    result = subprocess.run(
-                        base_cmd,  # nosec B603
-                        capture_output=True,
-                        text=True,
-                        timeout=120,  # 2 minute timeout per simulation
-                        shell=False,
-                    )
-                    if result.returncode == 0 and result.stdout:
-                        data = json_module.loads(result.stdout)
-                        if "ticks" in data and not data.get("timed_out", False):
-                            with self._estimate_lock:
-                                self._estimate_results.append(data["ticks"])
-                    elif result.stderr:
-                        with self._estimate_lock:
-                            self._estimate_errors.append(result.stderr.strip()[:200])
-                except Exception as e:
+        # Collect results in a background thread as the pool's workers finish them.
+        def collect_simulations():
+            """Run all simulations on the pool and collect tick counts."""
+            try:
+                results = get_simulation_pool().run_many(
+                    self.NUM_ESTIMATE_SIMULATIONS, self.get_type(), bot_names, options
+                )
+                for data in results:
                     with self._estimate_lock:
-                        self._estimate_errors.append(str(e)[:200])
-
-        thread = threading.Thread(target=run_simulations, daemon=True)
+                        if data.get("error"):
+                            self._estimate_errors.append(str(data["error"])[:200])
+                        elif "ticks" in data and not data.get("timed_out", False):
+                            self._estimate_results.append(data["ticks"])
+            except Exception as e:
+                with self._estimate_lock:
+                    self._estimate_errors.append(str(e)[:200])
+
+        thread = threading.Thread(target=collect_simulations, daemon=True)
         thread.start()
         self._estimate_threads = [thread]
 
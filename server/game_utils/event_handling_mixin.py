@@ -22,21 +22,29 @@ class EventHandlingMixin:
         get_all_visible_actions(player) -> list[ResolvedAction].
         rebuild_player_menu(player).
         rebuild_all_menus().
+        deferred_menu_updates() -> context manager.
         _is_player_spectator(player) -> bool.
+        request_tick().
     """
 
     def handle_event(self, player: "Player", event: dict) -> None:
-        """Handle an event from a player."""
+        """Handle an event from a player.
+
+        Turn menu refreshes requested while handling it are applied once,
+        after the handler returns.
+        """
+        self.request_tick()
         event_type = event.get("type")
 
-        if event_type == "menu":
-            self._handle_menu_event(player, event)
+        with self.deferred_menu_updates():
+            if event_type == "menu":
+                self._handle_menu_event(player, event)
 
-        elif event_type == "editbox":
-            self._handle_editbox_event(player, event)
+            elif event_type == "editbox":
+                self._handle_editbox_event(player, event)
 
-        elif event_type == "keybind":
-            self._handle_keybind_event(player, event)
+            elif event_type == "keybind":
+                self._handle_keybind_event(player, event)
 
     def _handle_menu_event(self, player: "Player", event: dict) -> None:
         """Handle a menu selection event."""
@@ -35,17 +35,24 @@ class GameCommunicationMixin:
         exclude: "Player | None" = None,
         **kwargs,
     ) -> None:
-        """Send a localized message to all players (each in their own locale)."""
+        """Send a localized message to all players (each in their own locale).
+
+        The message is formatted once per locale and the same text is used
+        for the transcript and the speech sent to every player sharing it.
+        """
+        texts: dict[str, str] = {}
         for player in self.players:
             if player is exclude:
                 continue
             user = self.get_user(player)
             locale = user.locale if user else "en"
-            localized = Localization.get(locale, message_id, **kwargs)
+            localized = texts.get(locale)
+            if localized is None:
+                localized = texts[locale] = Localization.get(locale, message_id, **kwargs)
             if hasattr(self, "record_transcript_event"):
                 self.record_transcript_event(player, localized, buffer)
             if user:
-                user.speak_l(message_id, buffer, **kwargs)
+                user.speak(localized, buffer)
 
     def broadcast_personal_l(
         self,
@@ -59,14 +66,15 @@ class GameCommunicationMixin:
         Send a personalized message to one player and a different message to everyone else.
 
         The player receives personal_message_id, while all other players receive
-        others_message_id with an additional player=player.name argument.
+        others_message_id with an additional player=player.name argument. The
+        others message is formatted once per locale.
 
         Args:
             player: The player who gets the personal message.
             personal_message_id: Message ID for the player (e.g., "you-rolled").
             others_message_id: Message ID for everyone else (e.g., "player-rolled").
             buffer: Audio buffer for speech.
-            **kwargs: Additional arguments passed to all speak_l calls.
+            **kwargs: Additional arguments passed to all messages.
         """
         user = self.get_user(player)
         locale = user.locale if user else "en"
@@ -74,18 +82,23 @@ class GameCommunicationMixin:
         if hasattr(self, "record_transcript_event"):
             self.record_transcript_event(player, personal_text, buffer)
         if user:
-            user.speak_l(personal_message_id, buffer, **kwargs)
+            user.speak(personal_text, buffer)
 
+        others_texts: dict[str, str] = {}
         for p in self.players:
             if p is player:
                 continue
             u = self.get_user(p)
             locale = u.locale if u else "en"
-            others_text = Localization.get(locale, others_message_id, player=player.name, **kwargs)
+            others_text = others_texts.get(locale)
+            if others_text is None:
+                others_text = others_texts[locale] = Localization.get(
+                    locale, others_message_id, player=player.name, **kwargs
+                )
             if hasattr(self, "record_transcript_event"):
                 self.record_transcript_event(p, others_text, buffer)
             if u:
-                u.speak_l(others_message_id, buffer, player=player.name, **kwargs)
+                u.speak(others_text, buffer)
 
     def label_l(self, message_id: str) -> Callable[["Game", "Player"], str]:
         """
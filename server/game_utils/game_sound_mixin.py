@@ -1,9 +1,10 @@
 """Mixin providing sound scheduling, event scheduling, and playback for games."""
 
-import random
+from bisect import bisect_right, insort
+from operator import itemgetter
 
 
-_SOUND_RANDOM = random.Random()
+_TARGET_TICK = itemgetter(0)
 
 from typing import TYPE_CHECKING
 
@@ -15,7 +16,13 @@ if TYPE_CHECKING:
 class GameSoundMixin:
     """Schedule and play sounds and game events for games.
 
+    scheduled_sounds and event_queue are kept sorted by target tick (stable,
+    so entries for the same tick keep their scheduling order). A sorted list
+    is a valid min-heap and saves in the same list format; each tick only the
+    due prefix is popped.
+
     Expected Game attributes:
+        rng: random.Random (picks sound variants).
         scheduled_sounds: list of [tick, sound, vol, pan, pitch].
         sound_scheduler_tick: int.
         event_queue: list of (tick, event_type, data).
@@ -24,6 +31,8 @@ class GameSoundMixin:
         current_ambience: str.
         players: list[Player].
         get_user(player) -> User | None.
+        request_tick().
+        mark_changed().
     """
 
     # ==========================================================================
@@ -41,7 +50,7 @@ class GameSoundMixin:
         variant_count: int = DEFAULT_DICE_ROLL_SOUND_VARIANTS,
     ) -> str:
         """Play one standard board-game dice roll sound and return its asset path."""
-        variant = _SOUND_RANDOM.randint(1, max(1, variant_count))
+        variant = self.rng.randint(1, max(1, variant_count))
         sound = sound_template.format(variant=variant)
         self.play_sound(sound)
         return sound
@@ -62,7 +71,7 @@ class GameSoundMixin:
         """
         next_delay = max(0, start_delay_ticks)
         for _ in range(max(0, spaces)):
-            variant = _SOUND_RANDOM.randint(1, max(1, variant_count))
+            variant = self.rng.randint(1, max(1, variant_count))
             sound = sound_template.format(variant=variant)
             self.schedule_sound(sound, delay_ticks=next_delay)
             next_delay += max(0, step_interval_ticks)
@@ -85,8 +94,9 @@ class GameSoundMixin:
             pan: Pan (-100 to 100, 0 = center).
             pitch: Pitch (100 = normal).
         """
+        self.request_tick()
         target_tick = self.sound_scheduler_tick + delay_ticks
-        self.scheduled_sounds.append([target_tick, sound, volume, pan, pitch])
+        insort(self.scheduled_sounds, [target_tick, sound, volume, pan, pitch], key=_TARGET_TICK)
 
     def schedule_sound_sequence(
         self,
@@ -110,20 +120,35 @@ class GameSoundMixin:
 
     def process_scheduled_sounds(self) -> None:
         """Process scheduled sounds. Called automatically in on_tick()."""
-        current_tick = self.sound_scheduler_tick
-
-        # Find and play sounds scheduled for this tick
-        remaining = []
-        for scheduled in self.scheduled_sounds:
-            tick, sound, volume, pan, pitch = scheduled
-            if tick <= current_tick:
+        scheduled = self.scheduled_sounds
+        if scheduled and scheduled[0][0] <= self.sound_scheduler_tick:
+            due_count = bisect_right(scheduled, self.sound_scheduler_tick, key=_TARGET_TICK)
+            due = scheduled[:due_count]
+            del scheduled[:due_count]
+            for _tick, sound, volume, pan, pitch in due:
                 self.play_sound(sound, volume, pan, pitch)
-            else:
-                remaining.append(scheduled)
-
-        self.scheduled_sounds = remaining
         self.sound_scheduler_tick += 1
 
+    def advance_sound_scheduler(self, ticks: int) -> None:
+        """Move the scheduler clock over ticks the table manager skipped."""
+        self.sound_scheduler_tick += ticks
+
+    def next_due_tick(self) -> int | None:
+        """Return the earliest scheduler tick with a sound or event due, or None.
+
+        Events are dispatched after on_tick has advanced the clock, so an
+        event counts as due one tick before its own tick.
+        """
+        due = [self.scheduled_sounds[0][0]] if self.scheduled_sounds else []
+        if self.event_queue:
+            due.append(self.event_queue[0][0] - 1)
+        return min(due, default=None)
+
+    def restore_scheduler_order(self) -> None:
+        """Sort the sound and event queues, e.g. after loading an older save."""
+        self.scheduled_sounds.sort(key=_TARGET_TICK)
+        self.event_queue.sort(key=_TARGET_TICK)
+
     # ==========================================================================
     # Event Scheduling
     # ==========================================================================
@@ -136,30 +161,27 @@ class GameSoundMixin:
             data: Event payload dict.
             delay_ticks: Ticks to wait before firing (0 = next tick).
         """
+        self.request_tick()
         target_tick = self.sound_scheduler_tick + delay_ticks
-        self.event_queue.append((target_tick, event_type, data))
+        insort(self.event_queue, (target_tick, event_type, data), key=_TARGET_TICK)
 
     def process_scheduled_events(self) -> None:
         """Process scheduled events. Call in on_tick() after process_scheduled_sounds().
 
         Events whose tick has arrived are dispatched to on_game_event().
-        Uses queue-swap so events added during handling are preserved.
+        They are popped before dispatch, so events scheduled while handling
+        them wait for a later call.
         """
-        if not self.event_queue:
+        queue = self.event_queue
+        if not queue or queue[0][0] > self.sound_scheduler_tick:
             return
 
-        to_process = self.event_queue
-        self.event_queue = []
-        remaining = []
-        current_tick = self.sound_scheduler_tick
-
-        for tick, event_type, data in to_process:
-            if tick <= current_tick:
-                self.on_game_event(event_type, data)
-            else:
-                remaining.append((tick, event_type, data))
-
-        self.event_queue = remaining + self.event_queue
+        due_count = bisect_right(queue, self.sound_scheduler_tick, key=_TARGET_TICK)
+        due = queue[:due_count]
+        del queue[:due_count]
+        self.mark_changed()
+        for _tick, event_type, data in due:
+            self.on_game_event(event_type, data)
 
     def on_game_event(self, event_type: str, data: dict) -> None:
         """Handle a scheduled game event. Override in subclasses.
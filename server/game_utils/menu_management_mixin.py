@@ -1,6 +1,8 @@
 """Mixin providing menu management functionality for games."""
 
-from typing import TYPE_CHECKING
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterator
 
 if TYPE_CHECKING:
     from ..games.base import Player, TransientDisplayState
@@ -13,18 +15,94 @@ from ..messages.localization import Localization
 TRANSIENT_DISPLAY_MENU_ID = "transient_display"
 
 
+@dataclass
+class PendingMenuUpdate:
+    """A turn menu refresh requested while menu updates are deferred."""
+
+    rebuild: bool = False
+    position: int | None = None
+    selection_id: str | None = None
+    play_selection_sound: bool = False
+    # What the player had open when first marked, to spot menus shown since
+    pending_action: str | None = None
+    actions_menu_open: bool = False
+
+
 class MenuManagementMixin:
     """Build and update turn menus and status boxes.
 
+    Inside deferred_menu_updates() (each tick and each player event),
+    rebuild_player_menu / update_player_menu only mark the player dirty.
+    Each dirty player's menu is then refreshed once when the scope ends.
+
     Expected Game attributes:
         _destroyed: bool.
         status: str.
         players: list[Player].
         _transient_display_state: dict[str, TransientDisplayState].
+        _pending_actions: dict[str, str].
+        _actions_menu_open: set[str].
+        _menu_defer_depth: int.
+        _dirty_menus: dict[str, PendingMenuUpdate].
         get_user(player) -> User | None.
         get_all_visible_actions(player) -> list[ResolvedAction].
     """
 
+    @contextmanager
+    def deferred_menu_updates(self) -> Iterator[None]:
+        """Defer and deduplicate turn menu refreshes until the block ends.
+
+        Scopes nest; menus are refreshed when the outermost one exits.
+        """
+        self._menu_defer_depth += 1
+        try:
+            yield
+        finally:
+            self._menu_defer_depth -= 1
+            if self._menu_defer_depth == 0 and self._dirty_menus:
+                self.flush_menu_updates()
+
+    def _mark_menu_dirty(self, player: "Player") -> PendingMenuUpdate:
+        """Record that a player's turn menu needs refreshing."""
+        pending = self._dirty_menus.get(player.id)
+        if pending is None:
+            pending = PendingMenuUpdate(
+                pending_action=self._pending_actions.get(player.id),
+                actions_menu_open=player.id in self._actions_menu_open,
+            )
+            self._dirty_menus[player.id] = pending
+        return pending
+
+    def flush_menu_updates(self) -> None:
+        """Refresh every dirty player's turn menu once, in player order."""
+        dirty = self._dirty_menus
+        self._dirty_menus = {}
+        for player in list(self.players):
+            pending = dirty.get(player.id)
+            if pending is None:
+                continue
+            # Another menu was opened after the refresh was asked for; when
+            # refreshed immediately, the turn menu would have been covered.
+            pending_action = self._pending_actions.get(player.id)
+            if pending_action is not None and pending_action != pending.pending_action:
+                continue
+            if player.id in self._actions_menu_open and not pending.actions_menu_open:
+                continue
+            update_kwargs: dict = {}
+            if pending.selection_id is not None:
+                update_kwargs["selection_id"] = pending.selection_id
+            if pending.play_selection_sound:
+                update_kwargs["play_selection_sound"] = True
+            if pending.rebuild:
+                if pending.position is not None:
+                    self.rebuild_player_menu(player, position=pending.position)
+                else:
+                    self.rebuild_player_menu(player)
+                if update_kwargs:
+                    self.update_player_menu(player, **update_kwargs)
+            else:
+                self.update_player_menu(player, **update_kwargs)
+
     def _get_transient_display_state(self, player: "Player") -> "TransientDisplayState | None":
         """Return the open transient display state for a player, if any."""
         return self._transient_display_state.get(player.id)
@@ -152,6 +230,13 @@ class MenuManagementMixin:
             return  # Don't rebuild menus after game is destroyed
         if self.status == "finished":
             return  # Don't rebuild turn menu after game has ended
+        if self._menu_defer_depth:
+            pending = self._mark_menu_dirty(player)
+            pending.rebuild = True
+            if position is not None:
+                pending.position = position
+                pending.selection_id = None
+            return
         if self._is_transient_display_open(player):
             return  # Don't clobber an open transient display
         user = self.get_user(player)
@@ -192,6 +277,12 @@ class MenuManagementMixin:
             return
         if self.status == "finished":
             return
+        if self._menu_defer_depth:
+            pending = self._mark_menu_dirty(player)
+            if selection_id is not None:
+                pending.selection_id = selection_id
+            pending.play_selection_sound = pending.play_selection_sound or play_selection_sound
+            return
         if self._is_transient_display_open(player):
             return  # Don't clobber an open transient display
         user = self.get_user(player)
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import random
 from typing import ClassVar
 
 from .bot_helper import BotHelper
@@ -25,6 +24,13 @@ class PushYourLuckBotMixin:
 
         BotHelper.on_tick(self)
 
+    def fast_forward_ticks(self) -> int:
+        """A bot without a target still needs on_tick to pick one."""
+        player = getattr(self, "current_player", None)
+        if player and getattr(player, "is_bot", False) and BotHelper.get_target(player) is None:
+            return 0
+        return super().fast_forward_ticks()
+
     def prepare_push_bot_turn(self, player) -> None:
         """Call at start of a bot's turn to (re)initialize its target."""
         if player and getattr(player, "is_bot", False):
@@ -39,7 +45,7 @@ class PushYourLuckBotMixin:
 
     def _calculate_push_bot_target(self, player) -> int:
         low, high = self.push_target_range
-        base = random.randint(low, high)  # nosec B311
+        base = self.rng.randint(low, high)  # nosec B311
         return self._adjust_push_bot_target(player, base)
 
     def _adjust_push_bot_target(self, player, target: int) -> int:
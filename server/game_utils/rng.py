@@ -0,0 +1,66 @@
+"""Per-game random number generator that saves with the game state."""
+
+import hashlib
+import random
+
+from mashumaro.types import SerializableType
+
+_MASK64 = (1 << 64) - 1
+
+
+class GameRandom(SerializableType, random.Random):
+    """random.Random driven by SplitMix64, so its whole state is one integer.
+
+    Games draw from their own instance (Game.rng) instead of the shared
+    module-level generator. It serializes as that integer, so a restored
+    game continues the same sequence, and seeding it makes a game
+    reproducible. All random.Random methods (randint, choice, shuffle, ...)
+    are available.
+    """
+
+    def seed(self, a=None, version: int = 2) -> None:
+        """Seed from an int, another hashable value, or the random module if None.
+
+        Drawing the default seed from the module-level generator keeps
+        random.seed() enough to make a freshly created game reproducible.
+        """
+        if a is None:
+            a = random.getrandbits(64)
+        elif not isinstance(a, int):
+            a = int.from_bytes(hashlib.sha256(str(a).encode()).digest()[:8], "big")
+        self._state = a & _MASK64
+        self.gauss_next = None
+
+    def getstate(self) -> int:
+        return self._state
+
+    def setstate(self, state: int) -> None:
+        self._state = state & _MASK64
+        self.gauss_next = None
+
+    def _next64(self) -> int:
+        self._state = z = (self._state + 0x9E3779B97F4A7C15) & _MASK64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+        return z ^ (z >> 31)
+
+    def getrandbits(self, k: int) -> int:
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        bits = 0
+        for _ in range((k + 63) // 64):
+            bits = (bits << 64) | self._next64()
+        return bits >> (-k % 64)
+
+    def random(self) -> float:
+        return (self._next64() >> 11) * (1.0 / (1 << 53))
+
+    def _serialize(self) -> int:
+        return self._state
+
+    @classmethod
+    def _deserialize(cls, value: int) -> "GameRandom":
+        # Skip __init__: seeding would draw from the module-level generator.
+        rng = cls.__new__(cls)
+        rng.setstate(value)
+        return rng
@@ -114,4 +114,5 @@ class RoundTransitionTimer:
         # Check if timer expired
         if self._game.round_timer_ticks <= 0:
             self._game.round_timer_state = self.IDLE
+            self._game.mark_changed()
             self._game.on_round_timer_ready()
@@ -0,0 +1,218 @@
+"""Warm process pool for running bot-only game simulations."""
+
+import logging
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError, as_completed
+from typing import Any, Iterator
+
+LOG = logging.getLogger("playpalace.game_utils.simulation_pool")
+
+# Per-player capture lists are large and only useful for a single verbose run.
+_DROPPED_RESULT_KEYS = ("player_menus", "player_sounds")
+
+# Wall-clock allowance per run, as each cli.py subprocess had before the pool.
+# run_many allows this much for every round of runs the workers have to do.
+RUN_TIMEOUT_SECONDS = 120.0
+
+
+def _kill_workers(executor: ProcessPoolExecutor) -> None:
+    """Kill an executor's worker processes, including ones busy with a run.
+
+    ProcessPoolExecutor has no public way to stop a worker mid-task, so
+    this reads its private _processes map. If that ever goes away nothing
+    is killed, and shutdown() leaves busy workers to exit after their run.
+    Call it before shutdown(), which drops the map.
+    """
+    processes = getattr(executor, "_processes", None)
+    if not isinstance(processes, dict):
+        LOG.warning("Cannot reach simulation workers to kill them")
+        return
+    for process in list(processes.values()):
+        process.kill()
+
+
+def _warm_worker() -> None:
+    """Import the server, all games and locales once per worker process."""
+    import server.cli  # noqa: F401
+
+
+def run_simulation(
+    game_type: str,
+    bot_names: list[str],
+    options: dict[str, Any],
+    max_ticks: int = 10000000,
+    seed: int | None = None,
+) -> dict[str, Any]:
+    """Run one quiet simulation in this process and return its results dict.
+
+    Options are passed as structured values (e.g. ints and bools), not as
+    CLI strings. Runs are fast-forwarded over bot think time, which does not
+    change the tick count. Errors are returned under "error" rather than raised.
+    """
+    from server.cli import GameSimulator
+
+    simulator = GameSimulator(
+        game_type,
+        bot_names,
+        options,
+        json_mode=True,
+        quiet=True,
+        max_ticks=max_ticks,
+        fast_forward=True,
+        seed=seed,
+    )
+    try:
+        if not simulator.setup():
+            return {"game_type": game_type, "error": "setup failed"}
+        results = simulator.run()
+    except Exception as e:
+        return {"game_type": game_type, "error": f"{type(e).__name__}: {e}"}
+    for key in _DROPPED_RESULT_KEYS:
+        results.pop(key, None)
+    return results
+
+
+class SimulationPool:
+    """Run simulations on a pool of worker processes that import the server once.
+
+    Workers are spawned rather than forked so they never inherit the running
+    server's event loop, sockets or threads. When runs overstay their
+    deadline the workers are killed and a fresh pool is started, since a
+    worker stuck in a game never frees itself.
+    """
+
+    def __init__(self, workers: int | None = None):
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self._lock = threading.Lock()
+        self._executor = self._start_executor()
+
+    def _start_executor(self) -> ProcessPoolExecutor:
+        """Start a new set of worker processes."""
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_worker,
+        )
+
+    def _restart(self, stale: ProcessPoolExecutor) -> None:
+        """Kill the workers of `stale` and replace it, unless already replaced."""
+        with self._lock:
+            if self._executor is not stale:
+                return
+            LOG.warning("Simulation runs timed out; restarting %d workers", self.workers)
+            _kill_workers(stale)
+            stale.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._start_executor()
+
+    def submit(
+        self,
+        game_type: str,
+        bot_names: list[str],
+        options: dict[str, Any],
+        max_ticks: int = 10000000,
+        seed: int | None = None,
+    ) -> "Future[dict[str, Any]]":
+        """Queue one simulation and return a future for its results dict."""
+        with self._lock:
+            return self._executor.submit(
+                run_simulation, game_type, bot_names, options, max_ticks, seed
+            )
+
+    def run_many(
+        self,
+        runs: int,
+        game_type: str,
+        bot_names: list[str],
+        options: dict[str, Any],
+        max_ticks: int = 10000000,
+        seed: int | None = None,
+        timeout: float | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Run a simulation `runs` times, yielding each results dict as it finishes.
+
+        With a seed, run i is seeded with seed + i, so every run is
+        reproducible on its own whichever worker it lands on.
+
+        Runs still unfinished after `timeout` seconds (default:
+        RUN_TIMEOUT_SECONDS per round of runs across the workers) are
+        yielded as errors, and the pool's workers are restarted. Other
+        callers' runs in flight on the same pool then fail as errors too.
+        """
+        if timeout is None:
+            timeout = RUN_TIMEOUT_SECONDS * math.ceil(runs / self.workers)
+        executor = self._executor
+        futures = [
+            self.submit(
+                game_type, bot_names, options, max_ticks, None if seed is None else seed + i
+            )
+            for i in range(runs)
+        ]
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                try:
+                    yield future.result()
+                except Exception as e:  # worker died or results failed to pickle
+                    yield {"game_type": game_type, "error": f"{type(e).__name__}: {e}"}
+        except TimeoutError:
+            unfinished = [future for future in futures if not future.done()]
+            self._restart(executor)
+            for _ in unfinished:
+                yield {"game_type": game_type, "error": f"timed out after {timeout:.0f}s"}
+
+    def shutdown(self) -> None:
+        """Cancel queued runs and stop the worker processes, even busy ones."""
+        with self._lock:
+            _kill_workers(self._executor)
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_shared_pool: SimulationPool | None = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_simulation_pool() -> SimulationPool:
+    """Return the process-wide pool, starting it on first use."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = SimulationPool()
+            LOG.info("Started simulation pool with %d workers", _shared_pool.workers)
+        return _shared_pool
+
+
+def shutdown_simulation_pool() -> None:
+    """Stop the process-wide pool if it was started (on server shutdown)."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is not None:
+            _shared_pool.shutdown()
+            _shared_pool = None
+
+
+def summarize_ticks(results: list[dict[str, Any]]) -> dict[str, Any]:
+    """Aggregate tick counts over finished, non-timed-out runs."""
+    ticks = [
+        r["ticks"]
+        for r in results
+        if "ticks" in r and not r.get("error") and not r.get("timed_out")
+    ]
+    summary: dict[str, Any] = {
+        "runs": len(results),
+        "completed": len(ticks),
+        "timed_out": sum(1 for r in results if r.get("timed_out")),
+        "errors": sum(1 for r in results if r.get("error")),
+    }
+    if ticks:
+        mean = sum(ticks) / len(ticks)
+        summary.update(
+            {
+                "mean_ticks": mean,
+                "min_ticks": min(ticks),
+                "max_ticks": max(ticks),
+                "std_dev_ticks": (sum((t - mean) ** 2 for t in ticks) / len(ticks)) ** 0.5,
+            }
+        )
+    return summary
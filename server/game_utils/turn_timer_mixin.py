@@ -12,6 +12,7 @@ class TurnTimerGameProtocol(Protocol):
     options: Any  # Must have turn_timer attribute
 
     def play_sound(self, sound: str) -> None: ...
+    def mark_changed(self) -> None: ...
     def _on_turn_timeout(self) -> None: ...
 
 
@@ -22,6 +23,7 @@ class TurnTimerMixin:
     - self.timer: PokerTurnTimer
     - self.options: object with 'turn_timer' attribute (str)
     - self.play_sound(sound: str)
+    - self.mark_changed()
     - _on_turn_timeout() -> implement this!
     """
 
@@ -52,6 +54,7 @@ class TurnTimerMixin:
     def on_tick_turn_timer(self) -> None:
         """Called every tick to update timer and check for timeout."""
         if self.timer.tick():
+            self.mark_changed()
             self._on_turn_timeout()
 
         self._maybe_play_timer_warning()
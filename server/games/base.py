@@ -17,6 +17,7 @@ from ..game_utils.options import (
 )
 from ..game_utils.game_result import GameResult, PlayerResult
 from ..game_utils.teams import TeamManager
+from ..game_utils.rng import GameRandom
 from ..game_utils.game_sound_mixin import GameSoundMixin
 from ..game_utils.game_communication_mixin import GameCommunicationMixin
 from ..game_utils.game_result_mixin import GameResultMixin
@@ -24,7 +25,7 @@ from ..game_utils.duration_estimate_mixin import DurationEstimateMixin
 from ..game_utils.game_scores_mixin import GameScoresMixin
 from ..game_utils.game_prediction_mixin import GamePredictionMixin
 from ..game_utils.turn_management_mixin import TurnManagementMixin
-from ..game_utils.menu_management_mixin import MenuManagementMixin
+from ..game_utils.menu_management_mixin import MenuManagementMixin, PendingMenuUpdate
 from ..game_utils.action_visibility_mixin import ActionVisibilityMixin
 from ..game_utils.lobby_actions_mixin import LobbyActionsMixin, BOT_NAMES
 from ..game_utils.event_handling_mixin import EventHandlingMixin
@@ -161,6 +162,8 @@ class Game(
         default_factory=list
     )  # [(tick, event_type, data), ...]
     is_animating: bool = False  # True while event sequence is playing
+    # Per-game RNG (serialized as one int so restored games continue the same sequence)
+    rng: GameRandom = field(default_factory=GameRandom)
     # Action sets (serialized - actions are pure data now)
     player_action_sets: dict[str, list[ActionSet]] = field(default_factory=dict)
     # Team manager (serialized for persistence)
@@ -180,6 +183,8 @@ class Game(
         ] = {}  # player_id -> context during action execution
         self._transient_display_state: dict[str, TransientDisplayState] = {}
         self._actions_menu_open: set[str] = set()  # player_ids with actions menu open
+        self._menu_defer_depth: int = 0  # >0 while turn menu refreshes are deferred
+        self._dirty_menus: dict[str, PendingMenuUpdate] = {}  # player_id -> pending refresh
         self._destroyed: bool = False  # Whether game has been destroyed
         # Duration estimation state
         self._estimate_threads: list[threading.Thread] = []  # Running simulation threads
@@ -195,9 +200,9 @@ class Game(
 
         Subclasses can override to rebuild non-serialized objects. Base turn
         management and sound scheduling are stored in serialized fields, so
-        they do not require rebuilding.
+        they only need their queues put back in tick order.
         """
-        pass
+        self.restore_scheduler_order()
 
     # Abstract methods games must implement
 
@@ -216,6 +221,11 @@ class Game(
     #: User preferences this game is relevant to (for per-game overrides).
     relevant_preferences: ClassVar[list[str]] = []
 
+    #: True if on_tick has nothing to do during play unless a bot, a scheduled
+    #: sound or event, or a duration estimate needs it. Lets the table manager
+    #: stop ticking human-only games between moves (see next_wakeup_tick).
+    idle_between_moves: ClassVar[bool] = False
+
     @classmethod
     def get_name_key(cls) -> str:
         """Return the localization key for this game's name."""
@@ -258,6 +268,9 @@ class Game(
         The server will look up localization keys like:
         - "leaderboard-type-{id}" for menu display (with underscores as hyphens)
         - "leaderboard-{format}-entry" for each entry
+
+        Values are accumulated per player as results are saved; after
+        changing these configs, run `python -m server.cli rebuild-stats`.
         """
         return []
 
@@ -317,6 +330,7 @@ class Game(
 
         player.replaced_human = True
         player.is_bot = True
+        self.request_tick()
         self._users.pop(player.id, None)
 
         bot_user = Bot(player.name, uuid=player.id)
@@ -336,6 +350,66 @@ class Game(
         # Check if duration estimation has completed
         self.check_estimate_completion()
 
+    def next_wakeup_tick(self) -> int | None:
+        """Return the sound_scheduler_tick at which on_tick next has work to do.
+
+        The table manager skips this game's ticks until then, or until a
+        player acts when this returns None (see request_tick). Games tick
+        every time except in the lobby and, for games that set
+        idle_between_moves, during play with no bots.
+        """
+        if self._estimate_running:
+            return self.sound_scheduler_tick
+        if self.status != "waiting" and (
+            not self.idle_between_moves
+            or self.status != "playing"
+            or any(player.is_bot for player in self.players)
+        ):
+            return self.sound_scheduler_tick
+        return self.next_due_tick()
+
+    def fast_forward_ticks(self) -> int:
+        """Return how many coming ticks would only count down the current bot's think time.
+
+        Only games that set idle_between_moves can be fast-forwarded: their
+        on_tick then does nothing but advance the scheduler clock and
+        decrement the current bot's bot_think_ticks (see BotHelper.on_tick)
+        until a scheduled sound or event is due.
+        """
+        if not self.idle_between_moves or self._estimate_running:
+            return 0
+        if not self.game_active or self.status != "playing":
+            return 0
+        current = self.current_player
+        if not current or not current.is_bot or current.bot_think_ticks <= 0:
+            return 0
+        ticks = current.bot_think_ticks
+        due = self.next_due_tick()
+        if due is not None:
+            ticks = min(ticks, due - self.sound_scheduler_tick)
+        return max(ticks, 0)
+
+    def fast_forward(self, ticks: int) -> None:
+        """Apply `ticks` ticks at once, as counted by fast_forward_ticks()."""
+        self.advance_sound_scheduler(ticks)
+        self.current_player.bot_think_ticks -= ticks
+
+    def request_tick(self) -> None:
+        """Resume ticking this game if the table manager put it to sleep."""
+        wake = getattr(self._table, "wake", None)
+        if wake:
+            wake()
+
+    def mark_changed(self) -> None:
+        """Have the table save this game at its next checkpoint.
+
+        Actions and anything else that calls request_tick() already do
+        this; on_tick code that changes the game by itself calls it.
+        """
+        mark_dirty = getattr(self._table, "mark_dirty", None)
+        if mark_dirty:
+            mark_dirty()
+
     def on_round_timer_ready(self) -> None:
         """Handle round-timer expiry for games using RoundTransitionTimer."""
         pass
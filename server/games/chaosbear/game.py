@@ -38,6 +38,8 @@ class ChaosBearGame(Game):
     If the bear catches you, you're out! Last player alive wins.
     """
 
+    idle_between_moves = True
+
     players: list[ChaosBearPlayer] = field(default_factory=list)
 
     # Game state
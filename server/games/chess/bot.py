@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
-import random
 
 if TYPE_CHECKING:
     from .game import ChessGame, ChessPlayer
@@ -499,7 +498,7 @@ def _score_move(game: "ChessGame", move: dict, color: str) -> int:
     game.restore_position(saved)
 
     # Small random factor to vary play
-    score += random.randint(-5, 5)  # nosec B311
+    score += game.rng.randint(-5, 5)  # nosec B311
 
     return score
 
@@ -521,7 +520,7 @@ def find_best_move(game: "ChessGame", player: "ChessPlayer") -> dict | None:
     top_score = scored_moves[0][0]
     top_moves = [m for s, m in scored_moves if s >= top_score - 20]
 
-    return random.choice(top_moves)  # nosec B311
+    return game.rng.choice(top_moves)  # nosec B311
 
 
 def bot_think(game: "ChessGame", player: "ChessPlayer") -> str | None:
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-import random
 
 from ..base import Game, Player, GameOptions
 from ..registry import register_game
@@ -535,7 +534,7 @@ class ChessGame(Game):
         self._team_manager.setup_teams([p.name for p in active_players])
 
         # Assign colors randomly
-        if random.random() < 0.5:  # nosec B311
+        if self.rng.random() < 0.5:  # nosec B311
             active_players[0].color = "white"
             active_players[1].color = "black"
         else:
@@ -594,7 +593,7 @@ class ChessGame(Game):
         self.broadcast_personal_l(player, "game-your-turn", "game-turn-start")
 
         if player.is_bot:
-            BotHelper.jolt_bot(player, ticks=random.randint(30, 60))  # nosec B311
+            BotHelper.jolt_bot(player, ticks=self.rng.randint(30, 60))  # nosec B311
 
     def _advance_turn(self) -> None:
         self.advance_turn(announce=False)
@@ -1185,7 +1184,7 @@ class ChessGame(Game):
             direction = -1 if piece["color"] == "white" else 1
             captured_sq = to_sq + 8 * direction
             self.board[captured_sq] = None
-            self.play_sound(f"game_chess/capture{random.randint(1, 2)}.ogg")  # nosec B311
+            self.play_sound(f"game_chess/capture{self.rng.randint(1, 2)}.ogg")  # nosec B311
             self.broadcast_personal_l(
                 player,
                 "chess-you-en-passant",
@@ -1201,7 +1200,7 @@ class ChessGame(Game):
         # Broadcast and play sounds
         if not en_passant:
             if target:
-                self.play_sound(f"game_chess/capture{random.randint(1, 2)}.ogg")  # nosec B311
+                self.play_sound(f"game_chess/capture{self.rng.randint(1, 2)}.ogg")  # nosec B311
                 self._broadcast_move(
                     player,
                     "chess-you-capture",
@@ -1255,7 +1254,7 @@ class ChessGame(Game):
                 self.promotion_square = to_sq
                 self.rebuild_all_menus()
                 if player.is_bot:
-                    BotHelper.jolt_bot(player, ticks=random.randint(10, 20))  # nosec B311
+                    BotHelper.jolt_bot(player, ticks=self.rng.randint(10, 20))  # nosec B311
                 return
 
         self._post_move_checks(player)
@@ -1263,7 +1262,7 @@ class ChessGame(Game):
     def _play_piece_sound(self, piece_type: str) -> None:
         """Play movement sound for a piece type."""
         sounds = {
-            "pawn": f"game_chess/movepawn{random.randint(1, 3)}.ogg",  # nosec B311
+            "pawn": f"game_chess/movepawn{self.rng.randint(1, 3)}.ogg",  # nosec B311
             "knight": "game_chess/moveknight.ogg",
             "bishop": "game_chess/movebishop.ogg",
             "rook": "game_chess/moverook.ogg",
@@ -940,12 +940,10 @@ class CoupGame(Game):
         self.broadcast_l("coup-plays-coup", player=player.name, target=target.name)
 
         duration = self.get_audio_duration_ticks("coup.ogg")
-        self.event_queue.append(
-            (
-                self.sound_scheduler_tick + duration,
-                "prompt_lose_influence",
-                {"target_id": target.id, "reason": "coup"},
-            )
+        self.schedule_event(
+            "prompt_lose_influence",
+            {"target_id": target.id, "reason": "coup"},
+            delay_ticks=duration,
         )
 
     def _action_tax(self, player: Player, action_id: str) -> None:
@@ -1035,13 +1033,7 @@ class CoupGame(Game):
         self.broadcast_l("coup-challenges", challenger=player.name, target=claimer.name)
 
         duration = self.get_audio_duration_ticks("challenge.ogg")
-        self.event_queue.append(
-            (
-                self.sound_scheduler_tick + duration,
-                "resolve_challenge",
-                {"challenger_id": player.id},
-            )
-        )
+        self.schedule_event("resolve_challenge", {"challenger_id": player.id}, delay_ticks=duration)
 
     def _action_block(self, player: Player, action_id: str) -> None:
         if self.turn_phase != "action_declared":
@@ -1141,22 +1133,7 @@ class CoupGame(Game):
         }
         return mapping.get(action, "")
 
-    def _process_events(self) -> None:
-        """Process queued game events."""
-        if not self.event_queue:
-            return
-
-        current_queue = list(self.event_queue)
-        self.event_queue = []
-        current_tick = self.sound_scheduler_tick
-
-        for tick, event_type, data in current_queue:
-            if tick <= current_tick:
-                self._handle_event(event_type, data)
-            else:
-                self.event_queue.append((tick, event_type, data))
-
-    def _handle_event(self, event_type: str, data: dict) -> None:
+    def on_game_event(self, event_type: str, data: dict) -> None:
         if event_type == "resolve_income":
             player = self.get_player_by_id(data.get("player_id"))
             if player:
@@ -1281,12 +1258,10 @@ class CoupGame(Game):
                 # We will just play the block success sound alongside the challenge success.
                 # Technically we should maybe sequentialize this, but both are short.
 
-            self.event_queue.append(
-                (
-                    self.sound_scheduler_tick + duration,
-                    "post_challenge_lose_influence",
-                    {"target_id": player.id, "reason": "failed_challenge"},
-                )
+            self.schedule_event(
+                "post_challenge_lose_influence",
+                {"target_id": player.id, "reason": "failed_challenge"},
+                delay_ticks=duration,
             )
 
         else:
@@ -1302,12 +1277,10 @@ class CoupGame(Game):
 
             self.broadcast_l("coup-bluff-called", player=claimer.name)
 
-            self.event_queue.append(
-                (
-                    self.sound_scheduler_tick + duration,
-                    "post_challenge_lose_influence",
-                    {"target_id": claimer.id, "reason": "lost_challenge"},
-                )
+            self.schedule_event(
+                "post_challenge_lose_influence",
+                {"target_id": claimer.id, "reason": "lost_challenge"},
+                delay_ticks=duration,
             )
 
     def on_tick(self) -> None:
@@ -1317,7 +1290,7 @@ class CoupGame(Game):
         if not self.game_active:
             return
 
-        self._process_events()
+        self.process_scheduled_events()
 
         if self.interrupt_timer_ticks > 0 and not self.is_resolving:
             self.interrupt_timer_ticks -= 1
@@ -1346,9 +1319,7 @@ class CoupGame(Game):
                         self.play_sound(f"game_coup/{sound_file}")
 
                     duration = self.get_audio_duration_ticks(sound_file) if sound_file else 0
-                    self.event_queue.append(
-                        (self.sound_scheduler_tick + duration, "post_block_success", {})
-                    )
+                    self.schedule_event("post_block_success", {}, delay_ticks=duration)
 
         CoupBot.on_tick(self)
 
@@ -1385,12 +1356,10 @@ class CoupGame(Game):
             )
 
             duration = self.get_audio_duration_ticks(sound_file)
-            self.event_queue.append(
-                (
-                    self.sound_scheduler_tick + duration,
-                    "prompt_lose_influence",
-                    {"target_id": target.id if target else "", "reason": "assassinated"},
-                )
+            self.schedule_event(
+                "prompt_lose_influence",
+                {"target_id": target.id if target else "", "reason": "assassinated"},
+                delay_ticks=duration,
             )
 
         elif self.active_action == "steal":
@@ -1550,7 +1519,7 @@ class CoupGame(Game):
             self.broadcast_l("coup-player-eliminated", player=player.name)
 
         duration = self.get_audio_duration_ticks(sound_file)
-        self.event_queue.append((self.sound_scheduler_tick + duration, "post_lose_influence", {}))
+        self.schedule_event("post_lose_influence", {}, delay_ticks=duration)
 
     def _post_lose_influence(self) -> None:
         if self._losing_player_id and self._losing_player_id in self.player_claims:
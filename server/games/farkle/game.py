@@ -297,6 +297,8 @@ class FarkleGame(ActionGuardMixin, RoundBasedGameMixin, Game):
     First player to reach the target score wins.
     """
 
+    idle_between_moves = True
+
     round_start_sound = None
 
     players: list[FarklePlayer] = field(default_factory=list)
@@ -7,9 +7,11 @@ submit white cards to fill in blanks. The judge picks the funniest submission.
 
 from dataclasses import dataclass, field
 from datetime import datetime
+import hashlib
 import json
-import random
 from pathlib import Path
+import sys
+from typing import Any
 
 from ..base import Game, Player, GameOptions
 from ..registry import register_game
@@ -31,6 +33,8 @@ from server.core.ui.keybinds import KeybindState
 # Pack loading (cached globally)
 # ==========================================================================
 
+PACKS_PATH = Path(__file__).parent / "humanity_packs.json"
+
 _humanity_packs: list[dict] | None = None
 
 
@@ -38,8 +42,7 @@ def load_humanity_packs() -> list[dict]:
     """Load card packs from JSON file. Results are cached."""
     global _humanity_packs
     if _humanity_packs is None:
-        packs_path = Path(__file__).parent / "humanity_packs.json"
-        with open(packs_path, "r", encoding="utf-8") as f:
+        with open(PACKS_PATH, "r", encoding="utf-8") as f:
             _humanity_packs = json.load(f)
     return _humanity_packs
 
@@ -109,17 +112,108 @@ def _get_default_packs() -> list[str]:
 
 
 # ==========================================================================
-# Card ID counter
+# Card table (built once per process)
 # ==========================================================================
 
-_next_card_id = 0
 
+@dataclass(frozen=True)
+class CardTable:
+    """Every card from every pack, indexed once per process.
+
+    Decks, hands and the current black card hold integer indices into these
+    tuples, so a saved game stores small ints rather than copies of the card
+    text. Indices follow the order of humanity_packs.json, so games record
+    ``version`` (a hash of that file) and are not restored against a
+    different one.
+    """
+
+    white_text: tuple[str, ...]
+    black_text: tuple[str, ...]
+    black_pick: tuple[int, ...]
+    white_by_pack: dict[str, range]
+    black_by_pack: dict[str, range]
+    version: str
+
+
+_card_table: CardTable | None = None
+
+
+def load_card_table() -> CardTable:
+    """Index all packs into a CardTable. Results are cached."""
+    global _card_table
+    if _card_table is None:
+        white_text: list[str] = []
+        black_text: list[str] = []
+        black_pick: list[int] = []
+        white_by_pack: dict[str, range] = {}
+        black_by_pack: dict[str, range] = {}
+        for pack in load_humanity_packs():
+            start = len(white_text)
+            for card in pack.get("white", []):
+                white_text.append(sys.intern(card["text"].rstrip(".")))
+            white_by_pack[pack["name"]] = range(start, len(white_text))
+
+            start = len(black_text)
+            for card in pack.get("black", []):
+                text = card["text"]
+                black_text.append(sys.intern(text))
+                black_pick.append(text.count("_") or 1)  # Cards with no blanks get 1 pick
+            black_by_pack[pack["name"]] = range(start, len(black_text))
+        _card_table = CardTable(
+            white_text=tuple(white_text),
+            black_text=tuple(black_text),
+            black_pick=tuple(black_pick),
+            white_by_pack=white_by_pack,
+            black_by_pack=black_by_pack,
+            version=hashlib.sha256(PACKS_PATH.read_bytes()).hexdigest()[:16],
+        )
+    return _card_table
+
+
+def _card_indices(texts: tuple[str, ...], by_pack: dict[str, range]) -> dict[tuple, int]:
+    """Map (pack name, card text) to card index, for migrating old saves.
+
+    A text repeated within a pack maps to its first index; the copies read
+    the same, so which one a save ends up holding does not matter.
+    """
+    indices: dict[tuple, int] = {}
+    for pack, cards in by_pack.items():
+        for index in cards:
+            indices.setdefault((pack, texts[index]), index)
+    return indices
 
-def _make_card_id() -> int:
-    """Generate a unique card ID for this session."""
-    global _next_card_id
-    _next_card_id += 1
-    return _next_card_id
+
+def _migrate_card_dicts(state: dict[str, Any]) -> None:
+    """Replace the card dicts of a pre-CardTable save with card indices, in place.
+
+    Old saves held {"text", "pack", ...} dicts. Cards no longer in their pack
+    are dropped from decks and discards; a missing card in a hand or on the
+    table cannot be replaced, so the save is refused.
+    """
+    table = load_card_table()
+    white = _card_indices(table.white_text, table.white_by_pack)
+    black = _card_indices(table.black_text, table.black_by_pack)
+
+    def convert(card: Any, index: dict[tuple, int], required: bool) -> int | None:
+        if not isinstance(card, dict):
+            return card
+        found = index.get((card.get("pack"), card.get("text")))
+        if found is None and required:
+            raise ValueError(f"Humanity Cards card no longer exists: {card.get('text')!r}")
+        return found
+
+    for key, index in (
+        ("white_deck", white),
+        ("white_discard", white),
+        ("black_deck", black),
+        ("black_discard", black),
+    ):
+        cards = [convert(card, index, False) for card in state.get(key) or []]
+        state[key] = [card for card in cards if card is not None]
+    for player in state.get("players") or []:
+        player["hand"] = [convert(card, white, True) for card in player.get("hand") or []]
+    state["current_black_card"] = convert(state.get("current_black_card"), black, True)
+    state["card_table_version"] = table.version
 
 
 # ==========================================================================
@@ -132,7 +226,7 @@ class HumanityCardsPlayer(Player):
     """Player state for Humanity Cards game."""
 
     score: int = 0
-    hand: list[dict] = field(default_factory=list)  # {"text": str, "pack": str, "id": int}
+    hand: list[int] = field(default_factory=list)  # White card indices into the CardTable
     submitted_cards: list[str] | None = None  # Text of submitted cards (None = not submitted)
     selected_indices: list[int] = field(default_factory=list)  # Indices into hand
 
@@ -226,17 +320,41 @@ class HumanityCardsGame(Game):
 
     # Game state
     phase: str = "waiting"  # waiting, submitting, judging, round_end
-    white_deck: list[dict] = field(default_factory=list)
-    black_deck: list[dict] = field(default_factory=list)
-    white_discard: list[dict] = field(default_factory=list)
-    black_discard: list[dict] = field(default_factory=list)
-    current_black_card: dict | None = None  # {"text": str, "pick": int, "pack": str}
+    # Decks hold card indices into the CardTable
+    white_deck: list[int] = field(default_factory=list)
+    black_deck: list[int] = field(default_factory=list)
+    white_discard: list[int] = field(default_factory=list)
+    black_discard: list[int] = field(default_factory=list)
+    current_black_card: int | None = None
+    card_table_version: str = ""  # CardTable.version the indices above refer to
     judge_indices: list[int] = field(default_factory=list)  # Indices into active players
     last_winner_index: int = -1  # For "Most Recent Winner" czar selection
     submissions: list[dict] = field(default_factory=list)  # [{"player_id": str, "cards": [str]}]
     submission_order: list[int] = field(default_factory=list)  # Shuffled indices into submissions
     round_end_ticks: int = 0  # Countdown ticks before next round starts
 
+    @classmethod
+    def __pre_deserialize__(cls, d: dict[str, Any]) -> dict[str, Any]:
+        """Migrate saves with card dicts, and refuse ones from other packs.
+
+        Raises:
+            ValueError: The saved cards refer to a different humanity_packs.json,
+                or a card in play no longer exists.
+        """
+        decks = ("white_deck", "black_deck", "white_discard", "black_discard")
+        hands = [player.get("hand") or [] for player in d.get("players") or []]
+        cards = [card for key in decks for card in d.get(key) or []]
+        cards += [card for hand in hands for card in hand]
+        if d.get("current_black_card") is not None:
+            cards.append(d["current_black_card"])
+        if any(isinstance(card, dict) for card in cards):
+            _migrate_card_dicts(d)
+        elif cards and d.get("card_table_version", "") not in ("", load_card_table().version):
+            # Saves from before card_table_version was recorded have no version
+            # and were written against the current file.
+            raise ValueError("Humanity Cards packs changed since this game was saved")
+        return d
+
     @classmethod
     def get_name(cls) -> str:
         return "Cards Against Humanity"
@@ -270,46 +388,40 @@ class HumanityCardsGame(Game):
 
     def _build_decks(self) -> None:
         """Build white and black decks from selected packs."""
-        packs = load_humanity_packs()
+        table = load_card_table()
         active_pack_names = set(self._get_active_packs())
+        self.card_table_version = table.version
 
         self.white_deck = []
         self.black_deck = []
         self.white_discard = []
         self.black_discard = []
 
-        for pack in packs:
-            if pack["name"] not in active_pack_names:
-                continue
-            pack_name = pack["name"]
+        for pack_name in table.white_by_pack:
+            if pack_name in active_pack_names:
+                self.white_deck.extend(table.white_by_pack[pack_name])
+                self.black_deck.extend(table.black_by_pack[pack_name])
 
-            for card in pack.get("white", []):
-                text = card["text"].rstrip(".")
-                self.white_deck.append(
-                    {
-                        "text": text,
-                        "pack": pack_name,
-                        "id": _make_card_id(),
-                    }
-                )
+        self.rng.shuffle(self.white_deck)  # nosec B311
+        self.rng.shuffle(self.black_deck)  # nosec B311
 
-            for card in pack.get("black", []):
-                text = card["text"]
-                pick = text.count("_")
-                if pick == 0:
-                    pick = 1  # Cards with no blanks get 1 pick
-                self.black_deck.append(
-                    {
-                        "text": text,
-                        "pick": pick,
-                        "pack": pack_name,
-                    }
-                )
+    def _white_text(self, card: int) -> str:
+        """Get the text of a white card."""
+        return load_card_table().white_text[card]
+
+    def _black_text(self) -> str:
+        """Get the text of the current black card, or "" if there is none."""
+        if self.current_black_card is None:
+            return ""
+        return load_card_table().black_text[self.current_black_card]
 
-        random.shuffle(self.white_deck)  # nosec B311
-        random.shuffle(self.black_deck)  # nosec B311
+    def _black_pick(self) -> int:
+        """Get how many white cards the current black card needs."""
+        if self.current_black_card is None:
+            return 1
+        return load_card_table().black_pick[self.current_black_card]
 
-    def _draw_white(self, count: int = 1) -> list[dict]:
+    def _draw_white(self, count: int = 1) -> list[int]:
         """Draw white cards from the deck, reshuffling discard if needed."""
         cards = []
         for _ in range(count):
@@ -317,7 +429,7 @@ class HumanityCardsGame(Game):
                 if self.white_discard:
                     self.white_deck = list(self.white_discard)
                     self.white_discard = []
-                    random.shuffle(self.white_deck)  # nosec B311
+                    self.rng.shuffle(self.white_deck)  # nosec B311
                     self.broadcast_l("hc-deck-reshuffled")
                 else:
                     break  # No cards available
@@ -325,13 +437,13 @@ class HumanityCardsGame(Game):
                 cards.append(self.white_deck.pop())
         return cards
 
-    def _draw_black(self) -> dict | None:
+    def _draw_black(self) -> int | None:
         """Draw a black card from the deck, reshuffling discard if needed."""
         if not self.black_deck:
             if self.black_discard:
                 self.black_deck = list(self.black_discard)
                 self.black_discard = []
-                random.shuffle(self.black_deck)  # nosec B311
+                self.rng.shuffle(self.black_deck)  # nosec B311
                 self.broadcast_l("hc-black-deck-reshuffled")
             else:
                 return None
@@ -397,7 +509,7 @@ class HumanityCardsGame(Game):
 
         if mode == "Random":
             indices = list(range(len(active)))
-            random.shuffle(indices)  # nosec B311
+            self.rng.shuffle(indices)  # nosec B311
             self.judge_indices = indices[:num_judges]
         elif mode == "Most Recent Winner":
             if self.last_winner_index >= 0 and self.last_winner_index < len(active):
@@ -649,8 +761,8 @@ class HumanityCardsGame(Game):
         user = self.get_user(player)
         locale = user.locale if user else "en"
         if idx in hcp.selected_indices:
-            return Localization.get(locale, "hc-card-selected", text=card["text"])
-        return Localization.get(locale, "hc-card-not-selected", text=card["text"])
+            return Localization.get(locale, "hc-card-selected", text=self._white_text(card))
+        return Localization.get(locale, "hc-card-not-selected", text=self._white_text(card))
 
     def _get_toggle_card_sound(self, player: Player, action_id: str) -> str | None:
         hcp: HumanityCardsPlayer = player  # type: ignore
@@ -671,7 +783,7 @@ class HumanityCardsGame(Game):
             return "hc-already-submitted"
         if self.phase != "submitting":
             return "action-not-playing"
-        required = self.current_black_card["pick"] if self.current_black_card else 1
+        required = self._black_pick()
         if len(hcp.selected_indices) != required:
             return ("hc-wrong-card-count", {"count": required})
         return None
@@ -692,7 +804,7 @@ class HumanityCardsGame(Game):
         hcp: HumanityCardsPlayer = player  # type: ignore
         user = self.get_user(player)
         locale = user.locale if user else "en"
-        required = self.current_black_card["pick"] if self.current_black_card else 1
+        required = self._black_pick()
         return Localization.get(
             locale,
             "hc-submit-cards",
@@ -734,8 +846,8 @@ class HumanityCardsGame(Game):
             sub_idx = self.submission_order[idx]
             if sub_idx < len(self.submissions):
                 sub = self.submissions[sub_idx]
-                if self.current_black_card:
-                    return self._fill_in_blanks(self.current_black_card["text"], sub["cards"])
+                if self.current_black_card is not None:
+                    return self._fill_in_blanks(self._black_text(), sub["cards"])
                 return ", ".join(sub["cards"])
         return f"Submission {idx + 1}"
 
@@ -759,8 +871,8 @@ class HumanityCardsGame(Game):
         return Visibility.VISIBLE
 
     def _get_judge_prompt_header_label(self, player: Player, action_id: str) -> str:
-        if self.current_black_card:
-            prompt_text = self._speech_friendly_black(self.current_black_card["text"])
+        if self.current_black_card is not None:
+            prompt_text = self._speech_friendly_black(self._black_text())
             return f"Choose the best card that matches: {prompt_text}"
         return "Choose the best card"
 
@@ -770,8 +882,8 @@ class HumanityCardsGame(Game):
         for idx in self.submission_order:
             if idx < len(self.submissions):
                 sub = self.submissions[idx]
-                if self.current_black_card:
-                    filled = self._fill_in_blanks(self.current_black_card["text"], sub["cards"])
+                if self.current_black_card is not None:
+                    filled = self._fill_in_blanks(self._black_text(), sub["cards"])
                 else:
                     filled = ", ".join(sub["cards"])
                 options.append(filled)
@@ -904,7 +1016,7 @@ class HumanityCardsGame(Game):
         if index >= len(hcp.hand):
             return
 
-        required = self.current_black_card["pick"] if self.current_black_card else 1
+        required = self._black_pick()
 
         user = self.get_user(player)
         if index in hcp.selected_indices:
@@ -1040,7 +1152,7 @@ class HumanityCardsGame(Game):
         if self._is_judge(hcp):
             return
 
-        required = self.current_black_card["pick"] if self.current_black_card else 1
+        required = self._black_pick()
         if len(hcp.selected_indices) != required:
             user = self.get_user(player)
             if user:
@@ -1053,7 +1165,7 @@ class HumanityCardsGame(Game):
         for idx in hcp.selected_indices:
             if idx < len(hcp.hand):
                 card = hcp.hand[idx]
-                submitted_texts.append(card["text"])
+                submitted_texts.append(self._white_text(card))
 
         hcp.submitted_cards = submitted_texts
 
@@ -1066,7 +1178,7 @@ class HumanityCardsGame(Game):
         hcp.selected_indices = []
 
         # Sound + announcement
-        self.play_sound(f"game_humanitycards/submit{random.randint(1, 2)}.ogg")  # nosec B311
+        self.play_sound(f"game_humanitycards/submit{self.rng.randint(1, 2)}.ogg")  # nosec B311
         user = self.get_user(player)
         if user:
             user.speak_l("hc-submitted")
@@ -1114,13 +1226,13 @@ class HumanityCardsGame(Game):
 
         # Announce winner
         winning_text = self._fill_in_blanks(
-            self.current_black_card["text"] if self.current_black_card else "",
+            self._black_text(),
             winning_sub["cards"],
         )
 
         # Play judge choice sound
         self.play_sound(
-            f"game_humanitycards/judgechoice{random.randint(1, 3)}.ogg"  # nosec B311
+            f"game_humanitycards/judgechoice{self.rng.randint(1, 3)}.ogg"  # nosec B311
         )
 
         self.broadcast_l(
@@ -1144,7 +1256,7 @@ class HumanityCardsGame(Game):
             sub_player = self.get_player_by_id(sub["player_id"])
             if sub_player:
                 filled = self._fill_in_blanks(
-                    self.current_black_card["text"] if self.current_black_card else "",
+                    self._black_text(),
                     sub["cards"],
                 )
                 self.broadcast_l(
@@ -1154,7 +1266,7 @@ class HumanityCardsGame(Game):
                 )
 
         # Play draw card sound as players receive new cards
-        self.play_sound(f"game_cards/draw{random.randint(1, 4)}.ogg")  # nosec B311
+        self.play_sound(f"game_cards/draw{self.rng.randint(1, 4)}.ogg")  # nosec B311
 
         # Check win condition
         if hc_winner.score >= self.options.winning_score:
@@ -1165,7 +1277,7 @@ class HumanityCardsGame(Game):
             self.round_end_ticks = 100  # ~5 seconds at 20 ticks/sec
 
             # Discard current black card
-            if self.current_black_card:
+            if self.current_black_card is not None:
                 self.black_discard.append(self.current_black_card)
                 self.current_black_card = None
 
@@ -1174,9 +1286,9 @@ class HumanityCardsGame(Game):
     def _action_view_black_card(self, player: Player, action_id: str) -> None:
         """View the current black card prompt."""
         user = self.get_user(player)
-        if not user or not self.current_black_card:
+        if not user or self.current_black_card is None:
             return
-        text = self._speech_friendly_black(self.current_black_card["text"])
+        text = self._speech_friendly_black(self._black_text())
         user.speak_l("hc-black-card", text=text)
 
     def _action_view_submission(self, player: Player, action_id: str) -> None:
@@ -1186,13 +1298,15 @@ class HumanityCardsGame(Game):
         if not user:
             return
 
-        if hcp.submitted_cards is not None and self.current_black_card:
-            filled = self._fill_in_blanks(self.current_black_card["text"], hcp.submitted_cards)
+        if hcp.submitted_cards is not None and self.current_black_card is not None:
+            filled = self._fill_in_blanks(self._black_text(), hcp.submitted_cards)
             user.speak_l("hc-your-submission", text=filled)
-        elif hcp.selected_indices and self.current_black_card:
+        elif hcp.selected_indices and self.current_black_card is not None:
             # Preview current selection
-            cards = [hcp.hand[i]["text"] for i in hcp.selected_indices if i < len(hcp.hand)]
-            filled = self._fill_in_blanks(self.current_black_card["text"], cards)
+            cards = [
+                self._white_text(hcp.hand[i]) for i in hcp.selected_indices if i < len(hcp.hand)
+            ]
+            filled = self._fill_in_blanks(self._black_text(), cards)
             user.speak_l("hc-preview-submission-text", text=filled)
         else:
             user.speak_l("hc-select-cards-first")
@@ -1306,12 +1420,12 @@ class HumanityCardsGame(Game):
 
         # Draw black card
         self.current_black_card = self._draw_black()
-        if not self.current_black_card:
+        if self.current_black_card is None:
             self.broadcast_l("hc-not-enough-cards")
             self.finish_game()
             return
 
-        pick_count = self.current_black_card.get("pick", 1)
+        pick_count = self._black_pick()
 
         # Announce round
         self.broadcast_l("hc-round-start", round=self.round)
@@ -1325,7 +1439,7 @@ class HumanityCardsGame(Game):
             self.broadcast_l("hc-judge-is", player=judges[0].name, count=len(judges), others=others)
 
         # Announce black card
-        black_text = self._speech_friendly_black(self.current_black_card["text"])
+        black_text = self._speech_friendly_black(self._black_text())
         self.broadcast_l("hc-black-card", text=black_text)
         if pick_count > 1:
             self.broadcast_l("hc-black-card-pick", count=pick_count)
@@ -1339,7 +1453,7 @@ class HumanityCardsGame(Game):
         # Jolt bots
         for p in active_players:
             if p.is_bot and not self._is_judge(p):
-                BotHelper.jolt_bot(p, ticks=random.randint(20, 40))  # nosec B311
+                BotHelper.jolt_bot(p, ticks=self.rng.randint(20, 40))  # nosec B311
 
         self.rebuild_all_menus()
 
@@ -1360,7 +1474,7 @@ class HumanityCardsGame(Game):
 
         # Shuffle presentation order
         self.submission_order = list(range(len(self.submissions)))
-        random.shuffle(self.submission_order)  # nosec B311
+        self.rng.shuffle(self.submission_order)  # nosec B311
 
         self.play_sound("game_humanitycards/judging.ogg")
         self.broadcast_l("hc-judging-start")
@@ -1368,7 +1482,7 @@ class HumanityCardsGame(Game):
         # Jolt judge bots
         for j in self._get_judges():
             if j.is_bot:
-                BotHelper.jolt_bot(j, ticks=random.randint(30, 50))  # nosec B311
+                BotHelper.jolt_bot(j, ticks=self.rng.randint(30, 50))  # nosec B311
 
         self.rebuild_all_menus()
 
@@ -1392,13 +1506,13 @@ class HumanityCardsGame(Game):
         if self.phase == "submitting" and not self._is_judge(player):
             if player.submitted_cards is not None:
                 return None
-            required = self.current_black_card["pick"] if self.current_black_card else 1
+            required = self._black_pick()
 
             # Select random cards if not enough selected
             if len(player.selected_indices) < required:
                 available = [i for i in range(len(player.hand)) if i not in player.selected_indices]
                 if available:
-                    pick = random.choice(available)  # nosec B311
+                    pick = self.rng.choice(available)  # nosec B311
                     return f"toggle_card_{pick}"
 
             # Submit when we have enough
@@ -1460,7 +1574,7 @@ class HumanityCardsGame(Game):
 
             # Bot judge picks a random submission
             if self.submission_order:
-                pick = random.randint(0, len(self.submission_order) - 1)  # nosec B311
+                pick = self.rng.randint(0, len(self.submission_order) - 1)  # nosec B311
                 judge.bot_pending_action = f"judge_pick_{pick}"
 
     # ==========================================================================
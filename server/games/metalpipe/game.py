@@ -59,6 +59,8 @@ class MetalPipeGame(Game):
     only one player remains.
     """
 
+    idle_between_moves = True
+
     players: list[MetalPipePlayer] = field(default_factory=list)
     options: MetalPipeOptions = field(default_factory=MetalPipeOptions)
 
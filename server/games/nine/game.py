@@ -90,6 +90,8 @@ SUIT_KEYS = {
 class NineGame(Game):
     "nine-description"
 
+    idle_between_moves = True
+
     #    Nine - A card game where players form sequences.
 
     players: list[NinePlayer] = field(default_factory=list)
@@ -94,6 +94,8 @@ class PigGame(PushYourLuckBotMixin, ActionGuardMixin, RoundBasedGameMixin, Game)
     First player to reach the target score wins.
     """
 
+    idle_between_moves = True
+
     # Game-specific state - use PigPlayer list instead of Player
     players: list[PigPlayer] = field(default_factory=list)
     options: PigOptions = field(default_factory=PigOptions)
@@ -103,6 +103,8 @@ class PiratesGame(Game):
     - Golden Moon event every 3rd round (3x XP)
     """
 
+    idle_between_moves = True
+
     players: list[PiratesPlayer] = field(default_factory=list)
     options: PiratesOptions = field(default_factory=PiratesOptions)
 
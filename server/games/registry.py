@@ -1,15 +1,140 @@
-"""Game registry for registering and looking up game types."""
-
+"""Game registry for registering and looking up game types.
+
+Game modules are not imported up front. Their type, names, category and
+player counts come from a static index (game_index.json, regenerated with
+tools/export_game_index.py), and a game's module is imported the first time
+its class is asked for.
+"""
+
+import importlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Type, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .base import Game
 
+INDEX_PATH = Path(__file__).parent / "game_index.json"
+
+#: Modules defining each game, in menu order. Add new games here and
+#: regenerate the index.
+GAME_MODULES = [
+    "server.games.pig.game",
+    "server.games.scopa.game",
+    "server.games.lightturret.game",
+    "server.games.threes.game",
+    "server.games.milebymile.game",
+    "server.games.chaosbear.game",
+    "server.games.farkle.game",
+    "server.games.yahtzee.game",
+    "server.games.ninetynine.game",
+    "server.games.tradeoff.game",
+    "server.games.pirates.game",
+    "server.games.leftrightcenter.game",
+    "server.games.ludo.game",
+    "server.games.tossup.game",
+    "server.games.midnight.game",
+    "server.games.ageofheroes.game",
+    "server.games.fivecarddraw.game",
+    "server.games.holdem.game",
+    "server.games.crazyeights.game",
+    "server.games.snakesandladders.game",
+    "server.games.rollingballs.game",
+    "server.games.sorry.game",
+    "server.games.metalpipe.game",
+    "server.games.humanitycards.game",
+    "server.games.nine.game",
+    "server.games.blackjack.game",
+    "server.games.twentyone.game",
+    "server.games.chess.game",
+    "server.games.backgammon.game",
+    "server.games.senet.game",
+    # PlayAural games
+    "server.games.battleship.game",
+    "server.games.coup.game",
+    "server.games.dominos.game",
+    "server.games.lastcard.game",
+    "server.games.pusoydos.game",
+]
+
+
+@dataclass(frozen=True)
+class GameInfo:
+    """Index entry for a game, answering the same metadata classmethods as its class."""
+
+    type: str
+    class_name: str
+    module: str
+    name: str
+    name_key: str
+    category: str
+    min_players: int
+    max_players: int
+    relevant_preferences: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_class(cls, game_class: Type["Game"]) -> "GameInfo":
+        """Build an index entry from a loaded game class."""
+        return cls(
+            type=game_class.get_type(),
+            class_name=game_class.__name__,
+            module=game_class.__module__,
+            name=game_class.get_name(),
+            name_key=game_class.get_name_key(),
+            category=game_class.get_category(),
+            min_players=game_class.get_min_players(),
+            max_players=game_class.get_max_players(),
+            relevant_preferences=list(game_class.relevant_preferences),
+        )
+
+    def get_type(self) -> str:
+        return self.type
+
+    def get_name(self) -> str:
+        return self.name
+
+    def get_name_key(self) -> str:
+        return self.name_key
+
+    def get_category(self) -> str:
+        return self.category
+
+    def get_min_players(self) -> int:
+        return self.min_players
+
+    def get_max_players(self) -> int:
+        return self.max_players
+
+    def to_dict(self) -> dict:
+        """Return the entry as written to the index file."""
+        return {
+            "type": self.type,
+            "class_name": self.class_name,
+            "module": self.module,
+            "name": self.name,
+            "name_key": self.name_key,
+            "category": self.category,
+            "min_players": self.min_players,
+            "max_players": self.max_players,
+            "relevant_preferences": self.relevant_preferences,
+        }
+
+
+def _load_index(path: Path = INDEX_PATH) -> dict[str, GameInfo]:
+    """Read the game index, or return an empty one if it has not been generated."""
+    try:
+        entries = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    return {entry["type"]: GameInfo(**entry) for entry in entries}
+
 
 class GameRegistry:
     """Registry of all available game types."""
 
-    _games: dict[str, Type["Game"]] = {}
+    _games: dict[str, Type["Game"]] = {}  # loaded classes
+    _index: dict[str, GameInfo] = _load_index()
 
     @classmethod
     def register(cls, game_class: Type["Game"]) -> None:
@@ -19,18 +144,44 @@ class GameRegistry:
 
     @classmethod
     def get(cls, game_type: str) -> Type["Game"] | None:
-        """Get a game class by type."""
-        return cls._games.get(game_type)
+        """Get a game class by type, importing its module on first use."""
+        game_class = cls._games.get(game_type)
+        if game_class is None and game_type in cls._index:
+            importlib.import_module(cls._index[game_type].module)
+            game_class = cls._games.get(game_type)
+        return game_class
 
     @classmethod
     def get_game_class(cls, game_type: str) -> Type["Game"] | None:
         """Backward compatible alias for getting a game class by type."""
         return cls.get(game_type)
 
+    @classmethod
+    def get_info(cls, game_type: str) -> "GameInfo | Type[Game] | None":
+        """Get a game's metadata without importing it."""
+        return cls._index.get(game_type) or cls._games.get(game_type)
+
+    @classmethod
+    def get_infos(cls) -> list["GameInfo | Type[Game]"]:
+        """Get metadata for all games without importing them.
+
+        Games registered without an index entry are returned as their class.
+        """
+        infos: list[GameInfo | Type[Game]] = list(cls._index.values())
+        infos.extend(game for game_type, game in cls._games.items() if game_type not in cls._index)
+        return infos
+
+    @classmethod
+    def load_all(cls) -> None:
+        """Import every indexed game module."""
+        for game_type in cls._index:
+            cls.get(game_type)
+
     @classmethod
     def get_all(cls) -> list[Type["Game"]]:
-        """Get all registered game classes."""
-        return list(cls._games.values())
+        """Get all game classes, importing any not yet loaded."""
+        cls.load_all()
+        return [cls._games[info.get_type()] for info in cls.get_infos()]
 
     @classmethod
     def get_games_for_preference(cls, pref_name: str) -> list[str]:
@@ -39,17 +190,25 @@ class GameRegistry:
         Results are sorted alphabetically for stable menu ordering.
         """
         result = []
-        for game_type, game_cls in cls._games.items():
-            if pref_name in getattr(game_cls, "relevant_preferences", []):
-                result.append(game_type)
+        for info in cls.get_infos():
+            if pref_name in getattr(info, "relevant_preferences", []):
+                result.append(info.get_type())
         result.sort()
         return result
 
+    @classmethod
+    def get_infos_by_category(cls) -> dict[str, list["GameInfo | Type[Game]"]]:
+        """Get game metadata organized by category, without importing games."""
+        categories: dict[str, list[GameInfo | Type[Game]]] = {}
+        for info in cls.get_infos():
+            categories.setdefault(info.get_category(), []).append(info)
+        return categories
+
     @classmethod
     def get_by_category(cls) -> dict[str, list[Type["Game"]]]:
-        """Get games organized by category."""
+        """Get game classes organized by category."""
         categories: dict[str, list[Type["Game"]]] = {}
-        for game_class in cls._games.values():
+        for game_class in cls.get_all():
             category = game_class.get_category()
             if category not in categories:
                 categories[category] = []
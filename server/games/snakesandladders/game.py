@@ -35,6 +35,8 @@ class SnakesAndLaddersGame(Game):
     Exact roll required to win (bounce back rule).
     """
 
+    idle_between_moves = True
+
     # Game State - Override players list with specific type for Mashumaro
     players: list[SnakesPlayer] = field(default_factory=list)
 
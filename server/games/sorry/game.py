@@ -83,6 +83,8 @@ class SorryOptions(GameOptions):
 class SorryGame(Game):
     """Classic Sorry with rules-profile extension point."""
 
+    idle_between_moves = True
+
     players: list[SorryPlayer] = field(default_factory=list)
     options: SorryOptions = field(default_factory=SorryOptions)
 
@@ -68,6 +68,8 @@ class ThreesGame(ActionGuardMixin, RoundBasedGameMixin, Game, DiceGameMixin):
     Lowest score wins after all rounds.
     """
 
+    idle_between_moves = True
+
     relevant_preferences = ["dice_keeping_style"]
 
     players: list[ThreesPlayer] = field(default_factory=list)
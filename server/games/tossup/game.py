@@ -89,6 +89,8 @@ class TossUpGame(PushYourLuckBotMixin, ActionGuardMixin, RoundBasedGameMixin, Ga
     When you run out of dice, you get a fresh set. First to reach target score wins.
     """
 
+    idle_between_moves = True
+
     # Game-specific state
     players: list[TossUpPlayer] = field(default_factory=list)
     options: TossUpOptions = field(default_factory=TossUpOptions)
@@ -219,7 +221,7 @@ class TossUpGame(PushYourLuckBotMixin, ActionGuardMixin, RoundBasedGameMixin, Ga
         self.play_sound("game_pig/roll.ogg")
 
         # Jolt the rolling player to pause before next action
-        BotHelper.jolt_bot(player, ticks=random.randint(10, 20))  # nosec B311
+        BotHelper.jolt_bot(player, ticks=self.rng.randint(10, 20))  # nosec B311
 
         # Roll the dice
         green = 0
@@ -408,6 +410,11 @@ class TossUpGame(PushYourLuckBotMixin, ActionGuardMixin, RoundBasedGameMixin, Ga
         if target is None:
             target = 15  # Default fallback
 
+        # If we haven't rolled yet, always roll (can't bank nothing, even
+        # when a tiebreaker starts us at or above the target score)
+        if player.turn_points == 0:
+            return "roll"
+
         # If we can win this turn, bank immediately
         my_score = self.get_player_score(player)
         if my_score + player.turn_points >= self.options.target_score:
@@ -416,10 +423,6 @@ class TossUpGame(PushYourLuckBotMixin, ActionGuardMixin, RoundBasedGameMixin, Ga
         # Decide based on dice count and target
         dice_count = player.dice_count
 
-        # If we haven't rolled yet, always roll
-        if player.turn_points == 0:
-            return "roll"
-
         # If we've hit our target, consider banking based on dice count
         if player.turn_points >= target:
             # More dice = more likely to bust, so bank more often
@@ -432,7 +435,7 @@ class TossUpGame(PushYourLuckBotMixin, ActionGuardMixin, RoundBasedGameMixin, Ga
             else:
                 bank_chance = 0.02
 
-            if random.random() < bank_chance:  # nosec B311
+            if self.rng.random() < bank_chance:  # nosec B311
                 return "bank"
             else:
                 return "roll"
@@ -515,5 +518,5 @@ class TossUpGame(PushYourLuckBotMixin, ActionGuardMixin, RoundBasedGameMixin, Ga
 
     def end_turn(self, jolt_min: int = 20, jolt_max: int = 30) -> None:
         """Override to use TossUp's turn advancement logic."""
-        BotHelper.jolt_bots(self, ticks=random.randint(jolt_min, jolt_max))  # nosec B311
+        BotHelper.jolt_bots(self, ticks=self.rng.randint(jolt_min, jolt_max))  # nosec B311
         self._on_turn_end()
@@ -209,6 +209,8 @@ class YahtzeeGame(ActionGuardMixin, Game, DiceGameMixin):
     Highest total score wins.
     """
 
+    idle_between_moves = True
+
     relevant_preferences = ["clear_kept_on_roll", "dice_keeping_style"]
 
     players: list[YahtzeePlayer] = field(default_factory=list)
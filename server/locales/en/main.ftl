@@ -177,6 +177,7 @@ missing-players = Cannot restore: these players are not available: { $players }
 table-restored = Table restored! All players have been transferred.
 table-saved-destroying = Table saved! Returning to main menu.
 game-type-not-found = Game type no longer exists.
+saved-table-load-failed = This saved table can no longer be loaded.
 
 # Action disabled reasons
 action-not-your-turn = It's not your turn.
@@ -325,6 +326,7 @@ rate-limit-login-ip = Too many login attempts from this address. Please wait and
 rate-limit-login-user = Too many failed login attempts for this username. Please wait and try again.
 rate-limit-registration = Too many registration attempts from this address. Please wait and try again.
 rate-limit-refresh = Too many refresh attempts from this address. Please wait and try again.
+auth-busy = The server is busy handling other logins. Please try again in a moment.
 
 # Session/auth errors
 account-not-found = Account not found.
@@ -392,6 +394,16 @@ you-have-been-unbanned = You have been unbanned from this server.
     Reason:
 ban-no-reason = No reason given.
 
+# Server status
+server-status = Server Status
+server-status-tick = Ticks: { $ticks } at { $interval } ms, average { $mean } ms, 95th percentile { $p95 } ms, max { $max } ms. Over budget: { $overruns }, skipped: { $skipped }, policy: { $policy }.
+server-status-tick-phase = { $phase }: average { $mean } ms, 95th percentile { $p95 } ms, max { $max } ms, caused { $overruns } overruns.
+server-status-game-cost = { $game }: { $tables } open tables, { $total } ms spent ticking, average { $mean } ms, max { $max } ms per table tick.
+server-status-packets = Outgoing packets: validation { $mode }, { $validated } validated, { $fast } fast-encoded, { $mismatches } fast-path mismatches, { $reused } reused shared frames.
+server-status-localization = Localized messages: { $hits } cache hits, { $misses } misses, { $size } of { $max_size } cached.
+server-status-outbox = Outbound queues: { $queued } packets queued, deepest { $max_depth } of { $high }, { $dropped } low-priority packets dropped, { $evicted } slow clients disconnected.
+server-status-no-ticks = No ticks have been recorded yet.
+
 # Virtual bots (server owner only)
 virtual-bots = Virtual Bots
 virtual-bots-fill = Fill Server
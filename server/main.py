@@ -64,6 +64,11 @@ Examples:
         action="store_true",
         help="Block startup until all localization bundles compile (default: warm in background).",
     )
+    parser.add_argument(
+        "--preload-games",
+        action="store_true",
+        help="Import every game module at startup (default: import each game on first use).",
+    )
 
     args = parser.parse_args()
 
@@ -78,6 +83,7 @@ Examples:
             ssl_cert=args.ssl_cert,
             ssl_key=args.ssl_key,
             preload_locales=args.preload_locales,
+            preload_games=args.preload_games,
         )
     )
 
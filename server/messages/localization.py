@@ -5,6 +5,7 @@ import json
 import logging
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 from babel.lists import format_list
@@ -15,6 +16,13 @@ from fluent_compiler.resource import FtlResource
 
 LOG = logging.getLogger("playpalace.localization")
 
+# Formatted messages kept by Localization.get. Menu labels such as "back" or
+# "play" are formatted thousands of times a minute with the same arguments.
+FORMAT_CACHE_SIZE = 4096
+
+# Argument types whose values are safe to key the format cache on.
+_CACHEABLE_ARG_TYPES = (str, int, float, bool)
+
 
 class Localization:
     """
@@ -55,6 +63,7 @@ class Localization:
         cls._locales_dir = Path(locales_dir)
         cls._bundles = {}
         cls._missing_key_fallback_warnings = set()
+        cls.clear_format_cache()
         disable_cache = os.environ.get(cls._CACHE_DISABLE_ENV, "").strip().lower()
         cls._cache_enabled = disable_cache not in {"1", "true", "yes", "on"}
         cls._cache_dir = None
@@ -77,6 +86,7 @@ class Localization:
             )
             raise SystemExit(1)
 
+        cls.clear_format_cache()
         found_locale = False
         for locale_dir in cls._locales_dir.iterdir():
             if not locale_dir.is_dir():
@@ -274,6 +284,9 @@ class Localization:
         """
         Get a localized message.
 
+        Results are cached when every argument is a str, int, float or bool;
+        other arguments are formatted on each call.
+
         Args:
             locale: The locale code (e.g., 'en', 'es').
             message_id: The message ID from the .ftl file.
@@ -282,6 +295,21 @@ class Localization:
         Returns:
             The formatted message string.
         """
+        if not kwargs:
+            return _cached_get(locale, message_id, ())
+        args = []
+        for name, value in kwargs.items():
+            if type(value) not in _CACHEABLE_ARG_TYPES:
+                return cls._get_uncached(locale, message_id, kwargs)
+            # The type is part of the key: 1, 1.0 and True hash alike but
+            # format differently.
+            args.append((name, type(value), value))
+        args.sort()
+        return _cached_get(locale, message_id, tuple(args))
+
+    @classmethod
+    def _get_uncached(cls, locale: str, message_id: str, kwargs: dict[str, object]) -> str:
+        """Format a message, falling back to English if the locale lacks it."""
         try:
             return cls._format_message(locale, message_id, kwargs)
         except Exception:
@@ -305,6 +333,22 @@ class Localization:
             )
             return f"[{message_id}]"
 
+    @classmethod
+    def clear_format_cache(cls) -> None:
+        """Drop all cached formatted messages."""
+        _cached_get.cache_clear()
+
+    @classmethod
+    def get_cache_stats(cls) -> dict[str, int]:
+        """Return format cache counters for the admin status screen."""
+        info = _cached_get.cache_info()
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "max_size": info.maxsize,
+        }
+
     @classmethod
     def format_list_and(cls, locale: str, items: list[str]) -> str:
         """
@@ -403,6 +447,14 @@ class Localization:
         return result
 
 
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _cached_get(locale: str, message_id: str, args: tuple[tuple[str, type, object], ...]) -> str:
+    """Format a message for Localization.get from its frozen arguments."""
+    return Localization._get_uncached(
+        locale, message_id, {name: value for name, _, value in args}
+    )
+
+
 def get_message(locale: str, message_id: str, **kwargs) -> str:
     """Convenience function to get a localized message."""
     return Localization.get(locale, message_id, **kwargs)
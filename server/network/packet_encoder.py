@@ -0,0 +1,368 @@
+"""Outbound packet encoding with configurable validation.
+
+Every server->client packet used to go through the pydantic packet models on
+its way out. Packets are built by server code, so this mostly re-checks
+trusted data on the hottest path in the server. PacketEncoder keeps full
+validation available and adds two cheaper modes:
+
+* ``full``: validate every packet with the pydantic models (default).
+* ``sampled``: validate one packet in N per packet type, and check that the
+  fast path produced the same payload; the rest use the fast path.
+* ``off``: always use the fast path.
+
+The fast path is a per-type plan derived from ``packet_models.py``: the
+allowed keys, the defaults pydantic would fill in, and which fields hold
+nested models. It drops None values and fills defaults, which matches
+``model_dump(exclude_none=True)`` for well-formed packets. Packets the plan
+cannot handle (unknown type or keys) fall back to full validation, so a bad
+packet is still refused and logged.
+
+Frames are serialized with orjson when it is installed, and with the
+standard json module otherwise. Packets that go out unchanged to many
+clients can be built as SharedPacket, which keeps its serialized text after
+the first encode so later recipients reuse it.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import BaseModel, ValidationError
+
+from .packet_models import SERVER_TO_CLIENT_PACKET_ADAPTER, ServerToClientPacket
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+PACKET_LOGGER = logging.getLogger("playpalace.packets")
+
+VALIDATION_FULL = "full"
+VALIDATION_SAMPLED = "sampled"
+VALIDATION_OFF = "off"
+VALIDATION_MODES = (VALIDATION_FULL, VALIDATION_SAMPLED, VALIDATION_OFF)
+DEFAULT_SAMPLE_RATE = 100
+
+
+def dumps_packet(payload: dict[str, Any]) -> str:
+    """Serialize a packet payload to a JSON text frame."""
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload)
+
+
+def _read_only(self: "SharedPacket", *args: Any, **kwargs: Any) -> Any:
+    raise TypeError("SharedPacket is read-only; copy it with dict(packet) to change it")
+
+
+class SharedPacket(dict):
+    """A read-only packet dict sent unchanged to many clients.
+
+    The first PacketEncoder.encode stores the serialized frame on ``wire``;
+    later encodes return it as is. Changing the packet afterwards would
+    change it for every recipient and leave ``wire`` stale, so mutating
+    methods raise TypeError.
+    """
+
+    __slots__ = ("wire",)
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.wire: str | None = None
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+
+@dataclass
+class _ModelPlan:
+    """Precomputed fast-path layout for one pydantic model."""
+
+    allowed: frozenset[str]
+    defaults: dict[str, Any]
+    nested: dict[str, "_ModelPlan"] = field(default_factory=dict)
+
+
+def _find_model(annotation: Any) -> type[BaseModel] | None:
+    """Return the pydantic model nested in an annotation, if any."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        found = _find_model(arg)
+        if found is not None:
+            return found
+    return None
+
+
+def _build_plan(model: type[BaseModel]) -> _ModelPlan:
+    """Build the fast-path plan for a model from its declared fields."""
+    defaults: dict[str, Any] = {}
+    nested: dict[str, _ModelPlan] = {}
+    for name, info in model.model_fields.items():
+        if not info.is_required():
+            default = info.get_default(call_default_factory=True)
+            if default is not None:
+                defaults[name] = default
+        inner = _find_model(info.annotation)
+        if inner is not None:
+            nested[name] = _build_plan(inner)
+    return _ModelPlan(allowed=frozenset(model.model_fields), defaults=defaults, nested=nested)
+
+
+def _packet_models() -> list[type[BaseModel]]:
+    """Return every model in the server->client packet union."""
+    union = get_args(ServerToClientPacket)[0]
+    if get_origin(union) is Union:
+        return list(get_args(union))
+    return [union]
+
+
+def _apply_plan(data: dict[str, Any], plan: _ModelPlan) -> dict[str, Any] | None:
+    """Strip None values and fill defaults; None if data has unknown keys."""
+    payload = dict(plan.defaults)
+    for key, value in data.items():
+        if value is None:
+            continue
+        if key not in plan.allowed:
+            return None
+        sub_plan = plan.nested.get(key)
+        if sub_plan is not None:
+            value = _apply_nested(value, sub_plan)
+            if value is None:
+                return None
+        payload[key] = value
+    return payload
+
+
+def _apply_nested(value: Any, plan: _ModelPlan) -> Any:
+    """Apply a nested model plan to a dict or to the dict items of a list."""
+    if isinstance(value, dict):
+        return _apply_plan(value, plan)
+    if isinstance(value, list):
+        items = []
+        for item in value:
+            if isinstance(item, dict):
+                item = _apply_plan(item, plan)
+                if item is None:
+                    return None
+            items.append(item)
+        return items
+    return value
+
+
+PACKET_PLANS: dict[str, _ModelPlan] = {
+    model.model_fields["type"].default: _build_plan(model) for model in _packet_models()
+}
+
+# One representative packet per type, exercising optional and nested fields.
+# The startup self-test runs these through both paths; a new packet type
+# without a sample fails the self-test so this list stays in step with
+# packet_models.py.
+SELF_TEST_PACKETS: list[dict[str, Any]] = [
+    {"type": "authorize_success", "username": "u", "version": "11.0.0", "session_token": None},
+    {
+        "type": "refresh_session_success",
+        "username": "u",
+        "session_token": "a",
+        "session_expires_at": 1,
+        "refresh_token": "r",
+        "refresh_expires_at": 2,
+    },
+    {"type": "refresh_session_failure", "message": "expired"},
+    {"type": "speak", "text": "hello", "buffer": None},
+    {"type": "speak", "text": "hello", "buffer": "activity", "muted": True},
+    {"type": "play_sound", "name": "ding.ogg", "volume": 80, "pan": -10, "pitch": 100},
+    {"type": "play_sound", "name": "ding.ogg"},
+    {"type": "play_music", "name": "theme.ogg"},
+    {"type": "stop_music"},
+    {"type": "play_ambience", "intro": "", "loop": "rain.ogg", "outro": ""},
+    {"type": "stop_ambience"},
+    {
+        "type": "menu",
+        "menu_id": "turn_menu",
+        "items": ["Plain", {"text": "Roll", "id": "roll", "sound": None}, {"text": "Bank"}],
+        "multiletter_enabled": True,
+        "escape_behavior": "keybind",
+        "position": None,
+        "selection_id": "roll",
+    },
+    {
+        "type": "menu_patch",
+        "menu_id": "turn_menu",
+        "ops": [
+            {"op": "remove", "id": "bank"},
+            {"op": "insert", "index": 1, "item": {"text": "Keep", "id": "keep", "sound": None}},
+            {"op": "replace", "id": "roll", "item": {"text": "Roll", "id": "roll"}, "index": None},
+        ],
+        "position": 0,
+    },
+    {"type": "request_input", "input_id": "chat", "prompt": "Say", "default_value": "x"},
+    {"type": "document_editor", "dialog_id": "doc", "source_content": None},
+    {"type": "clear_ui"},
+    {"type": "disconnect", "reconnect": True, "message": None},
+    {"type": "server_status", "mode": "maintenance", "retry_after": 5},
+    {"type": "table_create", "host": "Alice", "game": "Pig"},
+    {"type": "update_options_lists", "games": [{"type": "pig", "name": "Pig"}], "languages": {}},
+    {"type": "pong"},
+    {"type": "chat", "convo": "global", "sender": "Alice", "message": "hi", "language": "en"},
+    {"type": "game_list", "games": [{"id": "t1", "name": "Pig", "type": "pig"}]},
+    {"type": "add_playlist", "playlist_id": "p", "tracks": ["a.ogg"]},
+    {"type": "start_playlist", "playlist_id": "p"},
+    {"type": "remove_playlist", "playlist_id": "p"},
+    {"type": "get_playlist_duration", "playlist_id": "p", "request_id": None},
+    {"type": "open_client_options", "options": {"theme": "dark"}},
+    {"type": "open_server_options"},
+    {"type": "batch", "packets": [{"type": "speak", "text": "hi"}, {"type": "pong"}]},
+]
+
+
+def fast_payload(packet: dict[str, Any]) -> dict[str, Any] | None:
+    """Build a packet's wire payload without validation, or None if unsupported."""
+    plan = PACKET_PLANS.get(packet.get("type"))  # type: ignore[arg-type]
+    if plan is None:
+        return None
+    return _apply_plan(packet, plan)
+
+
+def validated_payload(packet: dict[str, Any]) -> dict[str, Any]:
+    """Validate a packet with the pydantic models and return its payload.
+
+    Raises:
+        ValidationError: If the packet does not match its model.
+    """
+    packet_model = SERVER_TO_CLIENT_PACKET_ADAPTER.validate_python(packet)
+    return packet_model.model_dump(exclude_none=True)
+
+
+def run_self_test() -> list[str]:
+    """Check the fast path against pydantic for every packet type.
+
+    Returns:
+        Problems found; empty when the fast path matches for all types.
+    """
+    problems: list[str] = []
+    covered = set()
+    for packet in SELF_TEST_PACKETS:
+        packet_type = packet["type"]
+        covered.add(packet_type)
+        expected = validated_payload(packet)
+        actual = fast_payload(packet)
+        if actual != expected:
+            problems.append(f"{packet_type}: fast path gave {actual!r}, expected {expected!r}")
+    for packet_type in sorted(set(PACKET_PLANS) - covered):
+        problems.append(f"{packet_type}: no self-test sample")
+    return problems
+
+
+class PacketEncoder:
+    """Turn outbound packets into wire payloads under a validation mode."""
+
+    def __init__(self, mode: str = VALIDATION_FULL, sample_rate: int = DEFAULT_SAMPLE_RATE):
+        """
+        Initialize the encoder.
+
+        Args:
+            mode: "full", "sampled" or "off".
+            sample_rate: Under "sampled", validate one packet in this many per type.
+        """
+        if mode not in VALIDATION_MODES:
+            raise ValueError(f"Unknown packet validation mode: {mode!r}")
+        self.mode = mode
+        self.sample_rate = max(1, sample_rate)
+        self._sample_counters: dict[str, int] = {}
+        self.validated = 0
+        self.fast = 0
+        self.mismatches = 0
+        self.reused = 0
+
+    def prepare(self, packet: dict[str, Any], identifier: str) -> dict[str, Any] | None:
+        """
+        Return the wire payload for a packet, or None to refuse it.
+
+        Args:
+            packet: Packet dict built by server code.
+            identifier: Recipient name used in log messages.
+        """
+        if self.mode != VALIDATION_FULL:
+            payload = fast_payload(packet)
+            if payload is not None:
+                if self.mode == VALIDATION_OFF or not self._due_for_sample(packet["type"]):
+                    self.fast += 1
+                    return payload
+                return self._validate(packet, identifier, fast=payload)
+        return self._validate(packet, identifier)
+
+    def encode(self, packet: dict[str, Any], identifier: str) -> str | None:
+        """
+        Return the serialized frame for a packet, or None to refuse it.
+
+        A SharedPacket is prepared and serialized once; its text is reused
+        for every later recipient.
+
+        Args:
+            packet: Packet dict built by server code.
+            identifier: Recipient name used in log messages.
+        """
+        if isinstance(packet, SharedPacket):
+            if packet.wire is not None:
+                self.reused += 1
+                return packet.wire
+            payload = self.prepare(packet, identifier)
+            if payload is None:
+                return None
+            packet.wire = dumps_packet(payload)
+            return packet.wire
+        payload = self.prepare(packet, identifier)
+        if payload is None:
+            return None
+        return dumps_packet(payload)
+
+    def _due_for_sample(self, packet_type: str) -> bool:
+        """Return True for one packet in every sample_rate of this type."""
+        count = self._sample_counters.get(packet_type, 0)
+        self._sample_counters[packet_type] = count + 1
+        return count % self.sample_rate == 0
+
+    def _validate(
+        self,
+        packet: dict[str, Any],
+        identifier: str,
+        fast: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | None:
+        """Validate with pydantic, comparing with the fast payload if given."""
+        self.validated += 1
+        try:
+            payload = validated_payload(packet)
+        except ValidationError as exc:
+            PACKET_LOGGER.warning(
+                "Refusing to send invalid packet (type=%s) to %s: %s",
+                packet.get("type", "?"),
+                identifier,
+                exc,
+            )
+            return None
+        if fast is not None and fast != payload:
+            self.mismatches += 1
+            PACKET_LOGGER.warning(
+                "Fast packet encoding differs from validated payload (type=%s)",
+                packet.get("type", "?"),
+            )
+        return payload
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return counters for the admin status screen."""
+        return {
+            "mode": self.mode,
+            "sample_rate": self.sample_rate,
+            "validated": self.validated,
+            "fast": self.fast,
+            "mismatches": self.mismatches,
+            "reused": self.reused,
+        }
+
+
+DEFAULT_PACKET_ENCODER = PacketEncoder()
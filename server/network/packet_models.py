@@ -49,6 +49,7 @@ class AuthorizePacket(BasePacket):
     patch: int | None = None
     client_type: str | None = None
     platform: str | None = None
+    features: list[str] | None = None
 
     @model_validator(mode="after")
     def _ensure_credentials(self) -> "AuthorizePacket":
@@ -72,6 +73,7 @@ class RefreshSessionPacket(BasePacket):
     username: str | None = None
     client_type: str | None = None
     platform: str | None = None
+    features: list[str] | None = None
 
 
 class MenuSelectionPacket(BasePacket):
@@ -86,6 +88,12 @@ class EscapePacket(BasePacket):
     menu_id: str | None = None
 
 
+# Sent by a client that could not apply a menu_patch, to get the full menu.
+class MenuResyncPacket(BasePacket):
+    type: Literal["menu_resync"] = "menu_resync"
+    menu_id: str
+
+
 class KeybindPacket(BasePacket):
     type: Literal["keybind"] = "keybind"
     key: str
@@ -187,6 +195,7 @@ ClientToServerPacket = Annotated[
         MenuSelectionPacket,
         KeybindPacket,
         EscapePacket,
+        MenuResyncPacket,
         EditboxPacket,
         DocumentEditorResponsePacket,
         ChatPacket,
@@ -288,6 +297,32 @@ class MenuPacket(BasePacket):
     play_selection_sound: bool | None = None
 
 
+class MenuPatchOp(BaseModel):
+    """One edit to a menu's item list, applied in order.
+
+    remove and replace name the item by id; insert places item at index
+    (0-based) in the list as it stands after the previous ops.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+    op: Literal["insert", "remove", "replace"]
+    id: str | None = None
+    index: int | None = Field(default=None, ge=0)
+    item: MenuItemPayload | None = None
+
+
+# Changes to a menu the client already has, instead of the full item list.
+# Only sent to clients that list "menu_patch" in their authorize features;
+# a client that cannot apply one answers with menu_resync.
+class MenuPatchPacket(BasePacket):
+    type: Literal["menu_patch"] = "menu_patch"
+    menu_id: str
+    ops: list[MenuPatchOp]
+    position: int | None = None
+    selection_id: str | None = None
+    play_selection_sound: bool | None = None
+
+
 class RequestInputPacket(BasePacket):
     type: Literal["request_input"] = "request_input"
     input_id: str
@@ -411,6 +446,13 @@ class OpenServerOptionsPacket(BasePacket):
     options: dict[str, Any] = Field(default_factory=dict)
 
 
+# Several packets in one frame, in order. Only sent to clients that list
+# "batch" in their authorize features; each entry is validated on its own.
+class BatchPacket(BasePacket):
+    type: Literal["batch"] = "batch"
+    packets: list[dict[str, Any]]
+
+
 ServerToClientPacket = Annotated[
     Union[
         AuthorizeSuccessPacket,
@@ -423,6 +465,7 @@ ServerToClientPacket = Annotated[
         PlayAmbiencePacket,
         StopAmbiencePacket,
         MenuPacket,
+        MenuPatchPacket,
         RequestInputPacket,
         DocumentEditorPacket,
         ClearUIPacket,
@@ -439,6 +482,7 @@ ServerToClientPacket = Annotated[
         GetPlaylistDurationPacket,
         OpenClientOptionsPacket,
         OpenServerOptionsPacket,
+        BatchPacket,
     ],
     Field(discriminator="type"),
 ]
@@ -1,22 +1,83 @@
 """WebSocket server for client connections."""
 
+import asyncio
 import errno
 import json
 import logging
 import ssl
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Coroutine
+from typing import Callable, Coroutine, Iterable
 
 import websockets
-from pydantic import ValidationError
 from websockets.asyncio.server import serve, ServerConnection
 
-from .packet_models import SERVER_TO_CLIENT_PACKET_ADAPTER
+from .packet_encoder import DEFAULT_PACKET_ENCODER, PacketEncoder, SharedPacket
 
 PACKET_LOGGER = logging.getLogger("playpalace.packets")
 
+# Client feature flag (sent in authorize/refresh_session) for batch frames
+BATCH_FEATURE = "batch"
+MENU_PATCH_FEATURE = "menu_patch"
+
+# Outbound queue limits per connection. Past the high watermark, queued
+# low-priority packets are dropped down to the low watermark; a client still
+# over the high watermark after that is disconnected with a reconnect hint.
+DEFAULT_OUTBOX_HIGH_WATERMARK = 1000
+DEFAULT_OUTBOX_LOW_WATERMARK = 250
+# Packet types that may be dropped from a backed-up queue. Menus are never
+# dropped, other than ones already superseded by a later menu.
+LOW_PRIORITY_PACKET_TYPES = frozenset({"play_sound"})
+# How long an evicted client gets to receive its disconnect packet
+EVICTION_SEND_TIMEOUT_S = 1.0
+
+# How long fan_out waits for a recipient before reporting it as slow
+DEFAULT_BROADCAST_TIMEOUT_S = 2.0
+
+# Menu settings a later packet inherits from an earlier one it supersedes
+_MENU_SETTING_KEYS = ("multiletter_enabled", "escape_behavior", "grid_enabled", "grid_width")
+
+
+def coalesce_packets(packets: list[dict]) -> list[dict]:
+    """
+    Drop menu packets superseded by a later menu with the same menu_id.
+
+    The client replaces a menu wholesale when it receives a new one with the
+    same id, so only the last one queued for each id needs to be sent, along
+    with any menu_patch packets after it. Patches never supersede anything,
+    since they apply on top of what came before. Settings carried by a
+    dropped menu but missing from the one that replaces it are copied over.
+    Other packets are kept in order.
+    """
+    latest_menus: dict[str, dict] = {}
+    kept: list[dict] = []
+    for packet in reversed(packets):
+        packet_type = packet.get("type")
+        if packet_type in ("menu", "menu_patch"):
+            menu_id = packet.get("menu_id")
+            latest = latest_menus.get(menu_id)
+            if latest is not None:
+                if packet_type == "menu":
+                    for key in _MENU_SETTING_KEYS:
+                        if key in packet and key not in latest:
+                            latest[key] = packet[key]
+                continue
+            if packet_type == "menu":
+                packet = dict(packet)
+                latest_menus[menu_id] = packet
+        kept.append(packet)
+    kept.reverse()
+    return kept
+
+
+@dataclass
+class OutboxStats:
+    """Outbound queue counters shared by a server's connections."""
+
+    dropped: int = 0
+    evicted: int = 0
+
 
 @dataclass
 class ClientConnection:
@@ -29,32 +90,159 @@ class ClientConnection:
     replaced: bool = False
     client_type: str = ""
     platform: str = ""
+    supports_batch: bool = False
+    supports_menu_patch: bool = False
+    encoder: PacketEncoder = field(default=DEFAULT_PACKET_ENCODER, repr=False, compare=False)
+    high_watermark: int = DEFAULT_OUTBOX_HIGH_WATERMARK
+    low_watermark: int = DEFAULT_OUTBOX_LOW_WATERMARK
+    outbox_stats: OutboxStats = field(default_factory=OutboxStats, repr=False, compare=False)
+    evicted: bool = False
+    dropped: int = 0
 
-    async def send(self, packet: dict) -> None:
-        """Send a packet to this client."""
-        try:
-            packet_model = SERVER_TO_CLIENT_PACKET_ADAPTER.validate_python(packet)
-            payload = packet_model.model_dump(exclude_none=True)
-        except ValidationError as exc:
-            identifier = self.username or self.address
-            PACKET_LOGGER.warning(
-                "Refusing to send invalid packet (type=%s) to %s: %s",
-                packet.get("type", "?"),
-                identifier,
-                exc,
-            )
-            return
+    # Packets waiting for the writer task (not compared, not part of identity)
+    _outbox: list[dict] = field(default_factory=list, repr=False, compare=False)
+    _writer: asyncio.Task | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of packets waiting for the writer task."""
+        return len(self._outbox)
 
+    def _encode(self, packet: dict) -> str | None:
+        """Return a packet's serialized frame, or None if it was refused."""
+        return self.encoder.encode(packet, self.username or self.address)
+
+    async def _send_text(self, text: str, packet_type: str) -> None:
+        """Write one serialized frame, ignoring clients that already left."""
         try:
-            await self.websocket.send(json.dumps(payload))
+            await self.websocket.send(text)
         except websockets.exceptions.ConnectionClosed:
             identifier = self.username or self.address
             PACKET_LOGGER.debug(
                 "Dropped packet type=%s to disconnected client %s",
-                payload.get("type", "?"),
+                packet_type,
                 identifier,
             )
 
+    async def send(self, packet: dict) -> None:
+        """Send a packet to this client."""
+        text = self._encode(packet)
+        if text is None:
+            return
+        await self._send_text(text, packet.get("type", "?"))
+
+    def enqueue(self, packets: list[dict]) -> None:
+        """
+        Queue packets for delivery by this connection's writer task.
+
+        One writer runs per connection. Packets queued while it is still
+        sending (a slow client) are merged into its next frame, with
+        superseded menus dropped. The queue is bounded by the watermarks
+        (see _shed_outbox).
+        """
+        if not packets or self.evicted:
+            return
+        self._outbox.extend(packets)
+        if len(self._outbox) > self.high_watermark:
+            self._shed_outbox()
+            if self.evicted:
+                return
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._drain_outbox())
+            self._writer.add_done_callback(self._log_writer_exception)
+
+    async def _drain_outbox(self) -> None:
+        """Send queued packets until the outbox is empty."""
+        while self._outbox:
+            packets = coalesce_packets(self._outbox)
+            self._outbox = []
+            encoded = []
+            for packet in packets:
+                # One packet that fails to serialize must not cost the rest
+                try:
+                    text = self._encode(packet)
+                except Exception:
+                    PACKET_LOGGER.exception(
+                        "Dropping packet type=%s for %s that failed to encode",
+                        packet.get("type", "?"),
+                        self.username or self.address,
+                    )
+                    continue
+                if text is not None:
+                    encoded.append((packet, text))
+            if self.supports_batch and len(encoded) > 1:
+                # Splice the already-serialized packets into the batch frame
+                # so shared packets are not serialized again.
+                frame = '{"type": "batch", "packets": [' + ",".join(
+                    text for _, text in encoded
+                ) + "]}"
+                await self._send_text(frame, "batch")
+                continue
+            for packet, text in encoded:
+                await self._send_text(text, packet.get("type", "?"))
+
+    def _shed_outbox(self) -> None:
+        """
+        Shrink a queue that passed the high watermark.
+
+        Superseded menus go first, then the oldest low-priority packets
+        until the queue is down to the low watermark. If it is still over
+        the high watermark, the client is evicted.
+        """
+        queued = len(self._outbox)
+        packets = coalesce_packets(self._outbox)
+        excess = len(packets) - self.low_watermark
+        if excess > 0:
+            kept = []
+            for packet in packets:
+                if excess > 0 and packet.get("type") in LOW_PRIORITY_PACKET_TYPES:
+                    excess -= 1
+                    continue
+                kept.append(packet)
+            packets = kept
+        dropped = queued - len(packets)
+        self.dropped += dropped
+        self.outbox_stats.dropped += dropped
+        self._outbox = packets
+        if len(packets) > self.high_watermark:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Disconnect a client that cannot keep up, asking it to reconnect."""
+        PACKET_LOGGER.warning(
+            "Disconnecting slow client %s with %d packets queued",
+            self.username or self.address,
+            len(self._outbox),
+        )
+        self.evicted = True
+        self._outbox = []
+        self.outbox_stats.evicted += 1
+        if self._writer is not None and not self._writer.done():
+            self._writer.cancel()
+        self._writer = asyncio.create_task(self._send_eviction())
+        self._writer.add_done_callback(self._log_writer_exception)
+
+    async def _send_eviction(self) -> None:
+        """Send the reconnect hint (briefly) and close the connection."""
+        text = self._encode({"type": "disconnect", "reconnect": True})
+        if text is not None:
+            try:
+                await asyncio.wait_for(
+                    self._send_text(text, "disconnect"), EVICTION_SEND_TIMEOUT_S
+                )
+            except TimeoutError:
+                pass
+        await self.close()
+
+    @staticmethod
+    def _log_writer_exception(task: asyncio.Task) -> None:
+        """Log exceptions from the writer task."""
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            PACKET_LOGGER.warning("Error sending queued packets: %s", exc)
+
     async def close(self) -> None:
         """Close this connection."""
         try:
@@ -63,6 +251,53 @@ class ClientConnection:
             PACKET_LOGGER.debug("Failed to close websocket: %s", exc)
 
 
+async def fan_out(
+    clients: Iterable["ClientConnection"],
+    packet: dict,
+    *,
+    timeout: float = DEFAULT_BROADCAST_TIMEOUT_S,
+) -> list["ClientConnection"]:
+    """
+    Send one packet to many clients concurrently.
+
+    The packet is serialized once and shared by every recipient. Sends run
+    side by side, so one slow client no longer delays everyone after it.
+    Sends still running after ``timeout`` are left to finish in the
+    background and their clients are reported as slow.
+
+    Returns:
+        The clients whose send had not finished within the timeout.
+    """
+    clients = list(clients)
+    if not clients:
+        return []
+    shared = packet if isinstance(packet, SharedPacket) else SharedPacket(packet)
+    sends = {asyncio.ensure_future(client.send(shared)): client for client in clients}
+    done, pending = await asyncio.wait(sends, timeout=timeout)
+    for task in done:
+        _log_send_exception(task)
+    for task in pending:
+        task.add_done_callback(_log_send_exception)
+    slow = [sends[task] for task in pending]
+    if slow:
+        PACKET_LOGGER.warning(
+            "Slow consumers for %s packet after %.1fs: %s",
+            packet.get("type", "?"),
+            timeout,
+            ", ".join(client.username or client.address for client in slow),
+        )
+    return slow
+
+
+def _log_send_exception(task: asyncio.Future) -> None:
+    """Log an exception from one fan_out send."""
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        PACKET_LOGGER.warning("Error sending broadcast packet: %s", exc)
+
+
 class WebSocketServer:
     """
     Async WebSocket server for handling client connections.
@@ -81,6 +316,9 @@ class WebSocketServer:
         ssl_cert: str | Path | None = None,
         ssl_key: str | Path | None = None,
         max_message_size: int | None = None,
+        packet_encoder: PacketEncoder | None = None,
+        outbox_high_watermark: int = DEFAULT_OUTBOX_HIGH_WATERMARK,
+        outbox_low_watermark: int = DEFAULT_OUTBOX_LOW_WATERMARK,
     ):
         self.host = host
         self.port = port
@@ -88,10 +326,17 @@ class WebSocketServer:
         self._on_disconnect = on_disconnect
         self._on_message = on_message
         self._clients: dict[str, ClientConnection] = {}
+        # username -> its current connection, kept in sync by bind_username and
+        # _handle_client so per-user lookups don't scan every connection
+        self._clients_by_username: dict[str, ClientConnection] = {}
         self._server = None
         self._running = False
         self._ssl_context = None
         self._max_message_size = max_message_size
+        self._packet_encoder = packet_encoder or DEFAULT_PACKET_ENCODER
+        self._outbox_high_watermark = max(1, outbox_high_watermark)
+        self._outbox_low_watermark = max(0, min(outbox_low_watermark, self._outbox_high_watermark))
+        self._outbox_stats = OutboxStats()
 
         # Configure SSL if certificates provided
         if ssl_cert and ssl_key:
@@ -155,11 +400,19 @@ class WebSocketServer:
         for client in list(self._clients.values()):
             await client.close()
         self._clients.clear()
+        self._clients_by_username.clear()
 
     async def _handle_client(self, websocket: ServerConnection) -> None:
         """Handle a client connection."""
         address = f"{websocket.remote_address[0]}:{websocket.remote_address[1]}"
-        client = ClientConnection(websocket=websocket, address=address)
+        client = ClientConnection(
+            websocket=websocket,
+            address=address,
+            encoder=self._packet_encoder,
+            high_watermark=self._outbox_high_watermark,
+            low_watermark=self._outbox_low_watermark,
+            outbox_stats=self._outbox_stats,
+        )
         self._clients[address] = client
 
         try:
@@ -188,26 +441,70 @@ class WebSocketServer:
         finally:
             if address in self._clients:
                 del self._clients[address]
+            if client.username and self._clients_by_username.get(client.username) is client:
+                del self._clients_by_username[client.username]
             if self._on_disconnect:
                 await self._on_disconnect(client)
 
-    async def broadcast(self, packet: dict, exclude: ClientConnection | None = None) -> None:
-        """Broadcast a packet to all authenticated clients."""
-        for client in self._clients.values():
-            if client.authenticated and client != exclude:
-                await client.send(packet)
+    async def broadcast(
+        self,
+        packet: dict,
+        exclude: ClientConnection | None = None,
+        *,
+        recipients: Iterable[ClientConnection] | None = None,
+        timeout: float = DEFAULT_BROADCAST_TIMEOUT_S,
+    ) -> list[ClientConnection]:
+        """
+        Broadcast a packet concurrently (see fan_out).
+
+        Args:
+            packet: Packet to send.
+            exclude: Client to leave out.
+            recipients: Clients to send to; defaults to all authenticated clients.
+            timeout: Seconds before a recipient is reported as slow.
+
+        Returns:
+            The recipients whose send had not finished within the timeout.
+        """
+        if recipients is None:
+            recipients = (client for client in self._clients.values() if client.authenticated)
+        return await fan_out(
+            (client for client in recipients if client is not exclude), packet, timeout=timeout
+        )
 
     async def send_to_user(self, username: str, packet: dict) -> bool:
         """Send a packet to a specific user."""
-        for client in self._clients.values():
-            if client.username == username:
-                await client.send(packet)
-                return True
-        return False
+        client = self._clients_by_username.get(username)
+        if client is None:
+            return False
+        await client.send(packet)
+        return True
+
+    def get_outbox_stats(self) -> dict:
+        """Return outbound queue depth and shedding counters for the admin status screen."""
+        depths = [client.queue_depth for client in self._clients.values()]
+        return {
+            "connections": len(depths),
+            "queued": sum(depths),
+            "max_depth": max(depths, default=0),
+            "high_watermark": self._outbox_high_watermark,
+            "low_watermark": self._outbox_low_watermark,
+            "dropped": self._outbox_stats.dropped,
+            "evicted": self._outbox_stats.evicted,
+        }
+
+    def bind_username(self, client: ClientConnection, username: str) -> None:
+        """
+        Set a client's username and index it for lookups.
+
+        The newest connection for a username wins, so a session taking over
+        from an older one is found even before the old one has closed.
+        """
+        if client.username and self._clients_by_username.get(client.username) is client:
+            del self._clients_by_username[client.username]
+        client.username = username
+        self._clients_by_username[username] = client
 
     def get_client_by_username(self, username: str) -> ClientConnection | None:
         """Get a client by username."""
-        for client in self._clients.values():
-            if client.username == username:
-                return client
-        return None
+        return self._clients_by_username.get(username)
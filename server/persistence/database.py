@@ -3,11 +3,135 @@
 import sqlite3
 import sys
 import json
+import threading
+from itertools import groupby
 from pathlib import Path
+from typing import Callable
 from dataclasses import dataclass, field
 
 from server.core.tables.table import Table
 from server.core.users.base import TrustLevel
+from server.persistence.writer import DEFAULT_MAX_BATCH, DatabaseWriter, WriteJob
+
+# Built-in leaderboard kinds for Database.get_leaderboard. Each one is a
+# column of player_game_stats.
+LEADERBOARD_KINDS = ("wins", "total_score", "high_score", "games_played")
+
+# How a player_custom_stats row turns its running sums into the ranked value.
+# Ratio stats without a positive denominator have no value yet.
+_CUSTOM_STAT_VALUE = """
+    CASE aggregate
+        WHEN 'max' THEN maximum
+        WHEN 'avg' THEN 1.0 * total / samples
+        WHEN 'ratio' THEN CASE WHEN denominator > 0 THEN 1.0 * total / denominator END
+        ELSE total
+    END"""
+
+_UPSERT_PLAYER_GAME_STATS = """
+    INSERT INTO player_game_stats (
+        player_id, game_type, player_name, games_played, wins, total_score, high_score,
+        last_result_id
+    )
+    VALUES (?, ?, ?, 1, ?, ?, ?, ?)
+    ON CONFLICT (player_id, game_type) DO UPDATE SET
+        player_name = excluded.player_name,
+        games_played = games_played + 1,
+        wins = wins + excluded.wins,
+        total_score = total_score + excluded.total_score,
+        high_score = MAX(high_score, excluded.high_score),
+        last_result_id = excluded.last_result_id
+"""
+
+_UPSERT_PLAYER_CUSTOM_STATS = """
+    INSERT INTO player_custom_stats (
+        player_id, game_type, stat_id, aggregate, total, maximum, denominator, samples,
+        last_result_id
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?)
+    ON CONFLICT (player_id, game_type, stat_id) DO UPDATE SET
+        aggregate = excluded.aggregate,
+        total = total + excluded.total,
+        maximum = MAX(maximum, excluded.maximum),
+        denominator = denominator + excluded.denominator,
+        samples = samples + 1,
+        last_result_id = excluded.last_result_id
+"""
+
+
+def _stat_path_value(data: dict, path: str, player_id: str, player_name: str) -> float | None:
+    """Read a number from custom_data by dot-separated path.
+
+    Supports {player_id} and {player_name} placeholders in the path.
+    """
+    current = data
+    resolved = path.replace("{player_id}", player_id).replace("{player_name}", player_name)
+    for part in resolved.split("."):
+        if not isinstance(current, dict) or part not in current:
+            return None
+        current = current[part]
+    if isinstance(current, (int, float)):
+        return current
+    return None
+
+
+def _result_score(custom_data: dict, player_name: str) -> int | float:
+    """A player's score in one result: final_scores, else final_light (Light Turret)."""
+    for key in ("final_scores", "final_light"):
+        scores = custom_data.get(key)
+        score = scores.get(player_name) if isinstance(scores, dict) else None
+        if isinstance(score, (int, float)) and score:
+            return score
+    return 0
+
+
+def _player_stat_rows(
+    result_id: int,
+    game_type: str,
+    players: list[tuple[str, str, bool, bool]],
+    custom_data: dict,
+    leaderboard_types: list[dict],
+) -> tuple[list[tuple], list[tuple]]:
+    """Build the player_game_stats and player_custom_stats upserts for one result.
+
+    Server-side bots are left out; virtual bots count like players.
+    """
+    game_rows = []
+    custom_rows = []
+    winner_name = custom_data.get("winner_name")
+    for player_id, player_name, is_bot, is_virtual_bot in players:
+        if is_bot and not is_virtual_bot:
+            continue
+        score = _result_score(custom_data, player_name)
+        won = 1 if winner_name == player_name else 0
+        game_rows.append((player_id, game_type, player_name, won, score, score, result_id))
+        for config in leaderboard_types:
+            if "numerator" in config and "denominator" in config:
+                aggregate = "ratio"
+                value = _stat_path_value(custom_data, config["numerator"], player_id, player_name)
+                denominator = _stat_path_value(
+                    custom_data, config["denominator"], player_id, player_name
+                )
+                if value is None or denominator is None:
+                    continue
+            else:
+                aggregate = config.get("aggregate", "sum")
+                value = _stat_path_value(custom_data, config["path"], player_id, player_name)
+                denominator = 0
+                if value is None:
+                    continue
+            custom_rows.append(
+                (
+                    player_id,
+                    game_type,
+                    config["id"],
+                    aggregate,
+                    value,
+                    value,
+                    denominator,
+                    result_id,
+                )
+            )
+    return game_rows, custom_rows
 
 
 @dataclass
@@ -46,7 +170,7 @@ class SavedTableRecord:
         username: Owner username.
         save_name: User-visible save name.
         game_type: Game type identifier.
-        game_json: Serialized game state.
+        game_json: Serialized game state (JSON text or a packed GameCodec blob).
         members_json: Serialized member list.
         saved_at: Timestamp string.
     """
@@ -55,7 +179,7 @@ class SavedTableRecord:
     username: str
     save_name: str
     game_type: str
-    game_json: str
+    game_json: str | bytes
     members_json: str
     saved_at: str
 
@@ -64,12 +188,25 @@ class Database:
     """SQLite database for PlayPalace persistence.
 
     Stores users, tables, saved tables, and game results.
+
+    The connection runs in WAL mode. After start_writer(), the frequent
+    writes (game results, ratings, preferences, refresh tokens and table
+    saves) are queued to a DatabaseWriter thread instead of committing on
+    the caller's thread; reads that must see them flush the queue first.
     """
 
     def __init__(self, db_path: str | Path = "playpalace.db"):
         """Initialize the database wrapper with a path."""
         self.db_path = Path(db_path)
         self._conn: sqlite3.Connection | None = None
+        self._writer: DatabaseWriter | None = None
+        # Ratings written but maybe not committed yet, so a rating update
+        # right after another one reads the newer value.
+        self._pending_ratings: dict[tuple[str, str], tuple[float, float]] = {}
+        self._pending_ratings_lock = threading.Lock()
+        # Set by connect() when player_game_stats was just created for a
+        # database that already holds game results (see rebuild_player_stats).
+        self.player_stats_stale = False
 
     def connect(self) -> None:
         """Connect to the database and create tables if needed."""
@@ -83,14 +220,52 @@ class Database:
             raise SystemExit(1) from exc
         self._conn.row_factory = sqlite3.Row
         self._conn.execute("PRAGMA foreign_keys = ON")
+        # WAL lets this connection read while the writer thread commits.
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
         self._create_tables()
 
+    def start_writer(self, max_batch: int = DEFAULT_MAX_BATCH) -> None:
+        """Queue deferrable writes to a background writer thread from now on."""
+        if self._writer:
+            return
+        self._writer = DatabaseWriter(self.db_path, max_batch)
+        self._writer.start()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until queued writes are committed.
+
+        Returns:
+            False if the timeout expired first.
+        """
+        if not self._writer:
+            return True
+        return self._writer.flush(timeout)
+
     def close(self) -> None:
-        """Close the database connection."""
+        """Commit queued writes, then close the database connection."""
+        if self._writer:
+            self._writer.close()
+            self._writer = None
         if self._conn:
             self._conn.close()
             self._conn = None
 
+    def _write(self, job: WriteJob, on_commit: Callable[[], None] | None = None) -> None:
+        """Run a write job, on the writer thread if one is running.
+
+        Without a writer the job runs now on this connection and is
+        committed before returning.
+        """
+        if self._writer:
+            self._writer.submit(job, on_commit)
+            return
+        job(self._conn)
+        self._conn.commit()
+        if on_commit:
+            on_commit()
+
     def _create_tables(self) -> None:
         """Create database tables if they don't exist."""
         cursor = self._conn.cursor()
@@ -176,10 +351,64 @@ class Database:
             CREATE INDEX IF NOT EXISTS idx_game_results_timestamp
             ON game_results(timestamp)
         """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_game_results_type_timestamp
+            ON game_results(game_type, timestamp)
+        """)
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_result_players_player
             ON game_result_players(player_id)
         """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_result_players_result
+            ON game_result_players(result_id)
+        """)
+
+        # Per-player aggregates of game results, kept current by save_game_result
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'player_game_stats'"
+        )
+        player_stats_existed = cursor.fetchone() is not None
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS player_game_stats (
+                player_id TEXT NOT NULL,
+                game_type TEXT NOT NULL,
+                player_name TEXT NOT NULL,
+                games_played INTEGER NOT NULL DEFAULT 0,
+                wins INTEGER NOT NULL DEFAULT 0,
+                total_score NUMERIC NOT NULL DEFAULT 0,
+                high_score NUMERIC NOT NULL DEFAULT 0,
+                last_result_id INTEGER NOT NULL,
+                PRIMARY KEY (player_id, game_type)
+            )
+        """)
+        for column in LEADERBOARD_KINDS:
+            cursor.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_player_game_stats_{column}
+                ON player_game_stats(game_type, {column} DESC, last_result_id DESC)
+            """)  # nosec B608 - column names come from LEADERBOARD_KINDS
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS player_custom_stats (
+                player_id TEXT NOT NULL,
+                game_type TEXT NOT NULL,
+                stat_id TEXT NOT NULL,
+                aggregate TEXT NOT NULL,
+                total NUMERIC NOT NULL DEFAULT 0,
+                maximum NUMERIC,
+                denominator NUMERIC NOT NULL DEFAULT 0,
+                samples INTEGER NOT NULL DEFAULT 0,
+                last_result_id INTEGER NOT NULL,
+                value REAL GENERATED ALWAYS AS ({_CUSTOM_STAT_VALUE}) STORED,
+                PRIMARY KEY (player_id, game_type, stat_id)
+            )
+        """)  # nosec B608 - interpolated SQL is a module constant
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_player_custom_stats_value
+            ON player_custom_stats(game_type, stat_id, value DESC, last_result_id DESC)
+        """)
+        if not player_stats_existed:
+            cursor.execute("SELECT 1 FROM game_results LIMIT 1")
+            self.player_stats_stale = cursor.fetchone() is not None
 
         # Player ratings (for skill-based matchmaking)
         cursor.execute("""
@@ -383,20 +612,20 @@ class Database:
 
     def update_user_locale(self, username: str, locale: str) -> None:
         """Update a user's locale."""
-        cursor = self._conn.cursor()
-        cursor.execute(
-            "UPDATE users SET locale = ? WHERE lower(username) = lower(?)", (locale, username)
+        self._write(
+            lambda conn: conn.execute(
+                "UPDATE users SET locale = ? WHERE lower(username) = lower(?)", (locale, username)
+            )
         )
-        self._conn.commit()
 
     def update_user_preferences(self, username: str, preferences_json: str) -> None:
         """Update a user's preferences."""
-        cursor = self._conn.cursor()
-        cursor.execute(
-            "UPDATE users SET preferences_json = ? WHERE lower(username) = lower(?)",
-            (preferences_json, username),
+        self._write(
+            lambda conn: conn.execute(
+                "UPDATE users SET preferences_json = ? WHERE lower(username) = lower(?)",
+                (preferences_json, username),
+            )
         )
-        self._conn.commit()
 
     def update_user_password(self, username: str, password_hash: str) -> None:
         """Update a user's password hash.
@@ -418,15 +647,17 @@ class Database:
         self, username: str, token: str, expires_at: int, created_at: int
     ) -> None:
         """Store a new refresh token."""
-        cursor = self._conn.cursor()
-        cursor.execute(
-            "INSERT INTO refresh_tokens (username, token, expires_at, created_at) VALUES (?, ?, ?, ?)",
-            (username, token, expires_at, created_at),
+        self._write(
+            lambda conn: conn.execute(
+                "INSERT INTO refresh_tokens (username, token, expires_at, created_at)"
+                " VALUES (?, ?, ?, ?)",
+                (username, token, expires_at, created_at),
+            )
         )
-        self._conn.commit()
 
     def get_refresh_token(self, token: str) -> sqlite3.Row | None:
         """Fetch a refresh token record by token."""
+        self.flush()
         cursor = self._conn.cursor()
         cursor.execute(
             "SELECT username, token, expires_at, created_at, revoked_at, replaced_by "
@@ -439,12 +670,12 @@ class Database:
         self, token: str, revoked_at: int, replaced_by: str | None = None
     ) -> None:
         """Revoke a refresh token and optionally link its replacement."""
-        cursor = self._conn.cursor()
-        cursor.execute(
-            "UPDATE refresh_tokens SET revoked_at = ?, replaced_by = ? WHERE token = ?",
-            (revoked_at, replaced_by, token),
+        self._write(
+            lambda conn: conn.execute(
+                "UPDATE refresh_tokens SET revoked_at = ?, replaced_by = ? WHERE token = ?",
+                (revoked_at, replaced_by, token),
+            )
         )
-        self._conn.commit()
 
     def get_user_count(self) -> int:
         """Get the total number of users in the database."""
@@ -760,31 +991,26 @@ class Database:
 
     def save_table(self, table: Table) -> None:
         """Save a table to the database."""
-        cursor = self._conn.cursor()
+        self.save_all_tables([table])
 
-        # Serialize members
+    @staticmethod
+    def _table_row(table: Table) -> tuple:
+        """Snapshot a table's columns for saving."""
         members_json = json.dumps(
             [{"username": m.username, "is_spectator": m.is_spectator} for m in table.members]
         )
-
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO tables (table_id, game_type, host, members_json, game_json, status)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """,
-            (
-                table.table_id,
-                table.game_type,
-                table.host,
-                members_json,
-                table.game_json,
-                table.status,
-            ),
+        return (
+            table.table_id,
+            table.game_type,
+            table.host,
+            members_json,
+            table.game_json,
+            table.status,
         )
-        self._conn.commit()
 
     def load_table(self, table_id: str) -> Table | None:
         """Load a table from the database."""
+        self.flush()
         cursor = self._conn.cursor()
         cursor.execute("SELECT * FROM tables WHERE table_id = ?", (table_id,))
         row = cursor.fetchone()
@@ -811,6 +1037,7 @@ class Database:
 
     def load_all_tables(self) -> list[Table]:
         """Load all tables from the database."""
+        self.flush()
         cursor = self._conn.cursor()
         cursor.execute("SELECT table_id FROM tables")
         tables = []
@@ -822,20 +1049,25 @@ class Database:
 
     def delete_table(self, table_id: str) -> None:
         """Delete a table from the database."""
-        cursor = self._conn.cursor()
-        cursor.execute("DELETE FROM tables WHERE table_id = ?", (table_id,))
-        self._conn.commit()
+        self._write(lambda conn: conn.execute("DELETE FROM tables WHERE table_id = ?", (table_id,)))
 
     def delete_all_tables(self) -> None:
         """Delete all tables from the database."""
-        cursor = self._conn.cursor()
-        cursor.execute("DELETE FROM tables")
-        self._conn.commit()
+        self._write(lambda conn: conn.execute("DELETE FROM tables"))
 
     def save_all_tables(self, tables: list[Table]) -> None:
-        """Save multiple tables."""
-        for table in tables:
-            self.save_table(table)
+        """Save multiple tables in one transaction."""
+        rows = [self._table_row(table) for table in tables]
+        self._write(
+            lambda conn: conn.executemany(
+                """
+                INSERT OR REPLACE INTO tables
+                    (table_id, game_type, host, members_json, game_json, status)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+        )
 
     # Saved table operations (user-saved game states)
 
@@ -844,7 +1076,7 @@ class Database:
         username: str,
         save_name: str,
         game_type: str,
-        game_json: str,
+        game_json: str | bytes,
         members_json: str,
     ) -> SavedTableRecord:
         """Save a table state to a user's saved tables."""
@@ -929,49 +1161,109 @@ class Database:
             tuple[str, str, bool, bool]
         ],  # (player_id, player_name, is_bot, is_virtual_bot)
         custom_data: dict | None = None,
-    ) -> int:
+        leaderboard_types: list[dict] | None = None,
+    ) -> None:
         """
         Save a game result to the database.
 
+        The players' rows in player_game_stats and player_custom_stats are
+        updated in the same transaction.
+
         Args:
             game_type: The game type identifier
             timestamp: ISO format timestamp
             duration_ticks: Game duration in ticks
             players: List of (player_id, player_name, is_bot, is_virtual_bot) tuples
             custom_data: Game-specific result data
-
-        Returns:
-            The result ID
+            leaderboard_types: The game's custom leaderboard configs
+                (Game.get_leaderboard_types()) to accumulate
         """
-        cursor = self._conn.cursor()
+        custom_json = json.dumps(custom_data) if custom_data else None
+        players = list(players)
 
-        # Insert the main result record
-        cursor.execute(
-            """
-            INSERT INTO game_results (game_type, timestamp, duration_ticks, custom_data)
-            VALUES (?, ?, ?, ?)
-            """,
-            (
-                game_type,
-                timestamp,
-                duration_ticks,
-                json.dumps(custom_data) if custom_data else None,
-            ),
-        )
-        result_id = cursor.lastrowid
+        def write(conn: sqlite3.Connection) -> None:
+            cursor = conn.cursor()
 
-        # Insert player records
-        for player_id, player_name, is_bot, is_virtual_bot in players:
+            # Insert the main result record
             cursor.execute(
                 """
-                INSERT INTO game_result_players (result_id, player_id, player_name, is_bot, is_virtual_bot)
+                INSERT INTO game_results (game_type, timestamp, duration_ticks, custom_data)
+                VALUES (?, ?, ?, ?)
+                """,
+                (game_type, timestamp, duration_ticks, custom_json),
+            )
+            result_id = cursor.lastrowid
+
+            # Insert player records
+            cursor.executemany(
+                """
+                INSERT INTO game_result_players
+                    (result_id, player_id, player_name, is_bot, is_virtual_bot)
                 VALUES (?, ?, ?, ?, ?)
                 """,
-                (result_id, player_id, player_name, 1 if is_bot else 0, 1 if is_virtual_bot else 0),
+                [
+                    (result_id, player_id, player_name, int(bool(is_bot)), int(bool(is_virtual)))
+                    for player_id, player_name, is_bot, is_virtual in players
+                ],
             )
 
+            game_rows, custom_rows = _player_stat_rows(
+                result_id, game_type, players, custom_data or {}, leaderboard_types or []
+            )
+            cursor.executemany(_UPSERT_PLAYER_GAME_STATS, game_rows)
+            cursor.executemany(_UPSERT_PLAYER_CUSTOM_STATS, custom_rows)
+
+        self._write(write)
+
+    def rebuild_player_stats(self, leaderboard_types: dict[str, list[dict]]) -> int:
+        """
+        Recompute player_game_stats and player_custom_stats from all game results.
+
+        Args:
+            leaderboard_types: Custom leaderboard configs keyed by game type;
+                game types missing here only get the built-in stats
+
+        Returns:
+            Number of game results replayed
+        """
+        cursor = self._conn.cursor()
+        writer = self._conn.cursor()
+        writer.execute("DELETE FROM player_custom_stats")
+        writer.execute("DELETE FROM player_game_stats")
+        cursor.execute("""
+            SELECT gr.id, gr.game_type, gr.custom_data,
+                   grp.player_id, grp.player_name, grp.is_bot, grp.is_virtual_bot
+            FROM game_results gr
+            INNER JOIN game_result_players grp ON grp.result_id = gr.id
+            ORDER BY gr.id, grp.id
+        """)
+        replayed = 0
+        game_rows: list[tuple] = []
+        custom_rows: list[tuple] = []
+        for result_id, rows in groupby(cursor, key=lambda row: row["id"]):
+            rows = list(rows)
+            game_type = rows[0]["game_type"]
+            custom_data = json.loads(rows[0]["custom_data"]) if rows[0]["custom_data"] else {}
+            players = [
+                (row["player_id"], row["player_name"], row["is_bot"], row["is_virtual_bot"])
+                for row in rows
+            ]
+            result_game_rows, result_custom_rows = _player_stat_rows(
+                result_id, game_type, players, custom_data, leaderboard_types.get(game_type, [])
+            )
+            game_rows.extend(result_game_rows)
+            custom_rows.extend(result_custom_rows)
+            replayed += 1
+            if len(game_rows) >= 10000:
+                writer.executemany(_UPSERT_PLAYER_GAME_STATS, game_rows)
+                writer.executemany(_UPSERT_PLAYER_CUSTOM_STATS, custom_rows)
+                game_rows.clear()
+                custom_rows.clear()
+        writer.executemany(_UPSERT_PLAYER_GAME_STATS, game_rows)
+        writer.executemany(_UPSERT_PLAYER_CUSTOM_STATS, custom_rows)
         self._conn.commit()
-        return result_id
+        self.player_stats_stale = False
+        return replayed
 
     def get_player_game_history(
         self,
@@ -1053,6 +1345,166 @@ class Database:
             for row in cursor.fetchall()
         ]
 
+    def get_game_result_players_for(self, result_ids: list[int]) -> dict[int, list[dict]]:
+        """Get the players of several game results in one query, keyed by result id."""
+        players: dict[int, list[dict]] = {result_id: [] for result_id in result_ids}
+        if not result_ids:
+            return players
+        cursor = self._conn.cursor()
+        placeholders = ", ".join("?" * len(result_ids))
+        cursor.execute(
+            f"""
+            SELECT result_id, player_id, player_name, is_bot, is_virtual_bot
+            FROM game_result_players
+            WHERE result_id IN ({placeholders})
+            ORDER BY id
+            """,  # nosec B608 - placeholders only
+            result_ids,
+        )
+        for row in cursor.fetchall():
+            players[row["result_id"]].append(
+                {
+                    "player_id": row["player_id"],
+                    "player_name": row["player_name"],
+                    "is_bot": bool(row["is_bot"]),
+                    "is_virtual_bot": bool(row["is_virtual_bot"]),
+                }
+            )
+        return players
+
+    def get_leaderboard(self, game_type: str, kind: str, limit: int = 10) -> list[dict]:
+        """
+        Rank players of a game type over its whole history.
+
+        Reads player_game_stats, so the cost depends on limit rather than on
+        the number of stored results. Server-side bots are left out; virtual
+        bots are ranked like players.
+
+        Args:
+            game_type: The game type to rank
+            kind: One of LEADERBOARD_KINDS ("wins", "total_score",
+                "high_score", "games_played")
+            limit: Maximum number of entries
+
+        Returns:
+            List of dicts with rank, player_id, player_name (from their most
+            recent game), value and games_played, best first. Ties go to the
+            player who played most recently.
+        """
+        if kind not in LEADERBOARD_KINDS:
+            raise ValueError(f"Unknown leaderboard kind: {kind}")
+        cursor = self._conn.cursor()
+        cursor.execute(
+            f"""
+            SELECT player_id, player_name, {kind} AS value, games_played
+            FROM player_game_stats
+            WHERE game_type = ?
+            ORDER BY {kind} DESC, last_result_id DESC
+            LIMIT ?
+            """,  # nosec B608 - column names come from LEADERBOARD_KINDS
+            (game_type, limit),
+        )
+        return [
+            {
+                "rank": rank,
+                "player_id": row["player_id"],
+                "player_name": row["player_name"],
+                "value": row["value"],
+                "games_played": row["games_played"],
+            }
+            for rank, row in enumerate(cursor.fetchall(), 1)
+        ]
+
+    def get_custom_leaderboard(self, game_type: str, stat_id: str, limit: int = 10) -> list[dict]:
+        """
+        Rank players of a game type by one of its custom leaderboard stats.
+
+        Args:
+            game_type: The game type to rank
+            stat_id: The leaderboard config id
+            limit: Maximum number of entries
+
+        Returns:
+            List of dicts with rank, player_id, player_name and value, best first
+        """
+        cursor = self._conn.cursor()
+        cursor.execute(
+            """
+            SELECT pcs.player_id, pgs.player_name, pcs.value
+            FROM player_custom_stats pcs
+            INNER JOIN player_game_stats pgs
+                ON pgs.player_id = pcs.player_id AND pgs.game_type = pcs.game_type
+            WHERE pcs.game_type = ? AND pcs.stat_id = ? AND pcs.value IS NOT NULL
+            ORDER BY pcs.value DESC, pcs.last_result_id DESC
+            LIMIT ?
+            """,
+            (game_type, stat_id, limit),
+        )
+        return [
+            {
+                "rank": rank,
+                "player_id": row["player_id"],
+                "player_name": row["player_name"],
+                "value": row["value"],
+            }
+            for rank, row in enumerate(cursor.fetchall(), 1)
+        ]
+
+    def get_player_game_stats(self, player_id: str, game_type: str) -> dict | None:
+        """
+        Get a player's aggregate stats for one game type.
+
+        Returns:
+            Dict with player_name, games_played, wins, total_score, high_score
+            and custom (stat id -> value), or None if they have no results
+        """
+        cursor = self._conn.cursor()
+        cursor.execute(
+            """
+            SELECT player_name, games_played, wins, total_score, high_score
+            FROM player_game_stats
+            WHERE player_id = ? AND game_type = ?
+            """,
+            (player_id, game_type),
+        )
+        row = cursor.fetchone()
+        if not row:
+            return None
+        stats = dict(row)
+        cursor.execute(
+            """
+            SELECT stat_id, value FROM player_custom_stats
+            WHERE player_id = ? AND game_type = ? AND value IS NOT NULL
+            """,
+            (player_id, game_type),
+        )
+        stats["custom"] = {row["stat_id"]: row["value"] for row in cursor.fetchall()}
+        return stats
+
+    def get_latest_player_names(self, game_type: str, player_ids: list[str]) -> dict[str, str]:
+        """Get each player's name from their most recent game of a type."""
+        if not player_ids:
+            return {}
+        cursor = self._conn.cursor()
+        placeholders = ", ".join("?" * len(player_ids))
+        cursor.execute(
+            f"""
+            SELECT player_id, player_name FROM player_game_stats
+            WHERE game_type = ? AND player_id IN ({placeholders})
+            """,  # nosec B608 - placeholders only
+            (game_type, *player_ids),
+        )
+        return {row["player_id"]: row["player_name"] for row in cursor.fetchall()}
+
+    def get_player_game_types(self, player_id: str) -> set[str]:
+        """Get the game types a player has at least one result for."""
+        cursor = self._conn.cursor()
+        cursor.execute(
+            "SELECT game_type FROM player_game_stats WHERE player_id = ?",
+            (player_id,),
+        )
+        return {row["game_type"] for row in cursor.fetchall()}
+
     def get_game_stats(self, game_type: str, limit: int | None = None) -> list[tuple]:
         """
         Get game results for a game type.
@@ -1172,6 +1624,10 @@ class Database:
         Returns:
             (mu, sigma) tuple or None if no rating exists
         """
+        with self._pending_ratings_lock:
+            pending = self._pending_ratings.get((player_id, game_type))
+        if pending:
+            return pending
         cursor = self._conn.cursor()
         cursor.execute(
             """
@@ -1187,15 +1643,26 @@ class Database:
 
     def set_player_rating(self, player_id: str, game_type: str, mu: float, sigma: float) -> None:
         """Set or update a player's rating for a game type."""
-        cursor = self._conn.cursor()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO player_ratings (player_id, game_type, mu, sigma)
-            VALUES (?, ?, ?, ?)
-            """,
-            (player_id, game_type, mu, sigma),
+        key = (player_id, game_type)
+        rating = (mu, sigma)
+        with self._pending_ratings_lock:
+            self._pending_ratings[key] = rating
+
+        def committed() -> None:
+            with self._pending_ratings_lock:
+                if self._pending_ratings.get(key) == rating:
+                    del self._pending_ratings[key]
+
+        self._write(
+            lambda conn: conn.execute(
+                """
+                INSERT OR REPLACE INTO player_ratings (player_id, game_type, mu, sigma)
+                VALUES (?, ?, ?, ?)
+                """,
+                (player_id, game_type, mu, sigma),
+            ),
+            committed,
         )
-        self._conn.commit()
 
     def get_rating_leaderboard(
         self, game_type: str, limit: int = 10
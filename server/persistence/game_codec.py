@@ -0,0 +1,162 @@
+"""Encoding of saved game state.
+
+Games are mashumaro dataclasses and were always stored as their to_json()
+text. GameCodec puts a choice of format in front of that:
+
+* ``json``: the to_json() text, unchanged (default).
+* ``packed``: the to_dict() tree with field names interned, serialized with
+  msgpack when it is installed (compact JSON otherwise) and compressed with
+  zstd when zstandard is installed (zlib otherwise).
+
+Interning replaces every dict with ``[shape, *values]``, where ``shape``
+indexes a table of key tuples stored once per blob, and every list with
+``[-1, *items]``. Game state repeats the same dataclasses many times over
+(actions in action sets, cards, players), so this alone halves a typical
+save before compression.
+
+Packed blobs are bytes that start with MAGIC, a format version and a byte
+naming the body serializer and compression. Anything else is read as
+to_json() text, so saves written before packed existed still load, and a
+server can switch codecs without migrating its database.
+"""
+
+import json
+import zlib
+from typing import TYPE_CHECKING, Any
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional speedup
+    msgpack = None  # type: ignore[assignment]
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional speedup
+    zstandard = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from ..games.base import Game
+
+CODEC_JSON = "json"
+CODEC_PACKED = "packed"
+GAME_CODECS = (CODEC_JSON, CODEC_PACKED)
+DEFAULT_GAME_CODEC_NAME = CODEC_JSON
+
+MAGIC = b"PPG"
+FORMAT_VERSION = 1
+# Low nibble of the flags byte: body serializer; high nibble: compression.
+BODY_JSON = 0
+BODY_MSGPACK = 1
+COMPRESS_NONE = 0
+COMPRESS_ZLIB = 1
+COMPRESS_ZSTD = 2
+_HEADER_SIZE = len(MAGIC) + 2
+_LIST = -1
+_CONTAINERS = frozenset((dict, list, tuple))
+
+
+class UnreadableGameState(ValueError):
+    """A packed blob this server cannot read as installed.
+
+    The state itself is intact: it comes from a newer format version, or
+    needs msgpack or zstandard. Callers should keep the blob so it loads
+    again once the server is upgraded or the package is reinstalled.
+    """
+
+
+def _intern(value: Any, shapes: dict[tuple, int]) -> list:
+    """Return a dict or list with its dicts turned into [shape, *values]."""
+    if type(value) is dict:
+        keys = tuple(value)
+        shape = shapes.get(keys)
+        if shape is None:
+            shape = shapes[keys] = len(shapes)
+        out = [shape]
+        value = value.values()
+    else:
+        out = [_LIST]
+    out += [_intern(item, shapes) if type(item) in _CONTAINERS else item for item in value]
+    return out
+
+
+def _expand(value: list, shapes: list[list]) -> Any:
+    """Inverse of _intern."""
+    items = [_expand(item, shapes) if type(item) is list else item for item in value[1:]]
+    if value[0] == _LIST:
+        return items
+    return dict(zip(shapes[value[0]], items))
+
+
+class GameCodec:
+    """Encode games in one format and decode blobs in any of them."""
+
+    def __init__(self, name: str = DEFAULT_GAME_CODEC_NAME, compress: bool = True):
+        """
+        Initialize the codec.
+
+        Args:
+            name: One of GAME_CODECS.
+            compress: Compress packed blobs (ignored for json).
+        """
+        if name not in GAME_CODECS:
+            raise ValueError(
+                f"Unknown game codec {name!r} (expected one of: {', '.join(GAME_CODECS)})"
+            )
+        self.name = name
+        self.body = BODY_MSGPACK if msgpack is not None else BODY_JSON
+        if not compress:
+            self.compression = COMPRESS_NONE
+        else:
+            self.compression = COMPRESS_ZSTD if zstandard is not None else COMPRESS_ZLIB
+
+    def encode(self, game: "Game") -> str | bytes:
+        """Serialize a game for storage."""
+        if self.name == CODEC_JSON:
+            return game.to_json()
+        shapes: dict[tuple, int] = {}
+        root = _intern(game.to_dict(), shapes)
+        tree = [list(shapes), root]
+        if self.body == BODY_MSGPACK:
+            body = msgpack.packb(tree, use_bin_type=True)
+        else:
+            body = json.dumps(tree, separators=(",", ":")).encode("utf-8")
+        if self.compression == COMPRESS_ZSTD:
+            body = zstandard.ZstdCompressor().compress(body)
+        elif self.compression == COMPRESS_ZLIB:
+            body = zlib.compress(body, 1)
+        flags = self.body | (self.compression << 4)
+        return MAGIC + bytes((FORMAT_VERSION, flags)) + body
+
+    @staticmethod
+    def decode(game_class: type["Game"], blob: str | bytes) -> "Game":
+        """Restore a game from a blob written by any codec.
+
+        Raises:
+            UnreadableGameState: The blob is from a newer format version, or
+                needs msgpack or zstandard and that package is not installed.
+        """
+        if isinstance(blob, str):
+            return game_class.from_json(blob)
+        if not blob.startswith(MAGIC):
+            return game_class.from_json(blob.decode("utf-8"))
+        version, flags = blob[len(MAGIC)], blob[len(MAGIC) + 1]
+        if version > FORMAT_VERSION:
+            raise UnreadableGameState(f"Game state format version {version} is newer than this server")
+        body_format, compression = flags & 0x0F, flags >> 4
+        body = blob[_HEADER_SIZE:]
+        if compression == COMPRESS_ZSTD:
+            if zstandard is None:
+                raise UnreadableGameState("Game state is zstd-compressed but zstandard is not installed")
+            body = zstandard.ZstdDecompressor().decompress(body)
+        elif compression == COMPRESS_ZLIB:
+            body = zlib.decompress(body)
+        if body_format == BODY_MSGPACK:
+            if msgpack is None:
+                raise UnreadableGameState("Game state is msgpack-encoded but msgpack is not installed")
+            shapes, root = msgpack.unpackb(body, raw=False)
+        else:
+            shapes, root = json.loads(body)
+        return game_class.from_dict(_expand(root, shapes))
+
+
+DEFAULT_GAME_CODEC = GameCodec()
@@ -0,0 +1,144 @@
+"""Write-behind worker for the SQLite database."""
+
+import logging
+import queue
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+LOG = logging.getLogger("playpalace.persistence")
+
+DEFAULT_MAX_BATCH = 500
+
+WriteJob = Callable[[sqlite3.Connection], Any]
+
+
+class DatabaseWriter:
+    """Apply queued database writes on a dedicated thread.
+
+    Jobs run in submission order on the writer's own connection. Everything
+    queued when the writer wakes up (up to ``max_batch`` jobs) is committed
+    in one transaction, so a burst of writes costs one commit instead of one
+    each, and none of them blocks the event loop. Each job runs in its own
+    savepoint: a failing job is logged and rolled back without losing the
+    rest of its batch.
+    """
+
+    def __init__(self, db_path: str | Path, max_batch: int = DEFAULT_MAX_BATCH):
+        """
+        Initialize the writer. Call start() before submitting jobs.
+
+        Args:
+            db_path: Database file to write to.
+            max_batch: Most jobs committed in one transaction.
+        """
+        self.db_path = Path(db_path)
+        self.max_batch = max(1, max_batch)
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        # Only the submitting thread bumps submitted and only the writer
+        # bumps completed, so pending needs no lock.
+        self.submitted = 0
+        self.completed = 0
+        self.batches = 0
+        self.failed = 0
+
+    @property
+    def pending(self) -> int:
+        """Jobs submitted but not yet committed."""
+        return self.submitted - self.completed
+
+    def start(self) -> None:
+        """Open the writer's connection and start its thread."""
+        if self._thread:
+            return
+        # Opened here so a bad path fails the caller; only the thread uses it.
+        conn = sqlite3.connect(str(self.db_path), isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        self._thread = threading.Thread(
+            target=self._run, args=(conn,), name="db-writer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, job: WriteJob | None, on_commit: Callable[[], None] | None = None) -> None:
+        """
+        Queue a write.
+
+        Args:
+            job: Called with the writer's connection inside a transaction.
+                It must not commit.
+            on_commit: Called on the writer thread once the job's batch has
+                been committed (or rolled back after an error).
+        """
+        if not self._thread:
+            raise RuntimeError("Database writer is not running")
+        self.submitted += 1
+        self._queue.put((job, on_commit))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until every job submitted so far has been committed.
+
+        Returns:
+            False if the timeout expired first.
+        """
+        if not self._thread or not self.pending:
+            return True
+        done = threading.Event()
+        self.submit(None, done.set)
+        return done.wait(timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Commit everything still queued, then stop the writer thread."""
+        if not self._thread:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            LOG.error("Database writer did not finish; %d writes may be lost", self.pending)
+        self._thread = None
+
+    def _run(self, conn: sqlite3.Connection) -> None:
+        """Drain the queue in batches until close() is called."""
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = None in batch
+            self._apply(conn, [item for item in batch if item is not None])
+        conn.close()
+
+    def _apply(self, conn: sqlite3.Connection, batch: list[tuple]) -> None:
+        """Run one batch of jobs in a single transaction."""
+        if not batch:
+            return
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for job, _on_commit in batch:
+                if job is None:
+                    continue
+                conn.execute("SAVEPOINT job")
+                try:
+                    job(conn)
+                except Exception:
+                    LOG.exception("Deferred database write failed")
+                    self.failed += 1
+                    conn.execute("ROLLBACK TO job")
+                conn.execute("RELEASE job")
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            LOG.exception("Database writer lost a batch of %d writes", len(batch))
+            self.failed += len(batch)
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+        self.batches += 1
+        self.completed += len(batch)
+        for _job, on_commit in batch:
+            if on_commit:
+                on_commit()
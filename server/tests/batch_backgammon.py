@@ -1,49 +1,24 @@
 """Batch backgammon simulation — run many games in parallel and check win rates."""
 
-import json
-import subprocess
 import sys
 from collections import Counter
-from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
-SERVER_DIR = Path(__file__).parent.parent
-CLI = SERVER_DIR / "cli.py"
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from server.game_utils.simulation_pool import SimulationPool  # noqa: E402
+
 GAMES_PER_DIFFICULTY = 500
 WORKERS = 4
 
 DIFFICULTIES = ["random", "simple"]
 
 
-def run_one_game(difficulty: str, game_id: int) -> dict:
-    """Run a single backgammon simulation and return the result."""
-    result = subprocess.run(
-        [
-            sys.executable,
-            str(CLI),
-            "simulate",
-            "backgammon",
-            "--bots",
-            "2",
-            "-o",
-            f"bot_difficulty={difficulty}",
-            "--json",
-            "--quiet",
-        ],
-        capture_output=True,
-        text=True,
-        timeout=300,
-        cwd=str(SERVER_DIR),
-    )
-    if result.returncode != 0:
-        # Capture the last part of stderr for the traceback
-        stderr = result.stderr.strip()
-        # Get the last traceback if present
-        if "Traceback" in stderr:
-            stderr = stderr[stderr.rfind("Traceback") :]
-        return {"difficulty": difficulty, "id": game_id, "error": stderr}
-
-    data = json.loads(result.stdout)
+def parse_game(difficulty: str, game_id: int, data: dict) -> dict:
+    """Turn one simulation results dict into a win record."""
+    if data.get("error"):
+        return {"difficulty": difficulty, "id": game_id, "error": data["error"]}
+
     messages = data.get("messages", [])
     timed_out = data.get("timed_out", False)
 
@@ -74,28 +49,24 @@ def main():
     print(f"Difficulties: {', '.join(DIFFICULTIES)}")
     print()
 
-    all_tasks = []
-    for diff in DIFFICULTIES:
-        for i in range(GAMES_PER_DIFFICULTY):
-            all_tasks.append((diff, i))
-
     results = []
     completed = 0
-    total = len(all_tasks)
-
-    with ProcessPoolExecutor(max_workers=WORKERS) as pool:
-        futures = {pool.submit(run_one_game, diff, gid): (diff, gid) for diff, gid in all_tasks}
-        for future in as_completed(futures):
-            completed += 1
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                diff, gid = futures[future]
-                results.append({"difficulty": diff, "id": gid, "error": str(e)})
-
-            if completed % 50 == 0 or completed == total:
-                print(f"  {completed}/{total} games complete")
+    total = GAMES_PER_DIFFICULTY * len(DIFFICULTIES)
+
+    pool = SimulationPool(WORKERS)
+    try:
+        for diff in DIFFICULTIES:
+            runs = pool.run_many(
+                GAMES_PER_DIFFICULTY, "backgammon", ["Alice", "Bob"], {"bot_difficulty": diff}
+            )
+            for gid, data in enumerate(runs):
+                completed += 1
+                results.append(parse_game(diff, gid, data))
+
+                if completed % 50 == 0 or completed == total:
+                    print(f"  {completed}/{total} games complete")
+    finally:
+        pool.shutdown()
 
     # Aggregate results per difficulty
     print()
@@ -0,0 +1,121 @@
+"""Benchmark action resolution over every registered game's action sets.
+
+Each game is set up with bots the same way ``cli.py simulate`` does and run
+for a few ticks, then every player's action sets are resolved repeatedly,
+once with the compiled resolver and once with the old per-call
+``inspect.signature`` lookups for comparison.
+"""
+
+import inspect
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from server.cli import GameSimulator  # noqa: E402
+from server.game_utils.actions import ResolvedAction, Visibility  # noqa: E402
+from server.games.registry import GameRegistry  # noqa: E402
+
+ROUNDS = 200
+WARMUP_TICKS = 20
+
+
+def legacy_resolve(game, player, action) -> ResolvedAction:
+    """Resolve an action the way ActionSet did before compiled callbacks."""
+
+    def call(name):
+        method = getattr(game, name, None)
+        if not method:
+            return None, False
+        if "action_id" in inspect.signature(method).parameters:
+            return method(player, action_id=action.id), True
+        return method(player), True
+
+    disabled_reason = None
+    if action.is_enabled:
+        disabled_reason, _ = call(action.is_enabled)
+    visible = True
+    if action.is_hidden:
+        visibility, found = call(action.is_hidden)
+        if found:
+            visible = visibility == Visibility.VISIBLE
+    label = action.label
+    if action.get_label:
+        method = getattr(game, action.get_label, None)
+        if method:
+            label = method(player, action.id)
+    sound = None
+    if action.get_sound:
+        sound, _ = call(action.get_sound)
+    return ResolvedAction(action, label, disabled_reason is None, disabled_reason, visible, sound)
+
+
+def start_game(game_type: str):
+    """Return a started game with the minimum number of bots, or None."""
+    game_class = GameRegistry.get(game_type)
+    bots = [f"Bot{i}" for i in range(max(2, game_class.get_min_players()))]
+    sim = GameSimulator(game_type, bots, {}, json_mode=True, quiet=True)
+    if not sim.setup() or sim.game.prestart_validate():
+        return None
+    game = sim.game
+    game.setup_keybinds()
+    game.on_start()
+    for _ in range(WARMUP_TICKS):
+        if not game.game_active:
+            break
+        game.on_tick()
+    return game
+
+
+def bench(game, resolve_set) -> tuple[float, int]:
+    """Return (seconds, actions resolved) for ROUNDS passes over all players."""
+    count = 0
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        for player in game.players:
+            for action_set in game.get_action_sets(player):
+                count += len(resolve_set(action_set, game, player))
+    return time.perf_counter() - started, count
+
+
+def resolve_compiled(action_set, game, player):
+    return action_set.resolve_actions(game, player)
+
+
+def resolve_legacy(action_set, game, player):
+    return [
+        legacy_resolve(game, player, action_set._actions[aid])
+        for aid in action_set._order
+        if aid in action_set._actions
+    ]
+
+
+def main() -> None:
+    total_legacy = total_compiled = 0.0
+    print(f"{'game':20} {'actions':>8} {'legacy us':>10} {'compiled us':>12} {'speedup':>8}")
+    for game_type in sorted(info.get_type() for info in GameRegistry.get_infos()):
+        try:
+            game = start_game(game_type)
+        except Exception as exc:  # keep benchmarking the other games
+            print(f"{game_type:20} setup failed: {exc}")
+            continue
+        if game is None:
+            print(f"{game_type:20} skipped")
+            continue
+        legacy_s, count = bench(game, resolve_legacy)
+        compiled_s, _ = bench(game, resolve_compiled)
+        if not count:
+            continue
+        total_legacy += legacy_s
+        total_compiled += compiled_s
+        print(
+            f"{game_type:20} {count // ROUNDS:8d} {legacy_s / count * 1e6:10.2f} "
+            f"{compiled_s / count * 1e6:12.2f} {legacy_s / compiled_s:7.1f}x"
+        )
+    if total_compiled:
+        print(f"Overall speedup: {total_legacy / total_compiled:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark localized broadcasts: per-player formatting vs once per locale."""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from server.core.users.network_user import NetworkUser  # noqa: E402
+from server.game_utils.game_communication_mixin import GameCommunicationMixin  # noqa: E402
+from server.games.base import Player  # noqa: E402
+from server.messages.localization import Localization  # noqa: E402
+from server.network.packet_encoder import (  # noqa: E402
+    PacketEncoder,
+    VALIDATION_OFF,
+    dumps_packet,
+)
+
+ROUNDS = 2000
+PLAYERS = 8
+LOCALES = ("en", "en", "en", "de")
+
+
+class BenchTable(GameCommunicationMixin):
+    def __init__(self):
+        self.players = [Player(id=f"p{i}", name=f"Player{i}") for i in range(PLAYERS)]
+        self.users = {
+            player.id: NetworkUser(player.name, LOCALES[i % len(LOCALES)], None)
+            for i, player in enumerate(self.players)
+        }
+
+    def get_user(self, player):
+        return self.users[player.id]
+
+
+def per_player(table: BenchTable, encoder: PacketEncoder, name: str) -> None:
+    """The previous path: format, build and serialize for every player."""
+    for player in table.players:
+        user = table.users[player.id]
+        text = Localization.get(user.locale, "game-player-skipped", player=name)
+        payload = encoder.prepare({"type": "speak", "text": text, "buffer": "table"}, "bench")
+        dumps_packet(payload)
+
+
+def per_locale(table: BenchTable, encoder: PacketEncoder, name: str) -> None:
+    """broadcast_l plus the connection's encode step."""
+    table.broadcast_l("game-player-skipped", player=name)
+    for user in table.users.values():
+        for packet in user.get_queued_messages():
+            encoder.encode(packet, "bench")
+
+
+def bench(step) -> float:
+    """Return average microseconds per broadcast."""
+    table = BenchTable()
+    encoder = PacketEncoder(VALIDATION_OFF)
+    Localization.init(Path(__file__).parent.parent / "locales")
+    step(table, encoder, "Warmup")  # compile the locale bundles outside the timing
+    started = time.perf_counter()
+    for round_number in range(ROUNDS):
+        # A fresh name each round so no broadcast text repeats.
+        step(table, encoder, f"Player{round_number}")
+    elapsed = time.perf_counter() - started
+    return elapsed / ROUNDS * 1_000_000
+
+
+def main() -> None:
+    print(f"{ROUNDS} broadcasts to {PLAYERS} players in {len(set(LOCALES))} locales")
+    before = bench(per_player)
+    after = bench(per_locale)
+    print(f"  per player  {before:8.1f} us/broadcast")
+    print(f"  per locale  {after:8.1f} us/broadcast  ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
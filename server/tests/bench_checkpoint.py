@@ -0,0 +1,107 @@
+"""Benchmark table persistence: save-everything-at-shutdown vs. incremental checkpoints.
+
+Builds TABLES mid-game tables (bots only, SIM_TICKS ticks into the game)
+across a few game types, then times:
+
+- the old shutdown: serialize every table and commit each save separately
+- a checkpoint round spread over ticks at the default budget
+- shutdown after a round, when only DIRTY_SHARE of the tables changed
+- restart recovery: Server._load_tables reading the checkpointed rows back
+
+Usage: python tests/bench_checkpoint.py [tables]
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from server.cli import GameSimulator  # noqa: E402
+from server.core.server import Server  # noqa: E402
+from server.core.tables.checkpoint import TableCheckpointer  # noqa: E402
+from server.core.tables.manager import TableManager  # noqa: E402
+from server.messages.localization import Localization  # noqa: E402
+from server.persistence.database import Database  # noqa: E402
+
+TABLES = 300
+GAME_TYPES = ("pig", "farkle", "yahtzee", "scopa", "chess", "milebymile")
+SIM_TICKS = 200
+DIRTY_SHARE = 0.1
+
+
+def build(tables: int) -> TableManager:
+    """Tables holding games SIM_TICKS ticks in, cycling through GAME_TYPES."""
+    manager = TableManager()
+    for index in range(tables):
+        game_type = GAME_TYPES[index % len(GAME_TYPES)]
+        simulator = GameSimulator(
+            game_type=game_type,
+            bot_names=["Alice", "Bob"],
+            options={},
+            json_mode=False,
+            quiet=True,
+            max_ticks=SIM_TICKS,
+        )
+        simulator.setup()
+        with contextlib.redirect_stdout(io.StringIO()):  # "timed out" warnings
+            simulator.run()
+        table = manager.create_table(game_type, "Alice", simulator.capturing_bots["Alice"])
+        table.game = simulator.game
+    return manager
+
+
+def main() -> None:
+    tables = int(sys.argv[1]) if len(sys.argv) > 1 else TABLES
+    Localization.init(Path(__file__).parent.parent / "locales", enabled_locales=["en"])
+    manager = build(tables)
+    print(f"{tables} mid-game tables ({', '.join(GAME_TYPES)})")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(Path(tmp) / "bench.db")
+        db.connect()
+        started = time.perf_counter()
+        for table in manager.get_all_tables():
+            table.save_game_state()
+            db.save_table(table)
+        print(f"  old shutdown (all tables)      {(time.perf_counter() - started) * 1000:8.1f} ms")
+
+        db.start_writer()
+        checkpointer = TableCheckpointer(manager, db, interval_s=1.0)
+        checkpointer._next_round = 0
+        slices = []
+        while True:
+            started = time.perf_counter()
+            checkpointer.on_tick()
+            slices.append((time.perf_counter() - started) * 1000)
+            if not checkpointer._queue:
+                break
+        print(
+            f"  checkpoint round               {len(slices):5d} ticks,"
+            f" max {max(slices):.1f} ms/tick (budget {checkpointer.budget_s * 1000:.0f} ms)"
+        )
+
+        all_tables = manager.get_all_tables()
+        for table in all_tables[: int(len(all_tables) * DIRTY_SHARE)]:
+            table.game.on_tick()
+            table.wake()
+        started = time.perf_counter()
+        saved, unchanged = checkpointer.checkpoint_all()
+        db.flush()
+        elapsed = (time.perf_counter() - started) * 1000
+        label = f"new shutdown ({DIRTY_SHARE:.0%} dirty)"
+        print(f"  {label:30} {elapsed:8.1f} ms ({saved} saved, {unchanged} unchanged)")
+        db.close()
+
+        server = Server(db_path=Path(tmp) / "bench.db", config_path=Path(tmp) / "missing.toml")
+        server._db.connect()
+        print("  restart: ", end="")
+        server._load_tables()
+        server._db.close()
+
+
+if __name__ == "__main__":
+    main()
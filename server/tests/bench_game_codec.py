@@ -0,0 +1,100 @@
+"""Benchmark game-state codecs on every registered game.
+
+Each game is played by bots for SIM_TICKS ticks (or to the end, if sooner)
+and its state is then encoded and decoded REPEATS times with each codec:
+json (to_json text), packed without compression, and packed. Median encode
+and decode times include mashumaro's to_dict/from_dict, as a save does.
+
+Usage: python tests/bench_game_codec.py [game_type ...]
+"""
+
+import contextlib
+import io
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from server.cli import GameSimulator  # noqa: E402
+from server.games.base import BOT_NAMES  # noqa: E402
+from server.games.registry import GameRegistry, get_game_class  # noqa: E402
+from server.messages.localization import Localization  # noqa: E402
+from server.persistence.game_codec import (  # noqa: E402
+    BODY_MSGPACK,
+    COMPRESS_ZSTD,
+    GameCodec,
+)
+
+SIM_TICKS = 300
+REPEATS = 20
+CODECS = {
+    "json": GameCodec("json"),
+    "packed-raw": GameCodec("packed", compress=False),
+    "packed": GameCodec("packed"),
+}
+
+
+def mid_game(game_type: str):
+    """Return a game SIM_TICKS ticks in, played by its minimum number of bots."""
+    game_class = get_game_class(game_type)
+    players = max(2, game_class.get_min_players())
+    simulator = GameSimulator(
+        game_type=game_type,
+        bot_names=BOT_NAMES[:players],
+        options={},
+        quiet=True,
+        max_ticks=SIM_TICKS,
+        seed=1,
+    )
+    if not simulator.setup():
+        return None
+    with contextlib.redirect_stdout(io.StringIO()):  # "timed out" warnings
+        simulator.run()
+    return simulator.game
+
+
+def median_ms(func) -> tuple[float, object]:
+    """Median milliseconds of REPEATS calls, and the last result."""
+    times = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        result = func()
+        times.append((time.perf_counter() - started) * 1000)
+    return statistics.median(times), result
+
+
+def main() -> None:
+    Localization.init(Path(__file__).parent.parent / "locales", enabled_locales=["en"])
+    game_types = sys.argv[1:] or [info.get_type() for info in GameRegistry.get_infos()]
+    packed = CODECS["packed"]
+    print(
+        f"packed body: {'msgpack' if packed.body == BODY_MSGPACK else 'json'}, "
+        f"compression: {'zstd' if packed.compression == COMPRESS_ZSTD else 'zlib'}"
+    )
+    print(f"{'game':18}" + "".join(f"{name + ' enc/dec ms, bytes':>32}" for name in CODECS))
+    totals = {name: [0.0, 0.0, 0] for name in CODECS}
+    for game_type in game_types:
+        game = mid_game(game_type)
+        if game is None:
+            print(f"{game_type:18} (setup failed)")
+            continue
+        game_class = type(game)
+        line = f"{game_type:18}"
+        for name, codec in CODECS.items():
+            encode_ms, blob = median_ms(lambda: codec.encode(game))
+            decode_ms, _ = median_ms(lambda: codec.decode(game_class, blob))
+            line += f"{encode_ms:10.2f} {decode_ms:6.2f} {len(blob):13,d}"
+            totals[name][0] += encode_ms
+            totals[name][1] += decode_ms
+            totals[name][2] += len(blob)
+        print(line)
+    print(
+        f"{'total':18}"
+        + "".join(f"{enc:10.2f} {dec:6.2f} {size:13,d}" for enc, dec, size in totals.values())
+    )
+
+
+if __name__ == "__main__":
+    main()
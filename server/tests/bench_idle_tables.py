@@ -0,0 +1,61 @@
+"""Benchmark table ticking with mostly idle lobbies: every table vs. due tables only."""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from server.core.tables.manager import TableManager  # noqa: E402
+from server.core.users.test_user import MockUser  # noqa: E402
+from server.games.base import Game  # noqa: E402
+from server.games.registry import get_game_class  # noqa: E402
+from server.messages.localization import Localization  # noqa: E402
+
+LOBBIES = 500
+GAME_TYPES = ("pig", "farkle", "yahtzee", "scopa", "chess")
+TICKS = 200
+
+
+def build() -> TableManager:
+    """LOBBIES waiting tables, one human host each, across a few game types."""
+    manager = TableManager()
+    for index in range(LOBBIES):
+        host = f"host{index}"
+        user = MockUser(host)
+        game_type = GAME_TYPES[index % len(GAME_TYPES)]
+        table = manager.create_table(game_type, host, user)
+        game = get_game_class(game_type)()
+        table.game = game
+        game._table = table
+        game.initialize_lobby(host, user)
+    return manager
+
+
+def bench(manager: TableManager) -> float:
+    """Return milliseconds per manager tick."""
+    for _ in range(20):  # let lobby sounds play out
+        manager.on_tick()
+    started = time.perf_counter()
+    for _ in range(TICKS):
+        manager.on_tick()
+    return (time.perf_counter() - started) / TICKS * 1000
+
+
+def main() -> None:
+    Localization.init(Path(__file__).parent.parent / "locales", enabled_locales=["en"])
+    Localization.get("en", "welcome")  # compile the bundle outside the timing
+    every_tick = Game.next_wakeup_tick
+    Game.next_wakeup_tick = lambda self: self.sound_scheduler_tick
+    before = bench(build())
+    Game.next_wakeup_tick = every_tick
+    manager = build()
+    after = bench(manager)
+    print(f"{LOBBIES} idle lobbies, {TICKS} ticks")
+    print(f"  tick all   {before:8.3f} ms/tick")
+    print(f"  due only   {after:8.3f} ms/tick  ({before / after:.0f}x)")
+    print(f"  {manager.get_sleeping_count()} of {LOBBIES} tables sleeping")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark leaderboard reads: per-result lookups vs. the player_game_stats table.
+
+Builds a database with RESULTS pig results (3 seats each, drawn from
+PLAYERS players), backfills player stats with rebuild_player_stats and
+times a wins leaderboard both ways. The per-result path only reads the
+latest 100 games, like the old menus did; get_leaderboard ranks the whole
+history. Also times save_game_result, which now updates the stats rows.
+
+Usage: python tests/bench_leaderboards.py [results]
+"""
+
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from server.persistence.database import Database  # noqa: E402
+
+RESULTS = 1_000_000
+PLAYERS = 5000
+SEATS = 3
+ROUNDS = 5
+
+
+def populate(db: Database, results: int) -> None:
+    rng = random.Random(0)
+    result_rows = []
+    player_rows = []
+    for result_id in range(1, results + 1):
+        seated = rng.sample(range(PLAYERS), SEATS)
+        names = [f"player{i}" for i in seated]
+        scores = {name: rng.randint(0, 100) for name in names}
+        custom_data = {"winner_name": rng.choice(names), "final_scores": scores}
+        result_rows.append((result_id, "pig", f"{result_id:012d}", 100, json.dumps(custom_data)))
+        player_rows.extend((result_id, f"uuid-{i}", f"player{i}", 0, 0) for i in seated)
+    with db._conn:
+        db._conn.executemany(
+            "INSERT INTO game_results (id, game_type, timestamp, duration_ticks, custom_data)"
+            " VALUES (?, ?, ?, ?, ?)",
+            result_rows,
+        )
+        db._conn.executemany(
+            "INSERT INTO game_result_players"
+            " (result_id, player_id, player_name, is_bot, is_virtual_bot) VALUES (?, ?, ?, ?, ?)",
+            player_rows,
+        )
+
+
+def per_result_wins(db: Database) -> list[tuple[str, int]]:
+    """The old approach: latest 100 results, one player query each."""
+    wins: dict[str, int] = {}
+    for row in db.get_game_stats("pig", limit=100):
+        custom_data = json.loads(row[4]) if row[4] else {}
+        for player in db.get_game_result_players(row[0]):
+            won = custom_data.get("winner_name") == player["player_name"]
+            wins[player["player_name"]] = wins.get(player["player_name"], 0) + won
+    return sorted(wins.items(), key=lambda item: item[1], reverse=True)[:10]
+
+
+def timed(fn) -> float:
+    """Return milliseconds per call."""
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn()
+    return (time.perf_counter() - started) / ROUNDS * 1000
+
+
+def main() -> None:
+    results = int(sys.argv[1]) if len(sys.argv) > 1 else RESULTS
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(Path(tmp) / "bench.db")
+        db.connect()
+        started = time.perf_counter()
+        populate(db, results)
+        print(f"{results} results built in {time.perf_counter() - started:.1f} s")
+
+        started = time.perf_counter()
+        db.rebuild_player_stats({})
+        print(f"rebuild_player_stats in {time.perf_counter() - started:.1f} s")
+
+        legacy = timed(lambda: per_result_wins(db))
+        print(f"  per-result (latest 100 games)  {legacy:9.1f} ms")
+        for kind in ("wins", "total_score", "high_score", "games_played"):
+            elapsed = timed(lambda: db.get_leaderboard("pig", kind))
+            print(f"  get_leaderboard {kind:14} {elapsed:9.1f} ms (all {results} games)")
+        elapsed = timed(lambda: db.get_player_game_stats("uuid-0", "pig"))
+        print(f"  get_player_game_stats          {elapsed:9.1f} ms")
+        players = [(f"uuid-{i}", f"player{i}", False, False) for i in range(SEATS)]
+        custom_data = {"winner_name": "player0", "final_scores": {"player0": 10}}
+        elapsed = timed(
+            lambda: db.save_game_result("pig", "2024-01-01T00:00:00", 100, players, custom_data)
+        )
+        print(f"  save_game_result               {elapsed:9.1f} ms")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
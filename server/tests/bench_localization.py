@@ -0,0 +1,49 @@
+"""Benchmark Localization.get with and without the format cache."""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from server.messages.localization import Localization  # noqa: E402
+
+ROUNDS = 20000
+
+# Typical menu-builder calls: constant labels and low-cardinality arguments.
+WORKLOAD = [
+    ("back", {}),
+    ("play", {}),
+    ("visibility-unavailable", {}),
+    ("game-player-skipped", {"player": "Alice"}),
+    ("game-player-skipped", {"player": "Bob"}),
+]
+
+
+def bench(get) -> float:
+    """Return average microseconds per call."""
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        for message_id, kwargs in WORKLOAD:
+            get("en", message_id, **kwargs)
+    elapsed = time.perf_counter() - started
+    return elapsed / (ROUNDS * len(WORKLOAD)) * 1_000_000
+
+
+def uncached(locale: str, message_id: str, **kwargs) -> str:
+    return Localization._get_uncached(locale, message_id, kwargs)
+
+
+def main() -> None:
+    Localization.init(Path(__file__).parent.parent / "locales", enabled_locales=["en"])
+    Localization.get("en", "back")  # compile the bundle outside the timing
+    before = bench(uncached)
+    after = bench(Localization.get)
+    print(f"{ROUNDS * len(WORKLOAD)} calls")
+    print(f"  uncached  {before:6.2f} us/call")
+    print(f"  cached    {after:6.2f} us/call  ({before / after:.1f}x)")
+    print(f"  {Localization.get_cache_stats()}")
+
+
+if __name__ == "__main__":
+    main()
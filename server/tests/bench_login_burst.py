@@ -0,0 +1,151 @@
+"""Load test: a burst of logins against a ticking server, measuring tick jitter.
+
+Simulated clients log in concurrently through Server._handle_authorize
+while the tick scheduler runs. Each tick records how late it started;
+with Argon2 on the event loop every password check delays the ticks
+behind it.
+
+    python tests/bench_login_burst.py --clients 500 --mode both
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from server.auth.auth import AuthManager, CredentialPool  # noqa: E402
+from server.core.server import Server  # noqa: E402
+from server.core.tick import TickScheduler  # noqa: E402
+from server.core.users.base import TrustLevel  # noqa: E402
+from server.messages.localization import Localization  # noqa: E402
+
+PASSWORD = "burst-password"
+TICK_MS = 50
+
+
+class SimulatedClient:
+    """Just enough of ClientConnection for the login flow."""
+
+    def __init__(self, index: int):
+        self.address = f"10.{index // 65536}.{index // 256 % 256}.{index % 256}:5000"
+        self.username = None
+        self.authenticated = False
+        self.replaced = False
+        self.client_type = ""
+        self.platform = ""
+        self.supports_batch = False
+        self.supports_menu_patch = False
+        self.sent: list[dict] = []
+
+    async def send(self, packet: dict) -> None:
+        self.sent.append(packet)
+
+    def enqueue(self, packets: list[dict]) -> None:
+        self.sent.extend(packets)
+
+    async def close(self) -> None:
+        pass
+
+
+def build_server(workdir: Path, clients: int, workers: int, executor: str) -> Server:
+    """Create a server with `clients` approved accounts sharing one password."""
+    server = Server(
+        db_path=str(workdir / "burst.db"),
+        locales_dir="locales",
+        config_path=workdir / "missing.toml",
+    )
+    server._db.connect()
+    pool = CredentialPool(workers, executor, max_pending=clients)
+    server._auth = AuthManager(server._db, pool)
+    password_hash = server._auth.hash_password(PASSWORD)
+    for index in range(clients):
+        server._db.create_user(f"user{index}", password_hash, "en", TrustLevel.USER, True)
+    server._login_ip_limit = 0
+    server._login_user_limit = 0
+    Localization.get("en", "welcome")  # compile the bundle before timing
+    return server
+
+
+async def run_burst(server: Server, clients: int, inline: bool) -> dict:
+    """Log every client in while ticking; return timing results."""
+    if inline:
+        # The previous behaviour: Argon2 runs on the event loop.
+        auth = server._auth
+
+        async def authenticate_inline(username: str, password: str):
+            return auth.authenticate(username, password)
+
+        auth.authenticate_async = authenticate_inline
+
+    tick_starts: list[float] = []
+
+    def on_tick() -> None:
+        tick_starts.append(time.monotonic())
+        server._on_tick()
+
+    scheduler = TickScheduler(on_tick, TICK_MS)
+    await scheduler.start()
+    await asyncio.sleep(0.2)
+
+    started = time.perf_counter()
+    simulated = [SimulatedClient(index) for index in range(clients)]
+    await asyncio.gather(
+        *(
+            server._handle_authorize(client, {"username": f"user{i}", "password": PASSWORD})
+            for i, client in enumerate(simulated)
+        )
+    )
+    elapsed = time.perf_counter() - started
+    await asyncio.sleep(0.2)
+    await scheduler.stop()
+
+    gaps = sorted(
+        (later - earlier) * 1000 - TICK_MS for earlier, later in zip(tick_starts, tick_starts[1:])
+    )
+    logged_in = sum(
+        1 for client in simulated if any(p.get("type") == "authorize_success" for p in client.sent)
+    )
+    return {
+        "elapsed_s": elapsed,
+        "logged_in": logged_in,
+        "ticks": len(tick_starts),
+        "p95_late_ms": gaps[int(len(gaps) * 0.95)] if gaps else 0.0,
+        "max_late_ms": gaps[-1] if gaps else 0.0,
+    }
+
+
+def run_mode(clients: int, workers: int, executor: str, inline: bool) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        server = build_server(Path(tmp), clients, workers, executor)
+        try:
+            return asyncio.run(run_burst(server, clients, inline))
+        finally:
+            server._auth.close()
+            server._db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--executor", choices=("thread", "process"), default="thread")
+    parser.add_argument("--mode", choices=("inline", "pool", "both"), default="both")
+    args = parser.parse_args()
+
+    modes = ["inline", "pool"] if args.mode == "both" else [args.mode]
+    print(f"{args.clients} logins, {TICK_MS} ms ticks, {args.workers} {args.executor} workers")
+    for mode in modes:
+        result = run_mode(args.clients, args.workers, args.executor, mode == "inline")
+        print(
+            f"  {mode:6}  {result['logged_in']}/{args.clients} logged in "
+            f"in {result['elapsed_s']:.1f}s, {result['ticks']} ticks, "
+            f"tick lateness p95 {result['p95_late_ms']:.1f} ms, max {result['max_late_ms']:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
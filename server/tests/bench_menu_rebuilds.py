@@ -0,0 +1,81 @@
+"""Count turn menu builds per game with and without deferred menu updates.
+
+Runs every registered game through the same simulation as ``cli.py
+simulate`` twice with the same random seed: once with menu refreshes
+deferred to the end of each tick (the default), and once with them applied
+immediately. Reports how many times visible actions were resolved for a menu and the
+time spent.
+"""
+
+import random
+import sys
+import time
+from contextlib import nullcontext
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from server.cli import GameSimulator  # noqa: E402
+from server.game_utils.action_set_system_mixin import ActionSetSystemMixin  # noqa: E402
+from server.games.registry import GameRegistry  # noqa: E402
+
+SEED = 1234
+MAX_TICKS = 20000
+
+builds = 0
+_get_all_visible_actions = ActionSetSystemMixin.get_all_visible_actions
+
+
+def _counting_get_all_visible_actions(self, player):
+    global builds
+    builds += 1
+    return _get_all_visible_actions(self, player)
+
+
+def run(game_type: str, deferred: bool) -> tuple[int, int, float] | None:
+    """Return (ticks, menu builds, seconds) for one seeded simulation."""
+    global builds
+    game_class = GameRegistry.get(game_type)
+    bots = [f"Bot{i}" for i in range(max(2, game_class.get_min_players()))]
+    random.seed(SEED)
+    sim = GameSimulator(game_type, bots, {}, json_mode=True, quiet=True, max_ticks=MAX_TICKS)
+    if not sim.setup():
+        return None
+    if not deferred:
+        sim.game.deferred_menu_updates = nullcontext
+    builds = 0
+    started = time.perf_counter()
+    result = sim.run()
+    elapsed = time.perf_counter() - started
+    if "error" in result:
+        return None
+    return result["ticks"], builds, elapsed
+
+
+def main() -> None:
+    ActionSetSystemMixin.get_all_visible_actions = _counting_get_all_visible_actions
+    total_immediate = total_deferred = 0
+    print(f"{'game':20} {'ticks':>7} {'immediate':>10} {'deferred':>9} {'saved':>6} {'time':>14}")
+    for game_type in sorted(info.get_type() for info in GameRegistry.get_infos()):
+        immediate = run(game_type, deferred=False)
+        deferred = run(game_type, deferred=True)
+        if immediate is None or deferred is None:
+            print(f"{game_type:20} skipped")
+            continue
+        ticks, immediate_builds, immediate_s = immediate
+        deferred_ticks, deferred_builds, deferred_s = deferred
+        if deferred_ticks != ticks:
+            print(f"{game_type:20} tick count changed: {ticks} -> {deferred_ticks}")
+        total_immediate += immediate_builds
+        total_deferred += deferred_builds
+        saved = 1 - deferred_builds / immediate_builds if immediate_builds else 0.0
+        print(
+            f"{game_type:20} {ticks:7d} {immediate_builds:10d} {deferred_builds:9d} "
+            f"{saved:6.0%} {immediate_s:6.2f}s/{deferred_s:5.2f}s"
+        )
+    if total_immediate:
+        print(f"Menu builds saved overall: {1 - total_deferred / total_immediate:.0%}")
+
+
+if __name__ == "__main__":
+    main()
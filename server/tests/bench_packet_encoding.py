@@ -0,0 +1,58 @@
+"""Benchmark per-packet encoding cost under each packet validation mode."""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from server.network.packet_encoder import (  # noqa: E402
+    PacketEncoder,
+    SELF_TEST_PACKETS,
+    VALIDATION_MODES,
+    dumps_packet,
+    orjson,
+)
+
+ROUNDS = 2000
+
+# Weighted towards what a busy game actually sends.
+WORKLOAD = [
+    {"type": "speak", "text": "Alice rolls a 5.", "buffer": "table"},
+    {"type": "speak", "text": "Bob banks 23 points."},
+    {"type": "play_sound", "name": "game_pig/roll.ogg", "volume": 100, "pan": 0, "pitch": 100},
+    {
+        "type": "menu",
+        "menu_id": "turn_menu",
+        "items": [{"text": f"Action {i}", "id": f"action_{i}", "sound": None} for i in range(12)],
+        "multiletter_enabled": True,
+        "escape_behavior": "keybind",
+        "position": None,
+    },
+] + SELF_TEST_PACKETS
+
+
+def bench(mode: str) -> float:
+    """Return average microseconds per packet for prepare + serialize."""
+    encoder = PacketEncoder(mode)
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        for packet in WORKLOAD:
+            dumps_packet(encoder.prepare(packet, "bench"))
+    elapsed = time.perf_counter() - started
+    return elapsed / (ROUNDS * len(WORKLOAD)) * 1_000_000
+
+
+def main() -> None:
+    print(f"Serializer: {'orjson' if orjson is not None else 'json'}")
+    print(f"{ROUNDS * len(WORKLOAD)} packets per mode")
+    baseline = None
+    for mode in VALIDATION_MODES:
+        per_packet = bench(mode)
+        if baseline is None:
+            baseline = per_packet
+        print(f"  {mode:8} {per_packet:7.2f} us/packet  ({baseline / per_packet:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
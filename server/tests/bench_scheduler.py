@@ -0,0 +1,106 @@
+"""Benchmark GameSoundMixin with thousands of queued sounds and events.
+
+A long animation is queued up front and the scheduler is ticked until it has
+played out, once with the sorted queues and once with the old full-list scan
+for comparison.
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from server.game_utils.game_sound_mixin import GameSoundMixin  # noqa: E402
+
+SOUNDS = 5000
+EVENTS = 1000
+STEP_TICKS = 2
+
+
+class BenchGame(GameSoundMixin):
+    def __init__(self):
+        self.scheduled_sounds = []
+        self.sound_scheduler_tick = 0
+        self.event_queue = []
+        self.played = 0
+        self.rng = random.Random(0)
+
+    def request_tick(self) -> None:
+        pass
+
+    def mark_changed(self) -> None:
+        pass
+
+    def play_sound(self, name: str, volume: int = 100, pan: int = 0, pitch: int = 100) -> None:
+        self.played += 1
+
+    def on_game_event(self, event_type: str, data: dict) -> None:
+        self.played += 1
+
+
+class LegacyBenchGame(BenchGame):
+    """Unsorted queues scanned and rebuilt every tick, as before."""
+
+    def schedule_sound(self, sound, delay_ticks=0, volume=100, pan=0, pitch=100) -> None:
+        target_tick = self.sound_scheduler_tick + delay_ticks
+        self.scheduled_sounds.append([target_tick, sound, volume, pan, pitch])
+
+    def schedule_event(self, event_type, data, delay_ticks=0) -> None:
+        self.event_queue.append((self.sound_scheduler_tick + delay_ticks, event_type, data))
+
+    def process_scheduled_sounds(self) -> None:
+        remaining = []
+        for scheduled in self.scheduled_sounds:
+            tick, sound, volume, pan, pitch = scheduled
+            if tick <= self.sound_scheduler_tick:
+                self.play_sound(sound, volume, pan, pitch)
+            else:
+                remaining.append(scheduled)
+        self.scheduled_sounds = remaining
+        self.sound_scheduler_tick += 1
+
+    def process_scheduled_events(self) -> None:
+        if not self.event_queue:
+            return
+        to_process = self.event_queue
+        self.event_queue = []
+        remaining = []
+        for tick, event_type, data in to_process:
+            if tick <= self.sound_scheduler_tick:
+                self.on_game_event(event_type, data)
+            else:
+                remaining.append((tick, event_type, data))
+        self.event_queue = remaining + self.event_queue
+
+
+def bench(game_class) -> tuple[float, float, int]:
+    """Return (schedule ms, play-out ms, ticks) for one long animation."""
+    game = game_class()
+    started = time.perf_counter()
+    game.schedule_standard_token_movement_sounds(SOUNDS, step_interval_ticks=STEP_TICKS)
+    for index in range(EVENTS):
+        game.schedule_event("step", {"index": index}, delay_ticks=index * STEP_TICKS * 5)
+    scheduled = time.perf_counter()
+    ticks = 0
+    while game.scheduled_sounds or game.event_queue:
+        game.process_scheduled_sounds()
+        game.process_scheduled_events()
+        ticks += 1
+    finished = time.perf_counter()
+    assert game.played == SOUNDS + EVENTS
+    return (scheduled - started) * 1000, (finished - scheduled) * 1000, ticks
+
+
+def main() -> None:
+    legacy_schedule, legacy_play, ticks = bench(LegacyBenchGame)
+    sorted_schedule, sorted_play, _ = bench(BenchGame)
+    print(f"{SOUNDS} sounds and {EVENTS} events over {ticks} ticks")
+    print(f"  legacy   schedule {legacy_schedule:8.2f} ms  play out {legacy_play:9.2f} ms")
+    print(f"  sorted   schedule {sorted_schedule:8.2f} ms  play out {sorted_play:9.2f} ms")
+    print(f"  play-out speedup {legacy_play / sorted_play:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
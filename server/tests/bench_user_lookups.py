@@ -0,0 +1,79 @@
+"""Benchmark per-tick username lookups: connection scan vs. username index."""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from server.core.tables.manager import TableManager  # noqa: E402
+from server.network.websocket_server import ClientConnection, WebSocketServer  # noqa: E402
+
+USERS = 1000
+SEATS = 4
+ROUNDS = 20
+
+
+class DummyUser:
+    def __init__(self, username: str):
+        self.username = username
+
+
+def build() -> tuple[WebSocketServer, TableManager, list[str]]:
+    """USERS connected users, seated SEATS to a table."""
+    server = WebSocketServer()
+    tables = TableManager()
+    usernames = [f"user{i}" for i in range(USERS)]
+    for i, username in enumerate(usernames):
+        client = ClientConnection(websocket=None, address=f"10.0.0.{i}:5000")
+        server.clients[client.address] = client
+        server.bind_username(client, username)
+        if i % SEATS == 0:
+            table = tables.create_table("pig", username, DummyUser(username))
+        else:
+            table.add_member(username, DummyUser(username))
+    return server, tables, usernames
+
+
+def scan_client(server: WebSocketServer, username: str):
+    for client in server.clients.values():
+        if client.username == username:
+            return client
+    return None
+
+
+def scan_table(tables: TableManager, username: str):
+    for table in tables.get_all_tables():
+        for member in table.members:
+            if member.username == username:
+                return table
+    return None
+
+
+def bench(server, tables, usernames, find_client, find_table) -> float:
+    """Return milliseconds per simulated tick (one lookup of each kind per user)."""
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        for username in usernames:
+            find_client(server, username)
+            find_table(tables, username)
+    return (time.perf_counter() - started) / ROUNDS * 1000
+
+
+def main() -> None:
+    server, tables, usernames = build()
+    before = bench(server, tables, usernames, scan_client, scan_table)
+    after = bench(
+        server,
+        tables,
+        usernames,
+        lambda srv, name: srv.get_client_by_username(name),
+        lambda mgr, name: mgr.find_user_table(name),
+    )
+    print(f"{USERS} users at {USERS // SEATS} tables")
+    print(f"  scan   {before:8.2f} ms/tick")
+    print(f"  index  {after:8.2f} ms/tick  ({before / after:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark tick latency while many games finish in the same tick.
+
+Each tick, GAMES games of SEATS players end at once: every game saves its
+result and updates its players' ratings, as GameResultMixin does. The tick
+is timed with the old setup (rollback journal, a commit per statement), with
+WAL but still committing on the tick, and with the write-behind writer
+thread. For the writer the time until everything is committed is shown too.
+
+Usage: python tests/bench_write_behind.py [games]
+"""
+
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from server.game_utils.stats_helpers import RatingHelper  # noqa: E402
+from server.persistence.database import Database  # noqa: E402
+
+GAMES = 50
+SEATS = 4
+TICKS = 20
+
+
+def finish_games(db: Database, tick: int, games: int) -> None:
+    """Persist the end of `games` games, as one server tick would."""
+    for game in range(games):
+        ids = [f"uuid-{game}-{seat}" for seat in range(SEATS)]
+        names = [f"player{game}-{seat}" for seat in range(SEATS)]
+        scores = {name: seat * 10 for seat, name in enumerate(names)}
+        db.save_game_result(
+            "pig",
+            f"2024-01-01T00:{tick:02d}:00",
+            1200,
+            [(pid, name, False, False) for pid, name in zip(ids, names)],
+            {"winner_name": names[-1], "final_scores": scores},
+        )
+        RatingHelper(db, "pig").update_ratings([[pid] for pid in reversed(ids)])
+
+
+def run(mode: str, games: int) -> tuple[list[float], list[float]]:
+    """Return per-tick milliseconds and, for the writer, milliseconds until committed."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(Path(tmp) / "bench.db")
+        db.connect()
+        if mode == "rollback":
+            db._conn.execute("PRAGMA journal_mode = DELETE")
+            db._conn.execute("PRAGMA synchronous = FULL")
+        elif mode == "writer":
+            db.start_writer()
+        ticks = []
+        durable = []
+        for tick in range(TICKS):
+            started = time.perf_counter()
+            finish_games(db, tick, games)
+            ticks.append((time.perf_counter() - started) * 1000)
+            db.flush()
+            durable.append((time.perf_counter() - started) * 1000)
+        db.close()
+    return ticks, durable
+
+
+def main() -> None:
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else GAMES
+    print(f"{games} games x {SEATS} players finishing in one tick, {TICKS} ticks")
+    for mode in ("rollback", "wal", "writer"):
+        ticks, durable = run(mode, games)
+        line = (
+            f"  {mode:9} tick median {statistics.median(ticks):8.1f} ms  max {max(ticks):8.1f} ms"
+        )
+        if mode == "writer":
+            line += f"  (committed after {statistics.median(durable):.1f} ms median)"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
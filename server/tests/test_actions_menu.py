@@ -39,3 +39,76 @@ def test_actions_menu_respects_show_in_actions_menu():
 
     enabled = action_set.get_enabled_actions(game, player)
     assert [ra.action.id for ra in enabled] == ["shown"]
+
+
+class LabelledGame:
+    def __init__(self):
+        self.calls = []
+
+    def _enabled(self, player) -> str | None:
+        return "disabled-reason"
+
+    def _hidden(self, player, *, action_id: str | None = None) -> Visibility:
+        self.calls.append(action_id)
+        return Visibility.HIDDEN if action_id == "secret" else Visibility.VISIBLE
+
+    def _label(self, player, action_id: str) -> str:
+        return f"Label {action_id}"
+
+    def _sound(self, player, *, action_id: str | None = None) -> str:
+        return f"{action_id}.ogg"
+
+
+def _labelled_set() -> ActionSet:
+    action_set = ActionSet(name="turn")
+    for action_id in ("open", "secret"):
+        action_set.add(
+            Action(
+                id=action_id,
+                label="Static",
+                handler="_action",
+                is_enabled="_enabled",
+                is_hidden="_hidden",
+                get_label="_label",
+                get_sound="_sound",
+            )
+        )
+    return action_set
+
+
+def test_resolve_actions_passes_action_id_only_when_accepted():
+    game = LabelledGame()
+    resolved = _labelled_set().resolve_actions(game, DummyPlayer())
+
+    assert [ra.label for ra in resolved] == ["Label open", "Label secret"]
+    assert [ra.visible for ra in resolved] == [True, False]
+    assert [ra.sound for ra in resolved] == ["open.ogg", "secret.ogg"]
+    assert all(ra.disabled_reason == "disabled-reason" for ra in resolved)
+    assert game.calls == ["open", "secret"]
+
+
+def test_resolve_action_respects_instance_overrides_and_missing_methods():
+    game = LabelledGame()
+    game._enabled = lambda player: None
+    action_set = _labelled_set()
+    action_set.add(
+        Action(id="orphan", label="Orphan", handler="_action", is_enabled="_nope", is_hidden="_nope")
+    )
+
+    resolved = action_set.resolve_actions(game, DummyPlayer())
+
+    assert resolved[0].enabled
+    orphan = resolved[-1]
+    assert orphan.enabled and orphan.visible and orphan.label == "Orphan"
+    # Other instances of the class still use the class method.
+    assert not action_set.resolve_action(LabelledGame(), DummyPlayer(), resolved[0].action).enabled
+
+
+def test_resolve_action_picks_up_methods_replaced_on_the_class(monkeypatch):
+    action_set = _labelled_set()
+    action = action_set.get_action("open")
+    assert action_set.resolve_action(LabelledGame(), DummyPlayer(), action).label == "Label open"
+
+    monkeypatch.setattr(LabelledGame, "_label", lambda self, player, action_id: "Patched")
+
+    assert action_set.resolve_action(LabelledGame(), DummyPlayer(), action).label == "Patched"
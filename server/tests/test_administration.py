@@ -7,6 +7,7 @@ import pytest
 
 from server.core import administration
 from server.core.administration import AdministrationMixin, require_admin, require_server_owner
+from server.core.tick import TickMetrics
 from server.core.users.base import TrustLevel, MenuItem
 
 
@@ -31,6 +32,9 @@ class DummyUser:
     def speak_l(self, message_id: str, **kwargs):
         self.spoken.append((message_id, kwargs))
 
+    def speak(self, text: str, **kwargs):
+        self.spoken.append((text, kwargs))
+
     def play_sound(self, sound: str):
         self.sounds.append(sound)
 
@@ -63,10 +67,17 @@ class AdminHost(AdministrationMixin):
         self._users = {}
         self._user_states = {}
         self.main_menu_calls = []
+        self.tick_metrics = TickMetrics()
 
     def _show_main_menu(self, user: DummyUser) -> None:
         self.main_menu_calls.append(user.username)
 
+    def get_tick_metrics(self) -> dict:
+        snapshot = self.tick_metrics.snapshot()
+        snapshot["tick_interval_ms"] = 50
+        snapshot["overrun_policy"] = "catch_up"
+        return snapshot
+
 
 @pytest.mark.asyncio
 async def test_require_admin_and_server_owner_decorators():
@@ -136,7 +147,7 @@ def test_show_admin_menu_includes_owner_actions():
 
     host._show_admin_menu(admin_user)
     admin_ids = _get_menu_ids(admin_user)
-    assert admin_ids == ["account_approval", "ban_user", "unban_user", "back"]
+    assert admin_ids == ["account_approval", "ban_user", "unban_user", "server_status", "back"]
     assert host._user_states["admin"]["menu"] == "admin_menu"
 
     host._show_admin_menu(owner_user)
@@ -145,6 +156,7 @@ def test_show_admin_menu_includes_owner_actions():
         "account_approval",
         "ban_user",
         "unban_user",
+        "server_status",
         "promote_admin",
         "demote_admin",
         "virtual_bots",
@@ -343,3 +355,66 @@ async def test_handle_admin_menu_selection_routes_correctly(monkeypatch):
 
     await host._handle_admin_menu_selection(admin_user, "virtual_bots")
     assert called == [("virtual", "admin")]
+
+
+@pytest.mark.asyncio
+async def test_server_status_reports_tick_metrics():
+    host = AdminHost()
+    admin_user = DummyUser("admin", TrustLevel.ADMIN)
+
+    await host._handle_admin_menu_selection(admin_user, "server_status")
+    assert admin_user.spoken[-1][0] == "server-status-no-ticks"
+    assert admin_user.menus[-1]["menu_id"] == "admin_menu"
+
+    host.tick_metrics.begin_tick()
+    host.tick_metrics.record_phase("tables", 0.08)
+    host.tick_metrics.end_tick(0.08, 0.05)
+    await host._handle_admin_menu_selection(admin_user, "server_status")
+    text, kwargs = admin_user.spoken[-1]
+    assert text.splitlines() == ["server-status-tick", "server-status-tick-phase"]
+    assert kwargs["buffer"] == "misc"
+    assert admin_user.menus[-1]["menu_id"] == "admin_menu"
+
+
+@pytest.mark.asyncio
+async def test_server_status_reports_localization_cache():
+    host = AdminHost()
+    admin_user = DummyUser("admin", TrustLevel.ADMIN)
+    host.tick_metrics.begin_tick()
+    host.tick_metrics.end_tick(0.01, 0.05)
+    base_metrics = host.get_tick_metrics()
+    host.get_tick_metrics = lambda: {
+        **base_metrics,
+        "localization": {"hits": 9, "misses": 3, "size": 3, "max_size": 4096},
+    }
+
+    await host._handle_admin_menu_selection(admin_user, "server_status")
+
+    text, _ = admin_user.spoken[-1]
+    assert text.splitlines()[-1] == "server-status-localization"
+
+
+@pytest.mark.asyncio
+async def test_server_status_reports_outbound_queues():
+    host = AdminHost()
+    admin_user = DummyUser("admin", TrustLevel.ADMIN)
+    host.tick_metrics.begin_tick()
+    host.tick_metrics.end_tick(0.01, 0.05)
+    base_metrics = host.get_tick_metrics()
+    host.get_tick_metrics = lambda: {
+        **base_metrics,
+        "outbox": {
+            "connections": 2,
+            "queued": 12,
+            "max_depth": 10,
+            "high_watermark": 1000,
+            "low_watermark": 250,
+            "dropped": 40,
+            "evicted": 1,
+        },
+    }
+
+    await host._handle_admin_menu_selection(admin_user, "server_status")
+
+    text, _ = admin_user.spoken[-1]
+    assert text.splitlines()[-1] == "server-status-outbox"
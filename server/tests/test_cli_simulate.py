@@ -0,0 +1,45 @@
+"""Tests for GameSimulator fast-forward mode."""
+
+import pytest
+
+from server.cli import GameSimulator
+from server.games.registry import GameRegistry
+
+FAST_FORWARD_GAMES = sorted(
+    game_class.get_type() for game_class in GameRegistry.get_all() if game_class.idle_between_moves
+)
+
+
+def _simulate(game_type: str, seed: int, fast_forward: bool) -> dict:
+    simulator = GameSimulator(
+        game_type,
+        ["Alice", "Bob"],
+        {},
+        json_mode=True,
+        quiet=True,
+        fast_forward=fast_forward,
+        seed=seed,
+    )
+    assert simulator.setup()
+    return simulator.run()
+
+
+@pytest.mark.parametrize("game_type", FAST_FORWARD_GAMES)
+def test_fast_forward_matches_tick_by_tick_run(game_type):
+    for seed in (1, 2):
+        normal = _simulate(game_type, seed, fast_forward=False)
+        fast = _simulate(game_type, seed, fast_forward=True)
+
+        assert fast["ticks"] == normal["ticks"]
+        assert fast["rounds"] == normal["rounds"]
+        assert fast["messages"] == normal["messages"]
+
+
+def test_games_with_timers_are_never_fast_forwarded():
+    simulator = GameSimulator("coup", ["Alice", "Bob"], {}, json_mode=True, quiet=True)
+    assert simulator.setup()
+    game = simulator.game
+    game.on_start()
+    for _ in range(20):
+        assert game.fast_forward_ticks() == 0
+        game.on_tick()
@@ -4,7 +4,7 @@ import json
 
 import pytest
 
-from server.persistence.database import Database
+from server.persistence.database import LEADERBOARD_KINDS, Database
 from server.core.tables.table import Table, TableMember
 from server.core.users.base import TrustLevel
 
@@ -225,3 +225,140 @@ def test_approve_and_delete_user(db):
 
     assert db.delete_user("pending") is True
     assert db.get_user("pending") is None
+
+
+def _save_results(db: Database) -> None:
+    alice = ("uuid-alice", "alice", False, False)
+    bob = ("uuid-bob", "bob", False, False)
+    server_bot = ("bot-1", "Botty", True, False)
+    virtual_bot = ("vb-1", "Vee", True, True)
+    db.save_game_result(
+        "pig",
+        "2024-01-01T00:00:00",
+        10,
+        [alice, bob, server_bot],
+        {"winner_name": "alice", "final_scores": {"alice": 50, "bob": 20, "Botty": 99}},
+    )
+    db.save_game_result(
+        "pig",
+        "2024-01-02T00:00:00",
+        10,
+        [alice, virtual_bot],
+        {"winner_name": "Vee", "final_scores": {"alice": 30, "Vee": 60}},
+    )
+    db.save_game_result(
+        "pig",
+        "2024-01-03T00:00:00",
+        10,
+        [("uuid-bob", "bobby", False, False), alice],
+        {"winner_name": "bobby", "final_scores": {"bobby": 70}},
+    )
+    db.save_game_result("farkle", "2024-01-04T00:00:00", 10, [alice], None)
+
+
+def _board(db: Database, kind: str) -> list[tuple]:
+    return [
+        (entry["rank"], entry["player_name"], entry["value"], entry["games_played"])
+        for entry in db.get_leaderboard("pig", kind)
+    ]
+
+
+def test_get_leaderboard_aggregates_all_history(db):
+    _save_results(db)
+
+    assert _board(db, "wins") == [(1, "alice", 1, 3), (2, "bobby", 1, 2), (3, "Vee", 1, 1)]
+    assert _board(db, "total_score") == [
+        (1, "bobby", 90, 2),
+        (2, "alice", 80, 3),
+        (3, "Vee", 60, 1),
+    ]
+    assert _board(db, "high_score") == [(1, "bobby", 70, 2), (2, "Vee", 60, 1), (3, "alice", 50, 3)]
+    assert _board(db, "games_played")[0] == (1, "alice", 3, 3)
+    assert len(db.get_leaderboard("pig", "wins", limit=2)) == 2
+    assert db.get_leaderboard("chess", "wins") == []
+    with pytest.raises(ValueError):
+        db.get_leaderboard("pig", "fastest")
+
+
+def test_bulk_result_lookups(db):
+    _save_results(db)
+    result_ids = [row[0] for row in db.get_game_stats("pig")]
+
+    players = db.get_game_result_players_for(result_ids)
+
+    assert players == {result_id: db.get_game_result_players(result_id) for result_id in result_ids}
+    assert db.get_latest_player_names("pig", ["uuid-bob", "nobody"]) == {"uuid-bob": "bobby"}
+    assert db.get_player_game_types("uuid-alice") == {"pig", "farkle"}
+
+
+CUSTOM_TYPES = [
+    {"id": "best_turn", "path": "best.{player_name}", "aggregate": "max"},
+    {"id": "avg_turn", "path": "best.{player_name}", "aggregate": "avg"},
+    {"id": "accuracy", "numerator": "hits.{player_id}", "denominator": "shots.{player_id}"},
+]
+
+
+def _save_custom_results(db: Database) -> None:
+    alice = ("uuid-alice", "alice", False, False)
+    bob = ("uuid-bob", "bob", False, False)
+    for best, hits, shots in (({"alice": 4, "bob": 9}, 3, 4), ({"alice": 8}, 1, 4)):
+        db.save_game_result(
+            "pig",
+            "2024-01-01T00:00:00",
+            10,
+            [alice, bob],
+            {
+                "best": best,
+                "hits": {"uuid-alice": hits, "uuid-bob": 0},
+                "shots": {"uuid-alice": shots, "uuid-bob": 0},
+            },
+            leaderboard_types=CUSTOM_TYPES,
+        )
+
+
+def test_custom_stats_accumulate_on_save(db):
+    _save_custom_results(db)
+
+    best = db.get_custom_leaderboard("pig", "best_turn")
+    assert [(e["rank"], e["player_name"], e["value"]) for e in best] == [
+        (1, "bob", 9),
+        (2, "alice", 8),
+    ]
+    # bob's zero shots give no accuracy value.
+    accuracy = db.get_custom_leaderboard("pig", "accuracy")
+    assert [(e["player_name"], e["value"]) for e in accuracy] == [("alice", 0.5)]
+
+    stats = db.get_player_game_stats("uuid-alice", "pig")
+    assert stats["games_played"] == 2
+    assert stats["custom"] == {"best_turn": 8, "avg_turn": 6, "accuracy": 0.5}
+    assert db.get_player_game_stats("uuid-alice", "chess") is None
+
+
+def test_rebuild_player_stats_matches_incremental(db):
+    _save_results(db)
+    _save_custom_results(db)
+    boards = {kind: db.get_leaderboard("pig", kind) for kind in LEADERBOARD_KINDS}
+    alice = db.get_player_game_stats("uuid-alice", "pig")
+
+    assert db.rebuild_player_stats({"pig": CUSTOM_TYPES}) == 6
+
+    assert {kind: db.get_leaderboard("pig", kind) for kind in LEADERBOARD_KINDS} == boards
+    assert db.get_player_game_stats("uuid-alice", "pig") == alice
+
+
+def test_player_stats_stale_for_existing_history(tmp_path):
+    db = Database(tmp_path / "old.db")
+    db.connect()
+    _save_results(db)
+    db._conn.execute("DROP TABLE player_custom_stats")
+    db._conn.execute("DROP TABLE player_game_stats")
+    db.close()
+
+    db = Database(tmp_path / "old.db")
+    db.connect()
+    assert db.player_stats_stale is True
+    assert db.get_leaderboard("pig", "wins") == []
+    db.rebuild_player_stats({})
+    assert db.player_stats_stale is False
+    assert _board(db, "wins")[0] == (1, "alice", 1, 3)
+    db.close()
@@ -0,0 +1,80 @@
+"""Tests for the write-behind DatabaseWriter and Database.start_writer."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from server.persistence.database import Database
+from server.persistence.writer import DatabaseWriter
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(db_path=tmp_path / "test.db")
+    database.connect()
+    database.start_writer()
+    try:
+        yield database
+    finally:
+        database.close()
+
+
+def _count(path, table: str) -> int:
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]  # nosec B608
+    finally:
+        conn.close()
+
+
+def test_writer_groups_queued_jobs_into_one_transaction(tmp_path):
+    path = tmp_path / "w.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE t (n INTEGER)")
+    conn.close()
+    writer = DatabaseWriter(path)
+    writer.start()
+    release = threading.Event()
+    writer.submit(lambda conn: release.wait())
+    for n in range(100):
+        writer.submit(lambda conn, n=n: conn.execute("INSERT INTO t VALUES (?)", (n,)))
+    writer.submit(lambda conn: conn.execute("INSERT INTO missing VALUES (1)"))
+
+    release.set()
+    assert writer.flush(timeout=5)
+
+    assert _count(path, "t") == 100
+    assert writer.failed == 1
+    assert writer.batches <= 3
+    writer.close()
+
+
+def test_close_commits_queued_writes(tmp_path):
+    database = Database(db_path=tmp_path / "test.db")
+    database.connect()
+    database.start_writer()
+    database.create_user("alice", "hash")
+    database.update_user_preferences("alice", '{"x": 1}')
+    for n in range(20):
+        database.save_game_result("pig", f"2024-01-01T00:00:{n:02d}", 10, [], None)
+
+    database.close()
+
+    assert _count(tmp_path / "test.db", "game_results") == 20
+    database.connect()
+    assert database.get_user("alice").preferences_json == '{"x": 1}'
+    database.close()
+
+
+def test_reads_see_deferred_writes(db):
+    db.save_game_result("pig", "2024-01-01", 10, [("u1", "alice", False, False)])
+    db.set_player_rating("u1", "pig", 30.0, 5.0)
+    assert db.get_player_rating("u1", "pig") == (30.0, 5.0)
+
+    db.store_refresh_token("alice", "tok", 100, 1)
+    assert db.get_refresh_token("tok")["username"] == "alice"
+
+    assert db.flush(timeout=5)
+    assert db.get_leaderboard("pig", "games_played")[0]["player_name"] == "alice"
+    assert db._pending_ratings == {}
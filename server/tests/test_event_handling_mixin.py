@@ -1,5 +1,6 @@
 """Targeted tests for the EventHandlingMixin behaviors."""
 
+from contextlib import nullcontext
 from dataclasses import dataclass
 
 from server.games.base import Player, ActionContext, TransientDisplayState
@@ -65,6 +66,9 @@ class DummyGame(EventHandlingMixin):
         self.rebuild_player_calls = 0
         self.leave_requests: list[str] = []
 
+    def request_tick(self) -> None:
+        pass
+
     # Helpers for tests
     def register_action(
         self, action_id: str, *, enabled: bool = True, disabled_reason: str | None = None
@@ -108,6 +112,9 @@ class DummyGame(EventHandlingMixin):
     def rebuild_all_menus(self) -> None:
         self.rebuild_all_calls += 1
 
+    def deferred_menu_updates(self):
+        return nullcontext()
+
     def rebuild_player_menu(self, _player: Player) -> None:
         self.rebuild_player_calls += 1
 
@@ -153,6 +160,9 @@ class DummyEndScreenGame(GameResultMixin, EventHandlingMixin):
     def get_type(self) -> str:
         return "dummy"
 
+    def request_tick(self) -> None:
+        pass
+
     def get_active_players(self) -> list[Player]:
         return self.players
 
@@ -162,6 +172,9 @@ class DummyEndScreenGame(GameResultMixin, EventHandlingMixin):
     def get_all_visible_actions(self, _player: Player):
         return []
 
+    def deferred_menu_updates(self):
+        return nullcontext()
+
     def _is_player_spectator(self, player: Player) -> bool:
         return player.is_spectator
 
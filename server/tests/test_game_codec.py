@@ -0,0 +1,70 @@
+"""Tests for GameCodec."""
+
+import pytest
+
+from server.core.tables.manager import TableManager
+from server.core.users.bot import Bot
+from server.core.users.test_user import MockUser
+from server.games.pig.game import PigGame
+from server.persistence.game_codec import FORMAT_VERSION, MAGIC, GameCodec, UnreadableGameState
+
+
+def _pig_game() -> PigGame:
+    game = PigGame()
+    game.add_player("player1", MockUser("player1"))
+    game.add_player("Bot1", Bot("Bot1"))
+    game.on_start()
+    game.round = 3
+    game._team_manager.add_to_team_score("player1", 25)
+    return game
+
+
+@pytest.mark.parametrize(
+    "codec", [GameCodec(), GameCodec("packed"), GameCodec("packed", compress=False)]
+)
+def test_round_trip_restores_identical_state(codec):
+    game = _pig_game()
+
+    blob = codec.encode(game)
+    restored = codec.decode(PigGame, blob)
+
+    assert restored.to_json() == game.to_json()
+    assert restored.get_player_score(restored.players[0]) == 25
+
+
+def test_packed_blob_is_tagged_and_smaller_than_json():
+    game = _pig_game()
+
+    blob = GameCodec("packed").encode(game)
+
+    assert blob[: len(MAGIC) + 1] == MAGIC + bytes((FORMAT_VERSION,))
+    assert len(blob) < len(game.to_json()) / 4
+
+
+def test_decode_reads_json_saves_as_text_or_bytes():
+    game = _pig_game()
+    packed = GameCodec("packed")
+
+    assert packed.decode(PigGame, game.to_json()).round == 3
+    assert packed.decode(PigGame, game.to_json().encode("utf-8")).round == 3
+
+
+def test_decode_rejects_newer_format_and_unknown_codec():
+    blob = bytearray(GameCodec("packed").encode(_pig_game()))
+    blob[len(MAGIC)] = FORMAT_VERSION + 1
+
+    with pytest.raises(UnreadableGameState, match="newer"):
+        GameCodec.decode(PigGame, bytes(blob))
+    with pytest.raises(ValueError, match="Unknown game codec"):
+        GameCodec("pickle")
+
+
+def test_tables_encode_with_their_manager_codec():
+    manager = TableManager()
+    manager.codec = GameCodec("packed")
+    table = manager.create_table("pig", "player1", MockUser("player1"))
+
+    table.game = _pig_game()
+
+    assert table.game_json.startswith(MAGIC)
+    assert GameCodec.decode(PigGame, table.game_json).round == 3
@@ -0,0 +1,49 @@
+"""Tests for lazy game loading through the static game index."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from server.games.registry import GameInfo, GameRegistry, INDEX_PATH
+
+
+def test_game_index_is_up_to_date(tmp_path: Path) -> None:
+    server_dir = Path(__file__).resolve().parents[1]
+    out = tmp_path / "game_index.json"
+    subprocess.run(
+        [sys.executable, "tools/export_game_index.py", "--out", str(out)],
+        cwd=server_dir,
+        check=True,
+    )
+    assert out.read_text(encoding="utf-8") == INDEX_PATH.read_text(encoding="utf-8")
+
+
+def test_index_matches_loaded_classes() -> None:
+    for game_class in GameRegistry.get_all():
+        assert GameRegistry.get_info(game_class.get_type()) == GameInfo.from_class(game_class)
+
+
+def test_get_imports_game_module_on_first_use() -> None:
+    code = (
+        "import sys\n"
+        "from server.games.registry import GameRegistry\n"
+        "assert GameRegistry.get_infos()\n"
+        "assert 'server.games.chess.game' not in sys.modules\n"
+        "assert GameRegistry.get('chess').__module__ == 'server.games.chess.game'\n"
+        "assert 'server.games.backgammon.game' not in sys.modules\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[2],
+        check=True,
+    )
+
+
+def test_infos_by_category_lists_every_game() -> None:
+    categories = GameRegistry.get_infos_by_category()
+    listed = {info.get_type() for infos in categories.values() for info in infos}
+    assert listed == {game_class.get_type() for game_class in GameRegistry.get_all()}
+
+
+def test_get_unknown_game_returns_none() -> None:
+    assert GameRegistry.get("no-such-game") is None
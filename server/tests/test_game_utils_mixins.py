@@ -1,4 +1,3 @@
-import json
 import threading
 from dataclasses import dataclass
 from types import SimpleNamespace
@@ -6,8 +5,10 @@ from types import SimpleNamespace
 from server.game_utils.action_execution_mixin import ActionExecutionMixin
 from server.game_utils.actions import Action, MenuInput, EditboxInput, ResolvedAction
 from server.game_utils.duration_estimate_mixin import DurationEstimateMixin
+from server.game_utils.game_communication_mixin import GameCommunicationMixin
 from server.game_utils.game_prediction_mixin import GamePredictionMixin
 from server.game_utils.game_scores_mixin import GameScoresMixin
+from server.game_utils.game_sound_mixin import GameSoundMixin
 from server.game_utils.options import GameOptions, MenuOption, option_field
 from server.core.users.base import EscapeBehavior, MenuItem, TrustLevel
 from server.games.base import Player
@@ -146,6 +147,9 @@ class DummyActionGame(ActionExecutionMixin):
         self.handler_calls: list[tuple] = []
         self.options: GameOptions | None = None
 
+    def request_tick(self) -> None:
+        pass
+
     def register(
         self,
         action: Action,
@@ -609,13 +613,12 @@ def test_duration_estimate_runs_and_reports(monkeypatch):
         2,
     )
 
-    calls = {"count": 0}
+    submitted = []
 
-    def fake_run(*args, **kwargs):
-        idx = calls["count"]
-        calls["count"] += 1
-        data = {"ticks": 100 + idx * 100}
-        return SimpleNamespace(returncode=0, stdout=json.dumps(data), stderr="")
+    class FakePool:
+        def run_many(self, runs, game_type, bot_names, options):
+            submitted.append((runs, game_type, bot_names, options))
+            return iter([{"ticks": 100 + idx * 100} for idx in range(runs)])
 
     class FakeThread:
         def __init__(self, target, daemon):
@@ -629,7 +632,9 @@ def test_duration_estimate_runs_and_reports(monkeypatch):
         def is_alive(self):
             return self._alive
 
-    monkeypatch.setattr("server.game_utils.duration_estimate_mixin.subprocess.run", fake_run)
+    monkeypatch.setattr(
+        "server.game_utils.duration_estimate_mixin.get_simulation_pool", lambda: FakePool()
+    )
     monkeypatch.setattr("server.game_utils.duration_estimate_mixin.threading.Thread", FakeThread)
 
     user = StubUser()
@@ -647,6 +652,7 @@ def test_duration_estimate_runs_and_reports(monkeypatch):
     assert "bot_time" in estimate_result
     assert estimate_result["bot_time"] == "7 seconds"
     assert estimate_result["human_time"] == "15 seconds"
+    assert submitted == [(2, "duration-game", ["Alice", "Bob"], {})]
 
 
 def test_duration_estimate_rejects_parallel_request(monkeypatch):
@@ -658,3 +664,126 @@ def test_duration_estimate_rejects_parallel_request(monkeypatch):
     game._action_estimate_duration(player, "estimate")
 
     assert ("speak_l", "estimate-already-running", "misc", {}) in user.spoken
+
+
+class DummyCommunicationGame(GameCommunicationMixin):
+    def __init__(self, users: dict[str, StubUser]):
+        self.users = users
+        self.players = [Player(id=pid, name=pid.title()) for pid in users]
+        self.transcript = []
+
+    def get_user(self, player: Player):
+        return self.users.get(player.id)
+
+    def record_transcript_event(self, player: Player, text: str, buffer: str) -> None:
+        self.transcript.append((player.id, text, buffer))
+
+
+def _count_localization_calls(monkeypatch) -> list[tuple[str, str]]:
+    calls = []
+
+    def fake_get(locale: str, message_id: str, **kwargs) -> str:
+        calls.append((locale, message_id))
+        return f"{locale}:{message_id}:{kwargs.get('player', '')}"
+
+    monkeypatch.setattr(
+        "server.game_utils.game_communication_mixin.Localization.get", fake_get
+    )
+    return calls
+
+
+def test_broadcast_l_formats_once_per_locale(monkeypatch):
+    calls = _count_localization_calls(monkeypatch)
+    users = {"a": StubUser("en"), "b": StubUser("de"), "c": StubUser("en"), "d": StubUser("de")}
+    game = DummyCommunicationGame(users)
+
+    game.broadcast_l("game-starting", exclude=game.players[3])
+
+    assert sorted(calls) == [("de", "game-starting"), ("en", "game-starting")]
+    assert users["a"].spoken == [("speak", "en:game-starting:", "table")]
+    assert users["b"].spoken == [("speak", "de:game-starting:", "table")]
+    assert users["c"].spoken == [("speak", "en:game-starting:", "table")]
+    assert users["d"].spoken == []
+    assert [pid for pid, _, _ in game.transcript] == ["a", "b", "c"]
+
+
+def test_broadcast_personal_l_formats_others_once_per_locale(monkeypatch):
+    calls = _count_localization_calls(monkeypatch)
+    users = {"a": StubUser("en"), "b": StubUser("en"), "c": StubUser("en"), "d": StubUser("de")}
+    game = DummyCommunicationGame(users)
+
+    game.broadcast_personal_l(game.players[0], "you-rolled", "player-rolled", roll=4)
+
+    assert calls == [("en", "you-rolled"), ("en", "player-rolled"), ("de", "player-rolled")]
+    assert users["a"].spoken == [("speak", "en:you-rolled:", "table")]
+    assert users["b"].spoken == [("speak", "en:player-rolled:A", "table")]
+    assert users["c"].spoken == users["b"].spoken
+    assert users["d"].spoken == [("speak", "de:player-rolled:A", "table")]
+
+
+class DummySoundGame(GameSoundMixin):
+    def __init__(self):
+        self.scheduled_sounds = []
+        self.sound_scheduler_tick = 0
+        self.event_queue = []
+        self.played: list[str] = []
+        self.events: list[tuple[int, str]] = []
+
+    def request_tick(self) -> None:
+        pass
+
+    def mark_changed(self) -> None:
+        pass
+
+    def play_sound(self, name: str, volume: int = 100, pan: int = 0, pitch: int = 100) -> None:
+        self.played.append(name)
+
+    def on_game_event(self, event_type: str, data: dict) -> None:
+        self.events.append((self.sound_scheduler_tick, event_type))
+        if event_type == "chain":
+            self.schedule_event("chained", {})
+
+
+def test_scheduled_sounds_play_in_tick_then_schedule_order():
+    game = DummySoundGame()
+    game.schedule_sound("c.ogg", delay_ticks=2)
+    game.schedule_sound("a.ogg", delay_ticks=1)
+    game.schedule_sound("b.ogg", delay_ticks=1)
+    game.schedule_sound("d.ogg", delay_ticks=2)
+
+    assert [entry[0] for entry in game.scheduled_sounds] == [1, 1, 2, 2]
+    assert game.next_due_tick() == 1
+    game.process_scheduled_sounds()
+    assert game.played == []
+    game.process_scheduled_sounds()
+    assert game.played == ["a.ogg", "b.ogg"]
+    game.process_scheduled_sounds()
+    assert game.played == ["a.ogg", "b.ogg", "c.ogg", "d.ogg"]
+    assert game.scheduled_sounds == []
+    assert game.next_due_tick() is None
+
+
+def test_scheduled_events_added_while_handling_wait_for_next_call():
+    game = DummySoundGame()
+    game.schedule_event("late", {}, delay_ticks=3)
+    game.schedule_event("chain", {}, delay_ticks=1)
+
+    assert game.next_due_tick() == 0
+    game.process_scheduled_sounds()
+    game.process_scheduled_events()
+    assert game.events == [(1, "chain")]
+    assert [event[1] for event in game.event_queue] == ["chained", "late"]
+    game.process_scheduled_events()
+    assert game.events == [(1, "chain"), (1, "chained")]
+
+
+def test_restore_scheduler_order_sorts_older_saves():
+    game = DummySoundGame()
+    game.scheduled_sounds = [[5, "b.ogg", 100, 0, 100], [2, "a.ogg", 100, 0, 100]]
+    game.event_queue = [(4, "second", {}), (3, "first", {})]
+
+    game.restore_scheduler_order()
+
+    assert [entry[1] for entry in game.scheduled_sounds] == ["a.ogg", "b.ogg"]
+    assert [event[1] for event in game.event_queue] == ["first", "second"]
+    assert game.next_due_tick() == 2
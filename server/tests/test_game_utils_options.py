@@ -132,6 +132,9 @@ class ViewerRebuildGuardGame(EventHandlingMixin, OptionsHandlerMixin):
     def get_user(self, player: Player) -> OptionsUser | None:
         return self._user
 
+    def request_tick(self) -> None:
+        pass
+
     def _get_transient_display_state(self, player: Player) -> TransientDisplayState | None:
         return self._transient_display_state.get(player.id)
 
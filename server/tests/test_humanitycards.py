@@ -0,0 +1,132 @@
+"""Tests for Humanity Cards deck storage."""
+
+import pytest
+
+from server.core.users.bot import Bot
+from server.games.humanitycards.game import (
+    HumanityCardsGame,
+    get_pack_names,
+    load_card_table,
+    load_humanity_packs,
+)
+
+
+def _start_game(packs: list[str] | None = None) -> HumanityCardsGame:
+    game = HumanityCardsGame()
+    game.rng.seed(7)
+    if packs is not None:
+        game.options.card_packs = packs
+    for name in ("Alice", "Bob", "Charlie"):
+        game.add_player(name, Bot(name))
+    game.on_start()
+    return game
+
+
+def test_card_table_indexes_every_pack():
+    table = load_card_table()
+    packs = load_humanity_packs()
+
+    assert len(table.white_text) == sum(len(pack.get("white", [])) for pack in packs)
+    assert len(table.black_text) == len(table.black_pick)
+    first = packs[0]
+    assert table.white_text[table.white_by_pack[first["name"]][0]] == (
+        first["white"][0]["text"].rstrip(".")
+    )
+    assert all(pick >= 1 for pick in table.black_pick)
+
+
+def test_decks_and_hands_hold_card_indices():
+    base = get_pack_names()[0]
+    game = _start_game([base])
+    table = load_card_table()
+
+    assert all(isinstance(card, int) for card in game.white_deck)
+    assert all(isinstance(card, int) for player in game.players for card in player.hand)
+    assert isinstance(game.current_black_card, int)
+    assert game._black_pick() == table.black_pick[game.current_black_card]
+    dealt = game.white_deck + [card for player in game.players for card in player.hand]
+    assert sorted(dealt) == list(table.white_by_pack[base])
+
+
+def test_save_and_restore_keeps_cards():
+    game = _start_game()
+
+    restored = HumanityCardsGame.from_json(game.to_json())
+
+    assert restored.white_deck == game.white_deck
+    assert restored.current_black_card == game.current_black_card
+    assert restored._black_text() == game._black_text()
+    hand = restored.players[0].hand
+    assert [restored._white_text(card) for card in hand] == [
+        game._white_text(card) for card in game.players[0].hand
+    ]
+
+
+def test_save_with_every_pack_stays_small():
+    game = _start_game(get_pack_names())
+
+    # Card text stays in the shared table; copying it into the save took over 3 MB.
+    assert len(game.white_deck) > 10000
+    assert len(game.to_json()) < 500_000
+
+
+def test_black_card_zero_counts_as_drawn():
+    game = _start_game()
+    game.current_black_card = 0
+
+    assert game._black_text() == load_card_table().black_text[0]
+
+
+def _pre_index_state(game: HumanityCardsGame) -> dict:
+    """The game's state as saved before decks held card indices."""
+    table = load_card_table()
+
+    def pack_of(index: int, by_pack: dict[str, range]) -> str:
+        return next(name for name, cards in by_pack.items() if index in cards)
+
+    def white(index: int) -> dict:
+        pack = pack_of(index, table.white_by_pack)
+        return {"text": table.white_text[index], "pack": pack, "id": index + 1}
+
+    def black(index: int) -> dict:
+        pack = pack_of(index, table.black_by_pack)
+        return {"text": table.black_text[index], "pick": table.black_pick[index], "pack": pack}
+
+    state = game.to_dict()
+    del state["card_table_version"]
+    state["white_deck"] = [white(card) for card in game.white_deck]
+    state["black_deck"] = [black(card) for card in game.black_deck]
+    state["current_black_card"] = black(game.current_black_card)
+    for player in state["players"]:
+        player["hand"] = [white(card) for card in player["hand"]]
+    return state
+
+
+def test_restore_migrates_saves_with_card_dicts():
+    game = _start_game([get_pack_names()[0]])
+
+    restored = HumanityCardsGame.from_dict(_pre_index_state(game))
+
+    # Cards repeated within a pack may come back as another copy with the same text.
+    assert [restored._white_text(c) for c in restored.white_deck] == [
+        game._white_text(c) for c in game.white_deck
+    ]
+    assert len(restored.black_deck) == len(game.black_deck)
+    assert restored._black_text() == game._black_text()
+    assert [[restored._white_text(c) for c in p.hand] for p in restored.players] == [
+        [game._white_text(c) for c in p.hand] for p in game.players
+    ]
+    assert restored.card_table_version == load_card_table().version
+
+
+def test_restore_refuses_saves_from_other_packs():
+    state = _start_game().to_dict()
+    state["card_table_version"] = "0" * 16
+
+    with pytest.raises(ValueError, match="packs changed"):
+        HumanityCardsGame.from_dict(state)
+
+    # Waiting games hold no cards yet, so any version restores.
+    assert HumanityCardsGame.from_dict(
+        {**HumanityCardsGame().to_dict(), **{"card_table_version": "x"}}
+    )
@@ -4,12 +4,14 @@ Integration tests for PlayPalace v11.
 Tests larger chunks of server code working together.
 """
 
+import asyncio
+
 import pytest
 import tempfile
 import os
 
 from server.persistence.database import Database
-from server.auth.auth import AuthManager, AuthResult
+from server.auth.auth import AuthManager, AuthResult, CredentialPool, CredentialPoolBusy
 from server.core.tables.manager import TableManager
 from server.core.tables.table import Table
 from server.core.users.test_user import MockUser
@@ -166,6 +168,50 @@ class TestAuthIntegration:
         self.auth.invalidate_session(token)
         assert self.auth.validate_session(token) is None
 
+    @pytest.mark.asyncio
+    async def test_async_register_and_authenticate(self):
+        """The async API hashes on the credential pool with the same results."""
+        assert await self.auth.register_async("asyncuser", "password123")
+        assert not await self.auth.register_async("asyncuser", "different")
+
+        assert await self.auth.authenticate_async("asyncuser", "password123") == AuthResult.SUCCESS
+        assert (
+            await self.auth.authenticate_async("asyncuser", "wrongpassword")
+            == AuthResult.WRONG_PASSWORD
+        )
+        assert (
+            await self.auth.authenticate_async("nobody", "password") == AuthResult.USER_NOT_FOUND
+        )
+        assert await self.auth.reset_password_async("asyncuser", "newpassword")
+        assert self.auth.authenticate("asyncuser", "newpassword") == AuthResult.SUCCESS
+        assert self.auth.pool.get_stats()["completed"] == 4
+        self.auth.close()
+
+    @pytest.mark.asyncio
+    async def test_async_authenticate_upgrades_legacy_hash(self):
+        """A legacy SHA-256 hash is replaced with Argon2 on async login."""
+        self.auth.register("legacy", "password123")
+        self.db.update_user_password("legacy", self.auth._hash_password_sha256("password123"))
+
+        assert await self.auth.authenticate_async("legacy", "password123") == AuthResult.SUCCESS
+        assert not self.auth._is_legacy_hash(self.db.get_user("legacy").password_hash)
+        self.auth.close()
+
+    @pytest.mark.asyncio
+    async def test_credential_pool_refuses_when_saturated(self):
+        """Requests beyond max_pending are refused instead of queued."""
+        pool = CredentialPool(workers=1, max_pending=1)
+        auth = AuthManager(self.db, pool)
+        auth.register("busyuser", "password123")
+
+        first = asyncio.ensure_future(auth.authenticate_async("busyuser", "password123"))
+        await asyncio.sleep(0)
+        with pytest.raises(CredentialPoolBusy):
+            await auth.authenticate_async("busyuser", "password123")
+        assert await first == AuthResult.SUCCESS
+        assert pool.get_stats()["rejected"] == 1
+        auth.close()
+
 
 class TestTableManagerIntegration:
     """Test table manager operations."""
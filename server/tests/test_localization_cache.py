@@ -51,6 +51,43 @@ def test_localization_cache_can_be_disabled(tmp_path, monkeypatch):
     assert not cache_dir.exists()
 
 
+def test_localization_get_memoizes_hashable_arguments(tmp_path):
+    locales_dir = tmp_path / "locales"
+    (locales_dir / "en").mkdir(parents=True)
+    (locales_dir / "en" / "main.ftl").write_text(
+        "hello = Hello\ngreet = Hi { $name }\ncount = { $n } items\n", encoding="utf-8"
+    )
+    Localization.init(locales_dir)
+
+    assert Localization.get("en", "hello") == "Hello"
+    assert Localization.get("en", "hello") == "Hello"
+    assert Localization.get("en", "greet", name="Alice") == "Hi Alice"
+    assert Localization.get("en", "greet", name="Bob") == "Hi Bob"
+    assert Localization.get("en", "greet", name="Alice") == "Hi Alice"
+    stats = Localization.get_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (2, 3, 3)
+
+    # Equal-hashing values of different types are cached separately.
+    assert Localization.get("en", "count", n=1) == Localization.get("en", "count", n=1.0)
+    assert Localization.get_cache_stats()["misses"] == 5
+
+    # Arguments outside the cacheable types are formatted every time.
+    Localization.get("en", "greet", name=["x"])
+    assert Localization.get_cache_stats()["size"] == 5
+
+
+def test_localization_init_clears_memoized_messages(tmp_path):
+    locales_dir = tmp_path / "locales"
+    _write_locale(locales_dir, "Hi")
+    Localization.init(locales_dir)
+    assert Localization.get("en", "hello") == "Hi"
+
+    _write_locale(locales_dir, "Hello again")
+    Localization.init(locales_dir)
+    assert Localization.get_cache_stats()["size"] == 0
+    assert Localization.get("en", "hello") == "Hello again"
+
+
 def test_localization_missing_key_falls_back_to_english(tmp_path):
     locales_dir = tmp_path / "locales"
     (locales_dir / "en").mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,71 @@
+"""Tests for deferred turn menu refreshes in MenuManagementMixin."""
+
+from server.core.users.test_user import MockUser
+from server.games.pig.game import PigGame
+
+
+def _started_game() -> tuple[PigGame, list[MockUser]]:
+    game = PigGame()
+    users = [MockUser("Alice"), MockUser("Bob")]
+    for user in users:
+        game.add_player(user.username, user)
+    game.on_start()
+    for user in users:
+        user.clear_messages()
+    return game, users
+
+
+def _menu_messages(user: MockUser) -> list:
+    return [m for m in user.messages if m.type in ("show_menu", "update_menu")]
+
+
+def test_menu_refreshes_are_deduplicated_until_scope_ends():
+    game, users = _started_game()
+
+    with game.deferred_menu_updates():
+        game.rebuild_all_menus()
+        game.update_all_menus()
+        game.rebuild_all_menus()
+        assert all(not _menu_messages(user) for user in users)
+
+    for user in users:
+        assert [m.type for m in _menu_messages(user)] == ["show_menu"]
+
+
+def test_nested_scopes_flush_once_and_keep_selection():
+    game, users = _started_game()
+    alice = game.players[0]
+
+    with game.deferred_menu_updates():
+        with game.deferred_menu_updates():
+            game.update_player_menu(alice, selection_id="roll")
+        assert not _menu_messages(users[0])
+
+    messages = _menu_messages(users[0])
+    assert [m.type for m in messages] == ["update_menu"]
+    assert messages[0].data["selection_id"] == "roll"
+    assert not _menu_messages(users[1])
+
+
+def test_deferred_refresh_skipped_when_another_menu_opened_after():
+    game, users = _started_game()
+    alice = game.players[0]
+
+    with game.deferred_menu_updates():
+        game.rebuild_all_menus()
+        # Opening an input menu after the refresh request covers the turn menu.
+        game._pending_actions[alice.id] = "some_input"
+
+    assert not _menu_messages(users[0])
+    assert [m.type for m in _menu_messages(users[1])] == ["show_menu"]
+
+
+def test_handle_event_defers_menu_refreshes():
+    game, users = _started_game()
+    current = game.current_player
+    user = users[0] if current.name == "Alice" else users[1]
+
+    game.handle_event(current, {"type": "menu", "menu_id": "turn_menu", "selection_id": "roll"})
+
+    turn_menus = [m for m in _menu_messages(user) if m.data["menu_id"] == "turn_menu"]
+    assert len(turn_menus) == 1
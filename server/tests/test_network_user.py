@@ -1,14 +1,21 @@
 """Tests for the NetworkUser implementation."""
 
 from server.core.users.base import EscapeBehavior, MenuItem, TrustLevel
-from server.core.users.network_user import NetworkUser
+from server.core.users.network_user import NetworkUser, diff_menu_items
 from server.core.users.preferences import UserPreferences
+from server.network.packet_encoder import SharedPacket
 
 
 class DummyConnection:
     """Minimal stand-in for a websocket connection."""
 
 
+class PatchingConnection:
+    """Connection for a client that accepts menu_patch packets."""
+
+    supports_menu_patch = True
+
+
 def drain_messages(user: NetworkUser) -> list[dict]:
     return user.get_queued_messages()
 
@@ -156,3 +163,133 @@ def test_setters_for_trust_preferences_and_approval():
 
     user.set_approved(True)
     assert user.approved is True
+
+
+def _turn_items(labels: dict[str, str]) -> list[MenuItem]:
+    return [MenuItem(text=text, id=item_id) for item_id, text in labels.items()]
+
+
+def test_diff_menu_items_by_id():
+    old = [{"text": "A", "id": "a"}, {"text": "B", "id": "b"}, {"text": "C", "id": "c"}]
+    new = [{"text": "D", "id": "d"}, {"text": "A", "id": "a"}, {"text": "C!", "id": "c"}]
+
+    assert diff_menu_items(old, new) == [
+        {"op": "remove", "id": "b"},
+        {"op": "insert", "index": 0, "item": {"text": "D", "id": "d"}},
+        {"op": "replace", "id": "c", "item": {"text": "C!", "id": "c"}},
+    ]
+    # Reordered items and items without ids are not diffed.
+    assert diff_menu_items(old, list(reversed(old))) is None
+    assert diff_menu_items(["plain"], ["plain"]) is None
+
+
+def test_network_user_sends_menu_patch_for_small_changes():
+    user = NetworkUser("alice", "en", PatchingConnection())
+    labels = {f"item{i}": f"Item {i}" for i in range(6)}
+    user.show_menu("turn_menu", _turn_items(labels), multiletter=False)
+    assert drain_messages(user)[0]["type"] == "menu"
+
+    labels["item2"] = "Item 2 (kept)"
+    user.update_menu("turn_menu", _turn_items(labels), selection_id="item2")
+    assert drain_messages(user) == [
+        {
+            "type": "menu_patch",
+            "menu_id": "turn_menu",
+            "ops": [{"op": "replace", "id": "item2", "item": {"text": "Item 2 (kept)", "id": "item2"}}],
+            "selection_id": "item2",
+        }
+    ]
+
+    # Rebuilding with unchanged settings also patches, keeping the focus position.
+    user.show_menu("turn_menu", _turn_items(labels), multiletter=False)
+    assert drain_messages(user) == [
+        {"type": "menu_patch", "menu_id": "turn_menu", "ops": [], "position": 2}
+    ]
+
+    # Nothing to change and no focus to restore means nothing is sent.
+    user.update_menu("turn_menu", _turn_items(labels))
+    assert drain_messages(user) == []
+
+    # Changing settings needs the full menu.
+    user.show_menu("turn_menu", _turn_items(labels), multiletter=True)
+    assert drain_messages(user)[0]["type"] == "menu"
+
+
+def test_network_user_sends_full_menu_when_patch_not_possible():
+    user = NetworkUser("alice", "en", PatchingConnection())
+    labels = {f"item{i}": f"Item {i}" for i in range(3)}
+    user.show_menu("turn_menu", _turn_items(labels))
+    drain_messages(user)
+
+    # Diff as large as the list itself
+    user.update_menu("turn_menu", _turn_items({k: v + "!" for k, v in labels.items()}))
+    assert drain_messages(user)[0]["type"] == "menu"
+
+    # A new connection has not seen the menu yet
+    user.set_connection(PatchingConnection())
+    user.update_menu("turn_menu", _turn_items(labels))
+    assert drain_messages(user)[0]["type"] == "menu"
+
+    # Clients that did not ask for patches always get full menus
+    plain = NetworkUser("bob", "en", DummyConnection())
+    plain.show_menu("turn_menu", _turn_items(labels))
+    labels["item0"] = "Changed"
+    plain.update_menu("turn_menu", _turn_items(labels))
+    assert [p["type"] for p in drain_messages(plain)] == ["menu", "menu"]
+
+
+def test_set_connection_turns_queued_patches_into_full_menus():
+    user = NetworkUser("alice", "en", PatchingConnection())
+    labels = {f"item{i}": f"Item {i}" for i in range(6)}
+    user.show_menu("turn_menu", _turn_items(labels), multiletter=False)
+    drain_messages(user)
+    labels["item1"] = "Item 1!"
+    user.update_menu("turn_menu", _turn_items(labels), selection_id="item1")
+    user.speak("hi")
+    labels["item2"] = "Item 2!"
+    user.update_menu("turn_menu", _turn_items(labels))
+    assert [p["type"] for p in user._message_queue] == ["menu_patch", "speak", "menu_patch"]
+
+    user.set_connection(PatchingConnection())
+
+    speak, menu = drain_messages(user)
+    assert speak["type"] == "speak"
+    assert menu["type"] == "menu"
+    assert menu["items"] == [item.to_dict() for item in _turn_items(labels)]
+    assert menu["multiletter_enabled"] is False
+
+    # The new client now has the menu, so later changes patch again.
+    labels["item3"] = "Item 3!"
+    user.update_menu("turn_menu", _turn_items(labels))
+    assert drain_messages(user)[0]["type"] == "menu_patch"
+
+
+def test_resend_menu_sends_the_current_menu_in_full():
+    user = NetworkUser("alice", "en", PatchingConnection())
+    labels = {f"item{i}": f"Item {i}" for i in range(6)}
+    user.show_menu("turn_menu", _turn_items(labels), position=3)
+    drain_messages(user)
+
+    user.resend_menu("turn_menu")
+    user.resend_menu("gone_menu")
+
+    (menu,) = drain_messages(user)
+    assert menu["type"] == "menu"
+    assert menu["position"] == 2
+    assert len(menu["items"]) == 6
+
+
+def test_speak_packets_are_shared_between_users():
+    alice = NetworkUser("Alice", "en", None)
+    bob = NetworkUser("Bob", "en", None)
+
+    alice.speak("Bob rolled a 6", buffer="table")
+    bob.speak("Bob rolled a 6", buffer="table")
+    bob.speak("hello")
+
+    (alice_packet,) = alice.get_queued_messages()
+    bob_packets = bob.get_queued_messages()
+    assert alice_packet is bob_packets[0]
+    assert isinstance(alice_packet, SharedPacket)
+    assert bob_packets[1] == {"type": "speak", "text": "hello"}
+
@@ -0,0 +1,150 @@
+"""Tests for outbound packet encoding and validation modes."""
+
+import json
+
+import pytest
+
+from server.network.packet_encoder import (
+    PacketEncoder,
+    SharedPacket,
+    VALIDATION_FULL,
+    VALIDATION_OFF,
+    VALIDATION_SAMPLED,
+    dumps_packet,
+    fast_payload,
+    run_self_test,
+    validated_payload,
+)
+from server.network.websocket_server import ClientConnection
+
+
+class DummyWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, data):
+        self.sent.append(data)
+
+
+def test_self_test_passes_for_every_packet_type():
+    assert run_self_test() == []
+
+
+def test_fast_payload_matches_validated_payload():
+    packet = {
+        "type": "menu",
+        "menu_id": "turn_menu",
+        "items": [{"text": "Roll", "id": "roll", "sound": None}, "Plain"],
+        "position": None,
+    }
+    assert fast_payload(packet) == validated_payload(packet)
+
+
+def test_fast_payload_rejects_unknown_type_and_keys():
+    assert fast_payload({"type": "no_such_packet"}) is None
+    assert fast_payload({"type": "speak", "text": "hi", "bogus": 1}) is None
+
+
+def test_off_mode_skips_validation():
+    encoder = PacketEncoder(VALIDATION_OFF)
+    payload = encoder.prepare({"type": "speak", "text": "hi", "buffer": None}, "alice")
+    assert payload == validated_payload({"type": "speak", "text": "hi"})
+    assert encoder.get_stats()["fast"] == 1
+    assert encoder.get_stats()["validated"] == 0
+
+
+def test_sampled_mode_validates_one_in_n_per_type():
+    encoder = PacketEncoder(VALIDATION_SAMPLED, sample_rate=3)
+    for _ in range(6):
+        encoder.prepare({"type": "pong"}, "alice")
+    encoder.prepare({"type": "stop_music"}, "alice")
+    stats = encoder.get_stats()
+    assert stats["validated"] == 3
+    assert stats["fast"] == 4
+    assert stats["mismatches"] == 0
+
+
+@pytest.mark.parametrize("mode", [VALIDATION_FULL, VALIDATION_SAMPLED, VALIDATION_OFF])
+def test_invalid_packets_are_refused_in_every_mode(mode):
+    encoder = PacketEncoder(mode)
+    assert encoder.prepare({"type": "speak", "text": "hi", "bogus": 1}, "alice") is None
+    assert encoder.prepare({"type": "no_such_packet"}, "alice") is None
+
+
+def test_unknown_mode_raises():
+    with pytest.raises(ValueError):
+        PacketEncoder("sometimes")
+
+
+def test_dumps_packet_round_trips():
+    payload = {"type": "speak", "text": "héllo"}
+    assert json.loads(dumps_packet(payload)) == payload
+
+
+@pytest.mark.asyncio
+async def test_client_connection_uses_its_encoder():
+    ws = DummyWebSocket()
+    encoder = PacketEncoder(VALIDATION_OFF)
+    conn = ClientConnection(websocket=ws, address="127.0.0.1:1234", encoder=encoder)
+
+    await conn.send({"type": "pong"})
+
+    assert json.loads(ws.sent[-1]) == {"type": "pong"}
+    assert encoder.get_stats()["fast"] == 1
+
+
+def test_shared_packet_is_serialized_once():
+    encoder = PacketEncoder(VALIDATION_FULL)
+    packet = SharedPacket(type="speak", text="hi", buffer="table")
+
+    first = encoder.encode(packet, "a")
+    second = encoder.encode(packet, "b")
+
+    assert first is second
+    assert json.loads(first) == validated_payload(packet)
+    stats = encoder.get_stats()
+    assert stats["validated"] == 1
+    assert stats["reused"] == 1
+
+
+def test_shared_packet_is_read_only():
+    packet = SharedPacket(type="speak", text="hi")
+
+    with pytest.raises(TypeError):
+        packet["buffer"] = "table"
+    with pytest.raises(TypeError):
+        packet.update(text="changed")
+    with pytest.raises(TypeError):
+        packet.pop("text")
+    assert packet == {"type": "speak", "text": "hi"}
+    assert dict(packet, buffer="table")["buffer"] == "table"
+
+
+def test_invalid_shared_packet_is_refused_every_time():
+    encoder = PacketEncoder(VALIDATION_FULL)
+    packet = SharedPacket(type="speak", text=5)
+
+    assert encoder.encode(packet, "a") is None
+    assert encoder.encode(packet, "b") is None
+    assert packet.wire is None
+
+
+@pytest.mark.asyncio
+async def test_batch_frame_splices_serialized_packets():
+    ws = DummyWebSocket()
+    conn = ClientConnection(
+        websocket=ws,
+        address="127.0.0.1:1234",
+        encoder=PacketEncoder(VALIDATION_OFF),
+        supports_batch=True,
+    )
+    shared = SharedPacket(type="speak", text="hi")
+
+    conn.enqueue([shared, {"type": "pong"}])
+    await conn._writer
+
+    assert json.loads(ws.sent[-1]) == {
+        "type": "batch",
+        "packets": [validated_payload(shared), {"type": "pong"}],
+    }
+    assert shared.wire is not None
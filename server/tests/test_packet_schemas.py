@@ -20,6 +20,7 @@ from server.network.packet_models import (
 CLIENT_TO_SERVER_SAMPLES = [
     {"type": "authorize", "username": "user", "password": "pw"},
     {"type": "authorize", "username": "user", "session_token": "token"},
+    {"type": "authorize", "username": "user", "password": "pw", "features": ["batch", "menu_patch"]},
     {"type": "register", "username": "user", "password": "pw", "email": "e@example.com"},
     {
         "type": "refresh_session",
@@ -31,6 +32,7 @@ CLIENT_TO_SERVER_SAMPLES = [
     {"type": "menu", "menu_id": "main", "selection": 1},
     {"type": "keybind", "key": "f1"},
     {"type": "escape", "menu_id": "main"},
+    {"type": "menu_resync", "menu_id": "turn_menu"},
     {"type": "editbox", "text": "hello", "input_id": "chat"},
     {"type": "chat", "convo": "local", "message": "hi", "language": "English"},
     {"type": "ping"},
@@ -118,6 +120,17 @@ SERVER_TO_CLIENT_SAMPLES = [
     },
     {"type": "open_client_options", "options": {}},
     {"type": "open_server_options", "options": {}},
+    {"type": "batch", "packets": [{"type": "speak", "text": "hi"}, {"type": "pong"}]},
+    {
+        "type": "menu_patch",
+        "menu_id": "turn_menu",
+        "ops": [
+            {"op": "remove", "id": "a"},
+            {"op": "insert", "index": 0, "item": {"text": "B", "id": "b"}},
+            {"op": "replace", "id": "c", "item": {"text": "C!", "id": "c"}},
+        ],
+        "selection_id": "b",
+    },
 ]
 
 
@@ -8,7 +8,7 @@ import pytest
 
 
 from server.core.server import Server, DEFAULT_WS_MAX_MESSAGE_BYTES
-from server.auth.auth import AuthResult
+from server.auth.auth import AuthResult, CredentialPoolBusy
 from server.core.users.base import TrustLevel
 from server.core.tables.table import Table
 from server.games.base import Player
@@ -49,6 +49,12 @@ class DummyAuth:
         self.calls["register"].append((username, password))
         return self.register_result
 
+    async def authenticate_async(self, username, password):
+        return self.authenticate(username, password)
+
+    async def register_async(self, username, password, **kwargs):
+        return self.register(username, password, **kwargs)
+
     def get_user(self, username):
         return self.user_record
 
@@ -402,6 +408,36 @@ async def test_login_rate_limit_by_username(server):
     assert "Too many failed login attempts" in client.sent[1]["text"]
 
 
+class BusyAuth(DummyAuth):
+    async def authenticate_async(self, username, password):
+        raise CredentialPoolBusy()
+
+    async def register_async(self, username, password, **kwargs):
+        raise CredentialPoolBusy()
+
+
+@pytest.mark.asyncio
+async def test_login_reports_busy_credential_pool(server):
+    server._auth = BusyAuth()
+    client = DummyClient()
+
+    await server._handle_authorize(client, {"username": "alice", "password": "validpass"})
+
+    assert "busy handling other logins" in client.sent[-1]["message"]
+    assert "alice" not in server._login_attempts_user
+
+
+@pytest.mark.asyncio
+async def test_register_reports_busy_credential_pool(server):
+    server._db = SimpleNamespace(get_user_count=lambda: 0)
+    server._auth = BusyAuth()
+    client = DummyClient()
+
+    await server._handle_register(client, {"username": "alice", "password": "validpass"})
+
+    assert "busy handling other logins" in client.sent[-1]["text"]
+
+
 @pytest.mark.asyncio
 async def test_registration_rate_limit_by_ip(server):
     server._db = SimpleNamespace(get_user_count=lambda: 0)
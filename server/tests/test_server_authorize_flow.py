@@ -61,6 +61,12 @@ class FakeAuth:
         )
         return True
 
+    async def authenticate_async(self, username, password):
+        return self.authenticate(username, password)
+
+    async def register_async(self, username, password, **kwargs):
+        return self.register(username, password, **kwargs)
+
     def get_user(self, username):
         return self.users.get(username)
 
@@ -119,6 +125,25 @@ async def test_authorize_with_session_token_valid(server):
     assert client.authenticated is True
     assert client.username == "alice"
     assert any(p.get("type") == "authorize_success" for p in client.sent)
+    assert client.supports_batch is False
+    assert client.supports_menu_patch is False
+
+
+@pytest.mark.asyncio
+async def test_authorize_records_batch_feature(server):
+    client = DummyClient()
+    server._auth.sessions["token"] = "alice"
+    packet = {
+        "type": "authorize",
+        "session_token": "token",
+        "username": "alice",
+        "features": ["batch", "menu_patch"],
+    }
+
+    await server._handle_authorize(client, packet)
+
+    assert client.supports_batch is True
+    assert client.supports_menu_patch is True
 
 
 @pytest.mark.asyncio
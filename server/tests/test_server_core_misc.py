@@ -16,6 +16,7 @@ from server.core.server import (
     ServerMode,
 )
 from server.core.state import ModeSnapshot
+from server.core.users.test_user import MockUser
 
 
 class FakeDBCount:
@@ -138,6 +139,8 @@ refresh_per_minute = 0
 [network]
 max_message_bytes = 2048
 allow_insecure_ws = true
+outbox_high_watermark = 400
+outbox_low_watermark = 900  # should clamp to high
 
 [localization]
 default_locale = "es"
@@ -163,6 +166,8 @@ default_locale = "es"
     assert srv._refresh_ip_limit == 0
     assert srv._ws_max_message_size == 2048
     assert srv._allow_insecure_ws is True
+    assert srv._outbox_high_watermark == 400
+    assert srv._outbox_low_watermark == 400  # clamped
     assert srv._default_locale == "es"
 
 
@@ -225,3 +230,34 @@ async def test_start_localization_warmup_skips_when_preload(monkeypatch, server)
     server._start_localization_warmup()
 
     assert not loop.tasks
+
+
+def test_leaderboards_and_my_stats_read_aggregates(server, monkeypatch):
+    monkeypatch.setattr(
+        "server.messages.localization.Localization.get",
+        lambda _locale, key, **kwargs: f"{key} {kwargs}" if kwargs else key,
+    )
+    server._db.connect()
+    alice = ("uuid-alice", "alice", False, False)
+    bob = ("uuid-bob", "bob", False, False)
+    for winner in ("alice", "alice", "bob"):
+        server._db.save_game_result(
+            "pig", datetime.now().isoformat(), 10, [alice, bob], {"winner_name": winner}
+        )
+    user = MockUser("alice", uuid="uuid-alice")
+
+    server._show_wins_leaderboard(user, "pig", "Pig")
+
+    items = [item.text for item in user.menus["game_leaderboard"]["items"]]
+    assert "'player': 'alice', 'wins': 2, 'losses': 1" in items[0]
+    assert "'player': 'bob', 'wins': 1, 'losses': 2" in items[1]
+
+    assert server._show_my_stats_menu(user) is True
+    stats_ids = [item.id for item in user.menus["my_stats_menu"]["items"]]
+    assert stats_ids == ["stats_pig", "back"]
+
+    server._show_my_game_stats(user, "pig")
+    stats_text = [item.text for item in user.menus["my_game_stats"]["items"]]
+    assert "my-stats-games-played {'value': 3}" in stats_text
+    assert "my-stats-losses {'value': 1}" in stats_text
+    server._db.close()
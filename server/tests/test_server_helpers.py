@@ -40,6 +40,9 @@ class DummyClient:
     async def send(self, payload):
         self.sent.append(payload)
 
+    def enqueue(self, packets):
+        self.sent.extend(packets)
+
 
 class DummyWebSocketServer:
     def __init__(self, mapping):
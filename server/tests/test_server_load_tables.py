@@ -10,15 +10,20 @@ from server.core.server import Server
 class StubTableManager:
     def __init__(self):
         self.added = []
+        self.removed = []
 
     def add_table(self, table):
         self.added.append(table)
 
+    def remove_table(self, table_id):
+        self.removed.append(table_id)
+
 
 class StubDB:
     def __init__(self, tables):
         self.tables = tables
         self.deleted = False
+        self.deleted_ids = []
 
     def load_all_tables(self):
         return self.tables
@@ -26,6 +31,9 @@ class StubDB:
     def delete_all_tables(self):
         self.deleted = True
 
+    def delete_table(self, table_id):
+        self.deleted_ids.append(table_id)
+
 
 class StubGameClass:
     def __init__(self):
@@ -76,8 +84,11 @@ class StubGame:
 
 def test_load_tables_handles_missing_game_class_and_restores(monkeypatch, tmp_path):
     # Unknown game type table triggers warning path; known stub restores bots
-    t_unknown = SimpleNamespace(game_json="{}", game_type="missing", game=None)
-    t_known = SimpleNamespace(game_json="{}", game_type="stub", game=None)
+    row = {"host": "alice", "members": [], "status": "playing", "_dirty": True}
+    t_unknown = SimpleNamespace(
+        table_id="t1", game_json="{}", game_type="missing", game=None, **row
+    )
+    t_known = SimpleNamespace(table_id="t2", game_json="{}", game_type="stub", game=None, **row)
     tables = [t_unknown, t_known]
 
     srv = Server(host="127.0.0.1", port=0, db_path=tmp_path / "db.sqlite", preload_locales=True)
@@ -97,4 +108,52 @@ def test_load_tables_handles_missing_game_class_and_restores(monkeypatch, tmp_pa
     # known game restored and bots attached
     assert t_known.game is not None
     assert any(u.username == "botty" for u in t_known.game._users.values())
-    assert srv._db.deleted is True
+    assert srv._db.deleted is False
+
+
+class BrokenGameClass(StubGameClass):
+    @staticmethod
+    def from_json(game_json):
+        raise ValueError("state from an older version")
+
+
+def test_load_tables_skips_tables_whose_game_fails_to_restore(monkeypatch, tmp_path, capsys):
+    row = {"host": "alice", "members": [], "status": "playing", "_dirty": True}
+    t_broken = SimpleNamespace(table_id="t1", game_json="{}", game_type="broken", game=None, **row)
+    t_known = SimpleNamespace(table_id="t2", game_json="{}", game_type="stub", game=None, **row)
+
+    srv = Server(host="127.0.0.1", port=0, db_path=tmp_path / "db.sqlite", preload_locales=True)
+    stub_tables = StubTableManager()
+    srv._tables = stub_tables  # type: ignore[assignment]
+    srv._db = StubDB([t_broken, t_known])  # type: ignore[assignment]
+    monkeypatch.setattr(
+        "server.core.server.get_game_class",
+        lambda gt: BrokenGameClass() if gt == "broken" else StubGameClass(),
+    )
+
+    srv._load_tables()
+
+    assert stub_tables.removed == ["t1"]
+    assert srv._db.deleted_ids == []
+    assert "t1" not in srv._checkpointer._saved
+    assert t_known.game is not None
+    assert "Could not restore broken table t1" in capsys.readouterr().out
+
+
+def test_load_tables_keeps_rows_it_cannot_read_as_installed(monkeypatch, tmp_path, capsys):
+    row = {"host": "alice", "members": [], "status": "playing", "_dirty": True}
+    newer = b"PPG\xff\x00{}"  # a format version from a newer server
+    t_newer = SimpleNamespace(table_id="t1", game_json=newer, game_type="stub", game=None, **row)
+
+    srv = Server(host="127.0.0.1", port=0, db_path=tmp_path / "db.sqlite", preload_locales=True)
+    stub_tables = StubTableManager()
+    srv._tables = stub_tables  # type: ignore[assignment]
+    srv._db = StubDB([t_newer])  # type: ignore[assignment]
+    monkeypatch.setattr("server.core.server.get_game_class", lambda gt: StubGameClass())
+
+    srv._load_tables()
+
+    assert stub_tables.removed == ["t1"]
+    assert srv._db.deleted_ids == []
+    assert "t1" not in srv._checkpointer._saved
+    assert "Skipping stub table t1 (kept in the database)" in capsys.readouterr().out
@@ -44,3 +44,16 @@ def test_main_default_preload_false(monkeypatch, main_module):
     main_module.main()
 
     assert captured["preload_locales"] is False
+
+
+def test_main_passes_preload_games_flag(monkeypatch, main_module):
+    captured = {}
+
+    async def fake_run_server(**kwargs):
+        captured.update(kwargs)
+
+    monkeypatch.setattr(main_module, "run_server", fake_run_server)
+    _set_argv(monkeypatch, ["--preload-games"])
+    main_module.main()
+
+    assert captured["preload_games"] is True
@@ -55,6 +55,12 @@ class FakeAuth:
         )
         return True
 
+    async def authenticate_async(self, username, password):
+        return self.authenticate(username, password)
+
+    async def register_async(self, username, password, **kwargs):
+        return self.register(username, password, **kwargs)
+
     def get_user(self, username):
         return self.users.get(username)
 
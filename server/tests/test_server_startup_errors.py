@@ -16,10 +16,14 @@ class DummyDB:
         self.connected = False
         self.closed = False
         self.trust_initialized = False
+        self.player_stats_stale = False
 
     def connect(self):
         self.connected = True
 
+    def start_writer(self):
+        return None
+
     def initialize_trust_levels(self):
         self.trust_initialized = True
         return None
@@ -36,6 +40,9 @@ class DummyDB:
     def save_all_tables(self, tables):
         return None
 
+    def flush(self):
+        return True
+
 
 class DummyWS:
     def __init__(self):
@@ -115,7 +122,7 @@ async def test_start_invalid_tick_interval_raises(tmp_path, capsys, monkeypatch)
     srv._start_localization_warmup = lambda: None
     srv._lifecycle.resolve_gate = lambda gid: None
     monkeypatch.setattr(
-        "server.core.server.TickScheduler", lambda callback, interval=None: srv._tick_scheduler
+        "server.core.server.TickScheduler", lambda callback, interval=None, **kwargs: srv._tick_scheduler
     )
     monkeypatch.setattr(
         "server.core.server.WebSocketServer", lambda *args, **kwargs: srv._ws_server
@@ -145,7 +152,7 @@ async def test_start_virtual_bot_config_error(tmp_path, capsys, monkeypatch):
     srv._start_localization_warmup = lambda: None
     srv._lifecycle.resolve_gate = lambda gid: None
     monkeypatch.setattr(
-        "server.core.server.TickScheduler", lambda callback, interval=None: srv._tick_scheduler
+        "server.core.server.TickScheduler", lambda callback, interval=None, **kwargs: srv._tick_scheduler
     )
     monkeypatch.setattr(
         "server.core.server.WebSocketServer", lambda *args, **kwargs: srv._ws_server
@@ -160,7 +167,11 @@ async def test_start_virtual_bot_config_error(tmp_path, capsys, monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_stop_cleans_resources(tmp_path):
+async def test_stop_cleans_resources(tmp_path, monkeypatch):
+    pool_stops = []
+    monkeypatch.setattr(
+        "server.core.server.shutdown_simulation_pool", lambda: pool_stops.append(True)
+    )
     srv = Server(host="127.0.0.1", port=0, db_path=tmp_path / "db.sqlite", preload_locales=True)
     srv._preload_locales = False
     srv._db = DummyDB()
@@ -175,6 +186,7 @@ async def test_stop_cleans_resources(tmp_path):
     assert srv._virtual_bots.saved is True
     assert srv._tick_scheduler.stopped is True
     assert srv._ws_server.stopped is True
+    assert pool_stops == [True]
 
 
 @pytest.mark.asyncio
@@ -193,7 +205,7 @@ async def test_start_with_restored_bots_message(tmp_path, capsys, monkeypatch):
     srv._lifecycle.resolve_gate = lambda gid: None
     srv._tables = DummyTables()
     monkeypatch.setattr(
-        "server.core.server.TickScheduler", lambda callback, interval=None: srv._tick_scheduler
+        "server.core.server.TickScheduler", lambda callback, interval=None, **kwargs: srv._tick_scheduler
     )
     monkeypatch.setattr(
         "server.core.server.WebSocketServer", lambda *args, **kwargs: srv._ws_server
@@ -203,3 +215,23 @@ async def test_start_with_restored_bots_message(tmp_path, capsys, monkeypatch):
     await srv.start()
     out = capsys.readouterr().out
     assert "Restored 2 virtual bots" in out
+
+
+@pytest.mark.asyncio
+async def test_start_invalid_game_codec_raises(tmp_path, capsys, monkeypatch):
+    srv = Server(
+        host="127.0.0.1",
+        port=0,
+        db_path=tmp_path / "db.sqlite",
+        config_path=tmp_path / "config.toml",
+    )
+    srv._db = DummyDB()
+    monkeypatch.setattr(
+        "server.core.server.load_server_config", lambda path: {"game_codec": "pickle"}
+    )
+
+    with pytest.raises(SystemExit):
+        await srv.start()
+
+    out = capsys.readouterr().err
+    assert "Invalid game_codec 'pickle'" in out
@@ -6,6 +6,8 @@ from types import SimpleNamespace
 import pytest
 
 from server.core.server import Server
+from server.core.tables.checkpoint import TableCheckpointer
+from server.core.tables.manager import TableManager
 
 
 class DummyTable:
@@ -14,6 +16,10 @@ class DummyTable:
         self.game_type = game_type
         self.game_json = game_json
         self.game = None
+        self.host = "host"
+        self.members = []
+        self.status = "waiting"
+        self._dirty = True
 
 
 class DummyTablesManager:
@@ -66,20 +72,31 @@ def server(tmp_path):
     return srv
 
 
-def test_save_tables_calls_db_and_manager(monkeypatch, server):
-    tables_manager = DummyTablesManager()
-    tables_manager.saved = [DummyTable("t1", "pig"), DummyTable("t2", "farkle")]
-    server._tables = tables_manager
-
+def test_save_tables_writes_only_changed_tables(server):
+    manager = TableManager()
+    host = SimpleNamespace(speak=lambda *args: None)
+    unchanged = manager.create_table("pig", "alice", host)
+    changed = manager.create_table("farkle", "bob", host)
     saved_to_db = []
-    server._db = SimpleNamespace(save_all_tables=lambda tables: saved_to_db.extend(tables))
+    server._db = SimpleNamespace(
+        save_all_tables=lambda tables: saved_to_db.extend(tables),
+        delete_table=lambda table_id: None,
+        flush=lambda: True,
+    )
+    server._tables = manager
+    server._checkpointer = TableCheckpointer(manager, server._db)
+    server._checkpointer.mark_saved(unchanged)
+    server._checkpointer.mark_saved(changed)
+    changed.status = "playing"
+    changed.wake()
 
     server._save_tables()
 
-    assert saved_to_db == tables_manager.saved
+    assert saved_to_db == [changed]
+    assert not changed._dirty
 
 
-def test_load_tables_restores_games_and_clears_db(monkeypatch, server):
+def test_load_tables_restores_games_and_keeps_rows(monkeypatch, server):
     dummy_game_json = json.dumps({"state": "dummy"})
     table_with_game = DummyTable("table-game", "test_game", game_json=dummy_game_json)
     plain_table = DummyTable("table-plain", "test_game")
@@ -107,4 +124,6 @@ def test_load_tables_restores_games_and_clears_db(monkeypatch, server):
     assert table_with_game.game.keybinds_setup
     assert table_with_game.game.rebuilt_players == ["BotOne"]
     assert table_with_game.game._table is table_with_game
-    assert called_delete == [True]
+    # Rows stay until the checkpointer sees the tables close.
+    assert called_delete == []
+    assert not table_with_game._dirty and not plain_table._dirty
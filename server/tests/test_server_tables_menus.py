@@ -301,6 +301,37 @@ def test_restore_saved_table_missing_players(server, monkeypatch):
     assert called.get("saved")
 
 
+def test_restore_saved_table_that_fails_to_load_creates_no_table(server, monkeypatch):
+    user = DummyUser("alice")
+    server._users = {"alice": user}
+    record = SimpleNamespace(
+        id=4,
+        game_type="stub",
+        members_json='[{"username": "alice", "is_bot": false}]',
+        game_json="{}",
+    )
+    db = DummyDB(saved=[record])
+    server._db = db
+
+    class BrokenGameClass(StubGameClass):
+        @staticmethod
+        def from_json(game_json):
+            raise ValueError("state from an older version")
+
+    monkeypatch.setattr("server.core.server.get_game_class", lambda _gt: BrokenGameClass)
+    called = {}
+    monkeypatch.setattr(
+        server, "_show_saved_tables_menu", lambda u: called.setdefault("saved", True)
+    )
+
+    asyncio.run(server._restore_saved_table(user, 4))
+
+    assert ("saved-table-load-failed", {}) in user.spoken
+    assert called.get("saved")
+    assert server._tables.get_all_tables() == []
+    assert db.deleted == []
+
+
 def test_restore_saved_table_success(server, monkeypatch):
     user = DummyUser("alice")
     bot_user = DummyUser("bot")
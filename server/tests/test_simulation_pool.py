@@ -0,0 +1,102 @@
+"""Tests for the simulation pool and in-process simulation runs."""
+
+import time
+
+from server.game_utils import simulation_pool
+from server.game_utils.simulation_pool import (
+    SimulationPool,
+    run_simulation,
+    shutdown_simulation_pool,
+    summarize_ticks,
+)
+
+
+def test_run_simulation_applies_structured_options():
+    result = run_simulation("pig", ["Alice", "Bob"], {"target_score": 10}, max_ticks=5000)
+
+    assert "error" not in result
+    assert result["ticks"] > 0
+    assert not result["timed_out"]
+    assert "player_menus" not in result
+
+
+def test_run_simulation_reports_setup_errors():
+    result = run_simulation("no-such-game", ["Alice", "Bob"], {})
+
+    assert result == {"game_type": "no-such-game", "error": "setup failed"}
+
+
+def test_summarize_ticks_skips_errors_and_timeouts():
+    summary = summarize_ticks(
+        [
+            {"ticks": 100, "timed_out": False},
+            {"ticks": 300, "timed_out": False},
+            {"ticks": 9000, "timed_out": True},
+            {"error": "boom"},
+        ]
+    )
+
+    assert summary == {
+        "runs": 4,
+        "completed": 2,
+        "timed_out": 1,
+        "errors": 1,
+        "mean_ticks": 200,
+        "min_ticks": 100,
+        "max_ticks": 300,
+        "std_dev_ticks": 100,
+    }
+
+
+def test_pool_streams_results_from_worker_processes():
+    pool = SimulationPool(workers=1)
+    try:
+        results = list(pool.run_many(2, "pig", ["Alice", "Bob"], {"target_score": 10}))
+    finally:
+        pool.shutdown()
+
+    assert len(results) == 2
+    assert all(result["ticks"] > 0 for result in results)
+
+
+def test_pool_seeds_each_run_from_the_base_seed():
+    pool = SimulationPool(workers=1)
+    try:
+        results = list(pool.run_many(3, "pig", ["Alice", "Bob"], {"target_score": 10}, seed=40))
+    finally:
+        pool.shutdown()
+
+    assert sorted(result["seed"] for result in results) == [40, 41, 42]
+    replay = run_simulation("pig", ["Alice", "Bob"], {"target_score": 10}, seed=41)
+    original = next(result for result in results if result["seed"] == 41)
+    assert replay["ticks"] == original["ticks"]
+    assert replay["messages"] == original["messages"]
+
+
+def test_pool_times_out_stuck_runs_and_restarts_its_workers():
+    pool = SimulationPool(workers=1)
+    try:
+        stuck = list(pool.run_many(2, "pig", ["Alice", "Bob"], {"target_score": 10**9}, timeout=2))
+        results = list(pool.run_many(1, "pig", ["Alice", "Bob"], {"target_score": 10}))
+    finally:
+        pool.shutdown()
+
+    assert [result["error"] for result in stuck] == ["timed out after 2s"] * 2
+    assert results[0]["ticks"] > 0
+
+
+def test_shutdown_stops_the_shared_pool_and_its_busy_workers(monkeypatch):
+    monkeypatch.setattr(simulation_pool, "_shared_pool", SimulationPool(workers=1))
+    pool = simulation_pool.get_simulation_pool()
+    future = pool.submit("pig", ["Alice", "Bob"], {"target_score": 10**9})
+    deadline = time.monotonic() + 30
+    while not future.running() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    workers = list(pool._executor._processes.values())
+
+    shutdown_simulation_pool()
+
+    for worker in workers:
+        worker.join(timeout=10)
+    assert workers and not any(worker.is_alive() for worker in workers)
+    assert simulation_pool._shared_pool is None
@@ -0,0 +1,101 @@
+"""Tests for TableCheckpointer."""
+
+from types import SimpleNamespace
+
+from server.core.tables.checkpoint import TableCheckpointer
+from server.core.tables.manager import TableManager
+from server.core.users.test_user import MockUser
+from server.games.pig.game import PigGame
+
+
+class FakeGame:
+    def __init__(self):
+        self.state = 0
+        self.serialized = 0
+
+    def to_json(self):
+        self.serialized += 1
+        return f'{{"state": {self.state}}}'
+
+
+class RecordingDB:
+    def __init__(self):
+        self.saves = []
+        self.deleted = []
+
+    def save_all_tables(self, tables):
+        self.saves.append([table.table_id for table in tables])
+
+    def delete_table(self, table_id):
+        self.deleted.append(table_id)
+
+
+def _setup(count, budget_s=1.0):
+    manager = TableManager()
+    db = RecordingDB()
+    checkpointer = TableCheckpointer(manager, db, interval_s=1.0, budget_s=budget_s)
+    tables = []
+    for n in range(count):
+        table = manager.create_table("pig", f"host{n}", SimpleNamespace())
+        table.game = FakeGame()
+        tables.append(table)
+    return manager, db, checkpointer, tables
+
+
+def _start_round(checkpointer):
+    checkpointer._next_round = 0
+    return checkpointer.on_tick()
+
+
+def test_rounds_save_only_dirty_tables_in_one_batch():
+    _manager, db, checkpointer, tables = _setup(3)
+    for table in tables:
+        checkpointer.mark_saved(table)
+    tables[0].game.state = 1
+    tables[0].wake()
+    tables[1].wake()  # dirty, but serializes to the same row
+
+    assert checkpointer.on_tick() == 0  # interval not reached
+    assert _start_round(checkpointer) == 1
+
+    assert db.saves == [[tables[0].table_id]]
+    assert checkpointer.tables_unchanged == 1
+    assert tables[2].game.serialized == 1  # only when it was assigned
+
+
+def test_budget_spreads_a_round_across_ticks():
+    _manager, db, checkpointer, tables = _setup(3, budget_s=0.0)
+
+    _start_round(checkpointer)
+    checkpointer.on_tick()
+    checkpointer.on_tick()
+
+    assert db.saves == [[table.table_id] for table in tables]
+    assert checkpointer.rounds == 1
+
+
+def test_ticks_mark_tables_dirty_only_when_the_game_changes():
+    manager = TableManager()
+    checkpointer = TableCheckpointer(manager, RecordingDB())
+    table = manager.create_table("pig", "host", MockUser("host"))
+    table.game = PigGame()
+    table.game._table = table
+    table.game.schedule_event("noop", {}, delay_ticks=1)
+    checkpointer.mark_saved(table)
+
+    table.on_tick()
+    assert not table._dirty
+
+    table.game.process_scheduled_events()  # as games with events do in on_tick
+    assert table._dirty
+
+
+def test_closed_tables_are_deleted_and_checkpoint_all_ignores_budget():
+    manager, db, checkpointer, tables = _setup(3, budget_s=0.0)
+
+    assert checkpointer.checkpoint_all() == (3, 0)
+    manager.remove_table(tables[0].table_id)
+    assert checkpointer.checkpoint_all() == (0, 2)  # checks clean tables too
+
+    assert db.saves == [[table.table_id for table in tables]]
+    assert db.deleted == [tables[0].table_id]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from contextlib import nullcontext
+
 from server.core.tables.table import Table, TableMember
 
 
@@ -35,6 +37,9 @@ class DummyGame:
     def on_tick(self):
         self.ticks += 1
 
+    def deferred_menu_updates(self):
+        return nullcontext()
+
     def get_player_by_id(self, pid):
         return None
 
@@ -53,6 +58,12 @@ def test_remove_member_triggers_destroy_when_empty():
     destroyed = []
 
     class Manager:
+        def on_member_added(self, tbl, username):
+            pass
+
+        def on_member_removed(self, tbl, username):
+            pass
+
         def on_table_destroy(self, tbl):
             destroyed.append(tbl)
 
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import json
+from contextlib import nullcontext
+
 from server.core.tables.manager import TableManager
-from server.core.tables.table import Table
+from server.core.tables.table import Table, TableMember
 
 
 class DummyUser:
@@ -20,6 +23,15 @@ class DummyServer:
         self.destroyed.append(table)
 
 
+def assert_user_index_consistent(manager: TableManager) -> None:
+    """find_user_table agrees with a scan of every table's members."""
+    expected = {}
+    for table in manager.get_all_tables():
+        for member in table.members:
+            expected.setdefault(member.username, table)
+    assert manager._user_tables == expected
+
+
 def _make_manager_with_server() -> tuple[TableManager, DummyServer]:
     manager = TableManager()
     server = DummyServer()
@@ -66,6 +78,45 @@ def test_find_user_table_returns_owner():
 
     assert manager.find_user_table("dave") is table
     assert manager.find_user_table("ghost") is None
+    assert_user_index_consistent(manager)
+
+
+def test_user_index_tracks_membership_changes():
+    manager, server = _make_manager_with_server()
+    t1 = manager.create_table("poker", "alice", DummyUser("alice"))
+    t2 = manager.create_table("poker", "bob", DummyUser("bob"))
+    t1.add_member("carol", DummyUser("carol"), as_spectator=True)
+    assert_user_index_consistent(manager)
+
+    t1.remove_member("carol")
+    t2.add_member("carol", DummyUser("carol"))
+    assert manager.find_user_table("carol") is t2
+    assert_user_index_consistent(manager)
+
+    # Emptying a table destroys it and unindexes its members.
+    t1.remove_member("alice")
+    assert server.destroyed == [t1]
+    assert manager.find_user_table("alice") is None
+    assert_user_index_consistent(manager)
+
+    # Removing a table that still has members unindexes them too.
+    manager.remove_table(t2.table_id)
+    assert manager.find_user_table("bob") is None
+    assert_user_index_consistent(manager)
+
+
+def test_user_index_includes_loaded_tables():
+    manager, _ = _make_manager_with_server()
+    loaded = Table(
+        table_id="loaded",
+        game_type="poker",
+        host="erin",
+        members=[TableMember("erin"), TableMember("frank", is_spectator=True)],
+    )
+    manager.add_table(loaded)
+
+    assert manager.find_user_table("frank") is loaded
+    assert_user_index_consistent(manager)
 
 
 def test_on_tick_ticks_games_and_removes_empty_tables():
@@ -75,6 +126,7 @@ def test_on_tick_ticks_games_and_removes_empty_tables():
     class DummyGame:
         def __init__(self):
             self.tick_count = 0
+            self.sound_scheduler_tick = 0
 
         def to_json(self) -> str:
             return "{}"
@@ -82,6 +134,12 @@ def test_on_tick_ticks_games_and_removes_empty_tables():
         def on_tick(self) -> None:
             self.tick_count += 1
 
+        def next_wakeup_tick(self) -> int:
+            return self.sound_scheduler_tick
+
+        def deferred_menu_updates(self):
+            return nullcontext()
+
     table.game = DummyGame()
 
     empty_table = Table(table_id="empty", game_type="poker", host="ghost")
@@ -94,6 +152,11 @@ def test_on_tick_ticks_games_and_removes_empty_tables():
     assert manager.get_table("empty") is None
     assert server.destroyed == [empty_table]
 
+    costs = manager.get_tick_costs()
+    assert list(costs) == ["poker"]
+    assert costs["poker"]["count"] == 1
+    assert costs["poker"]["tables"] == 1
+
 
 def test_add_table_and_save_all_rehydrate_state():
     manager, _ = _make_manager_with_server()
@@ -115,3 +178,106 @@ def test_add_table_and_save_all_rehydrate_state():
     assert table._manager is manager
     assert table.game_json == '{"saved": 1}'
     assert saved_tables[0] is table
+
+
+def _seat_pig_table(manager: TableManager, usernames: list[str]) -> tuple[Table, "PigGame"]:
+    from server.core.users.test_user import MockUser
+    from server.games.pig.game import PigGame
+
+    table = manager.create_table("pig", usernames[0], MockUser(usernames[0]))
+    game = PigGame()
+    table.game = game
+    game._table = table
+    game.initialize_lobby(usernames[0], table.get_user(usernames[0]))
+    for username in usernames[1:]:
+        user = MockUser(username)
+        table.add_member(username, user)
+        game.add_player(username, user)
+    return table, game
+
+
+def test_idle_lobby_is_skipped_until_a_player_acts():
+    manager, _server = _make_manager_with_server()
+    table, game = _seat_pig_table(manager, ["alice"])
+    start_clock = game.sound_scheduler_tick
+    ticked = []
+    original_on_tick = game.on_tick
+
+    def counting_on_tick():
+        ticked.append(game.sound_scheduler_tick)
+        original_on_tick()
+
+    game.on_tick = counting_on_tick
+    for _ in range(20):
+        manager.on_tick()
+
+    assert len(ticked) < 20
+    assert manager.get_sleeping_count() == 1
+    # Scheduling against the sleeping game first catches its clock up.
+    game.schedule_sound("ding.ogg", delay_ticks=3)
+    assert table.table_id not in manager._sleeping
+    assert game.sound_scheduler_tick == start_clock + 20
+    assert game.scheduled_sounds[-1][0] == start_clock + 23
+
+
+def test_sleeping_table_wakes_when_its_sound_is_due():
+    manager, _server = _make_manager_with_server()
+    table, game = _seat_pig_table(manager, ["alice", "bob"])
+    game.on_start()
+    start_clock = game.sound_scheduler_tick
+    for _ in range(20):
+        manager.on_tick()
+    assert table.table_id in manager._sleeping
+
+    game.schedule_sound("ding.ogg", delay_ticks=6)
+    user = table.get_user("bob")
+    user.clear_messages()
+    played_on = []
+    for tick in range(1, 13):
+        manager.on_tick()
+        if "ding.ogg" in user.get_sounds_played() and not played_on:
+            played_on.append(tick)
+
+    # Same tick as if the table had been ticked throughout.
+    assert played_on == [7]
+    assert table.table_id in manager._sleeping
+    table.wake()
+    assert game.sound_scheduler_tick == start_clock + 32
+
+
+def test_tables_with_bots_are_ticked_every_time():
+    from server.core.users.bot import Bot
+
+    manager, _server = _make_manager_with_server()
+    table, game = _seat_pig_table(manager, ["alice"])
+    game.add_player("Robo", Bot("Robo"))
+    game.on_start()
+    for _ in range(5):
+        manager.on_tick()
+    assert manager.get_sleeping_count() == 0
+
+
+def test_idle_lobbies_do_nothing_when_ticked():
+    """Every game's lobby is safe to skip: ticking it only advances the clock."""
+    from server.core.users.test_user import MockUser
+    from server.games.registry import GameRegistry
+
+    for game_class in GameRegistry.get_all():
+        game = game_class()
+        user = MockUser("alice")
+        game.initialize_lobby("alice", user)
+        for _ in range(200):
+            due = game.next_wakeup_tick()
+            if due is None or due > game.sound_scheduler_tick:
+                break
+            game.on_tick()
+        assert game.next_wakeup_tick() is None, game_class.get_type()
+        user.clear_messages()
+        before = json.loads(game.to_json())
+        for _ in range(5):
+            game.on_tick()
+        after = json.loads(game.to_json())
+        before.pop("sound_scheduler_tick")
+        after.pop("sound_scheduler_tick")
+        assert after == before, game_class.get_type()
+        assert user.messages == [], game_class.get_type()
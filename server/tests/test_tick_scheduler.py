@@ -1,10 +1,17 @@
 """Tests for the TickScheduler utility."""
 
 import asyncio
+import time
 
 import pytest
 
-from server.core.tick import TickScheduler, load_server_config, DEFAULT_TICK_INTERVAL_MS
+from server.core.tick import (
+    TickScheduler,
+    TickMetrics,
+    DurationHistogram,
+    load_server_config,
+    DEFAULT_TICK_INTERVAL_MS,
+)
 
 
 @pytest.mark.asyncio
@@ -47,6 +54,105 @@ async def test_tick_scheduler_swallows_callback_errors():
     assert calls["count"] >= 2  # continued after exception
 
 
+@pytest.mark.asyncio
+async def test_tick_scheduler_does_not_drift_with_slow_ticks():
+    calls = []
+
+    def on_tick():
+        calls.append(object())
+        time.sleep(0.005)  # half of the interval spent in tick work
+
+    scheduler = TickScheduler(on_tick, tick_interval_ms=10)
+
+    await scheduler.start()
+    await asyncio.sleep(0.3)
+    await scheduler.stop()
+
+    # Sleeping a full interval after each tick would give ~20 ticks here.
+    assert len(calls) >= 25
+    assert scheduler.metrics.tick.count == len(calls)
+
+
+@pytest.mark.asyncio
+async def test_tick_scheduler_skip_policy_drops_missed_ticks():
+    calls = {"count": 0}
+
+    def on_tick():
+        calls["count"] += 1
+        if calls["count"] == 1:
+            time.sleep(0.055)  # miss several deadlines once
+
+    scheduler = TickScheduler(on_tick, tick_interval_ms=10, overrun_policy="skip")
+
+    await scheduler.start()
+    await asyncio.sleep(0.1)
+    await scheduler.stop()
+
+    assert scheduler.metrics.overruns >= 1
+    assert scheduler.metrics.skipped_ticks >= 3
+
+
+@pytest.mark.asyncio
+async def test_tick_scheduler_catch_up_policy_replays_missed_ticks():
+    calls = {"count": 0}
+
+    def on_tick():
+        calls["count"] += 1
+        if calls["count"] == 1:
+            time.sleep(0.055)
+
+    scheduler = TickScheduler(on_tick, tick_interval_ms=10, max_catch_up_ticks=10)
+
+    await scheduler.start()
+    await asyncio.sleep(0.1)
+    await scheduler.stop()
+
+    assert scheduler.metrics.skipped_ticks == 0
+    assert calls["count"] >= 8
+
+
+def test_tick_scheduler_rejects_unknown_overrun_policy():
+    with pytest.raises(ValueError):
+        TickScheduler(lambda: None, overrun_policy="sometimes")
+
+
+def test_tick_metrics_attributes_overrun_to_slowest_phase():
+    metrics = TickMetrics()
+
+    metrics.begin_tick()
+    metrics.record_phase("tables", 0.002)
+    metrics.record_phase("flush", 0.001)
+    metrics.end_tick(0.003, 0.05)
+
+    metrics.begin_tick()
+    metrics.record_phase("tables", 0.01)
+    metrics.record_phase("flush", 0.06)
+    metrics.end_tick(0.07, 0.05)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["tick"]["count"] == 2
+    assert snapshot["overruns"] == 1
+    assert snapshot["phases"]["flush"]["overruns"] == 1
+    assert snapshot["phases"]["tables"]["overruns"] == 0
+    assert snapshot["phases"]["tables"]["count"] == 2
+
+
+def test_duration_histogram_buckets_and_percentiles():
+    histogram = DurationHistogram(buckets_ms=(1, 10, 100))
+    for seconds in (0.0005, 0.0005, 0.005, 0.2):
+        histogram.record(seconds)
+
+    assert histogram.counts == [2, 1, 0, 1]
+    assert histogram.percentile_ms(50) == 1.0
+    assert histogram.percentile_ms(75) == 10.0
+    assert histogram.percentile_ms(100) == pytest.approx(200.0)
+    assert histogram.mean_ms == pytest.approx(51.5)
+
+    histogram.reset()
+    assert histogram.count == 0
+    assert histogram.percentile_ms(95) == 0.0
+
+
 def test_tick_scheduler_default_interval():
     """Test that default tick interval is used when not specified."""
     scheduler = TickScheduler(lambda: None)
@@ -445,6 +445,27 @@ class TestTossUpPlayTest:
         # Should still be active (tiebreaker)
         # Just verify the game handled it without crashing
 
+    def test_bot_rolls_before_banking_in_tiebreaker(self):
+        """Test that a bot already at the target rolls instead of banking nothing."""
+        game = TossUpGame(options=TossUpOptions(target_score=30))
+        game.add_player("Bot1", Bot("Bot1"))
+        game.add_player("Bot2", Bot("Bot2"))
+        game.on_start()
+
+        game._team_manager.teams[0].total_score = 30
+        game._team_manager.teams[1].total_score = 30
+        game._on_round_end()
+
+        player = game.current_player
+        assert player.turn_points == 0
+        assert game.bot_think(player) == "roll"
+
+        for _ in range(3000):
+            if not game.game_active:
+                break
+            game.on_tick()
+        assert not game.game_active
+
     def test_different_starting_dice(self):
         """Test game with different starting dice counts."""
         for dice_count in [5, 15, 20]:
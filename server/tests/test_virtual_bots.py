@@ -150,8 +150,8 @@ def test_virtual_bots_load_config_and_fill_server(tmp_path, monkeypatch):
     assert manager._config.min_idle_ticks == 10
     assert manager._config.max_offline_ticks == 60
 
-    monkeypatch.setattr("server.core.virtual_bots.random.shuffle", lambda seq: seq)
-    monkeypatch.setattr("server.core.virtual_bots.random.randint", lambda a, b: a)
+    monkeypatch.setattr(manager._rng, "shuffle", lambda seq: seq)
+    monkeypatch.setattr(manager._rng, "randint", lambda a, b: a)
 
     added, online = manager.fill_server()
     assert added == 4
@@ -259,8 +259,8 @@ def test_guided_assignment_respects_priority(tmp_path, monkeypatch):
     server = FakeServer()
     manager = VirtualBotManager(server)
     manager.load_config(config_path)
-    monkeypatch.setattr("server.core.virtual_bots.random.shuffle", lambda seq: seq)
-    monkeypatch.setattr("server.core.virtual_bots.random.randint", lambda a, b: a)
+    monkeypatch.setattr(manager._rng, "shuffle", lambda seq: seq)
+    monkeypatch.setattr(manager._rng, "randint", lambda a, b: a)
 
     manager.fill_server()
     manager._refresh_guided_tables()
@@ -546,7 +546,7 @@ def test_try_join_game_rejects_full_table(monkeypatch):
 
     table = DummyTableForJoin("table1", FullGame())
     server._tables.waiting_tables.append(table)
-    monkeypatch.setattr("server.core.virtual_bots.random.choice", lambda seq: seq[0])
+    monkeypatch.setattr(manager._rng, "choice", lambda seq: seq[0])
 
     assert manager._try_join_game(bot) is False
     assert bot.table_id is None
@@ -587,7 +587,7 @@ def test_process_offline_bot_disabled_without_target(monkeypatch):
     bot.state = VirtualBotState.OFFLINE
     bot.target_rule = None
 
-    monkeypatch.setattr("server.core.virtual_bots.random.randint", lambda a, b: a)
+    monkeypatch.setattr(manager._rng, "randint", lambda a, b: a)
 
     manager._process_offline_bot(bot)
 
@@ -940,7 +940,7 @@ def test_handle_guided_bot_leaves_wrong_table(monkeypatch):
         ),
     )
 
-    monkeypatch.setattr("server.core.virtual_bots.random.randint", lambda a, b: a)
+    monkeypatch.setattr(manager._rng, "randint", lambda a, b: a)
 
     transitioned = manager._handle_guided_bot(bot)
 
@@ -1318,7 +1318,7 @@ def test_process_leaving_game_logout_branch(monkeypatch):
     bot.online_ticks = 10
     bot.target_online_ticks = 999
     manager._bots["Leaf"] = bot
-    monkeypatch.setattr("server.core.virtual_bots.random.randint", lambda a, b: a)
+    monkeypatch.setattr(manager._rng, "randint", lambda a, b: a)
 
     manager._process_leaving_game_bot(bot)
 
@@ -2244,7 +2244,7 @@ def test_restore_bot_user_conflict_sets_offline(monkeypatch):
     manager = VirtualBotManager(server)
     bot = VirtualBot("Taken", state=VirtualBotState.ONLINE_IDLE)
 
-    monkeypatch.setattr("server.core.virtual_bots.random.randint", lambda a, b: a)
+    monkeypatch.setattr(manager._rng, "randint", lambda a, b: a)
 
     manager._restore_bot_user(bot)
 
@@ -2296,7 +2296,7 @@ def test_take_bot_offline_removes_user_and_broadcasts(monkeypatch):
     server._users["Yin"] = DummyNetworkUser()
     server._user_states["Yin"] = {"menu": "main"}
 
-    monkeypatch.setattr("server.core.virtual_bots.random.randint", lambda a, b: a)
+    monkeypatch.setattr(manager._rng, "randint", lambda a, b: a)
 
     manager._take_bot_offline(bot)
 
@@ -2317,8 +2317,8 @@ def test_process_online_idle_bot_goes_offline_when_threshold_met(monkeypatch):
     bot.target_online_ticks = 0
     bot.think_ticks = 0
 
-    monkeypatch.setattr("server.core.virtual_bots.random.random", lambda: 0.0)
-    monkeypatch.setattr("server.core.virtual_bots.random.randint", lambda a, b: a)
+    monkeypatch.setattr(manager._rng, "random", lambda: 0.0)
+    monkeypatch.setattr(manager._rng, "randint", lambda a, b: a)
 
     manager._process_online_idle_bot(bot)
 
@@ -2377,7 +2377,7 @@ def test_process_online_idle_attempts_join_first(monkeypatch):
         "_try_create_game",
         lambda b: (_ for _ in ()).throw(AssertionError("create should not run")),
     )
-    monkeypatch.setattr("server.core.virtual_bots.random.random", lambda: 0.0)
+    monkeypatch.setattr(manager._rng, "random", lambda: 0.0)
 
     manager._process_online_idle_bot(bot)
 
@@ -2409,7 +2409,7 @@ def test_process_online_idle_attempts_create_when_join_fails(monkeypatch):
         return True
 
     monkeypatch.setattr(manager, "_try_create_game", fake_create)
-    monkeypatch.setattr("server.core.virtual_bots.random.random", lambda: 0.5)
+    monkeypatch.setattr(manager._rng, "random", lambda: 0.5)
 
     manager._process_online_idle_bot(bot)
 
@@ -2422,8 +2422,8 @@ def test_start_leaving_game_sets_state_and_logout_flag(monkeypatch):
     manager = VirtualBotManager(server)
     bot = VirtualBot("Hex", state=VirtualBotState.IN_GAME)
 
-    monkeypatch.setattr("server.core.virtual_bots.random.randint", lambda a, b: a)
-    monkeypatch.setattr("server.core.virtual_bots.random.random", lambda: 0.9)
+    monkeypatch.setattr(manager._rng, "randint", lambda a, b: a)
+    monkeypatch.setattr(manager._rng, "random", lambda: 0.9)
 
     manager._start_leaving_game(bot)
 
@@ -2440,7 +2440,7 @@ def test_process_leaving_game_logout_branch(monkeypatch):
     bot.online_ticks = 10
     bot.target_online_ticks = 999
     manager._bots["Leaf"] = bot
-    monkeypatch.setattr("server.core.virtual_bots.random.randint", lambda a, b: a)
+    monkeypatch.setattr(manager._rng, "randint", lambda a, b: a)
 
     manager._process_leaving_game_bot(bot)
 
@@ -2481,7 +2481,7 @@ def test_try_join_game_adds_bot_to_waiting_table(monkeypatch):
     table = DummyTableForJoin("table-1", game)
     server._tables.waiting_tables = [table]
 
-    monkeypatch.setattr("server.core.virtual_bots.random.choice", lambda seq: seq[0])
+    monkeypatch.setattr(manager._rng, "choice", lambda seq: seq[0])
 
     joined = manager._try_join_game(bot)
 
@@ -2536,7 +2536,7 @@ def test_try_create_game_builds_table(monkeypatch):
         "get_all",
         classmethod(lambda cls: [DummyGameClass]),
     )
-    monkeypatch.setattr("server.core.virtual_bots.random.choice", lambda seq: seq[0])
+    monkeypatch.setattr(manager._rng, "choice", lambda seq: seq[0])
     monkeypatch.setattr(server._tables, "create_table", fake_create_table)
 
     created = manager._try_create_game(bot)
@@ -2732,7 +2732,7 @@ def test_try_create_game_respects_limits_and_falls_back_to_join(monkeypatch):
     table = DummyTableForJoin("table-1", game)
     server._tables.waiting_tables = [table]
 
-    monkeypatch.setattr("server.core.virtual_bots.random.choice", lambda seq: seq[0])
+    monkeypatch.setattr(manager._rng, "choice", lambda seq: seq[0])
 
     created = manager._try_create_game(bot)
     assert created is True
@@ -2804,7 +2804,7 @@ def test_try_create_game_picks_available_game_type(monkeypatch):
         classmethod(lambda cls: [ScopaGameClass, NinetyNineGameClass]),
     )
     # Force random.choice to pick the first available (ninetynine since scopa is filtered)
-    monkeypatch.setattr("server.core.virtual_bots.random.choice", lambda seq: seq[0])
+    monkeypatch.setattr(manager._rng, "choice", lambda seq: seq[0])
 
     created = manager._try_create_game(bot)
 
@@ -1,10 +1,12 @@
 """Tests for WebSocket server helpers and client handling."""
 
+import asyncio
 import json
 
 import pytest
 
 from server.network import websocket_server
+from server.network.packet_encoder import PacketEncoder, VALIDATION_OFF
 from server.network.websocket_server import ClientConnection, WebSocketServer
 
 
@@ -36,20 +38,105 @@ async def test_client_connection_send_and_close():
     assert ws.closed
 
 
+@pytest.mark.asyncio
+async def test_client_connection_enqueue_sends_batch_frame():
+    ws = DummyWebSocket()
+    conn = ClientConnection(websocket=ws, address="127.0.0.1:1234", supports_batch=True)
+
+    conn.enqueue(
+        [
+            {"type": "menu", "menu_id": "turn_menu", "items": ["Roll"]},
+            {"type": "speak", "text": "hi"},
+            {"type": "menu", "menu_id": "turn_menu", "items": ["Roll", "Bank"]},
+            {"type": "bogus"},
+        ]
+    )
+    await conn._writer
+
+    assert len(ws.sent) == 1
+    frame = json.loads(ws.sent[0])
+    assert frame["type"] == "batch"
+    assert [p["type"] for p in frame["packets"]] == ["speak", "menu"]
+    assert frame["packets"][1]["items"] == ["Roll", "Bank"]
+
+
+@pytest.mark.asyncio
+async def test_client_connection_enqueue_without_batch_support_sends_in_order():
+    ws = DummyWebSocket()
+    conn = ClientConnection(websocket=ws, address="127.0.0.1:1234")
+
+    conn.enqueue([{"type": "speak", "text": "one"}, {"type": "speak", "text": "two"}])
+    await conn._writer
+
+    assert [json.loads(frame)["text"] for frame in ws.sent] == ["one", "two"]
+
+
+@pytest.mark.asyncio
+async def test_packet_that_fails_to_encode_does_not_lose_the_rest_of_the_batch():
+    ws = DummyWebSocket()
+    conn = ClientConnection(
+        websocket=ws,
+        address="127.0.0.1:1234",
+        supports_batch=True,
+        encoder=PacketEncoder(VALIDATION_OFF),
+    )
+
+    conn.enqueue(
+        [
+            {"type": "speak", "text": "one"},
+            {"type": "speak", "text": object()},
+            {"type": "speak", "text": "two"},
+        ]
+    )
+    await conn._writer
+
+    frame = json.loads(ws.sent[0])
+    assert [p["text"] for p in frame["packets"]] == ["one", "two"]
+
+
+def test_coalesce_packets_keeps_last_menu_per_id():
+    packets = [
+        {"type": "menu", "menu_id": "a", "items": ["1"]},
+        {"type": "menu", "menu_id": "b", "items": ["x"]},
+        {"type": "play_sound", "name": "ding"},
+        {"type": "menu", "menu_id": "a", "items": ["2"]},
+    ]
+
+    assert websocket_server.coalesce_packets(packets) == [
+        {"type": "menu", "menu_id": "b", "items": ["x"]},
+        {"type": "play_sound", "name": "ding"},
+        {"type": "menu", "menu_id": "a", "items": ["2"]},
+    ]
+
+
+def test_coalesce_packets_keeps_patches_after_last_full_menu():
+    packets = [
+        {"type": "menu", "menu_id": "a", "items": ["1"], "escape_behavior": "escape_event"},
+        {"type": "menu_patch", "menu_id": "a", "ops": []},
+        {"type": "menu", "menu_id": "a", "items": ["2"]},
+        {"type": "menu_patch", "menu_id": "a", "ops": [{"op": "remove", "id": "x"}]},
+    ]
+
+    assert websocket_server.coalesce_packets(packets) == [
+        {"type": "menu", "menu_id": "a", "items": ["2"], "escape_behavior": "escape_event"},
+        {"type": "menu_patch", "menu_id": "a", "ops": [{"op": "remove", "id": "x"}]},
+    ]
+
+
 @pytest.mark.asyncio
 async def test_websocket_server_broadcast_and_send_to_user():
     server = WebSocketServer()
     c1 = ClientConnection(DummyWebSocket(), "a:1")
     c1.authenticated = True
-    c1.username = "alice"
+    server.bind_username(c1, "alice")
 
     c2 = ClientConnection(DummyWebSocket(), "b:1")
     c2.authenticated = False
-    c2.username = "bob"
+    server.bind_username(c2, "bob")
 
     c3 = ClientConnection(DummyWebSocket(), "c:1")
     c3.authenticated = True
-    c3.username = "carol"
+    server.bind_username(c3, "carol")
 
     server.clients.update(
         {
@@ -84,6 +171,62 @@ async def test_websocket_server_broadcast_and_send_to_user():
     assert server.get_client_by_username("nobody") is None
 
 
+def assert_username_index_consistent(server: WebSocketServer) -> None:
+    """The username index matches a scan of the connected clients."""
+    for username, client in server._clients_by_username.items():
+        assert client.username == username
+        assert client in server.clients.values()
+    named = {client.username for client in server.clients.values() if client.username}
+    assert named == set(server._clients_by_username)
+
+
+class ClosingWebSocket(DummyWebSocket):
+    """A websocket that closes right after the connect handler runs."""
+
+    def __init__(self, port: int):
+        super().__init__()
+        self.port = port
+
+    @property
+    def remote_address(self):
+        return ("127.0.0.1", self.port)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        raise StopAsyncIteration
+
+
+@pytest.mark.asyncio
+async def test_username_index_follows_takeover_and_disconnect():
+    bound = {}
+
+    async def on_connect(client):
+        server.bind_username(client, "alice")
+        bound[client.address] = client
+
+    server = WebSocketServer(on_connect=on_connect)
+    old = ClientConnection(DummyWebSocket(), "a:1")
+    server.clients[old.address] = old
+    server.bind_username(old, "alice")
+    assert_username_index_consistent(server)
+
+    # A new session for the same user takes over the index entry ...
+    await server._handle_client(ClosingWebSocket(4001))
+    new = bound["127.0.0.1:4001"]
+    # ... and its disconnect removes it; the replaced old session stays unindexed.
+    assert new not in server.clients.values()
+    assert server.get_client_by_username("alice") is None
+
+    server.bind_username(old, "alice")
+    assert server.get_client_by_username("alice") is old
+    server.bind_username(old, "alice2")
+    assert server.get_client_by_username("alice") is None
+    assert server.get_client_by_username("alice2") is old
+    assert_username_index_consistent(server)
+
+
 @pytest.mark.asyncio
 async def test_websocket_server_passes_max_size(monkeypatch):
     recorded_kwargs = {}
@@ -114,3 +257,123 @@ async def test_websocket_server_passes_max_size(monkeypatch):
     await ws_server.start()
     assert recorded_kwargs.get("max_size") == 2048
     await ws_server.stop()
+
+
+class StalledWebSocket(DummyWebSocket):
+    """A websocket whose sends never finish until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = asyncio.Event()
+
+    async def send(self, data):
+        await self.release.wait()
+        self.sent.append(data)
+
+
+@pytest.mark.asyncio
+async def test_fan_out_does_not_wait_behind_slow_clients():
+    stalled_ws = StalledWebSocket()
+    stalled = ClientConnection(stalled_ws, "a:1")
+    stalled.username = "slowpoke"
+    fast = [ClientConnection(DummyWebSocket(), f"b:{i}") for i in range(3)]
+    packet = {"type": "chat", "convo": "global", "sender": "x", "message": "hi", "language": "en"}
+
+    slow = await websocket_server.fan_out([stalled, *fast], packet, timeout=0.05)
+
+    assert slow == [stalled]
+    assert all(json.loads(conn.websocket.sent[-1])["message"] == "hi" for conn in fast)
+    # The slow send still completes once the client catches up.
+    stalled_ws.release.set()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert json.loads(stalled_ws.sent[-1])["message"] == "hi"
+
+
+@pytest.mark.asyncio
+async def test_fan_out_serializes_the_packet_once():
+    encoder = PacketEncoder(VALIDATION_OFF)
+    clients = [ClientConnection(DummyWebSocket(), f"c:{i}", encoder=encoder) for i in range(4)]
+
+    await websocket_server.fan_out(clients, {"type": "pong"})
+
+    assert encoder.get_stats()["fast"] == 1
+    assert encoder.get_stats()["reused"] == 3
+    assert len({conn.websocket.sent[-1] for conn in clients}) == 1
+
+
+def _stalled_connection(**kwargs) -> tuple[ClientConnection, StalledWebSocket]:
+    ws = StalledWebSocket()
+    conn = ClientConnection(ws, "slow:1", supports_batch=True, **kwargs)
+    return conn, ws
+
+
+@pytest.mark.asyncio
+async def test_backed_up_outbox_drops_sounds_but_keeps_menus():
+    conn, ws = _stalled_connection(high_watermark=10, low_watermark=4)
+    conn.enqueue([{"type": "speak", "text": "first"}])
+    await asyncio.sleep(0)  # the writer takes "first" and stalls on it
+
+    conn.enqueue([{"type": "play_sound", "name": f"step{i}.ogg"} for i in range(8)])
+    conn.enqueue(
+        [
+            {"type": "menu", "menu_id": "turn_menu", "items": ["Roll"]},
+            {"type": "menu_patch", "menu_id": "turn_menu", "ops": []},
+            {"type": "play_sound", "name": "last.ogg"},
+        ]
+    )
+
+    assert not conn.evicted
+    assert conn.queue_depth == 4
+    assert conn.dropped == 7
+    assert conn.outbox_stats.dropped == 7
+    queued = [packet["type"] for packet in conn._outbox]
+    assert queued == ["play_sound", "menu", "menu_patch", "play_sound"]
+    assert conn._outbox[-1]["name"] == "last.ogg"
+    ws.release.set()
+    await conn._writer
+
+
+@pytest.mark.asyncio
+async def test_client_too_far_behind_is_disconnected_with_reconnect_hint():
+    conn, ws = _stalled_connection(high_watermark=5, low_watermark=2)
+    conn.enqueue([{"type": "speak", "text": "first"}])
+    await asyncio.sleep(0)
+
+    conn.enqueue([{"type": "speak", "text": f"line {i}"} for i in range(6)])
+
+    assert conn.evicted
+    assert conn.queue_depth == 0
+    assert conn.outbox_stats.evicted == 1
+    conn.enqueue([{"type": "speak", "text": "ignored"}])
+    assert conn.queue_depth == 0
+
+    ws.release.set()
+    await conn._writer
+    disconnect = json.loads(ws.sent[-1])
+    assert disconnect["type"] == "disconnect"
+    assert disconnect["reconnect"] is True
+    assert ws.closed
+
+
+@pytest.mark.asyncio
+async def test_outbox_stats_cover_all_connections():
+    ws_server = WebSocketServer(outbox_high_watermark=8, outbox_low_watermark=20)
+    stats = ws_server.get_outbox_stats()
+    assert stats["high_watermark"] == 8
+    assert stats["low_watermark"] == 8
+    assert stats["connections"] == 0 and stats["max_depth"] == 0
+
+    for index, depth in enumerate((3, 1)):
+        conn = ClientConnection(
+            StalledWebSocket(), f"c:{index}", outbox_stats=ws_server._outbox_stats
+        )
+        conn._outbox = [{"type": "speak", "text": "queued"}] * depth
+        ws_server.clients[conn.address] = conn
+    ws_server._outbox_stats.dropped = 5
+
+    stats = ws_server.get_outbox_stats()
+    assert stats["connections"] == 2
+    assert stats["queued"] == 4
+    assert stats["max_depth"] == 3
+    assert stats["dropped"] == 5
@@ -0,0 +1,50 @@
+"""Export the static game index used by GameRegistry for lazy game loading."""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from server.games.registry import (  # pylint: disable=wrong-import-position
+    GAME_MODULES,
+    INDEX_PATH,
+    GameInfo,
+    GameRegistry,
+)
+
+
+def build_index() -> list[dict]:
+    """Import every game module and return index entries in menu order."""
+    entries = []
+    for module in GAME_MODULES:
+        importlib.import_module(module)
+        for game_class in GameRegistry._games.values():
+            if game_class.__module__ == module:
+                entries.append(GameInfo.from_class(game_class).to_dict())
+    return entries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export the game index JSON.")
+    parser.add_argument(
+        "--out",
+        type=Path,
+        default=INDEX_PATH,
+        help="Path to write the game index JSON.",
+    )
+    args = parser.parse_args()
+
+    entries = build_index()
+    args.out.write_text(json.dumps(entries, indent=2) + "\n", encoding="utf-8")
+    print(f"Wrote {len(entries)} games to {args.out}")
+
+
+if __name__ == "__main__":
+    main()